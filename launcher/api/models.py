@@ -244,6 +244,7 @@ class APIHealthResponse(BaseModel):
     version: str
     managers: Dict[str, bool]
     event_bus: Dict[str, Any]
+    health_probes: Optional[Dict[str, Any]] = None
 
 
 class ServiceHealthResponse(BaseModel):
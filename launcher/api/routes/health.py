@@ -55,7 +55,8 @@ async def api_health(
         status="healthy" if all(managers.values()) else "degraded",
         version=__version__,
         managers=managers,
-        event_bus=bus_stats
+        event_bus=bus_stats,
+        health_probes=health_mgr.get_stats() if health_mgr else None,
     )
 
 
@@ -56,6 +56,9 @@ class HealthManagerConfig:
     failure_threshold: int = 5  # Default failures before marking unhealthy
     stable_duration: float = 300.0  # Seconds before switching to stable interval (5 min)
 
+    # Concurrency
+    max_concurrent_probes: int = 8  # Probe threads; one slow service can't stall the rest
+
     # Events
     event_callback: Optional[Callable] = None  # Callback for health events
 
@@ -179,6 +182,7 @@ class LauncherConfig:
                 'tcp_timeout': self.health.tcp_timeout,
                 'failure_threshold': self.health.failure_threshold,
                 'stable_duration': self.health.stable_duration,
+                'max_concurrent_probes': self.health.max_concurrent_probes,
             },
             'log': {
                 'log_dir': str(self.log.log_dir) if self.log.log_dir else None,
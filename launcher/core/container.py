@@ -108,6 +108,8 @@ class LauncherContainer:
                 startup_interval=self.config.health.startup_interval,
                 stable_interval=self.config.health.stable_interval,
                 http_timeout=self.config.health.http_timeout,
+                stable_duration=self.config.health.stable_duration,
+                max_concurrent_probes=self.config.health.max_concurrent_probes,
             )
 
         return self._health_mgr
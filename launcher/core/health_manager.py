@@ -3,6 +3,11 @@ Health Manager - Pure Python service health monitoring.
 
 Monitors service health via HTTP endpoints or custom checks,
 without UI dependencies. Uses threading instead of QThread.
+
+Probes run on a small thread pool so one hung service (docker compose,
+a stalled /health) never delays updates for the others. Each service has
+its own schedule: stable services back off, starting or flapping ones are
+probed more often.
 """
 
 import os
@@ -13,7 +18,9 @@ import subprocess
 import threading
 import urllib.request
 import logging
-from typing import Any, Dict, Optional, Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Optional, Callable, Set, Tuple
 from .types import HealthStatus, HealthEvent, ServiceState, ServiceStatus
 # Worker cmdline selectors + the arq-worker key set live in worker_detection,
 # the single source of truth shared with ProcessManager (a mismatch
@@ -32,6 +39,21 @@ HEALTH_ERROR_PREFIX = "Health check failed: "
 # loop wedged (e.g. host sleep/resume) — see Bridge._liveness_heartbeat_loop.
 BRIDGE_HEARTBEAT_MAX_AGE_SEC = 90.0
 
+# A service with this many health transitions inside the window is flapping
+# and gets probed at the startup interval until it settles.
+FLAP_TRANSITIONS = 3
+FLAP_WINDOW_SEC = 60.0
+
+
+class _ProbeCycle:
+    """Probes dispatched together; the cycle ends when the last one finishes."""
+
+    __slots__ = ("started", "pending")
+
+    def __init__(self, started: float, pending: int):
+        self.started = started
+        self.pending = pending
+
 
 class HealthManager:
     """
@@ -49,6 +71,8 @@ class HealthManager:
         startup_interval: float = 0.5,
         stable_interval: float = 5.0,
         http_timeout: float = 1.5,
+        stable_duration: float = 300.0,
+        max_concurrent_probes: int = 8,
     ):
         self.states = states
         self.event_callback = event_callback
@@ -58,14 +82,34 @@ class HealthManager:
         self.adaptive_enabled = adaptive_enabled
         self.startup_interval = startup_interval
         self.stable_interval = stable_interval
-        self.interval = self.base_interval
+        self.stable_duration = stable_duration
         self.http_timeout = http_timeout
+        self.max_concurrent_probes = max(1, max_concurrent_probes)
 
         # State tracking
         self.failure_counts: Dict[str, int] = {}
         self.service_healthy_since: Dict[str, Optional[float]] = {}
-        self.last_startup_detected: Optional[float] = None
         self._prev_status: Dict[str, HealthStatus] = {}
+        self._transitions: Dict[str, Deque[float]] = {}
+
+        # Per-service schedule (monotonic due times). A service is never
+        # probed twice at once; a lifecycle change made elsewhere (start,
+        # stop, new PID) makes it due immediately.
+        self._schedule_lock = threading.Lock()
+        self._next_due: Dict[str, float] = {}
+        self._in_flight: Set[str] = set()
+        # Last submitted probe per service, so shutdown can release the
+        # in-flight keys of probes that never got a pool thread.
+        self._probe_futures: Dict[str, Future] = {}
+        self._seen_lifecycle: Dict[str, Tuple] = {}
+        self._emit_lock = threading.Lock()
+
+        # Cycle latency metrics (see get_stats)
+        self._cycle_count = 0
+        self._last_cycle_sec = 0.0
+        self._avg_cycle_sec = 0.0
+        self._max_cycle_sec = 0.0
+        self._probe_sec: Dict[str, float] = {}
 
         # Transport backoff (for transient WinNAT/TCP churn on Windows)
         self._transport_backoff_until: Dict[str, float] = {}
@@ -75,6 +119,7 @@ class HealthManager:
         # Thread control
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._wake = threading.Event()
         self._running = False
 
     def start(self):
@@ -98,6 +143,7 @@ class HealthManager:
             return
 
         self._stop_event.set()
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=timeout)
         self._running = False
@@ -176,44 +222,42 @@ class HealthManager:
         """Emit a health event to the callback if registered."""
         if self.event_callback:
             try:
-                self.event_callback(event)
+                # Probes run concurrently; keep callbacks one at a time.
+                with self._emit_lock:
+                    self.event_callback(event)
             except Exception:
                 pass  # Don't let callback errors break the manager
 
-    def _update_adaptive_interval(self):
-        """Dynamically adjust health check interval based on service states."""
-        if not self.adaptive_enabled:
-            self.interval = self.base_interval
-            return
-
-        current_time = time.time()
+    def _is_flapping(self, key: str) -> bool:
+        """True if the service changed health status repeatedly within the window."""
+        recent = self._transitions.get(key)
+        return bool(
+            recent
+            and len(recent) >= FLAP_TRANSITIONS
+            and time.monotonic() - recent[0] <= FLAP_WINDOW_SEC
+        )
 
-        # Check if any service is starting (use fast interval)
-        if self.last_startup_detected and (current_time - self.last_startup_detected) < 60:
-            self.interval = self.startup_interval
-            return
+    def _service_interval(self, key: str) -> float:
+        """Probe interval for one service, from its own recent history."""
+        if not self.adaptive_enabled:
+            return self.base_interval
 
-        # Check if all services are stable (use slow interval)
-        if self.service_healthy_since:
-            min_healthy_duration = min(
-                (current_time - ts if ts else 0)
-                for ts in self.service_healthy_since.values()
-            )
+        state = self.states.get(key)
+        if self._is_flapping(key) or (state is not None and state.health == HealthStatus.STARTING):
+            return self.startup_interval
 
-            # If all services healthy for >5 minutes, use slow interval
-            if min_healthy_duration > 300:  # 5 minutes
-                self.interval = self.stable_interval
-                return
+        # Healthy for longer than stable_duration: back off
+        healthy_since = self.service_healthy_since.get(key)
+        if healthy_since and time.time() - healthy_since > self.stable_duration:
+            return self.stable_interval
 
-        # Default to base interval
-        self.interval = self.base_interval
+        return self.base_interval
 
     def _track_health_change(self, key: str, status: HealthStatus):
         """Track service health state changes for adaptive interval logic."""
         current_time = time.time()
 
         if status == HealthStatus.STARTING:
-            self.last_startup_detected = current_time
             self.service_healthy_since[key] = None
 
         elif status == HealthStatus.HEALTHY:
@@ -244,6 +288,10 @@ class HealthManager:
         # Log transitions
         old = self._prev_status.get(key)
         if old is not None and old != status:
+            recent = self._transitions.get(key)
+            if recent is None:
+                recent = self._transitions[key] = deque(maxlen=FLAP_TRANSITIONS)
+            recent.append(time.monotonic())
             if reason:
                 logger.info(
                     "health_transition service=%s %s -> %s failures=%d reason=%s",
@@ -862,45 +910,137 @@ class HealthManager:
             state.externally_managed = False
             self._emit_health_update(key, HealthStatus.STOPPED, details=details)
 
-    def _run_loop(self):
-        """Main health checking loop (runs in thread)."""
-        while not self._stop_event.is_set():
-          try:
-            self._update_adaptive_interval()
-            start_time = time.time()
-
-            # Check fast services (HTTP/TCP) before slow ones (docker-compose)
-            # so health cards update quickly at startup.
-            fast = []
-            slow = []
-            for key, state in self.states.items():
-                defn = state.definition
-                if defn.is_detached or defn.key == 'db' or defn.custom_health_check:
-                    slow.append((key, state))
-                else:
-                    fast.append((key, state))
+    @staticmethod
+    def _lifecycle(state: ServiceState) -> Tuple:
+        return (state.status, state.requested_running, state.pid)
 
-            for key, state in (*fast, *slow):
-                if self._stop_event.is_set():
-                    break
+    def _dispatch_due(self, pool: ThreadPoolExecutor) -> float:
+        """Submit every due, idle service; return seconds until the next one is due."""
+        now = time.monotonic()
+        # Wake at least this often so lifecycle changes are noticed quickly.
+        next_wake = self.startup_interval
+        due = []
+        with self._schedule_lock:
+            for key, state in list(self.states.items()):
+                if key in self._in_flight:
+                    continue
+                if self._seen_lifecycle.get(key) != self._lifecycle(state):
+                    self._next_due[key] = now
+                remaining = self._next_due.get(key, now) - now
+                if remaining > 0:
+                    next_wake = min(next_wake, remaining)
+                    continue
+                self._in_flight.add(key)
+                due.append((key, state))
+
+        if due:
+            # Submit fast services (HTTP/TCP) before slow ones (docker-compose,
+            # custom checks) so they get pool threads first.
+            def is_slow(item):
+                defn = item[1].definition
+                return bool(defn.is_detached or defn.key == 'db' or defn.custom_health_check)
+
+            cycle = _ProbeCycle(now, len(due))
+            due.sort(key=is_slow)
+            for i, (key, state) in enumerate(due):
                 try:
-                    self._check_service(key, state)
-                except Exception as exc:
-                    try:
-                        self._increment_failures(key)
-                        self._emit_health_update(
-                            key,
-                            HealthStatus.UNHEALTHY,
-                            details={"reason": f"health check loop error: {exc.__class__.__name__}: {exc}"},
-                        )
-                    except Exception:
-                        pass  # Never let emit errors kill the health loop
+                    future = pool.submit(self._probe, key, state, cycle)
+                except RuntimeError:
+                    # Pool (or interpreter) shutting down: release the keys
+                    # that never got a probe so a restart can schedule them.
+                    with self._schedule_lock:
+                        cycle.pending -= len(due) - i
+                        for unsent, _state in due[i:]:
+                            self._in_flight.discard(unsent)
+                    return next_wake
+                with self._schedule_lock:
+                    self._probe_futures[key] = future
+        return next_wake
+
+    def _probe(self, key: str, state: ServiceState, cycle: _ProbeCycle):
+        """Check one service on a pool thread and schedule its next probe."""
+        started = time.monotonic()
+        try:
+            if not self._stop_event.is_set():
+                self._check_service(key, state)
+        except Exception as exc:
+            try:
+                self._increment_failures(key)
+                self._emit_health_update(
+                    key,
+                    HealthStatus.UNHEALTHY,
+                    details={"reason": f"health check loop error: {exc.__class__.__name__}: {exc}"},
+                )
+            except Exception:
+                pass  # Never let emit errors kill the health loop
+        finally:
+            finished = time.monotonic()
+            with self._schedule_lock:
+                self._probe_sec[key] = finished - started
+                self._in_flight.discard(key)
+                # Changes the probe made itself should not trigger a re-probe.
+                self._seen_lifecycle[key] = self._lifecycle(state)
+                self._next_due[key] = finished + self._service_interval(key)
+                cycle.pending -= 1
+                if cycle.pending == 0:
+                    self._record_cycle(finished - cycle.started)
+            self._wake.set()
+
+    def _record_cycle(self, elapsed: float):
+        """Record the latency of one probe cycle (caller holds _schedule_lock)."""
+        self._cycle_count += 1
+        self._last_cycle_sec = elapsed
+        self._max_cycle_sec = max(self._max_cycle_sec, elapsed)
+        if self._cycle_count == 1:
+            self._avg_cycle_sec = elapsed
+        else:
+            self._avg_cycle_sec += 0.2 * (elapsed - self._avg_cycle_sec)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get probe scheduling statistics.
 
-            elapsed = time.time() - start_time
-            remaining = self.interval - elapsed
-            if remaining > 0:
-                self._stop_event.wait(timeout=remaining)
-          except Exception:
-            # Never let the health loop die — sleep and retry
-            self._stop_event.wait(timeout=2.0)
+        Returns:
+            Dictionary with cycle latency (last/avg/max, ms), per-service probe
+            latency and interval, and the services currently being probed
+        """
+        with self._schedule_lock:
+            return {
+                'cycle_count': self._cycle_count,
+                'last_cycle_ms': round(self._last_cycle_sec * 1000, 1),
+                'avg_cycle_ms': round(self._avg_cycle_sec * 1000, 1),
+                'max_cycle_ms': round(self._max_cycle_sec * 1000, 1),
+                'probe_ms': {key: round(sec * 1000, 1) for key, sec in self._probe_sec.items()},
+                'interval_sec': {key: self._service_interval(key) for key in self.states},
+                'in_flight': sorted(self._in_flight),
+                'max_concurrent_probes': self.max_concurrent_probes,
+            }
 
+    def _run_loop(self):
+        """Scheduler loop (runs in thread); probes run on a bounded pool."""
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_probes,
+            thread_name_prefix="health-probe",
+        )
+        try:
+            while not self._stop_event.is_set():
+                # Clear before dispatching so a probe finishing meanwhile
+                # still wakes the next wait.
+                self._wake.clear()
+                try:
+                    wait = self._dispatch_due(pool)
+                except Exception:
+                    # Never let the health loop die — sleep and retry
+                    wait = 2.0
+                self._wake.wait(timeout=wait)
+        finally:
+            # Queued probes are cancelled and their keys released, otherwise
+            # a later start() would treat them as in flight forever. A probe
+            # stuck in a subprocess or socket timeout finishes (and releases
+            # its key) on its own; don't block stop() on it.
+            with self._schedule_lock:
+                for key, future in self._probe_futures.items():
+                    if future.cancel():
+                        self._in_flight.discard(key)
+                self._probe_futures.clear()
+            pool.shutdown(wait=False)
@@ -5,14 +5,19 @@ Manages service console logs with persistence and filtering,
 without UI dependencies.
 """
 
-import os
 import re
 import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Deque, Dict, List, Optional, Callable, Tuple
 from datetime import datetime
 from .types import ServiceState
 from .paths import CONSOLE_LOG_DIR
+from .log_tailer import FileTail, create_watcher, read_last_lines
+
+# Subscriber callback: (service_key, new_lines) - one call per batch read.
+LogSubscriber = Callable[[str, List[str]], None]
 
 
 class LogManager:
@@ -22,12 +27,17 @@ class LogManager:
     Pure Python implementation with no Qt or UI dependencies.
     Features:
     - Persistent log files on disk
-    - In-memory log buffers (limited size)
+    - In-memory ring buffers (deque, fixed size)
     - Log level filtering
-    - Real-time log streaming
+    - Real-time log streaming: files are tailed from open handles (inotify
+      wakeups on Linux, stat polling elsewhere) and new lines are pushed to
+      subscribers in batches
     - ANSI color code stripping
     """
 
+    _ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    _ANSI_FRAGMENT = re.compile(r'\[[0-9;]{1,5}m')
+
     # Log level patterns
     LEVEL_PATTERNS = {
         "ERROR": re.compile(r"(?:\[(?:ERR|ERROR)\])|\b(?:ERR|ERROR)\b", re.IGNORECASE),
@@ -43,7 +53,8 @@ class LogManager:
         log_dir: Optional[Path] = None,
         max_log_lines: int = 5000,
         monitor_interval: float = 0.5,
-        log_callback: Optional[Callable[[str, str], None]] = None
+        log_callback: Optional[Callable[[str, str], None]] = None,
+        use_inotify: bool = True,
     ):
         """
         Initialize the log manager.
@@ -52,13 +63,17 @@ class LogManager:
             states: Dictionary of service states
             log_dir: Directory for log files (default: launcher canonical console log dir)
             max_log_lines: Maximum lines to keep in memory per service
-            monitor_interval: How often to check log files for new content (seconds)
-            log_callback: Optional callback for new log lines (service_key, line)
+            monitor_interval: How often to check log files for new content
+                (seconds); with inotify this is only the wakeup timeout
+            log_callback: Optional callback for new log lines (service_key, line).
+                Prefer subscribe(), which receives lines in batches.
+            use_inotify: Use inotify change notification where available
         """
         self.states = states
         self.max_log_lines = max_log_lines
         self.monitor_interval = monitor_interval
         self.log_callback = log_callback
+        self.use_inotify = use_inotify
 
         # Set up log directory
         if log_dir is None:
@@ -67,8 +82,13 @@ class LogManager:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track log file positions for monitoring
-        self._file_positions: Dict[str, int] = {}
+        # Open tail per log file; positions start where the persisted load ended
+        self._tails: Dict[str, FileTail] = {}
+        self._tail_lock = threading.Lock()
+        # Guards log buffers (API threads read while the monitor appends)
+        self._lock = threading.RLock()
+        self._subscribers: Tuple[LogSubscriber, ...] = ()
+        self._watcher = None
         self._monitor_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._running = False
@@ -80,29 +100,64 @@ class LogManager:
         """Load previously saved console logs on startup."""
         for key, state in self.states.items():
             log_file = self.log_dir / f"{key}.log"
+            position = 0
+            cleaned: list[str] = []
             if log_file.exists():
                 try:
-                    with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                        lines = f.readlines()
-                        # Load last N lines to respect max_log_lines
-                        cleaned: list[str] = []
-                        for line in lines[-self.max_log_lines:]:
-                            raw = line.rstrip()
-                            if not raw:
-                                continue
-                            clean = self._strip_ansi_codes(raw)
-                            clean = self._strip_ansi_artifacts(clean)
-                            if clean:
-                                cleaned.append(clean)
-                        state.log_buffer = cleaned
-                        # Track file position
-                        self._file_positions[key] = log_file.stat().st_size
+                    position = log_file.stat().st_size
+                    # Load last N lines to respect max_log_lines
+                    for line in read_last_lines(log_file, self.max_log_lines):
+                        raw = line.rstrip()
+                        if not raw:
+                            continue
+                        clean = self._strip_ansi_codes(raw)
+                        clean = self._strip_ansi_artifacts(clean)
+                        if clean:
+                            cleaned.append(clean)
                 except Exception:
-                    state.log_buffer = []
-                    self._file_positions[key] = 0
-            else:
-                state.log_buffer = []
-                self._file_positions[key] = 0
+                    cleaned = []
+                    position = 0
+            state.log_buffer = deque(cleaned, maxlen=self.max_log_lines)
+            self._tails[key] = FileTail(log_file, position=position)
+
+    def _buffer(self, state: ServiceState) -> Deque[str]:
+        """The state's ring buffer (states added after startup get one lazily)."""
+        buf = state.log_buffer
+        if not isinstance(buf, deque) or buf.maxlen != self.max_log_lines:
+            buf = state.log_buffer = deque(buf, maxlen=self.max_log_lines)
+        return buf
+
+    def subscribe(self, callback: LogSubscriber) -> Callable[[], None]:
+        """
+        Receive new log lines as they are read, one call per batch.
+
+        Args:
+            callback: Called as callback(service_key, lines) from the monitor thread
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + (callback,)
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = tuple(cb for cb in self._subscribers if cb is not callback)
+
+        return unsubscribe
+
+    def _publish(self, service_key: str, lines: List[str]):
+        if self.log_callback:
+            for line in lines:
+                try:
+                    self.log_callback(service_key, line)
+                except Exception:
+                    pass
+        for callback in self._subscribers:
+            try:
+                callback(service_key, lines)
+            except Exception:
+                pass
 
     def start_monitoring(self):
         """Start monitoring log files for new content."""
@@ -110,6 +165,7 @@ class LogManager:
             return
 
         self._stop_event.clear()
+        self._watcher = create_watcher(self.log_dir, prefer_inotify=self.use_inotify)
         self._running = True
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
@@ -125,8 +181,13 @@ class LogManager:
             return
 
         self._stop_event.set()
+        if self._watcher:
+            self._watcher.wakeup()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=timeout)
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
         self._running = False
 
     def is_monitoring(self) -> bool:
@@ -157,12 +218,9 @@ class LogManager:
         timestamp = datetime.now().strftime('%H:%M:%S')
         formatted = f"[{timestamp}] [{stream}] {clean_line}"
 
-        # Add to in-memory buffer
-        state.log_buffer.append(formatted)
-
-        # Trim buffer if too large
-        if len(state.log_buffer) > self.max_log_lines:
-            state.log_buffer = state.log_buffer[-self.max_log_lines:]
+        # Add to in-memory ring buffer
+        with self._lock:
+            self._buffer(state).append(formatted)
 
         # Persist to file
         self._persist_log_line(service_key, formatted)
@@ -171,12 +229,7 @@ class LogManager:
         if stream == "ERR" or self._detect_error(clean_line):
             state.last_error = clean_line
 
-        # Callback
-        if self.log_callback:
-            try:
-                self.log_callback(service_key, formatted)
-            except Exception:
-                pass
+        self._publish(service_key, [formatted])
 
     def get_logs(
         self,
@@ -201,7 +254,16 @@ class LogManager:
         if not state:
             return []
 
-        logs = state.log_buffer.copy()
+        with self._lock:
+            buf = self._buffer(state)
+            if not filter_text and not filter_level:
+                if max_lines and max_lines > 0:
+                    # Walk back only as far as needed
+                    logs = list(islice(reversed(buf), max_lines))
+                    logs.reverse()
+                    return logs
+                return list(buf)
+            logs = list(buf)
 
         # Apply text filter
         if filter_text:
@@ -225,16 +287,20 @@ class LogManager:
         if not state:
             return
 
-        state.log_buffer.clear()
-        self._file_positions[service_key] = 0
+        with self._lock:
+            self._buffer(state).clear()
 
         # Truncate log file
         log_file = self.log_dir / f"{service_key}.log"
-        try:
-            with open(log_file, 'w', encoding='utf-8') as f:
+        with self._tail_lock:
+            tail = self._tails.get(service_key)
+            if tail:
+                tail.reset()
+            try:
+                with open(log_file, 'w', encoding='utf-8') as f:
+                    pass
+            except Exception:
                 pass
-        except Exception:
-            pass
 
     def clear_all_logs(self):
         """Clear logs for all services."""
@@ -251,69 +317,68 @@ class LogManager:
             pass
 
     def _read_new_log_lines(self, service_key: str):
-        """Read new lines from log file since last check."""
+        """Read lines appended to the service's log file since the last read."""
         state = self.states.get(service_key)
         if not state:
             return
 
-        log_file = self.log_dir / f"{service_key}.log"
-        if not log_file.exists():
-            return
-
         try:
-            current_pos = self._file_positions.get(service_key, 0)
-
-            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                f.seek(current_pos)
-                new_lines = f.readlines()
-                self._file_positions[service_key] = f.tell()
-
-                for line in new_lines:
-                    raw = line.rstrip()
-                    if not raw:
-                        continue
-                    clean = self._strip_ansi_codes(raw)
-                    clean = self._strip_ansi_artifacts(clean)
-                    if not clean:
-                        continue
-
-                    state.log_buffer.append(clean)
-
-                    # Check for errors
-                    if '[ERR]' in clean or '[ERROR]' in clean:
-                        parts = clean.split('] ', 2)
-                        if len(parts) >= 3:
-                            state.last_error = parts[2]
-
-                    # Callback
-                    if self.log_callback:
-                        try:
-                            self.log_callback(service_key, clean)
-                        except Exception:
-                            pass
-
-                # Trim buffer if too large
-                if len(state.log_buffer) > self.max_log_lines:
-                    state.log_buffer = state.log_buffer[-self.max_log_lines:]
+            with self._tail_lock:
+                tail = self._tails.get(service_key)
+                if tail is None:
+                    tail = self._tails[service_key] = FileTail(self.log_dir / f"{service_key}.log")
+                new_lines = tail.read_lines()
+            if not new_lines:
+                return
+
+            cleaned: List[str] = []
+            for line in new_lines:
+                raw = line.rstrip()
+                if not raw:
+                    continue
+                clean = self._strip_ansi_codes(raw)
+                clean = self._strip_ansi_artifacts(clean)
+                if not clean:
+                    continue
+                cleaned.append(clean)
+
+                # Check for errors
+                if '[ERR]' in clean or '[ERROR]' in clean:
+                    parts = clean.split('] ', 2)
+                    if len(parts) >= 3:
+                        state.last_error = parts[2]
+
+            if not cleaned:
+                return
+            with self._lock:
+                self._buffer(state).extend(cleaned)
+            self._publish(service_key, cleaned)
 
         except Exception:
             pass
 
     def _monitor_loop(self):
-        """Monitor log files for new content (runs in thread)."""
+        """Tail log files as they change (runs in thread)."""
+        watcher = self._watcher
+        changed = None  # first pass: catch up on every service
         while not self._stop_event.is_set():
-            for key in self.states.keys():
+            if changed is None or "*" in changed:
+                keys = list(self.states.keys())
+            else:
+                keys = [name[:-4] for name in changed if name[:-4] in self.states]
+            for key in keys:
                 if self._stop_event.is_set():
                     break
                 self._read_new_log_lines(key)
 
-            self._stop_event.wait(timeout=self.monitor_interval)
+            changed = watcher.wait(self.monitor_interval)
 
     @staticmethod
     def _strip_ansi_codes(text: str) -> str:
         """Remove ANSI escape sequences (color codes) from text."""
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        if '\x1b' not in text:
+            return text
+        return LogManager._ANSI_ESCAPE.sub('', text)
 
     @staticmethod
     def _strip_ansi_artifacts(text: str) -> str:
@@ -321,8 +386,9 @@ class LogManager:
         Remove common SGR-like artifacts that may appear without the ESC prefix,
         such as "[2m", "[36m", "[1m", "[22m", etc.
         """
-        ansi_fragment = re.compile(r'\[[0-9;]{1,5}m')
-        return ansi_fragment.sub('', text)
+        if '[' not in text:
+            return text
+        return LogManager._ANSI_FRAGMENT.sub('', text)
 
     @staticmethod
     def _detect_error(line: str) -> bool:
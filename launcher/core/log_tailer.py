@@ -0,0 +1,232 @@
+"""
+Log Tailer - incremental tailing of service console log files.
+
+Keeps one open handle per log file and reads only the bytes appended since
+the last read. Rotation (file replaced) and truncation (file cleared) are
+detected from the file's identity and size.
+
+Change notification comes from a directory watcher:
+- InotifyWatcher (Linux, via libc - no extra dependency) wakes up only for
+  files that actually changed.
+- PollingWatcher (everywhere else) wakes every interval and reports files
+  whose size/mtime/identity moved, using stat() only.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class FileTail:
+    """Incremental reader for one append-only text file."""
+
+    def __init__(self, path: Path, position: int = 0):
+        self.path = Path(path)
+        self._handle = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._position = position
+        self._partial = b""
+
+    def close(self):
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._identity = None
+
+    def reset(self):
+        """Forget the read position (e.g. after the file was cleared)."""
+        self.close()
+        self._position = 0
+        self._partial = b""
+
+    def _open(self, st: os.stat_result):
+        self._handle = open(self.path, "rb")
+        self._identity = (st.st_dev, st.st_ino)
+        if self._position > st.st_size:
+            self._position = 0
+        self._handle.seek(self._position)
+
+    def read_lines(self) -> List[str]:
+        """Complete lines appended since the last call (partial last line is held)."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+
+        chunks: List[bytes] = []
+        if self._handle is not None and self._identity != (st.st_dev, st.st_ino):
+            # Rotated: drain whatever was still written to the old file,
+            # then follow the new one from its start.
+            chunks.append(self._handle.read())
+            self.close()
+            self._position = 0
+        elif self._handle is not None and st.st_size < self._position:
+            # Truncated in place.
+            self._handle.seek(0)
+            self._position = 0
+            self._partial = b""
+
+        if self._handle is None:
+            self._open(st)
+
+        data = self._handle.read()
+        self._position = self._handle.tell()
+        chunks.append(data)
+
+        buffered = self._partial + b"".join(chunks)
+        if not buffered:
+            return []
+        *complete, self._partial = buffered.split(b"\n")
+        return [line.decode("utf-8", errors="replace") for line in complete]
+
+
+def read_last_lines(path: Path, max_lines: int, block_size: int = 64 * 1024) -> List[str]:
+    """Last ``max_lines`` lines of a file, reading backwards from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        pos = end
+        blocks: List[bytes] = []
+        newlines = 0
+        while pos > 0 and newlines <= max_lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    data = b"".join(reversed(blocks))
+    lines = data.split(b"\n")
+    if pos > 0:
+        lines = lines[1:]  # first line may be cut mid-way
+    if lines and lines[-1] == b"":
+        lines.pop()
+    return [line.decode("utf-8", errors="replace") for line in lines[-max_lines:]]
+
+
+class PollingWatcher:
+    """Stat-based change detection for ``*.log`` files in one directory."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._seen: Dict[str, Tuple[int, int, int, int]] = {}
+        self._wake = threading.Event()
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Block up to ``timeout`` then return the names of changed log files."""
+        if self._wake.wait(timeout):
+            self._wake.clear()
+        changed: Set[str] = set()
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return changed
+        for entry in entries:
+            if not entry.name.endswith(".log"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            sig = (st.st_ino, st.st_dev, st.st_size, st.st_mtime_ns)
+            if self._seen.get(entry.name) != sig:
+                self._seen[entry.name] = sig
+                changed.add(entry.name)
+        return changed
+
+    def wakeup(self):
+        self._wake.set()
+
+    def close(self):
+        self._wake.set()
+
+
+class InotifyWatcher:
+    """inotify watch on one directory (Linux only)."""
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_Q_OVERFLOW = 0x00004000
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self._IN_MODIFY | self._IN_CLOSE_WRITE | self._IN_MOVED_TO | self._IN_CREATE
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(self.directory), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(err, f"inotify_add_watch failed for {self.directory}")
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Block until a log file changes (or ``timeout``); return changed names."""
+        changed: Set[str] = set()
+        try:
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        except (OSError, ValueError):
+            return changed
+        if self._wake_r in ready:
+            try:
+                os.read(self._wake_r, 512)
+            except BlockingIOError:
+                pass
+        if self._fd not in ready:
+            return changed
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + self._EVENT_HEADER.size <= len(data):
+                _wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+                offset += length
+                if mask & self._IN_Q_OVERFLOW:
+                    changed.add("*")
+                elif name.endswith(".log"):
+                    changed.add(name)
+        return changed
+
+    def wakeup(self):
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def close(self):
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def create_watcher(directory: Path, prefer_inotify: bool = True):
+    """InotifyWatcher where available, PollingWatcher otherwise."""
+    if prefer_inotify and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory)
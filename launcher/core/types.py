@@ -2,9 +2,10 @@
 Core types and enums for the launcher.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, List, Dict, Optional, Callable
+from typing import Any, Deque, List, Dict, Optional, Callable
 
 
 class HealthStatus(Enum):
@@ -91,8 +92,8 @@ class ServiceState:
     externally_managed: bool = False     # Running outside launcher control
     requested_running: Optional[bool] = None  # None=unknown, True=user started, False=user stopped
 
-    # Log buffer (limited size, in-memory)
-    log_buffer: List[str] = field(default_factory=list)
+    # Log buffer (ring buffer, sized by LogManager)
+    log_buffer: Deque[str] = field(default_factory=lambda: deque(maxlen=5000))
     max_log_lines: int = 5000
 
 
@@ -10,8 +10,11 @@ Supports a minimal subset of actions:
 - swipe
 - screenshot
 
-Uses UIAutomator2 for element-based interactions (more reliable than raw ADB).
-Falls back to ADB for basic commands (tap, swipe, keyevent).
+Element-based steps (wait/click/if-exists) resolve selectors against a cached,
+indexed UI snapshot (see ui_snapshot.py); the hierarchy is dumped via
+UIAutomator2 (more reliable than raw ADB), with direct UIAutomator2 selectors
+as the fallback when no dump is available. ADB handles basic commands (tap,
+swipe, keyevent).
 """
 import asyncio
 from dataclasses import dataclass
@@ -24,11 +27,22 @@ from pixsim7.backend.main.shared.logging import get_backend_logger
 from pixsim7.automation.domain import AppActionPreset
 from .adb import ADB
 from .uia2 import UIA2
-import re
+from .ui_snapshot import UiSnapshotCache
 import xml.etree.ElementTree as ET
 
 logger = get_backend_logger("automation.action_executor")
 
+# Actions that cannot change what is on screen by themselves. Every other
+# action invalidates the device's cached UI snapshot once it has run.
+_UI_READ_ONLY_ACTIONS = frozenset({
+    "screenshot",
+    "wait_for_element",
+    "if_element_exists",
+    "if_element_not_exists",
+    "repeat",
+    "call_preset",
+})
+
 
 @dataclass
 class ExecutionContext:
@@ -78,6 +92,14 @@ class ActionExecutor:
         self.adb = adb or ADB()
         self._screen_size_cache: Dict[str, tuple[int, int]] = {}
         self._preset_loader = preset_loader
+        self.ui_cache = UiSnapshotCache(self._dump_ui)
+
+    async def _dump_ui(self, serial: str) -> str:
+        """UI hierarchy XML for the snapshot cache (UIAutomator2, then ADB)."""
+        xml_text = await UIA2.dump_hierarchy(serial)
+        if not xml_text:
+            xml_text = await self.adb.dump_ui_xml(serial)
+        return xml_text
 
     async def _get_screen_size(self, serial: str) -> tuple[int, int]:
         """Get cached screen size for a device."""
@@ -155,58 +177,6 @@ class ActionExecutor:
         except Exception:
             return None
 
-    def _parse_bounds(self, bounds: str) -> tuple[int, int, int, int] | None:
-        # Bounds like: [x1,y1][x2,y2]
-        m = re.match(r"\[(\d+),(\d+)\]\[(\d+),(\d+)\]", bounds or "")
-        if not m:
-            return None
-        x1, y1, x2, y2 = map(int, m.groups())
-        return x1, y1, x2, y2
-
-    def _match_text(self, actual: str | None, pattern: str, mode: str = "exact") -> bool:
-        """Match text based on match mode"""
-        if actual is None:
-            return False
-        if mode == "exact":
-            return actual == pattern
-        elif mode == "contains":
-            return pattern in actual
-        elif mode == "starts_with":
-            return actual.startswith(pattern)
-        elif mode == "ends_with":
-            return actual.endswith(pattern)
-        elif mode == "regex":
-            try:
-                return re.search(pattern, actual) is not None
-            except re.error:
-                return False
-        return actual == pattern  # Default to exact
-
-    def _find_element(
-        self,
-        root: ET.Element,
-        resource_id: str | None = None,
-        text: str | None = None,
-        text_match_mode: str = "exact",
-        content_desc: str | None = None,
-        content_desc_match_mode: str = "exact",
-    ) -> ET.Element | None:
-        # Iterate nodes; UI dump uses nodes named 'node' with attributes: resource-id, text, content-desc, bounds
-        for node in root.iter():
-            rid = node.attrib.get("resource-id")
-            txt = node.attrib.get("text")
-            desc = node.attrib.get("content-desc")
-            # Resource ID is always exact match
-            if resource_id and rid == resource_id:
-                return node
-            # Text with match mode
-            if text and self._match_text(txt, text, text_match_mode):
-                return node
-            # Content desc with match mode
-            if content_desc and self._match_text(desc, content_desc, content_desc_match_mode):
-                return node
-        return None
-
     async def wait_for_element(
         self,
         serial: str,
@@ -218,16 +188,18 @@ class ActionExecutor:
         timeout: float = 10.0,
         interval: float = 0.5,
     ) -> bool:
-        """Wait for element using UIAutomator2 (more reliable than ADB dump)."""
-        return await UIA2.wait_for_element(
-            serial,
+        """Poll the UI snapshot until the element appears (re-parses only on change)."""
+        selector = dict(
             resource_id=resource_id,
             text=text,
             text_match_mode=text_match_mode,
             content_desc=content_desc,
             content_desc_match_mode=content_desc_match_mode,
-            timeout=timeout,
         )
+        if await self.ui_cache.snapshot(serial) is None:
+            return await UIA2.wait_for_element(serial, timeout=timeout, **selector)
+        element = await self.ui_cache.wait_for(serial, timeout=timeout, interval=interval, **selector)
+        return element is not None
 
     async def click_element(
         self,
@@ -238,15 +210,23 @@ class ActionExecutor:
         content_desc: str | None = None,
         content_desc_match_mode: str = "exact",
     ) -> bool:
-        """Click element using UIAutomator2 (more reliable than ADB dump)."""
-        return await UIA2.click_element(
-            serial,
+        """Tap the center of an element resolved from the UI snapshot."""
+        selector = dict(
             resource_id=resource_id,
             text=text,
             text_match_mode=text_match_mode,
             content_desc=content_desc,
             content_desc_match_mode=content_desc_match_mode,
         )
+        snapshot = await self.ui_cache.snapshot(serial)
+        if snapshot is None:
+            return await UIA2.click_element(serial, **selector)
+        element = snapshot.index.find(**selector)
+        if element is None or element.center is None:
+            return False
+        await self.adb.input_tap(serial, *element.center)
+        self.ui_cache.invalidate(serial)
+        return True
 
     async def element_exists(
         self,
@@ -257,17 +237,19 @@ class ActionExecutor:
         content_desc: str | None = None,
         content_desc_match_mode: str = "exact",
     ) -> bool:
-        """Check if element exists using UIAutomator2."""
-        el = await UIA2.find_element(
-            serial,
+        """Check if element exists in the current UI snapshot."""
+        selector = dict(
             resource_id=resource_id,
             text=text,
             text_match_mode=text_match_mode,
             content_desc=content_desc,
             content_desc_match_mode=content_desc_match_mode,
-            timeout=0,  # No wait, just check
         )
-        return el is not None
+        snapshot = await self.ui_cache.snapshot(serial)
+        if snapshot is None:
+            el = await UIA2.find_element(serial, timeout=0, **selector)  # No wait, just check
+            return el is not None
+        return snapshot.index.find(**selector) is not None
 
     async def execute_action(self, action: Dict[str, Any], ctx: ExecutionContext, preset: AppActionPreset, action_index: int = 0) -> None:
         """Execute a single action (supports nesting)"""
@@ -543,6 +525,9 @@ class ActionExecutor:
                 action_params=params,
                 action_path=full_path
             ) from e
+        finally:
+            if a_type not in _UI_READ_ONLY_ACTIONS:
+                self.ui_cache.invalidate(ctx.serial)
 
     async def execute(self, preset: AppActionPreset, ctx: ExecutionContext) -> None:  # type: ignore[override]
         """Execute all actions in a preset"""
@@ -1,16 +1,39 @@
 """
 Minimal ADB utilities (async wrappers)
+
+Two transports (``settings.adb_transport``):
+- ``server`` (default): speak the adb server socket protocol directly
+  (see adb_protocol.py) - no process per command. If the server socket
+  cannot be opened the call falls back to the ``adb`` binary, which also
+  starts the server for the next call. Failures after the request was sent
+  are not retried through the binary: the command may already have run.
+- ``subprocess``: run the ``adb`` binary for every command.
 """
 import asyncio
 import subprocess
 from typing import List, Tuple, Optional
 from pathlib import Path
 from pixsim7.backend.main.shared.config import settings
+from pixsim7.backend.main.shared.logging import get_backend_logger
+
+from .adb_protocol import AdbProtocolError, AdbServerClient, AdbServerUnavailable
+
+logger = get_backend_logger("automation.adb")
+
+# Server refused the request, dropped the stream mid-way or stopped answering
+# (read timeout). A tap or launch may already have run, so no replay.
+_SERVER_REQUEST_ERRORS = (AdbProtocolError, asyncio.IncompleteReadError, OSError)
+# Server not reachable at all (connect failed): fall back to the adb binary.
+_SERVER_UNAVAILABLE_ERRORS = (AdbServerUnavailable,)
 
 
 class ADB:
-    def __init__(self, adb_path: Optional[str] = None):
+    def __init__(self, adb_path: Optional[str] = None, transport: Optional[str] = None):
         self.adb_path = adb_path or settings.adb_path
+        self.transport = transport or settings.adb_transport
+        self._server: Optional[AdbServerClient] = None
+        if self.transport == "server":
+            self._server = AdbServerClient(settings.adb_server_host, settings.adb_server_port)
 
     def _run_sync(self, args: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
         """Synchronous subprocess execution (used via asyncio.to_thread)"""
@@ -25,14 +48,40 @@ class ADB:
         """Run ADB command in thread pool to avoid Windows asyncio subprocess issues"""
         return await asyncio.to_thread(self._run_sync, args, capture_output)
 
+    def _server_unavailable(self, op: str, error: Exception) -> None:
+        logger.warning(
+            "adb_server_unavailable_fallback",
+            op=op,
+            host=self._server.host,
+            port=self._server.port,
+            error=str(error) or type(error).__name__,
+        )
+
     async def connect(self, host_port: str) -> bool:
         """Connect to a device via TCP/IP. Returns True if successful."""
+        if self._server:
+            try:
+                out = await self._server.connect(host_port)
+            except _SERVER_REQUEST_ERRORS:
+                return False
+            except _SERVER_UNAVAILABLE_ERRORS as e:
+                self._server_unavailable("connect", e)
+            else:
+                # "failed to connect to ..." also contains "connect to"
+                return "failed" not in out.lower() and "connected to" in out.lower()
         code, out, err = await self._run(["connect", host_port])
         # Success if output contains "connected to" or "already connected"
         return code == 0 and ("connected to" in out.lower() or "already connected" in out.lower())
 
     async def devices(self) -> List[tuple[str, str]]:
         """Return list of (serial, state) from `adb devices`."""
+        if self._server:
+            try:
+                return await self._server.devices()
+            except _SERVER_REQUEST_ERRORS:
+                return []
+            except _SERVER_UNAVAILABLE_ERRORS as e:
+                self._server_unavailable("devices", e)
         code, out, _ = await self._run(["devices"])
         lines = out.splitlines()
         devices: List[tuple[str, str]] = []
@@ -46,6 +95,14 @@ class ADB:
         return devices
 
     async def shell(self, serial: str, *cmd: str) -> Tuple[int, str, str]:
+        if self._server:
+            try:
+                # The adb binary joins shell args with spaces as well.
+                return await self._server.shell(serial, " ".join(cmd))
+            except _SERVER_REQUEST_ERRORS as e:
+                return 1, "", f"error: {e}"
+            except _SERVER_UNAVAILABLE_ERRORS as e:
+                self._server_unavailable("shell", e)
         return await self._run(["-s", serial, "shell", *cmd])
 
     def _exec_out_sync(self, serial: str, *cmd: str) -> bytes:
@@ -57,7 +114,14 @@ class ADB:
         return result.stdout or b""
 
     async def exec_out(self, serial: str, *cmd: str) -> bytes:
-        """Run ADB exec-out command in thread pool"""
+        """Run ADB exec-out command (raw binary stdout)"""
+        if self._server:
+            try:
+                return await self._server.exec_out(serial, " ".join(cmd))
+            except _SERVER_REQUEST_ERRORS:
+                return b""
+            except _SERVER_UNAVAILABLE_ERRORS as e:
+                self._server_unavailable("exec_out", e)
         return await asyncio.to_thread(self._exec_out_sync, serial, *cmd)
 
     async def input_tap(self, serial: str, x: int, y: int) -> None:
@@ -114,12 +178,13 @@ class ADB:
         return dest_path
 
     async def dump_ui_xml(self, serial: str) -> str:
-        # Dump the current UI hierarchy (no delete - just overwrite)
-        code, out, err = await self.shell(serial, "uiautomator", "dump", "/sdcard/uidump.xml")
-        # Wait for dump to complete
-        import asyncio
-        await asyncio.sleep(0.3)
-        data = await self.exec_out(serial, "cat", "/sdcard/uidump.xml")
+        # Dump the current UI hierarchy (no delete - just overwrite) and read it
+        # back in the same shell: `uiautomator dump` returns once the file is
+        # written, so `&&` is the completion signal - no fixed sleep, one call.
+        data = await self.exec_out(
+            serial,
+            "uiautomator dump /sdcard/uidump.xml >/dev/null && cat /sdcard/uidump.xml",
+        )
         return data.decode("utf-8", errors="ignore")
 
     async def get_screen_size(self, serial: str) -> Tuple[int, int]:
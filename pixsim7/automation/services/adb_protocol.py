@@ -0,0 +1,205 @@
+"""
+ADB server wire-protocol client.
+
+Talks to the local adb server (default 127.0.0.1:5037) over its socket
+protocol instead of spawning an ``adb`` process per command. Every command
+is one short-lived socket; the server multiplexes them over its existing
+device transports, so concurrent taps/dumps across many devices cost a
+connect() each rather than a fork/exec.
+
+Protocol summary:
+- request:  4 hex digit length + ASCII payload
+- reply:    ``OKAY`` or ``FAIL`` + 4 hex digit length + message
+- ``host:transport:<serial>`` switches the socket to a device, after which a
+  device service (``shell,v2,raw:<cmd>``, ``exec:<cmd>``...) is requested.
+- shell v2 output is framed as ``[id:1][len:4 LE][data]`` packets; id 1 is
+  stdout, 2 stderr, 3 the exit code.
+"""
+import asyncio
+import struct
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_ADB_SERVER_HOST = "127.0.0.1"
+DEFAULT_ADB_SERVER_PORT = 5037
+
+_SHELL_STDOUT = 1
+_SHELL_STDERR = 2
+_SHELL_EXIT = 3
+
+
+class AdbProtocolError(RuntimeError):
+    """The adb server rejected a request (FAIL reply) or broke protocol."""
+
+
+class AdbServerUnavailable(RuntimeError):
+    """The adb server socket could not be opened (nothing sent yet)."""
+
+
+class AdbServerClient:
+    """Async client for the adb server socket protocol."""
+
+    # Whether each device's adbd speaks shell v2 (old Android images do not).
+    # Shared across clients since every ADB() builds its own.
+    _shell_v2: Dict[Tuple[str, int, str], bool] = {}
+
+    def __init__(
+        self,
+        host: str = DEFAULT_ADB_SERVER_HOST,
+        port: int = DEFAULT_ADB_SERVER_PORT,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        # Bounds a whole command once connected (uiautomator dumps and
+        # screencaps take seconds; a wedged adbd would otherwise hang forever).
+        self.read_timeout = read_timeout
+
+    async def _open(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.connect_timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise AdbServerUnavailable(str(e) or type(e).__name__) from e
+
+    async def _bounded(self, awaitable):
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.read_timeout)
+        except asyncio.TimeoutError as e:
+            raise AdbProtocolError(f"no reply from adb server within {self.read_timeout}s") from e
+
+    @staticmethod
+    async def _request(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        payload: str,
+    ) -> None:
+        data = payload.encode("utf-8")
+        writer.write(b"%04x" % len(data) + data)
+        await writer.drain()
+        status = await reader.readexactly(4)
+        if status == b"OKAY":
+            return
+        if status == b"FAIL":
+            raise AdbProtocolError(await AdbServerClient._read_string(reader))
+        raise AdbProtocolError(f"unexpected adb server reply {status!r} to {payload!r}")
+
+    @staticmethod
+    async def _read_string(reader: asyncio.StreamReader) -> str:
+        length = int(await reader.readexactly(4), 16)
+        return (await reader.readexactly(length)).decode("utf-8", errors="replace")
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+    async def host_query(self, service: str) -> str:
+        """Run a ``host:`` service that answers with one length-prefixed string."""
+        return await self._bounded(self._host_query(service))
+
+    async def _host_query(self, service: str) -> str:
+        reader, writer = await self._open()
+        try:
+            await self._request(reader, writer, service)
+            return await self._read_string(reader)
+        finally:
+            await self._close(writer)
+
+    async def _open_device_service(
+        self, serial: str, service: str
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await self._open()
+        try:
+            await self._request(reader, writer, f"host:transport:{serial}")
+            await self._request(reader, writer, service)
+        except BaseException:
+            await self._close(writer)
+            raise
+        return reader, writer
+
+    async def devices(self) -> List[Tuple[str, str]]:
+        out = await self.host_query("host:devices")
+        devices: List[Tuple[str, str]] = []
+        for line in out.splitlines():
+            if "\t" in line:
+                serial, state = line.strip().split("\t", 1)
+                devices.append((serial, state))
+        return devices
+
+    async def connect(self, host_port: str) -> str:
+        return await self.host_query(f"host:connect:{host_port}")
+
+    async def exec_out(self, serial: str, command: str) -> bytes:
+        """Raw stdout of ``command``, streamed until the device closes it."""
+        return await self._bounded(self._exec_out(serial, command))
+
+    async def _exec_out(self, serial: str, command: str) -> bytes:
+        reader, writer = await self._open_device_service(serial, f"exec:{command}")
+        try:
+            return await reader.read()
+        finally:
+            await self._close(writer)
+
+    async def supports_shell_v2(self, serial: str) -> bool:
+        key = (self.host, self.port, serial)
+        cached = self._shell_v2.get(key)
+        if cached is None:
+            features = await self.host_query(f"host-serial:{serial}:features")
+            cached = self._shell_v2[key] = "shell_v2" in features.split(",")
+        return cached
+
+    async def shell(self, serial: str, command: str) -> Tuple[int, str, str]:
+        """Run ``command`` and return (exit_code, stdout, stderr)."""
+        return await self._bounded(self._shell(serial, command))
+
+    async def _shell(self, serial: str, command: str) -> Tuple[int, str, str]:
+        if await self.supports_shell_v2(serial):
+            reader, writer = await self._open_device_service(serial, f"shell,v2,raw:{command}")
+            try:
+                return await self._read_shell_v2(reader)
+            finally:
+                await self._close(writer)
+
+        # Legacy shell: stdout and stderr merged, no exit status.
+        reader, writer = await self._open_device_service(serial, f"shell:{command}")
+        try:
+            out = await reader.read()
+        finally:
+            await self._close(writer)
+        return 0, out.decode("utf-8", errors="replace"), ""
+
+    @staticmethod
+    async def _read_shell_v2(reader: asyncio.StreamReader) -> Tuple[int, str, str]:
+        stdout = bytearray()
+        stderr = bytearray()
+        exit_code: Optional[int] = None
+        while True:
+            try:
+                header = await reader.readexactly(5)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    raise AdbProtocolError("truncated shell v2 packet header") from e
+                break
+            packet_id, length = struct.unpack("<BI", header)
+            data = await reader.readexactly(length) if length else b""
+            if packet_id == _SHELL_STDOUT:
+                stdout += data
+            elif packet_id == _SHELL_STDERR:
+                stderr += data
+            elif packet_id == _SHELL_EXIT:
+                exit_code = data[0] if data else 0
+                break
+        if exit_code is None:
+            raise AdbProtocolError("shell v2 stream closed without an exit status")
+        return (
+            exit_code,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
@@ -0,0 +1,232 @@
+"""
+Per-device UI snapshot cache with a parsed element index.
+
+A snapshot is one UI hierarchy dump parsed into an index by resource-id,
+text and content-desc, so exact selectors resolve with a dict lookup and
+other match modes scan only the pre-extracted attributes.
+
+- Snapshots are reused while fresh (``max_age``) and until ``invalidate()``
+  is called. ActionExecutor invalidates after every action that can change
+  the screen.
+- Dumps are keyed by content hash. An unchanged screen, or a screen seen
+  again, skips XML parsing; only the dump itself is paid for.
+- ``wait_for`` polls dumps at ``interval`` and re-parses only when the dump
+  actually changed.
+"""
+import asyncio
+import hashlib
+import re
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pixsim7.backend.main.shared.logging import get_backend_logger
+
+logger = get_backend_logger("automation.ui_snapshot")
+
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+def parse_bounds(bounds: str) -> Optional[Tuple[int, int, int, int]]:
+    """``"[x1,y1][x2,y2]"`` -> (x1, y1, x2, y2)."""
+    m = _BOUNDS_RE.match(bounds or "")
+    if not m:
+        return None
+    x1, y1, x2, y2 = map(int, m.groups())
+    return x1, y1, x2, y2
+
+
+def match_text(actual: Optional[str], pattern: str, mode: str = "exact") -> bool:
+    """Match text based on match mode"""
+    if actual is None:
+        return False
+    if mode == "exact":
+        return actual == pattern
+    elif mode == "contains":
+        return pattern in actual
+    elif mode == "starts_with":
+        return actual.startswith(pattern)
+    elif mode == "ends_with":
+        return actual.endswith(pattern)
+    elif mode == "regex":
+        # Whole-text match, like the other modes; use ".*" for a substring.
+        try:
+            return re.fullmatch(pattern, actual) is not None
+        except re.error:
+            return False
+    return actual == pattern  # Default to exact
+
+
+@dataclass(frozen=True)
+class UiElement:
+    text: str
+    resource_id: str
+    content_desc: str
+    class_name: str
+    bounds: Optional[Tuple[int, int, int, int]]
+
+    @property
+    def center(self) -> Optional[Tuple[int, int]]:
+        if not self.bounds:
+            return None
+        x1, y1, x2, y2 = self.bounds
+        return (x1 + x2) // 2, (y1 + y2) // 2
+
+
+@dataclass
+class UiIndex:
+    """Parsed elements of one dump, indexed by exact attribute value."""
+    elements: List[UiElement] = field(default_factory=list)
+    by_resource_id: Dict[str, List[UiElement]] = field(default_factory=dict)
+    by_text: Dict[str, List[UiElement]] = field(default_factory=dict)
+    by_content_desc: Dict[str, List[UiElement]] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, xml_text: str) -> Optional["UiIndex"]:
+        try:
+            root = ET.fromstring(xml_text)
+        except ET.ParseError:
+            return None
+        index = cls()
+        for node in root.iter("node"):
+            attrib = node.attrib
+            element = UiElement(
+                text=attrib.get("text", ""),
+                resource_id=attrib.get("resource-id", ""),
+                content_desc=attrib.get("content-desc", ""),
+                class_name=attrib.get("class", ""),
+                bounds=parse_bounds(attrib.get("bounds", "")),
+            )
+            index.elements.append(element)
+            if element.resource_id:
+                index.by_resource_id.setdefault(element.resource_id, []).append(element)
+            if element.text:
+                index.by_text.setdefault(element.text, []).append(element)
+            if element.content_desc:
+                index.by_content_desc.setdefault(element.content_desc, []).append(element)
+        return index
+
+    def find(
+        self,
+        resource_id: Optional[str] = None,
+        text: Optional[str] = None,
+        text_match_mode: str = "exact",
+        content_desc: Optional[str] = None,
+        content_desc_match_mode: str = "exact",
+    ) -> Optional[UiElement]:
+        """First element (document order) matching every given criterion."""
+        if not (resource_id or text or content_desc):
+            return None
+
+        # Start from the narrowest exact-match bucket, then check the rest.
+        if resource_id:
+            candidates = self.by_resource_id.get(resource_id, [])
+        elif text and text_match_mode == "exact":
+            candidates = self.by_text.get(text, [])
+        elif content_desc and content_desc_match_mode == "exact":
+            candidates = self.by_content_desc.get(content_desc, [])
+        else:
+            candidates = self.elements
+
+        for element in candidates:
+            if resource_id and element.resource_id != resource_id:
+                continue
+            if text and not match_text(element.text, text, text_match_mode):
+                continue
+            if content_desc and not match_text(element.content_desc, content_desc, content_desc_match_mode):
+                continue
+            return element
+        return None
+
+
+@dataclass
+class UiSnapshot:
+    digest: str
+    index: UiIndex
+    captured_at: float
+
+
+class UiSnapshotCache:
+    """
+    Snapshot per device serial, plus a small LRU of parsed indexes by dump
+    hash shared across devices (same app screen, same XML).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[str]],
+        *,
+        max_age: float = 1.0,
+        max_indexes: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self.max_age = max_age
+        self._max_indexes = max_indexes
+        self._clock = clock
+        self._snapshots: Dict[str, UiSnapshot] = {}
+        self._indexes: "OrderedDict[str, UiIndex]" = OrderedDict()
+        self.dumps = 0
+        self.parses = 0
+
+    def invalidate(self, serial: Optional[str] = None) -> None:
+        if serial is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(serial, None)
+
+    async def snapshot(self, serial: str, *, refresh: bool = False) -> Optional[UiSnapshot]:
+        """Current snapshot for ``serial``; None if the dump could not be parsed."""
+        cached = self._snapshots.get(serial)
+        now = self._clock()
+        if cached and not refresh and now - cached.captured_at <= self.max_age:
+            return cached
+
+        xml_text = await self._fetch(serial)
+        self.dumps += 1
+        digest = hashlib.blake2b(xml_text.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+        index = self._indexes.get(digest)
+        if index is None:
+            index = UiIndex.parse(xml_text)
+            if index is None:
+                self._snapshots.pop(serial, None)
+                logger.debug("ui_snapshot_unparseable", serial=serial, size=len(xml_text))
+                return None
+            self.parses += 1
+            self._indexes[digest] = index
+            if len(self._indexes) > self._max_indexes:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(digest)
+
+        snapshot = UiSnapshot(digest=digest, index=index, captured_at=now)
+        self._snapshots[serial] = snapshot
+        return snapshot
+
+    async def find(self, serial: str, *, refresh: bool = False, **selector) -> Optional[UiElement]:
+        snapshot = await self.snapshot(serial, refresh=refresh)
+        return snapshot.index.find(**selector) if snapshot else None
+
+    async def wait_for(
+        self,
+        serial: str,
+        *,
+        timeout: float = 10.0,
+        interval: float = 0.5,
+        **selector,
+    ) -> Optional[UiElement]:
+        """Poll until an element matching ``selector`` appears or ``timeout`` passes."""
+        deadline = self._clock() + max(0.0, timeout)
+        refresh = False
+        while True:
+            snapshot = await self.snapshot(serial, refresh=refresh)
+            if snapshot:
+                element = snapshot.index.find(**selector)
+                if element is not None:
+                    return element
+            if self._clock() >= deadline:
+                return None
+            await asyncio.sleep(max(0.0, min(interval, deadline - self._clock())))
+            refresh = True
@@ -23,6 +23,9 @@ Configuration (env vars, with sensible defaults):
   (the launcher auto-derives this from the daemon's PIXSIM_EMBEDDING_PORT and
   injects it into every service process)
 - PIXSIM_EMBEDDING_MODEL_ID — model identifier recorded on each image vector row
+- PIXSIM_EMBEDDING_WIRE_ENCODING — response encoding asked of both daemons:
+  ``f32`` (default; binary, lossless), ``f16`` (binary, half the bytes) or
+  ``json``
 
 The image path is an HTTP client to the standalone `embedding-daemon` service
 (launcher-managed, one GPU-resident model shared across all consumers).
@@ -57,12 +60,19 @@ logger = logging.getLogger(__name__)
 _DEFAULT_URL = "http://localhost:8002"
 _DEFAULT_MODEL_ID = "google/siglip2-large-patch16-384"
 _DEFAULT_TEXT_MODEL_ID = "BAAI/bge-base-en-v1.5"
+_DEFAULT_WIRE_ENCODING = "f32"
+
+
+def _wire_encoding() -> str:
+    return os.environ.get("PIXSIM_EMBEDDING_WIRE_ENCODING", _DEFAULT_WIRE_ENCODING)
 
 
 def _build_image_service() -> EmbeddingService:
     base_url = os.environ.get("PIXSIM_EMBEDDING_BASE_URL", _DEFAULT_URL)
     model_id = os.environ.get("PIXSIM_EMBEDDING_MODEL_ID", _DEFAULT_MODEL_ID)
-    return HttpEmbeddingService(base_url=base_url, model_id=model_id)
+    return HttpEmbeddingService(
+        base_url=base_url, model_id=model_id, wire_encoding=_wire_encoding()
+    )
 
 
 def _build_text_daemon_service() -> EmbeddingService | None:
@@ -74,7 +84,9 @@ def _build_text_daemon_service() -> EmbeddingService | None:
     if not base_url:
         return None
     model_id = os.environ.get("PIXSIM_TEXT_EMBED_MODEL", _DEFAULT_TEXT_MODEL_ID)
-    return HttpTextEmbeddingService(base_url=base_url, model_id=model_id)
+    return HttpTextEmbeddingService(
+        base_url=base_url, model_id=model_id, wire_encoding=_wire_encoding()
+    )
 
 
 def _extract_bare_model(model_id: str) -> str:
@@ -17,7 +17,7 @@ import time
 from datetime import datetime, timezone
 from fastapi import APIRouter, Response, Request, status as http_status
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Any, Literal
 
 from pixsim7.backend.main.shared.config import settings
 
@@ -56,6 +56,7 @@ class HealthResponse(BaseModel):
     database: str
     redis: str
     providers: list[str]
+    websocket: dict[str, Any] | None = None
 
 
 class ReadinessResponse(BaseModel):
@@ -107,6 +108,7 @@ async def health_check():
     from pixsim7.backend.main.infrastructure.redis import check_redis_connection
     from pixsim7.backend.main.services.provider import registry
     from pixsim7.backend.main.infrastructure.database.session import get_async_session
+    from pixsim7.backend.main.infrastructure.websocket import connection_manager
     from sqlalchemy import text
 
     _t0 = time.perf_counter()
@@ -149,7 +151,8 @@ async def health_check():
         status=overall_status,
         database=db_status,
         redis=redis_status,
-        providers=registry.list_provider_ids()
+        providers=registry.list_provider_ids(),
+        websocket=connection_manager.get_stats(),
     )
 
 
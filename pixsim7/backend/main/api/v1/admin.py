@@ -440,6 +440,25 @@ async def get_event_metrics(admin: CurrentAdminUser):
         }
 
 
+# ===== WEBSOCKET METRICS =====
+
+@router.get("/admin/websocket/connections")
+async def get_websocket_connections(admin: CurrentAdminUser):
+    """
+    Get websocket outbound-queue metrics
+
+    Returns the aggregate stats served on /health plus per-connection
+    queue depth and counters (with user ids, hence admin-only).
+    """
+    from pixsim7.backend.main.infrastructure.websocket import connection_manager
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "stats": connection_manager.get_stats(),
+        "connections": connection_manager.get_connection_stats(),
+    }
+
+
 # ===== LOG MANAGEMENT =====
 
 @router.get("/admin/logs", response_model=LogQueryResponse)
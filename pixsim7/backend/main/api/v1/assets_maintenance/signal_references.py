@@ -129,3 +129,21 @@ async def list_signal_references(
             )
         )
     return SignalReferenceListResponse(items=items, total=len(items))
+
+
+@router.post("/signal-references/rematch")
+async def rematch_signal_references(
+    admin: CurrentAdminUser,
+    db: DatabaseSession,
+) -> dict:
+    """Re-apply the current `signalref:*` references to every scored video.
+
+    The fast path after curating references: matches all stored fingerprints in
+    bulk and rewrites only the clips whose match/score moved — no ffmpeg, no
+    render-baseline refresh (use the rescore run for that). See
+    services/asset/signal_rematch.py.
+    """
+    from pixsim7.backend.main.services.asset.signal_rematch import rematch_library
+
+    summary = await rematch_library(db, admin.id)
+    return {"success": True, **summary}
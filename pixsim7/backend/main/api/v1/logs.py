@@ -11,7 +11,7 @@ from pydantic import BaseModel, Field
 
 from pixsim7.backend.main.api.dependencies import CurrentAdminUser
 from pixsim7.backend.main.infrastructure.database.session import get_log_db
-from pixsim7.backend.main.services.log_service import LogService
+from pixsim7.backend.main.services.log_service import LogService, encode_log_cursor
 from pixsim7.backend.main.domain import LogEntry
 from pixsim7.backend.main.shared.path_registry import get_path_registry
 from pixsim_logging import get_logger
@@ -135,9 +135,10 @@ class LogEntryResponse(BaseModel):
 class LogQueryResponse(BaseModel):
     """Response from log query."""
     logs: List[LogEntryResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Matching rows; only counted on the first page unless include_total=true")
     limit: int
     offset: int
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next (older) page")
 
 
 class AccountEventResponse(BaseModel):
@@ -279,14 +280,18 @@ async def query_logs(
     end_time: Optional[datetime] = Query(None, description="Logs before this time (ISO 8601)"),
     search: Optional[str] = Query(None, description="Text search in msg and error fields"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (prefer cursor)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
+    include_total: Optional[bool] = Query(None, description="Count matching rows (default: first page only)"),
     db: AsyncSession = Depends(get_log_db),
 ) -> LogQueryResponse:
     """
     Query structured logs with filters.
 
     Supports filtering by service, level, job_id, request_id, trace_id, stage, provider_id, time range, and text search.
-    Returns paginated results ordered by timestamp (newest first).
+    Returns paginated results ordered by timestamp (newest first). Page with
+    ``cursor=next_cursor``; offset paging still works but gets slower the
+    deeper it goes.
     """
     try:
         service_obj = LogService(db)
@@ -305,15 +310,24 @@ async def query_logs(
             end_time=end_time,
             search=search,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
         )
 
+        next_cursor = None
+        if len(logs) == limit:
+            next_cursor = encode_log_cursor(logs[-1].timestamp, logs[-1].id)
+
         return LogQueryResponse(
             logs=[_to_log_entry_response(log) for log in logs],
             total=total,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(
             "log_query_error",
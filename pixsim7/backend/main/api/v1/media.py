@@ -12,6 +12,7 @@ import mimetypes
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
@@ -22,7 +23,7 @@ from pixsim7.backend.main.infrastructure.queue.tasks import queue_and_wait
 from pixsim7.backend.main.services.asset import AssetIngestionService
 from pixsim7.backend.main.services.media import get_media_settings
 from pixsim7.backend.main.services.media.settings import MediaSettings
-from pixsim7.backend.main.services.storage import get_storage_service
+from pixsim7.backend.main.services.storage import get_storage_service, local_file_etag
 from pixsim7.backend.main.services.storage.roots import LOCAL_ROOT_ID
 from pixsim7.backend.main.shared.config import settings as app_settings
 from pixsim7.backend.main.shared.path_registry import get_path_registry
@@ -447,6 +448,69 @@ async def _proxy_archive_stream(storage, key: str, root_id: str, request: Reques
     )
 
 
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """
+    Evaluate a conditional GET against a file's validators (RFC 9110 §13.1).
+
+    ``If-None-Match`` takes precedence (weak comparison, ``*`` matches any);
+    ``If-Modified-Since`` is only consulted when it is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have one-second resolution.
+        return int(mtime) <= since.timestamp()
+    return False
+
+
+async def _serve_local_file(request: Request, file_path: str, key: str, max_age: int) -> Response:
+    """
+    Serve a local file with validators, conditional requests and Range support.
+
+    A single ``stat`` supplies the mtime/size ETag (same as ``get_metadata``),
+    Last-Modified and Content-Length. Matching ``If-None-Match`` /
+    ``If-Modified-Since`` answer 304 without touching the file; otherwise
+    FileResponse streams it (206 for a Range, ``If-Range`` checked against
+    our ETag) — handing the path to the server for sendfile when it supports
+    ``http.response.pathsend``, else reading 64KB chunks off the event loop.
+    The headers go on the returned response itself: FastAPI drops headers
+    set on the injected ``Response`` when a Response object is returned.
+    """
+    try:
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    etag = local_file_etag(stat_result)
+    headers = {
+        "Cache-Control": f"private, max-age={max_age}",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+    }
+    if _not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    content_type, _ = mimetypes.guess_type(key)
+    return FileResponse(
+        path=file_path,
+        headers=headers,
+        media_type=content_type or "application/octet-stream",
+        filename=Path(key).name,
+        stat_result=stat_result,
+    )
+
+
 class MediaTokenResponse(BaseModel):
     """Short-lived token for streaming media via element ``src`` query string."""
     token: str = Field(description="Short-lived media token (carry as ?token=)")
@@ -497,7 +561,8 @@ async def serve_media(
     Storage tiering: media on a non-local root (S3/MinIO archive) is served by
     redirecting to a short-lived presigned URL (default — direct stream), or
     proxy-streamed through the backend (``media_archive_serve_mode='proxy'``).
-    Local media is served via FileResponse as before.
+    Local media is streamed from disk with Range and conditional-request
+    (304) support — see ``_serve_local_file``.
 
     Auto-regeneration: If a thumbnail/preview is missing, automatically
     queues regeneration in background and returns 202 Accepted.
@@ -561,27 +626,12 @@ async def serve_media(
                 )
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Get file metadata
-    metadata = await storage.get_metadata(key, root_id=root_id)
-    if not metadata:
-        raise HTTPException(status_code=404, detail="File not found")
-
-    # Get local path for FileResponse
-    file_path = storage.get_path(key, root_id=root_id)
-
-    # Set caching headers
-    max_age = settings.cache_control_max_age_seconds
-    response.headers["Cache-Control"] = f"private, max-age={max_age}"
-    response.headers["ETag"] = metadata["etag"]
-    response.headers["Last-Modified"] = metadata["modified_at"].strftime(
-        "%a, %d %b %Y %H:%M:%S GMT"
-    )
-
-    # Return file
-    return FileResponse(
-        path=file_path,
-        media_type=metadata["content_type"],
-        filename=Path(key).name,
+    # Stream from disk: never loads the file into the worker.
+    return await _serve_local_file(
+        request,
+        storage.get_path(key, root_id=root_id),
+        key,
+        settings.cache_control_max_age_seconds,
     )
 
 
@@ -626,8 +676,10 @@ async def head_media(
     max_age = settings.cache_control_max_age_seconds
     response.headers["Cache-Control"] = f"private, max-age={max_age}"
     response.headers["ETag"] = metadata["etag"]
-    response.headers["Last-Modified"] = metadata["modified_at"].strftime(
-        "%a, %d %b %Y %H:%M:%S GMT"
+    # modified_at is naive local time for local roots, aware for S3;
+    # .timestamp() handles both, so HEAD and GET agree on Last-Modified.
+    response.headers["Last-Modified"] = formatdate(
+        metadata["modified_at"].timestamp(), usegmt=True
     )
     response.headers["Content-Type"] = metadata["content_type"]
     response.headers["Content-Length"] = str(metadata["size"])
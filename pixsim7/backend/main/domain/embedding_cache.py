@@ -0,0 +1,40 @@
+"""
+Embedding Cache — content-addressed vectors shared across rows and users.
+
+One row per (content sha256, embedder, model, input variant). The embedding
+pipelines look a vector up here before calling a daemon/provider, so duplicate
+media, re-uploads, relocated files and re-imports reuse the vector of the
+first copy instead of paying another forward pass. ``variant`` folds in any
+input-shaping config that changes the vector for the same bytes (e.g. the
+video frame-sampling settings); empty when the content alone determines it.
+
+The vector column is dimension-less because the cache spans embedding spaces
+(768-d text, 1024/1152-d image); ``dim`` records each row's width.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List
+
+from pgvector.sqlalchemy import Vector
+from pydantic import ConfigDict
+from sqlalchemy import Column
+from sqlmodel import Field, SQLModel
+
+from pixsim7.backend.main.shared.datetime_utils import utcnow
+
+
+class EmbeddingCacheEntry(SQLModel, table=True):
+    """A cached vector for one piece of content under one embedder + model."""
+
+    __tablename__ = "embedding_cache"
+    model_config = ConfigDict(protected_namespaces=())
+
+    content_sha256: str = Field(max_length=64, primary_key=True)
+    embedder_id: str = Field(max_length=100, primary_key=True)
+    model_id: str = Field(max_length=100, primary_key=True)
+    variant: str = Field(default="", max_length=64, primary_key=True)
+
+    vector: List[float] = Field(sa_column=Column(Vector(), nullable=False))
+    dim: int
+    created_at: datetime = Field(default_factory=utcnow)
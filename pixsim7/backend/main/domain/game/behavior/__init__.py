@@ -10,6 +10,7 @@ This package contains the core logic for NPC behavior simulation:
 """
 
 from .conditions import (
+    compile_condition,
     evaluate_condition,
     evaluate_conditions_all,
     evaluate_conditions_any,
@@ -44,6 +45,7 @@ from .routine_resolver import (
 
 __all__ = [
     # Conditions
+    "compile_condition",
     "evaluate_condition",
     "evaluate_conditions_all",
     "evaluate_conditions_any",
@@ -98,6 +98,7 @@ def _register_builtin_conditions() -> int:
     """
     from .conditions import (
         BUILTIN_CONDITIONS,
+        clear_compiled_conditions,
         register_condition_evaluator,
         _eval_stat_axis_gt,
         _eval_stat_axis_lt,
@@ -138,6 +139,9 @@ def _register_builtin_conditions() -> int:
     BUILTIN_CONDITIONS["location_type_in"] = _eval_location_type_in
     BUILTIN_CONDITIONS["expression"] = _eval_expression
 
+    # Anything compiled before registration was bound to the unresolved path
+    clear_compiled_conditions()
+
     # Register example custom evaluators with params schemas
     register_condition_evaluator(
         "evaluator:is_raining",
@@ -14,8 +14,11 @@ Built-in conditions now use the behavior_registry for uniform registration.
 from __future__ import annotations
 
 import ast
+import functools
+import operator
 import random
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import logging
 
@@ -25,6 +28,9 @@ logger = logging.getLogger(__name__)
 # Type alias for evaluator functions
 ConditionEvaluator = Callable[[Dict[str, Any], Dict[str, Any]], bool]
 
+# A condition bound to its evaluator: called with just the context
+CompiledCondition = Callable[[Dict[str, Any]], bool]
+
 
 # ==================
 # Built-in Condition Registry
@@ -86,6 +92,8 @@ def evaluate_condition(condition: Dict[str, Any], context: Dict[str, Any]) -> bo
     Evaluate a single condition using the Condition DSL.
 
     Uses unified registry lookup for both built-in and plugin conditions.
+    The condition is compiled on first use (see compile_condition) and the
+    cached closure is reused for every later evaluation.
 
     Args:
         condition: Condition dict with 'type' and type-specific fields
@@ -101,51 +109,7 @@ def evaluate_condition(condition: Dict[str, Any], context: Dict[str, Any]) -> bo
     Returns:
         True if condition is met, False otherwise
     """
-    cond_type = condition.get("type")
-
-    if not cond_type:
-        logger.warning("Condition missing 'type' field")
-        return False
-
-    try:
-        # Try built-in conditions registry first
-        if cond_type in BUILTIN_CONDITIONS:
-            evaluator = BUILTIN_CONDITIONS[cond_type]
-            return evaluator(condition, context)
-
-        # Try plugin conditions via behavior_registry
-        # Plugin conditions are registered with fully qualified IDs (e.g., "plugin:my_plugin:my_condition")
-        if cond_type.startswith("plugin:"):
-            from pixsim7.backend.main.infrastructure.plugins.behavior_registry import behavior_registry
-            metadata = behavior_registry.get_condition(cond_type)
-            if metadata:
-                # If a world-level allowlist is present, enforce plugin scoping.
-                world_enabled_plugins = context.get("world_enabled_plugins")
-                if isinstance(world_enabled_plugins, list):
-                    if metadata.plugin_id not in world_enabled_plugins:
-                        logger.debug(
-                            "Plugin condition skipped - plugin not enabled for world",
-                            condition_id=cond_type,
-                            plugin_id=metadata.plugin_id,
-                        )
-                        return False
-                # Plugin conditions expect just the context, not (condition, context)
-                return metadata.evaluator(context)
-            else:
-                logger.warning(f"Plugin condition not found in registry: {cond_type}")
-                return False
-
-        # Special handling for 'custom' type (legacy compatibility)
-        if cond_type == "custom":
-            return _eval_custom(condition, context)
-
-        # Unknown condition type
-        logger.warning(f"Unknown condition type: {cond_type}")
-        return False
-
-    except Exception as e:
-        logger.error(f"Error evaluating condition {cond_type}: {e}", exc_info=True)
-        return False
+    return compile_condition(condition)(context)
 
 
 def evaluate_conditions_all(conditions: List[Dict[str, Any]], context: Dict[str, Any]) -> bool:
@@ -156,7 +120,7 @@ def evaluate_conditions_all(conditions: List[Dict[str, Any]], context: Dict[str,
     """
     if not conditions:
         return True
-    return all(evaluate_condition(cond, context) for cond in conditions)
+    return all(compile_condition(cond)(context) for cond in conditions)
 
 
 def evaluate_conditions_any(conditions: List[Dict[str, Any]], context: Dict[str, Any]) -> bool:
@@ -167,7 +131,131 @@ def evaluate_conditions_any(conditions: List[Dict[str, Any]], context: Dict[str,
     """
     if not conditions:
         return True
-    return any(evaluate_condition(cond, context) for cond in conditions)
+    return any(compile_condition(cond)(context) for cond in conditions)
+
+
+# ==================
+# Compiled Conditions
+# ==================
+#
+# Conditions live in world config and are evaluated for every NPC x activity
+# x tick, so each condition dict is compiled once into a closure: the
+# evaluator is resolved, fixed fields are pre-parsed and invalid conditions
+# are rejected (with one warning) up front. Compiled closures are cached per
+# condition object in an LRU that holds the dict itself, so its id can't be
+# reused while cached. World configs are replaced rather than mutated when a
+# world is edited; a shallow snapshot still catches a top-level field edited
+# in place (edits nested inside a field need clear_compiled_conditions()).
+# Plugin conditions are still looked up per call, since plugins can be
+# unregistered at runtime.
+
+_COMPILED_CONDITIONS_MAX = 4096
+_compiled_conditions: OrderedDict[int, Tuple[Dict[str, Any], Dict[str, Any], CompiledCondition]] = OrderedDict()
+
+
+def compile_condition(condition: Dict[str, Any]) -> CompiledCondition:
+    """
+    Compile a condition into a closure taking only the evaluation context.
+
+    The result is cached for as long as the same (unchanged) condition dict
+    keeps being passed in. Evaluation errors are logged and read as False,
+    exactly like evaluate_condition.
+    """
+    key = id(condition)
+    entry = _compiled_conditions.get(key)
+    if entry is not None and entry[0] is condition and entry[1] == condition:
+        _compiled_conditions.move_to_end(key)
+        return entry[2]
+
+    compiled = _compile_condition(condition)
+    _compiled_conditions[key] = (condition, dict(condition), compiled)
+    _compiled_conditions.move_to_end(key)
+    if len(_compiled_conditions) > _COMPILED_CONDITIONS_MAX:
+        _compiled_conditions.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_conditions() -> None:
+    """Drop all compiled conditions (e.g. after built-in evaluators change)."""
+    _compiled_conditions.clear()
+    _compile_expression.cache_clear()
+
+
+def _always_false(context: Dict[str, Any]) -> bool:
+    return False
+
+
+def _compile_condition(condition: Dict[str, Any]) -> CompiledCondition:
+    cond_type = condition.get("type")
+
+    if not cond_type:
+        logger.warning("Condition missing 'type' field")
+        return _always_false
+
+    evaluator = BUILTIN_CONDITIONS.get(cond_type)
+    if evaluator is not None:
+        compiler = _BUILTIN_COMPILERS.get(evaluator)
+        try:
+            evaluate = (
+                compiler(condition)
+                if compiler is not None
+                else functools.partial(evaluator, condition)
+            )
+        except Exception as e:
+            logger.error(f"Error compiling condition {cond_type}: {e}", exc_info=True)
+            return _always_false
+    elif cond_type.startswith("plugin:"):
+        evaluate = functools.partial(_eval_plugin_condition, cond_type)
+    elif cond_type == "custom":
+        evaluate = functools.partial(_eval_custom, condition)
+    else:
+        # Not (yet) a known type - resolve again on each call, since the
+        # built-in registry may still be filled in after this compile.
+        return functools.partial(_eval_unresolved_condition, condition)
+
+    def evaluate_guarded(context: Dict[str, Any]) -> bool:
+        try:
+            return evaluate(context)
+        except Exception as e:
+            logger.error(f"Error evaluating condition {cond_type}: {e}", exc_info=True)
+            return False
+
+    return evaluate_guarded
+
+
+def _eval_plugin_condition(cond_type: str, context: Dict[str, Any]) -> bool:
+    # Plugin conditions are registered with fully qualified IDs (e.g., "plugin:my_plugin:my_condition")
+    from pixsim7.backend.main.infrastructure.plugins.behavior_registry import behavior_registry
+    metadata = behavior_registry.get_condition(cond_type)
+    if not metadata:
+        logger.warning(f"Plugin condition not found in registry: {cond_type}")
+        return False
+
+    # If a world-level allowlist is present, enforce plugin scoping.
+    world_enabled_plugins = context.get("world_enabled_plugins")
+    if isinstance(world_enabled_plugins, list):
+        if metadata.plugin_id not in world_enabled_plugins:
+            logger.debug(
+                "Plugin condition skipped - plugin not enabled for world",
+                condition_id=cond_type,
+                plugin_id=metadata.plugin_id,
+            )
+            return False
+    # Plugin conditions expect just the context, not (condition, context)
+    return metadata.evaluator(context)
+
+
+def _eval_unresolved_condition(condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
+    cond_type = condition.get("type")
+    evaluator = BUILTIN_CONDITIONS.get(cond_type)
+    if evaluator is None:
+        logger.warning(f"Unknown condition type: {cond_type}")
+        return False
+    try:
+        return evaluator(condition, context)
+    except Exception as e:
+        logger.error(f"Error evaluating condition {cond_type}: {e}", exc_info=True)
+        return False
 
 
 # ==================
@@ -695,139 +783,324 @@ def _eval_expression(condition: Dict[str, Any], context: Dict[str, Any]) -> bool
     """
     Evaluate expression-based condition with a restricted AST evaluator.
     """
+    return _compile_expression_condition(condition)(context)
+
+
+def _compile_expression_condition(condition: Dict[str, Any]) -> CompiledCondition:
     expression = condition.get("expression")
     if not isinstance(expression, str):
-        return False
+        return _always_false
+
+    evaluate = _compile_expression(expression.strip())
+    if evaluate is None:
+        return _always_false
 
-    expression = expression.strip()
+    def evaluate_expression(context: Dict[str, Any]) -> bool:
+        try:
+            return bool(evaluate(context))
+        except ValueError as exc:
+            logger.warning("Expression condition rejected: %s", exc)
+            return False
+        except Exception as exc:
+            logger.warning("Expression condition failed: %s", exc)
+            return False
+
+    return evaluate_expression
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """
+    Parse and validate an expression once, returning a closure over its AST.
+
+    Returns None (after logging why) for expressions that can never evaluate;
+    the rejection is cached like any other result.
+    """
     if not expression:
-        return False
+        return None
 
     # Avoid pathological payloads from user-authored world configs.
     if len(expression) > 512:
         logger.warning("Expression condition rejected due to size: %s", expression[:80])
-        return False
+        return None
 
     try:
         tree = ast.parse(expression, mode="eval")
     except SyntaxError:
         logger.warning("Invalid expression condition syntax: %s", expression)
-        return False
+        return None
 
     try:
-        return bool(_eval_expression_node(tree, context))
+        return _compile_expression_node(tree)
     except ValueError as exc:
         logger.warning("Expression condition rejected: %s", exc)
-        return False
-    except Exception as exc:
-        logger.warning("Expression condition failed: %s", exc)
-        return False
+        return None
 
 
-def _eval_expression_node(node: ast.AST, variables: Dict[str, Any]) -> Any:
+_BOOL_OPS: Dict[type, Callable[[List[Any]], bool]] = {ast.And: all, ast.Or: any}
+
+_UNARY_OPS: Dict[type, Callable[[Any], Any]] = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_BINARY_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+_COMPARE_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right if right is not None else False,
+    ast.NotIn: lambda left, right: left not in right if right is not None else True,
+}
+
+
+def _compile_expression_node(node: ast.AST) -> Callable[[Dict[str, Any]], Any]:
+    """Compile one AST node into a closure over the variables dict.
+
+    Raises ValueError for anything outside the supported subset.
+    """
     if isinstance(node, ast.Expression):
-        return _eval_expression_node(node.body, variables)
+        return _compile_expression_node(node.body)
 
     if isinstance(node, ast.Constant):
-        return node.value
+        constant = node.value
+        return lambda variables: constant
 
     if isinstance(node, ast.Name):
-        return variables.get(node.id)
+        name = node.id
+        return lambda variables: variables.get(name)
 
     if isinstance(node, ast.BoolOp):
-        values = [_eval_expression_node(value, variables) for value in node.values]
-        if isinstance(node.op, ast.And):
-            return all(bool(value) for value in values)
-        if isinstance(node.op, ast.Or):
-            return any(bool(value) for value in values)
-        raise ValueError(f"Unsupported boolean operator: {type(node.op).__name__}")
+        combine = _BOOL_OPS.get(type(node.op))
+        if combine is None:
+            raise ValueError(f"Unsupported boolean operator: {type(node.op).__name__}")
+        operands = [_compile_expression_node(value) for value in node.values]
+        # Every operand is evaluated (no short-circuit), as before compilation.
+        return lambda variables: combine([operand(variables) for operand in operands])
 
     if isinstance(node, ast.UnaryOp):
-        operand = _eval_expression_node(node.operand, variables)
-        if isinstance(node.op, ast.Not):
-            return not bool(operand)
-        if isinstance(node.op, ast.USub):
-            return -operand
-        if isinstance(node.op, ast.UAdd):
-            return +operand
-        raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
+        apply_unary = _UNARY_OPS.get(type(node.op))
+        if apply_unary is None:
+            raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
+        operand = _compile_expression_node(node.operand)
+        return lambda variables: apply_unary(operand(variables))
 
     if isinstance(node, ast.BinOp):
-        left = _eval_expression_node(node.left, variables)
-        right = _eval_expression_node(node.right, variables)
-        if isinstance(node.op, ast.Add):
-            return left + right
-        if isinstance(node.op, ast.Sub):
-            return left - right
-        if isinstance(node.op, ast.Mult):
-            return left * right
-        if isinstance(node.op, ast.Div):
-            return left / right
-        if isinstance(node.op, ast.Mod):
-            return left % right
-        raise ValueError(f"Unsupported binary operator: {type(node.op).__name__}")
+        apply_binary = _BINARY_OPS.get(type(node.op))
+        if apply_binary is None:
+            raise ValueError(f"Unsupported binary operator: {type(node.op).__name__}")
+        left = _compile_expression_node(node.left)
+        right = _compile_expression_node(node.right)
+        return lambda variables: apply_binary(left(variables), right(variables))
 
     if isinstance(node, ast.Compare):
-        left = _eval_expression_node(node.left, variables)
-        for operator, comparator in zip(node.ops, node.comparators):
-            right = _eval_expression_node(comparator, variables)
-
-            if isinstance(operator, ast.Eq):
-                passed = left == right
-            elif isinstance(operator, ast.NotEq):
-                passed = left != right
-            elif isinstance(operator, ast.Lt):
-                passed = left < right
-            elif isinstance(operator, ast.LtE):
-                passed = left <= right
-            elif isinstance(operator, ast.Gt):
-                passed = left > right
-            elif isinstance(operator, ast.GtE):
-                passed = left >= right
-            elif isinstance(operator, ast.In):
-                passed = left in right if right is not None else False
-            elif isinstance(operator, ast.NotIn):
-                passed = left not in right if right is not None else True
-            else:
-                raise ValueError(f"Unsupported comparison operator: {type(operator).__name__}")
-
-            if not passed:
-                return False
-            left = right
-        return True
+        first = _compile_expression_node(node.left)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            compare = _COMPARE_OPS.get(type(op))
+            if compare is None:
+                raise ValueError(f"Unsupported comparison operator: {type(op).__name__}")
+            steps.append((compare, _compile_expression_node(comparator)))
+
+        def evaluate_compare(variables: Dict[str, Any]) -> bool:
+            left = first(variables)
+            for compare, comparator in steps:
+                right = comparator(variables)
+                if not compare(left, right):
+                    return False
+                left = right
+            return True
+
+        return evaluate_compare
 
     if isinstance(node, ast.Attribute):
-        value = _eval_expression_node(node.value, variables)
-        if isinstance(value, dict):
-            return value.get(node.attr)
-        return getattr(value, node.attr, None)
+        target = _compile_expression_node(node.value)
+        attr = node.attr
+
+        def evaluate_attribute(variables: Dict[str, Any]) -> Any:
+            value = target(variables)
+            if isinstance(value, dict):
+                return value.get(attr)
+            return getattr(value, attr, None)
+
+        return evaluate_attribute
 
     if isinstance(node, ast.Subscript):
-        value = _eval_expression_node(node.value, variables)
-        key = _eval_expression_node(node.slice, variables)
-        if isinstance(value, dict):
-            return value.get(key)
-        if isinstance(value, (list, tuple)) and isinstance(key, int):
-            if 0 <= key < len(value):
-                return value[key]
+        target = _compile_expression_node(node.value)
+        index = _compile_expression_node(node.slice)
+
+        def evaluate_subscript(variables: Dict[str, Any]) -> Any:
+            value = target(variables)
+            key = index(variables)
+            if isinstance(value, dict):
+                return value.get(key)
+            if isinstance(value, (list, tuple)) and isinstance(key, int):
+                if 0 <= key < len(value):
+                    return value[key]
+                return None
             return None
-        return None
+
+        return evaluate_subscript
 
     if isinstance(node, ast.List):
-        return [_eval_expression_node(item, variables) for item in node.elts]
+        items = [_compile_expression_node(item) for item in node.elts]
+        return lambda variables: [item(variables) for item in items]
 
     if isinstance(node, ast.Tuple):
-        return tuple(_eval_expression_node(item, variables) for item in node.elts)
+        items = [_compile_expression_node(item) for item in node.elts]
+        return lambda variables: tuple(item(variables) for item in items)
 
     if isinstance(node, ast.Dict):
-        return {
-            _eval_expression_node(key, variables): _eval_expression_node(value, variables)
+        entries = [
+            (_compile_expression_node(key), _compile_expression_node(value))
             for key, value in zip(node.keys, node.values)
-        }
+        ]
+        return lambda variables: {key(variables): value(variables) for key, value in entries}
 
     raise ValueError(f"Unsupported expression node: {type(node).__name__}")
 
 
+# ==================
+# Built-in Compilers
+# ==================
+# Specialised compile steps for the hot built-in conditions; any built-in
+# without one is simply bound to its condition dict.
+
+
+def _compile_stat_comparison(
+    cond_type: str,
+    stat_definition: str,
+    axis: str,
+    npc_id_or_role: Optional[str],
+    passes: Callable[[float], bool],
+) -> CompiledCondition:
+    if not stat_definition or not axis:
+        logger.warning(
+            "%s condition missing required fields (statDefinition=%r, axis=%r)",
+            cond_type,
+            stat_definition,
+            axis,
+        )
+        return _always_false
+
+    def evaluate_stat(context: Dict[str, Any]) -> bool:
+        return passes(_get_stat_value(stat_definition, axis, context, npc_id_or_role))
+
+    return evaluate_stat
+
+
+def _compile_stat_axis_gt(condition: Dict[str, Any]) -> CompiledCondition:
+    threshold = condition.get("threshold", 0)
+    return _compile_stat_comparison(
+        "stat_axis_gt",
+        condition.get("statDefinition", ""),
+        condition.get("axis", ""),
+        condition.get("npcIdOrRole"),
+        lambda value: value > threshold,
+    )
+
+
+def _compile_stat_axis_lt(condition: Dict[str, Any]) -> CompiledCondition:
+    threshold = condition.get("threshold", 0)
+    return _compile_stat_comparison(
+        "stat_axis_lt",
+        condition.get("statDefinition", ""),
+        condition.get("axis", ""),
+        condition.get("npcIdOrRole"),
+        lambda value: value < threshold,
+    )
+
+
+def _compile_stat_axis_between(condition: Dict[str, Any]) -> CompiledCondition:
+    min_val = condition.get("min", 0)
+    max_val = condition.get("max", 100)
+    return _compile_stat_comparison(
+        "stat_axis_between",
+        condition.get("statDefinition", ""),
+        condition.get("axis", ""),
+        condition.get("npcIdOrRole"),
+        lambda value: min_val <= value <= max_val,
+    )
+
+
+def _compile_relationship_gt(condition: Dict[str, Any]) -> CompiledCondition:
+    threshold = condition.get("threshold", 0)
+    return _compile_stat_comparison(
+        "stat_axis_gt",
+        "relationships",
+        condition.get("axis") or condition.get("metric", "affinity"),
+        condition.get("npcIdOrRole", ""),
+        lambda value: value > threshold,
+    )
+
+
+def _compile_relationship_lt(condition: Dict[str, Any]) -> CompiledCondition:
+    threshold = condition.get("threshold", 0)
+    return _compile_stat_comparison(
+        "stat_axis_lt",
+        "relationships",
+        condition.get("axis") or condition.get("metric", "affinity"),
+        condition.get("npcIdOrRole", ""),
+        lambda value: value < threshold,
+    )
+
+
+def _compile_flag_equals(condition: Dict[str, Any]) -> CompiledCondition:
+    keys = tuple(condition.get("key", "").split("."))
+    expected_value = condition.get("value")
+
+    def evaluate_flag_equals(context: Dict[str, Any]) -> bool:
+        current = context.get("flags", {})
+        for k in keys:
+            if isinstance(current, dict):
+                current = current.get(k)
+            else:
+                return False
+        return current == expected_value
+
+    return evaluate_flag_equals
+
+
+def _compile_flag_exists(condition: Dict[str, Any]) -> CompiledCondition:
+    keys = tuple(condition.get("key", "").split("."))
+
+    def evaluate_flag_exists(context: Dict[str, Any]) -> bool:
+        current = context.get("flags", {})
+        for k in keys:
+            if isinstance(current, dict) and k in current:
+                current = current[k]
+            else:
+                return False
+        return True
+
+    return evaluate_flag_exists
+
+
+# Keyed by evaluator (not type name) so a re-registered type is never
+# compiled with another evaluator's semantics.
+_BUILTIN_COMPILERS: Dict[ConditionEvaluator, Callable[[Dict[str, Any]], CompiledCondition]] = {
+    _eval_stat_axis_gt: _compile_stat_axis_gt,
+    _eval_stat_axis_lt: _compile_stat_axis_lt,
+    _eval_stat_axis_between: _compile_stat_axis_between,
+    _eval_relationship_gt: _compile_relationship_gt,
+    _eval_relationship_lt: _compile_relationship_lt,
+    _eval_flag_equals: _compile_flag_equals,
+    _eval_flag_exists: _compile_flag_exists,
+    _eval_expression: _compile_expression_condition,
+}
+
+
 # ==================
 # Example Custom Evaluators
 # ==================
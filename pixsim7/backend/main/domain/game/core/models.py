@@ -100,6 +100,11 @@ class GameWorld(SQLModel, table=True):
     name: str = Field(max_length=128)
     meta: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
     created_at: datetime = Field(default_factory=utcnow, index=True)
+    npc_roster_version: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": "0"},
+        description="Bumped whenever an NPC joins or leaves this world's roster (see GameNPC hooks)",
+    )
 
 
 class GameWorldState(SQLModel, table=True):
@@ -140,6 +145,44 @@ class GameNPC(HasStats, table=True):
     # stats field inherited from HasStats - base stats (combat skills, attributes, etc.)
 
 
+# ===== NPC ROSTER VERSION =====
+# The world scheduler caches each world's NPC ids and reloads them only when
+# game_worlds.npc_roster_version moves; these hooks bump it in the same flush
+# as the NPC insert / delete / world reassignment. Bulk Core statements on
+# game_npcs bypass them and must bump the version themselves.
+
+from sqlalchemy import event, inspect as sa_inspect
+
+
+def _bump_npc_roster_version(connection, world_ids) -> None:
+    """Bump the roster version of the given worlds (None: world-less NPCs, which
+    every world's roster includes, so all worlds)."""
+    worlds = GameWorld.__table__
+    stmt = worlds.update().values(npc_roster_version=worlds.c.npc_roster_version + 1)
+    if None not in world_ids:
+        stmt = stmt.where(worlds.c.id.in_(world_ids))
+    connection.execute(stmt)
+
+
+@event.listens_for(GameNPC, "after_insert")
+@event.listens_for(GameNPC, "after_delete")
+def _npc_roster_changed(mapper, connection, target):
+    _bump_npc_roster_version(connection, {target.world_id})
+
+
+@event.listens_for(GameNPC.world_id, "set", active_history=True)
+def _load_previous_world(target, value, oldvalue, initiator):
+    """No-op; active_history loads the old world_id of an expired NPC on
+    reassignment, so the world it left is bumped too."""
+
+
+@event.listens_for(GameNPC, "after_update")
+def _npc_world_changed(mapper, connection, target):
+    history = sa_inspect(target).attrs.world_id.history
+    if history.has_changes():
+        _bump_npc_roster_version(connection, set(history.deleted) | set(history.added))
+
+
 class GameItem(HasStatsWithMetadata, table=True):
     __tablename__ = "game_items"
     id: Optional[int] = Field(default=None, primary_key=True)
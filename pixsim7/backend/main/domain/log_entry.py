@@ -7,7 +7,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 from sqlmodel import Field, SQLModel, JSON, Column
-from sqlalchemy import DateTime, Index, Text, text
+from sqlalchemy import BigInteger, DateTime, Index, Text, text
 
 
 class LogEntry(SQLModel, table=True):
@@ -74,6 +74,13 @@ class LogEntry(SQLModel, table=True):
         Index("idx_logs_stage_timestamp", "stage", "timestamp"),
         Index("idx_logs_channel_timestamp", "channel", "timestamp"),
         Index("idx_logs_domain_timestamp", "domain", "timestamp"),
+        # Keyset pagination walks (timestamp, id) newest-first; the per-filter
+        # indexes keep the walk ordered for the common viewer filters (service
+        # filters use idx_logs_service_level_timestamp above).
+        # extra->>'trace_id' has an expression index (log migration 20261016_0001).
+        Index("idx_logs_timestamp_id", "timestamp", "id"),
+        Index("idx_logs_level_timestamp", "level", "timestamp"),
+        Index("idx_logs_request_timestamp", "request_id", "timestamp"),
     )
 
     class Config:
@@ -94,3 +101,29 @@ class LogEntry(SQLModel, table=True):
                 "provider_job_id": "pv_job_abc",
             }
         }
+
+
+class LogFacet(SQLModel, table=True):
+    """Distinct value of a filterable log column, per service.
+
+    Refreshed periodically from log_entries (see LogService.refresh_facets)
+    so filter dropdowns don't run DISTINCT over the whole log table.
+    """
+    __tablename__ = "log_facets"
+
+    field: str = Field(primary_key=True, max_length=30, description="log_entries column name")
+    value: str = Field(primary_key=True, max_length=255)
+    service: str = Field(primary_key=True, max_length=150)
+    last_seen: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        description="Newest log timestamp carrying this value",
+    )
+    last_log_id: int = Field(
+        default=0,
+        sa_column=Column(BigInteger, nullable=False, server_default=text("0")),
+        description="Highest log_entries.id folded into this row (refresh watermark)",
+    )
+
+    __table_args__ = (
+        Index("idx_log_facets_field_service_value", "field", "service", "value"),
+    )
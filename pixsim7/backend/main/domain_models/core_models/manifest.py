@@ -42,6 +42,7 @@ manifest = DomainModelManifest(
         "pixsim7.backend.main.domain.platform.agent_profile",
         "pixsim7.backend.main.domain.platform.conversation",
         "pixsim7.backend.main.domain.local_folder_hash_cache",
+        "pixsim7.backend.main.domain.embedding_cache",
     ],
     auto_discover=True,
     enabled=True,
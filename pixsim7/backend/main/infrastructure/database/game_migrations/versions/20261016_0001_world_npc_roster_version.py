@@ -0,0 +1,31 @@
+"""Add game_worlds.npc_roster_version.
+
+Bumped by the GameNPC ORM hooks whenever an NPC is created, deleted or moved
+between worlds, so the world scheduler can tell from one primary-key read
+whether its cached NPC roster is stale instead of aggregating over game_npcs
+every tick.
+
+Revision ID: game_20261016_0001
+Revises: game_baseline
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = "game_20261016_0001"
+down_revision = "game_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "game_worlds",
+        sa.Column("npc_roster_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("game_worlds", "npc_roster_version")
@@ -0,0 +1,120 @@
+"""Keyset pagination indexes and the log_facets summary table.
+
+- (timestamp, id) and (<filter>, timestamp) indexes so the log viewer's
+  newest-first keyset pages stay index-ordered under the common filters.
+  Service filters already lead idx_logs_service_level_timestamp, so no
+  separate (service, timestamp) index is added to this write-heavy table.
+- Expression index on extra->>'trace_id' (the exact expression
+  LogService filters on), partial on rows that carry a trace id.
+- log_facets: distinct filter values per service, refreshed by the
+  refresh_log_facets cron instead of DISTINCT over log_entries.
+  last_log_id is the refresh watermark (log_entries.id, i.e. insertion
+  order), so rows that arrive late with old timestamps are still folded.
+
+Compressed chunks reject new indexes, so (as in 20260321_0001) compression
+is disabled around the index build and re-enabled afterwards.
+
+Revision ID: 20261016_0001
+Revises: 20260321_0001
+Create Date: 2026-10-16
+"""
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy import text
+import sqlalchemy as sa
+
+
+revision = "20261016_0001"
+down_revision = "20260321_0001"
+branch_labels = None
+depends_on = None
+
+
+_LOG_INDEXES = (
+    ("idx_logs_timestamp_id", ["timestamp", "id"]),
+    ("idx_logs_level_timestamp", ["level", "timestamp"]),
+    ("idx_logs_request_timestamp", ["request_id", "timestamp"]),
+)
+
+
+def _is_compressed_hypertable(conn, table: str) -> bool:
+    """Check if the table is a compressed TimescaleDB hypertable."""
+    row = conn.execute(
+        text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM timescaledb_information.compression_settings"
+            "  WHERE hypertable_name = :table"
+            ")"
+        ),
+        {"table": table},
+    ).scalar()
+    return bool(row)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    compressed = False
+    try:
+        compressed = _is_compressed_hypertable(conn, "log_entries")
+    except Exception:
+        pass
+
+    if compressed:
+        # Remove compression policy, decompress existing chunks, disable columnstore
+        try:
+            conn.execute(text("SELECT remove_compression_policy('log_entries', if_exists => true)"))
+        except Exception:
+            pass
+        try:
+            conn.execute(text("SELECT decompress_chunk(c, if_compressed => true) FROM show_chunks('log_entries') c"))
+        except Exception:
+            pass
+        conn.execute(text("ALTER TABLE log_entries SET (timescaledb.compress = false)"))
+
+    for name, columns in _LOG_INDEXES:
+        op.create_index(name, "log_entries", columns, if_not_exists=True)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_logs_trace_id_timestamp "
+        "ON log_entries ((extra->>'trace_id'), timestamp) "
+        "WHERE extra->>'trace_id' IS NOT NULL"
+    )
+
+    if compressed:
+        conn.execute(
+            text(
+                "ALTER TABLE log_entries SET ("
+                "  timescaledb.compress,"
+                "  timescaledb.compress_segmentby = 'service,level'"
+                ")"
+            )
+        )
+        try:
+            conn.execute(
+                text("SELECT add_compression_policy('log_entries', INTERVAL '7 days', if_not_exists => true)")
+            )
+        except Exception:
+            pass
+
+    op.create_table(
+        "log_facets",
+        sa.Column("field", sa.String(30), primary_key=True),
+        sa.Column("value", sa.String(255), primary_key=True),
+        sa.Column("service", sa.String(150), primary_key=True),
+        sa.Column("last_seen", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_log_id", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "idx_log_facets_field_service_value",
+        "log_facets",
+        ["field", "service", "value"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_log_facets_field_service_value", table_name="log_facets")
+    op.drop_table("log_facets")
+    op.execute("DROP INDEX IF EXISTS idx_logs_trace_id_timestamp")
+    for name, _columns in reversed(_LOG_INDEXES):
+        op.drop_index(name, table_name="log_entries", if_exists=True)
@@ -0,0 +1,40 @@
+"""embedding_cache — content-addressed (sha256, embedder, model) vector cache
+
+Lets the embedding pipelines reuse a vector for byte-identical content
+(duplicate media, re-uploads, re-imports, repeated prompt text) instead of
+running another forward pass. The composite primary key is the lookup index.
+
+New table only; the vector column is dimension-less (the cache spans text and
+image embedding spaces).
+
+Revision ID: 20260702_0001
+Revises: 20260626_0001
+Create Date: 2026-07-02
+"""
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+revision = "20260702_0001"
+down_revision = "20260626_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("content_sha256", sa.String(length=64), nullable=False),
+        sa.Column("embedder_id", sa.String(length=100), nullable=False),
+        sa.Column("model_id", sa.String(length=100), nullable=False),
+        sa.Column("variant", sa.String(length=64), nullable=False, server_default=""),
+        sa.Column("vector", Vector(), nullable=False),
+        sa.Column("dim", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("content_sha256", "embedder_id", "model_id", "variant"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache")
@@ -4,7 +4,7 @@ Event bus for domain events
 Simple in-memory event bus for Phase 1.
 Phase 2 will add Redis-backed persistent events.
 """
-from typing import Callable, Dict, List, Any, Awaitable, Optional
+from typing import Callable, Dict, List, Any, Awaitable, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
@@ -212,7 +212,8 @@ def register_event_type(
     event_type: str,
     description: str | None = None,
     payload_schema: Dict[str, Any] | None = None,
-    source: str | None = None
+    source: str | None = None,
+    coalesce_by: str | Tuple[str, ...] | None = None,
 ) -> str:
     """
     Register an event type for documentation and discovery.
@@ -226,16 +227,29 @@ def register_event_type(
         description: Human-readable description (defaults to event_type)
         payload_schema: Optional dict describing expected payload fields
         source: Optional source module/service name
+        coalesce_by: Payload field(s) identifying the entity this event
+            describes. Set only for state-style events where a newer event
+            fully supersedes an older one for the same entity; the batched
+            Redis bridge then forwards just the latest of them per window.
     """
+    if isinstance(coalesce_by, str):
+        coalesce_by = (coalesce_by,)
     _event_registry[event_type] = {
         "description": description or event_type,
         "payload_schema": payload_schema or {},
-        "source": source
+        "source": source,
+        "coalesce_by": tuple(coalesce_by) if coalesce_by else None,
     }
     logger.debug(f"Registered event type: {event_type}")
     return event_type
 
 
+def get_coalesce_fields(event_type: str) -> Tuple[str, ...] | None:
+    """Payload fields that identify superseded events of this type, if any"""
+    entry = _event_registry.get(event_type)
+    return entry.get("coalesce_by") if entry else None
+
+
 def get_registered_events() -> Dict[str, Dict[str, Any]]:
     """Get all registered event types (for documentation/tooling)"""
     return _event_registry.copy()
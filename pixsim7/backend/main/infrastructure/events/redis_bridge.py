@@ -3,24 +3,50 @@ Redis-backed event bus bridge
 
 Allows the in-process EventBus to propagate events across multiple
 processes (API + workers) using Redis pub/sub.
+
+Two modes (``settings.event_bridge_mode``, must match across processes):
+
+- ``immediate``: one PUBLISH per event on the shared ``CHANNEL``.
+- ``batched``: events are collected for ``event_bridge_batch_window_ms`` and
+  sent as one pipelined publish per window, one message per event family
+  channel (``pixsim7:events:v2:<family>``, family = prefix before the first
+  ``:`` or ``.``). Events registered with ``coalesce_by`` replace a still
+  pending event of the same type for the same entity. A bridge started with
+  ``families`` only subscribes to those channels.
 """
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import redis.asyncio as redis
 
-from pixsim7.backend.main.infrastructure.events.bus import Event, event_bus
+from pixsim7.backend.main.infrastructure.events.bus import (
+    Event,
+    event_bus,
+    get_coalesce_fields,
+)
 from pixsim7.backend.main.infrastructure.redis import get_redis
 from pixsim7.backend.main.shared.config import settings
 from pixsim_logging import configure_logging
 
 logger = configure_logging("event_bridge")
 
+BRIDGE_MODE_IMMEDIATE = "immediate"
+BRIDGE_MODE_BATCHED = "batched"
+
+
+def event_family(event_type: str) -> str:
+    """Family an event type belongs to ("job:created" -> "job")."""
+    for sep in (":", "."):
+        if sep in event_type:
+            return event_type.split(sep, 1)[0]
+    return event_type
+
 
 class RedisEventBridge:
     """
@@ -31,38 +57,93 @@ class RedisEventBridge:
     """
 
     CHANNEL = "pixsim7:events:v1"
-
-    def __init__(self, role: str = "process"):
+    FAMILY_CHANNEL_PREFIX = "pixsim7:events:v2"
+
+    def __init__(
+        self,
+        role: str = "process",
+        *,
+        mode: Optional[str] = None,
+        families: Optional[Iterable[str]] = None,
+        batch_window_ms: Optional[int] = None,
+        max_batch: Optional[int] = None,
+    ):
         self.role = role
+        self.mode = mode or settings.event_bridge_mode
+        if self.mode not in (BRIDGE_MODE_IMMEDIATE, BRIDGE_MODE_BATCHED):
+            raise ValueError(f"Unknown event bridge mode: {self.mode!r}")
+        self.families = tuple(sorted(set(families))) if families is not None else None
+        window_ms = settings.event_bridge_batch_window_ms if batch_window_ms is None else batch_window_ms
+        self._batch_window = max(0, window_ms) / 1000.0
+        self._max_batch = max(1, max_batch or settings.event_bridge_max_batch)
         self._publisher = None
         self._subscriber: Optional[redis.Redis] = None
+        self._pubsub = None
         self._listener_task: Optional[asyncio.Task] = None
         self._origin = f"{role}:{uuid.uuid4()}"
         self._stopping = asyncio.Event()
 
+        # Batched mode: pending events keyed for coalescing, in publish order
+        self._pending: Dict[Any, Event] = {}
+        self._unkeyed = itertools.count()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self.stats = {"events": 0, "coalesced": 0, "batches": 0, "messages": 0, "dropped": 0}
+
+    @property
+    def batched(self) -> bool:
+        return self.mode == BRIDGE_MODE_BATCHED
+
+    def channel_for(self, event_type: str) -> str:
+        if not self.batched:
+            return self.CHANNEL
+        return f"{self.FAMILY_CHANNEL_PREFIX}:{event_family(event_type)}"
+
+    def _subscriptions(self) -> Tuple[List[str], List[str]]:
+        """(channels, patterns) this bridge listens on."""
+        if not self.batched:
+            return [self.CHANNEL], []
+        if self.families is None:
+            return [], [f"{self.FAMILY_CHANNEL_PREFIX}:*"]
+        return [f"{self.FAMILY_CHANNEL_PREFIX}:{family}" for family in self.families], []
+
+    async def _subscribe(self) -> None:
+        # Dedicated connection for pub/sub listening
+        self._subscriber = await redis.from_url(
+            settings.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+        )
+        self._pubsub = self._subscriber.pubsub()
+        channels, patterns = self._subscriptions()
+        if channels:
+            await self._pubsub.subscribe(*channels)
+        if patterns:
+            await self._pubsub.psubscribe(*patterns)
+
     async def start(self):
-        if self._listener_task:
+        if self._listener_task or self._publisher:
             return
 
         try:
             self._publisher = await get_redis()
 
-            # Dedicated connection for pub/sub listening
-            self._subscriber = await redis.from_url(
-                settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
-            self._pubsub = self._subscriber.pubsub()
-            await self._pubsub.subscribe(self.CHANNEL)
+            channels, patterns = self._subscriptions()
+            if channels or patterns:
+                await self._subscribe()
+                self._listener_task = asyncio.create_task(self._listen_loop())
 
             # Register publisher hook
             event_bus.set_distributed_publisher(self._publish_remote)
 
-            self._listener_task = asyncio.create_task(self._listen_loop())
             logger.info(
                 "[EventBridge] Redis bridge started",
-                extra={"role": self.role, "channel": self.CHANNEL, "origin": self._origin}
+                extra={
+                    "role": self.role,
+                    "mode": self.mode,
+                    "channels": channels + patterns,
+                    "origin": self._origin,
+                },
             )
         except Exception as exc:
             logger.error("[EventBridge] Failed to start Redis bridge: %s", exc, exc_info=True)
@@ -73,6 +154,15 @@ class RedisEventBridge:
         self._stopping.set()
         event_bus.clear_distributed_publisher(self._publish_remote)
 
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._pending and self._publisher:
+            try:
+                await self._flush()
+            except Exception as exc:
+                logger.warning("[EventBridge] Final flush failed: %s", exc)
+
         if self._listener_task:
             self._listener_task.cancel()
             try:
@@ -83,7 +173,8 @@ class RedisEventBridge:
 
         if getattr(self, "_pubsub", None):
             try:
-                await self._pubsub.unsubscribe(self.CHANNEL)
+                await self._pubsub.unsubscribe()
+                await self._pubsub.punsubscribe()
                 await self._pubsub.close()
             except Exception:
                 pass
@@ -96,12 +187,16 @@ class RedisEventBridge:
                 pass
             self._subscriber = None
 
+        self._publisher = None
         self._stopping.clear()
         logger.info("[EventBridge] Redis bridge stopped", role=self.role)
 
     async def _publish_remote(self, event: Event):
         if not self._publisher:
             return
+        if self.batched:
+            await self._enqueue(event)
+            return
         payload = {
             "event_type": event.event_type,
             "data": event.data,
@@ -122,6 +217,77 @@ class RedisEventBridge:
         )
         await self._publisher.publish(self.CHANNEL, json.dumps(payload))
 
+    # ----- batched mode -----
+
+    def _coalesce_key(self, event: Event) -> Any:
+        fields = get_coalesce_fields(event.event_type)
+        if fields and isinstance(event.data, dict):
+            entity = tuple(event.data.get(name) for name in fields)
+            if None not in entity:
+                return (event.event_type, entity)
+        return next(self._unkeyed)
+
+    async def _enqueue(self, event: Event) -> None:
+        key = self._coalesce_key(event)
+        self.stats["events"] += 1
+        # Re-insert rather than overwrite so the surviving event keeps its
+        # place after anything published between the two.
+        if self._pending.pop(key, None) is not None:
+            self.stats["coalesced"] += 1
+        self._pending[key] = event
+
+        if len(self._pending) >= self._max_batch:
+            await self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.sleep(self._batch_window)
+        except asyncio.CancelledError:
+            return
+        self._flush_task = None
+        try:
+            await self._flush()
+        except Exception as exc:
+            logger.error("[EventBridge] Batch publish failed: %s", exc)
+
+    async def _flush(self) -> None:
+        """Publish everything pending: one message per family channel, one round trip."""
+        async with self._flush_lock:
+            if not self._pending or not self._publisher:
+                return
+            pending, self._pending = self._pending, {}
+
+            by_channel: Dict[str, List[Dict[str, Any]]] = {}
+            for event in pending.values():
+                by_channel.setdefault(self.channel_for(event.event_type), []).append({
+                    "event_type": event.event_type,
+                    "data": event.data,
+                    "timestamp": event.timestamp.isoformat(),
+                    "event_id": event.event_id,
+                })
+
+            pipe = self._publisher.pipeline(transaction=False)
+            for channel, events in by_channel.items():
+                pipe.publish(channel, json.dumps({"origin": self._origin, "events": events}))
+            try:
+                await pipe.execute()
+            except Exception:
+                self.stats["dropped"] += len(pending)
+                raise
+
+            self.stats["batches"] += 1
+            self.stats["messages"] += len(by_channel)
+            logger.debug(
+                "[EventBridge] Published event batch",
+                extra={
+                    "role": self.role,
+                    "events": len(pending),
+                    "channels": sorted(by_channel),
+                },
+            )
+
     async def _listen_loop(self):
         backoff = 1
         while not self._stopping.is_set():
@@ -129,7 +295,7 @@ class RedisEventBridge:
                 async for message in self._pubsub.listen():
                     if self._stopping.is_set():
                         return
-                    if message["type"] != "message":
+                    if message["type"] not in ("message", "pmessage"):
                         continue
 
                     backoff = 1  # reset on successful message
@@ -143,10 +309,19 @@ class RedisEventBridge:
                     if data.get("origin") == self._origin:
                         continue
 
-                    try:
-                        timestamp = datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else None
-                    except ValueError:
-                        timestamp = None
+                    if "events" in data:
+                        logger.debug(
+                            "[EventBridge] Received event batch from Redis",
+                            extra={
+                                "role": self.role,
+                                "channel": message.get("channel"),
+                                "events": len(data["events"]),
+                                "origin": data.get("origin"),
+                            },
+                        )
+                        for item in data["events"]:
+                            await self._republish(item)
+                        continue
 
                     logger.info(
                         "[EventBridge] Received event from Redis",
@@ -162,15 +337,7 @@ class RedisEventBridge:
                             ),
                         },
                     )
-                    await event_bus.publish(
-                        data.get("event_type"),
-                        data.get("data") or {},
-                        wait=False,
-                        strict=False,
-                        event_id=data.get("event_id"),
-                        timestamp=timestamp,
-                        propagate=False,
-                    )
+                    await self._republish(data)
             except asyncio.CancelledError:
                 return
             except Exception as exc:
@@ -187,20 +354,31 @@ class RedisEventBridge:
                 backoff = min(backoff * 2, 30)
                 # Re-subscribe after connection loss
                 try:
-                    self._subscriber = await redis.from_url(
-                        settings.redis_url,
-                        encoding="utf-8",
-                        decode_responses=True,
-                    )
-                    self._pubsub = self._subscriber.pubsub()
-                    await self._pubsub.subscribe(self.CHANNEL)
+                    await self._subscribe()
                     logger.info(
                         "[EventBridge] Listener reconnected",
-                        extra={"role": self.role, "channel": self.CHANNEL},
+                        extra={"role": self.role, "mode": self.mode},
                     )
                 except Exception as reconn_exc:
                     logger.error("[EventBridge] Reconnect failed: %s", reconn_exc)
 
+    async def _republish(self, data: Dict[str, Any]) -> None:
+        """Publish a remote event locally without sending it back to Redis."""
+        try:
+            timestamp = datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else None
+        except ValueError:
+            timestamp = None
+
+        await event_bus.publish(
+            data.get("event_type"),
+            data.get("data") or {},
+            wait=False,
+            strict=False,
+            event_id=data.get("event_id"),
+            timestamp=timestamp,
+            propagate=False,
+        )
+
 
 _bridge: Optional[RedisEventBridge] = None
 
@@ -272,15 +450,21 @@ def _summarize_event_data(event_type: str, data: dict) -> dict:
     return {}
 
 
-async def start_event_bus_bridge(role: str = "process") -> RedisEventBridge | None:
+async def start_event_bus_bridge(
+    role: str = "process",
+    families: Optional[Iterable[str]] = None,
+) -> RedisEventBridge | None:
     """
     Start Redis event bridge if not already running.
+
+    ``families`` limits which event families this process receives in
+    batched mode (``()`` = publish only). ``None`` receives everything.
     """
     global _bridge
     if _bridge:
         return _bridge
 
-    bridge = RedisEventBridge(role=role)
+    bridge = RedisEventBridge(role=role, families=families)
     await bridge.start()
     _bridge = bridge
     return bridge
@@ -42,7 +42,12 @@ async def broadcast_generation_event(event: Event):
             "event_id": event.event_id
         }
     )
-    await connection_manager.broadcast(message)
+    # A repeat of the same event type for the same generation (e.g. several
+    # job:retrying) supersedes one still waiting in a client's send queue.
+    coalesce_key = None
+    if message.get("generation_id") is not None:
+        coalesce_key = f"{event.event_type}:{message['generation_id']}"
+    await connection_manager.broadcast(message, coalesce_key=coalesce_key)
 
 
 async def broadcast_bridge_event(event: Event):
@@ -67,7 +72,8 @@ async def broadcast_bridge_event(event: Event):
             "event_id": event.event_id,
         },
     )
-    await connection_manager.broadcast(message)
+    # Pure state: only the newest status matters to a lagging client.
+    await connection_manager.broadcast(message, coalesce_key=event.event_type)
 
 
 async def broadcast_asset_event(event: Event):
@@ -99,7 +105,10 @@ async def broadcast_asset_event(event: Event):
             "event_id": event.event_id
         }
     )
-    await connection_manager.broadcast(message)
+    coalesce_key = None
+    if event.event_type == "asset:updated" and message.get("asset_id") is not None:
+        coalesce_key = f"asset:updated:{message['asset_id']}"
+    await connection_manager.broadcast(message, coalesce_key=coalesce_key)
 
 
 def register_websocket_handlers():
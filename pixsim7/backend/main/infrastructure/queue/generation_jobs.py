@@ -10,11 +10,13 @@ import logging
 import os
 import random
 import json
+import time
 from typing import TypedDict
 from datetime import timedelta
 from datetime import datetime
 from datetime import timezone
 
+from .poll_schedule import schedule_generation_polls
 from .queue_names import (
     GENERATION_FRESH_QUEUE_NAME,
     GENERATION_RETRY_QUEUE_NAME,
@@ -204,7 +206,20 @@ async def enqueue_immediate_poll(arq_pool, generation_id: int) -> bool:
     tick would otherwise miss it.  Uses no dedupe lease — immediate polls are
     idempotent (the `_poll_in_flight` guard handles overlap) and we never
     want to suppress one because a regular cron tick was already queued.
+
+    Also enters the generation into the poller's deadline schedule (without
+    moving an existing entry), so the cron picks it up from the next tick
+    instead of waiting for schedule reconciliation.
     """
+    try:
+        await schedule_generation_polls(
+            arq_pool, {generation_id: time.time() + 2}, only_new=True,
+        )
+    except Exception as e:
+        logger.warning(
+            "poll_schedule_add_failed",
+            extra={"generation_id": generation_id, "error": str(e)},
+        )
     try:
         await arq_pool.enqueue_job(
             "poll_generation_once",
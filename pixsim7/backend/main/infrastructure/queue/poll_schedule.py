@@ -0,0 +1,166 @@
+"""
+Status-poll schedule: deadline-ordered generation polls in Redis.
+
+Every PROCESSING generation has a ``next_poll_at`` (epoch seconds) in one of
+``POLL_SCHEDULE_SLOTS`` sorted sets. A generation's slot is fixed (CRC of its
+id). Poller workers heartbeat into a membership set and own slots by
+rendezvous hashing over the live members, so adding or removing a poller only
+moves the slots it gains or loses. A poll cycle reads only the due members of
+its own slots and leases them (pushes their score out by ``lease_seconds`` so
+a crashed worker's claims come back) in one Lua script, so two pollers that
+briefly disagree on slot ownership never claim the same generation; the
+poller then reschedules or removes each one after polling. A poller leaving
+cleanly drops its heartbeat so its slots move at once instead of after
+``POLL_MEMBER_TTL_SECONDS``.
+
+Layout:
+- ``pixsim7:poller:schedule:{slot}`` — ZSET generation_id -> next_poll_at
+- ``pixsim7:poller:members`` — ZSET worker_id -> last heartbeat
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import socket
+import zlib
+from collections import defaultdict
+from typing import Iterable, Mapping
+
+POLL_SCHEDULE_KEY_PREFIX = "pixsim7:poller:schedule"
+POLL_MEMBERS_KEY = "pixsim7:poller:members"
+
+# Fixed virtual-slot count. Generations never change slot; only slot
+# ownership moves when pollers join or leave.
+POLL_SCHEDULE_SLOTS = 16
+
+# A poller that has not heartbeated for this long loses its slots.
+POLL_MEMBER_TTL_SECONDS = 15.0
+
+_worker_id: str | None = None
+
+# KEYS = slot schedule keys; ARGV[1] = now, ARGV[2] = limit, ARGV[3] = lease
+# deadline. Reads and leases due members in one step. Returns the claimed ids.
+_CLAIM_DUE_LUA = """
+local claimed = {}
+local limit = tonumber(ARGV[2])
+for _, key in ipairs(KEYS) do
+    local remaining = limit - #claimed
+    if remaining <= 0 then
+        break
+    end
+    local members = redis.call('ZRANGEBYSCORE', key, '-inf', ARGV[1], 'LIMIT', 0, remaining)
+    for _, member in ipairs(members) do
+        redis.call('ZADD', key, 'XX', ARGV[3], member)
+        claimed[#claimed + 1] = member
+    end
+end
+return claimed
+"""
+
+
+def poll_schedule_key(slot: int) -> str:
+    return f"{POLL_SCHEDULE_KEY_PREFIX}:{slot}"
+
+
+def poll_schedule_slot(generation_id: int) -> int:
+    """Stable slot for a generation (process-independent, unlike ``hash()``)."""
+    return zlib.crc32(str(int(generation_id)).encode()) % POLL_SCHEDULE_SLOTS
+
+
+def poll_worker_id() -> str:
+    """Identity this process heartbeats under (host:pid)."""
+    global _worker_id
+    if _worker_id is None:
+        _worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    return _worker_id
+
+
+def _decode(member) -> str:
+    return member.decode() if isinstance(member, bytes) else str(member)
+
+
+def _rendezvous_weight(member: str, slot: int) -> int:
+    digest = hashlib.blake2b(f"{member}|{slot}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def owned_slots(worker_id: str, members: Iterable[str]) -> list[int]:
+    """Slots whose highest-weight live member is ``worker_id``."""
+    live = sorted(set(members) | {worker_id})
+    return [
+        slot
+        for slot in range(POLL_SCHEDULE_SLOTS)
+        if max(live, key=lambda m: _rendezvous_weight(m, slot)) == worker_id
+    ]
+
+
+async def heartbeat_poll_worker(redis, worker_id: str, *, now: float) -> list[int]:
+    """Record a heartbeat for ``worker_id`` and return the slots it owns now."""
+    await redis.zadd(POLL_MEMBERS_KEY, {worker_id: now})
+    await redis.zremrangebyscore(POLL_MEMBERS_KEY, "-inf", now - POLL_MEMBER_TTL_SECONDS)
+    members = await redis.zrangebyscore(POLL_MEMBERS_KEY, now - POLL_MEMBER_TTL_SECONDS, "+inf")
+    return owned_slots(worker_id, (_decode(m) for m in members))
+
+
+async def leave_poll_workers(redis, worker_id: str) -> None:
+    """Drop ``worker_id``'s heartbeat so the others take its slots now."""
+    await redis.zrem(POLL_MEMBERS_KEY, worker_id)
+
+
+async def schedule_generation_polls(
+    redis,
+    due_at: Mapping[int, float],
+    *,
+    only_new: bool = False,
+) -> None:
+    """Set ``next_poll_at`` for several generations.
+
+    ``only_new`` (ZADD NX) adds missing generations without moving ones that
+    already have a schedule — used by reconciliation and the submit hook.
+    """
+    by_slot: dict[int, dict[str, float]] = defaultdict(dict)
+    for generation_id, at in due_at.items():
+        by_slot[poll_schedule_slot(generation_id)][str(int(generation_id))] = float(at)
+    for slot, mapping in by_slot.items():
+        await redis.zadd(poll_schedule_key(slot), mapping, nx=only_new)
+
+
+async def unschedule_generation_polls(redis, generation_ids: Iterable[int]) -> None:
+    by_slot: dict[int, list[str]] = defaultdict(list)
+    for generation_id in generation_ids:
+        by_slot[poll_schedule_slot(generation_id)].append(str(int(generation_id)))
+    for slot, members in by_slot.items():
+        await redis.zrem(poll_schedule_key(slot), *members)
+
+
+async def claim_due_generation_polls(
+    redis,
+    slots: Iterable[int],
+    *,
+    now: float,
+    limit: int,
+    lease_seconds: float,
+) -> list[int]:
+    """Return up to ``limit`` due generation ids from ``slots``, leasing each.
+
+    Read and lease run as one script, so a generation is claimed by at most
+    one poller per lease. The lease (ZADD XX) only touches members still
+    present, so a generation removed concurrently (terminal) is not
+    resurrected.
+    """
+    keys = [poll_schedule_key(slot) for slot in slots]
+    if not keys or limit <= 0:
+        return []
+    members = await redis.eval(
+        _CLAIM_DUE_LUA, len(keys), *keys, now, int(limit), now + lease_seconds
+    )
+    return [int(_decode(m)) for m in members or []]
+
+
+async def scheduled_generation_ids(redis, slots: Iterable[int]) -> set[int]:
+    """All generation ids currently scheduled in ``slots`` (reconciliation)."""
+    ids: set[int] = set()
+    for slot in slots:
+        members = await redis.zrange(poll_schedule_key(slot), 0, -1)
+        ids.update(int(_decode(m)) for m in members)
+    return ids
@@ -1,4 +1,5 @@
 """WebSocket infrastructure for real-time updates"""
 from .manager import connection_manager, ConnectionManager
+from .outbound import OutboundQueue
 
-__all__ = ["connection_manager", "ConnectionManager"]
+__all__ = ["connection_manager", "ConnectionManager", "OutboundQueue"]
@@ -3,15 +3,22 @@ WebSocket connection manager for real-time updates
 
 Manages WebSocket connections and broadcasts generation status updates to connected clients.
 """
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 import json
 
 from pixsim_logging import configure_logging
 
+from .outbound import DEFAULT_MAX_QUEUE_SIZE, OutboundQueue
+
 logger = configure_logging("websocket_manager").bind(domain="websocket")
 
 
+def encode_message(message: dict) -> str:
+    """Encode a message exactly like ``WebSocket.send_json`` does."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections for real-time generation updates
@@ -21,13 +28,26 @@ class ConnectionManager:
     - Broadcast to specific users
     - Broadcast to all connections
     - Automatic cleanup on disconnect
+
+    Broadcasts encode the message once and hand the text to each
+    connection's OutboundQueue; a per-connection writer task does the
+    actual send, so a slow client only delays (and eventually overflows)
+    its own queue.
     """
 
-    def __init__(self):
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
         # Map of user_id -> set of WebSocket connections
         self._connections: Dict[int, Set[WebSocket]] = {}
         # All active connections
         self._all_connections: Set[WebSocket] = set()
+        # Outbound queue and owning user per connection
+        self._queues: Dict[WebSocket, OutboundQueue] = {}
+        self._connection_users: Dict[WebSocket, int] = {}
+        self._max_queue_size = max_queue_size
+        # Counters carried over from queues of closed connections
+        self._closed_sent = 0
+        self._closed_dropped = 0
+        self._closed_coalesced = 0
 
     async def connect(self, websocket: WebSocket, user_id: int):
         """
@@ -46,6 +66,12 @@ class ConnectionManager:
 
         # Add to all connections
         self._all_connections.add(websocket)
+        self._connection_users[websocket] = user_id
+        self._queues[websocket] = OutboundQueue(
+            websocket,
+            max_size=self._max_queue_size,
+            on_failure=self._on_send_failure,
+        )
 
         logger.info(f"WebSocket connected for user {user_id}. Total connections: {len(self._all_connections)}")
 
@@ -65,9 +91,24 @@ class ConnectionManager:
 
         # Remove from all connections
         self._all_connections.discard(websocket)
+        self._connection_users.pop(websocket, None)
+
+        queue = self._queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
+            self._closed_sent += queue.sent
+            self._closed_dropped += queue.dropped
+            self._closed_coalesced += queue.coalesced
 
         logger.info(f"WebSocket disconnected for user {user_id}. Total connections: {len(self._all_connections)}")
 
+    def _on_send_failure(self, queue: OutboundQueue) -> None:
+        """Writer task hit a send error: the connection is gone."""
+        websocket = queue.websocket
+        user_id = self._connection_users.get(websocket)
+        if user_id is not None:
+            self.disconnect(websocket, user_id)
+
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """
         Send a message to a specific WebSocket connection
@@ -76,60 +117,65 @@ class ConnectionManager:
             message: Message dict to send as JSON
             websocket: Target WebSocket connection
         """
+        queue = self._queues.get(websocket)
         try:
-            await websocket.send_json(message)
+            if queue is not None:
+                # Queued behind earlier broadcasts to keep per-socket ordering
+                queue.put(encode_message(message))
+            else:
+                await websocket.send_json(message)
         except Exception as e:
             logger.error(f"Failed to send message to WebSocket: {e}")
 
-    async def broadcast_to_user(self, message: dict, user_id: int):
+    async def broadcast_to_user(
+        self,
+        message: dict,
+        user_id: int,
+        *,
+        coalesce_key: Optional[str] = None,
+    ):
         """
         Broadcast a message to all connections for a specific user
 
         Args:
             message: Message dict to send as JSON
             user_id: Target user ID
+            coalesce_key: Replace a still-queued message with the same key
+                instead of queueing another one (latest-state updates)
         """
         if user_id not in self._connections:
             return
+        self._fanout(message, list(self._connections[user_id]), coalesce_key)
 
-        # Send to all connections for this user (snapshot to avoid mutation during await)
-        dead_connections = set()
-        for connection in list(self._connections[user_id]):
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to send to user {user_id}: {e}")
-                dead_connections.add(connection)
-
-        # Clean up dead connections
-        for connection in dead_connections:
-            self.disconnect(connection, user_id)
-
-    async def broadcast(self, message: dict):
+    async def broadcast(self, message: dict, *, coalesce_key: Optional[str] = None):
         """
         Broadcast a message to all connected clients
 
         Args:
             message: Message dict to send as JSON
+            coalesce_key: Replace a still-queued message with the same key
+                instead of queueing another one (latest-state updates)
         """
-        # Snapshot the set — concurrent disconnects can mutate _all_connections
-        # during awaits, which would raise RuntimeError on set iteration.
-        snapshot = list(self._all_connections)
-        dead_connections = set()
-        for connection in snapshot:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast: {e}")
-                dead_connections.add(connection)
-
-        # Clean up dead connections
-        for connection in dead_connections:
-            # Find user_id for this connection
-            for user_id, user_connections in list(self._connections.items()):
-                if connection in user_connections:
-                    self.disconnect(connection, user_id)
-                    break
+        self._fanout(message, list(self._all_connections), coalesce_key)
+
+    def _fanout(
+        self,
+        message: dict,
+        connections: List[WebSocket],
+        coalesce_key: Optional[str],
+    ) -> None:
+        if not connections:
+            return
+        try:
+            text = encode_message(message)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to encode WebSocket message: {e}")
+            return
+
+        for connection in connections:
+            queue = self._queues.get(connection)
+            if queue is not None:
+                queue.put(text, coalesce_key)
 
     def get_connection_count(self) -> int:
         """Get total number of active connections"""
@@ -139,6 +185,34 @@ class ConnectionManager:
         """Get number of connections for a specific user"""
         return len(self._connections.get(user_id, set()))
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Outbound queue metrics (current depth + lifetime counters)."""
+        queues = list(self._queues.values())
+        return {
+            "connections": len(self._all_connections),
+            "max_queue_size": self._max_queue_size,
+            "queued": sum(q.depth for q in queues),
+            "max_queue_depth": max((q.depth for q in queues), default=0),
+            "peak_queue_depth": max((q.max_depth for q in queues), default=0),
+            "sent": self._closed_sent + sum(q.sent for q in queues),
+            "dropped": self._closed_dropped + sum(q.dropped for q in queues),
+            "coalesced": self._closed_coalesced + sum(q.coalesced for q in queues),
+        }
+
+    def get_connection_stats(self) -> List[Dict[str, Any]]:
+        """Per-connection queue metrics; carries user ids, so admin-only."""
+        return [
+            {
+                "user_id": self._connection_users.get(q.websocket),
+                "depth": q.depth,
+                "peak_depth": q.max_depth,
+                "sent": q.sent,
+                "dropped": q.dropped,
+                "coalesced": q.coalesced,
+            }
+            for q in self._queues.values()
+        ]
+
 
 # Global connection manager instance
 connection_manager = ConnectionManager()
@@ -0,0 +1,147 @@
+"""
+Per-connection outbound queues for WebSocket fanout
+
+Each connection gets a bounded queue of pre-encoded text frames drained by
+its own writer task, so a broadcast only enqueues and one slow client can
+no longer hold up delivery to everyone else.
+
+Overflow policy:
+- Messages enqueued with a coalesce key replace a still-queued message with
+  the same key (latest state wins). The stale entry is dropped and the new
+  one joins the tail, so it is never delivered ahead of messages queued
+  before it. Use it for state/progress-style updates where only the newest
+  value matters.
+- When the queue is full, the oldest queued message is dropped.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from fastapi import WebSocket
+
+from pixsim_logging import configure_logging
+
+logger = configure_logging("websocket_outbound").bind(domain="websocket")
+
+DEFAULT_MAX_QUEUE_SIZE = 256
+
+
+class OutboundQueue:
+    """
+    Bounded send queue + writer task for one WebSocket connection.
+
+    Entries are ``[coalesce_key, text]`` lists; ``_keyed`` maps a coalesce
+    key to its still-queued entry (matched by identity) so a newer update
+    can take its place. A replaced entry is marked dead (``text = None``)
+    rather than searched for and removed; dead entries are skipped when
+    popping and compacted away once they outnumber the live ones.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        *,
+        max_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        on_failure: Optional[Callable[["OutboundQueue"], None]] = None,
+    ):
+        self.websocket = websocket
+        self.max_size = max(1, max_size)
+        self._on_failure = on_failure
+        self._items: Deque[List[Any]] = deque()
+        self._keyed: Dict[str, List[Any]] = {}
+        self._live = 0
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def depth(self) -> int:
+        return self._live
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, text: str, coalesce_key: Optional[str] = None) -> None:
+        """Queue a pre-encoded frame (never blocks)."""
+        if self._closed:
+            return
+
+        if coalesce_key is not None:
+            pending = self._keyed.pop(coalesce_key, None)
+            if pending is not None:
+                pending[1] = None
+                self._live -= 1
+                self.coalesced += 1
+
+        if self._live >= self.max_size:
+            self._pop_live()
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(
+                    "websocket_outbound_overflow",
+                    dropped=self.dropped,
+                    max_size=self.max_size,
+                )
+
+        entry = [coalesce_key, text]
+        self._items.append(entry)
+        self._live += 1
+        if coalesce_key is not None:
+            self._keyed[coalesce_key] = entry
+        if self._live > self.max_depth:
+            self.max_depth = self._live
+        if len(self._items) > 2 * self.max_size:
+            self._items = deque(item for item in self._items if item[1] is not None)
+        self._wakeup.set()
+
+    def _pop_live(self) -> List[Any]:
+        """Pop the oldest live entry (caller checks ``_live > 0``)."""
+        while True:
+            entry = self._items.popleft()
+            if entry[1] is not None:
+                break
+        self._live -= 1
+        key = entry[0]
+        if key is not None and self._keyed.get(key) is entry:
+            del self._keyed[key]
+        return entry
+
+    def close(self) -> None:
+        """Stop the writer; anything still queued is discarded."""
+        if self._closed:
+            return
+        self._discard()
+        self._task.cancel()
+
+    def _discard(self) -> None:
+        self._closed = True
+        self._items.clear()
+        self._keyed.clear()
+        self._live = 0
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                while not self._live:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+
+                entry = self._pop_live()
+                await self.websocket.send_text(entry[1])
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("websocket_outbound_send_failed", error=str(e))
+            self._discard()
+            if self._on_failure is not None:
+                self._on_failure(self)
@@ -32,6 +32,11 @@ from pixsim7.backend.main.infrastructure.queue import (
     get_generation_wait_metadata,
 )
 from pixsim7.backend.main.domain.providers.model_families import MODEL_ID_TO_FAMILY
+from pixsim7.backend.main.infrastructure.redis import get_redis
+from pixsim7.backend.main.services.account.slot_allocator import (
+    claim_account_slot,
+    release_account_slot,
+)
 
 logger = get_logger()
 
@@ -532,6 +537,30 @@ def _apply_user_visibility_filter(query, user_id: Optional[int]):
     return query.where(ProviderAccount.is_private == False)  # noqa: E712
 
 
+async def _slot_allocator_redis():
+    """Redis client for the account slot allocator, or None when it is off."""
+    from pixsim7.backend.main.services.generation.worker_settings import get_worker_settings
+    if not getattr(get_worker_settings(), "account_slot_allocator_enabled", True):
+        return None
+    try:
+        return await get_redis()
+    except Exception:
+        return None
+
+
+async def _release_slot_best_effort(redis, provider_id: str, account_id: int) -> None:
+    try:
+        await release_account_slot(redis, provider_id, account_id)
+    except Exception as e:
+        # The counter only over-reports until it expires or is reconciled.
+        logger.debug(
+            "account_slot_release_failed",
+            provider_id=provider_id,
+            account_id=account_id,
+            error=str(e),
+        )
+
+
 class AccountService:
     """
     Provider account management service
@@ -1256,8 +1285,59 @@ class AccountService:
             """Walk ranked candidates, atomically reserving the first one that
             still meets all eligibility predicates. Returns None if every
             candidate lost the race or had its state change between scan and
-            lock."""
-            for candidate in candidates:
+            lock.
+
+            With the slot allocator, one Redis script picks the first
+            candidate with a free slot across all workers, and only that row
+            is reserved in Postgres. A DB refusal hands the slot back and
+            resumes after that candidate; a Redis failure falls back to the
+            row-by-row walk over whatever is left.
+            """
+            remaining = list(candidates)
+            slot_redis = await _slot_allocator_redis() if remaining else None
+            if slot_redis is not None:
+                while remaining:
+                    try:
+                        claimed_id = await claim_account_slot(
+                            slot_redis,
+                            provider_id,
+                            [
+                                (c.id, c.current_processing_jobs, c.max_concurrent_jobs)
+                                for c in remaining
+                            ],
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "account_slot_allocator_unavailable",
+                            provider_id=provider_id,
+                            error=str(e),
+                        )
+                        break
+                    if claimed_id is None:
+                        return None
+                    index = next(
+                        (i for i, c in enumerate(remaining) if c.id == claimed_id),
+                        None,
+                    )
+                    if index is None:
+                        await _release_slot_best_effort(slot_redis, provider_id, claimed_id)
+                        break
+                    reserved = await self.reserve_account_if_available(
+                        claimed_id,
+                        require_active=True,
+                        include_exhausted=include_exhausted,
+                        now=now,
+                        skip_locked=True,
+                    )
+                    if reserved is not None:
+                        return reserved
+                    await _release_slot_best_effort(slot_redis, provider_id, claimed_id)
+                    remaining = remaining[index + 1:]
+                else:
+                    # Every candidate was full or refused.
+                    return None
+
+            for candidate in remaining:
                 reserved = await self.reserve_account_if_available(
                     candidate.id,
                     require_active=True,
@@ -1411,6 +1491,10 @@ class AccountService:
         await self.db.commit()
         await self.db.refresh(account)
 
+        slot_redis = await _slot_allocator_redis()
+        if slot_redis is not None:
+            await _release_slot_best_effort(slot_redis, account.provider_id, account.id)
+
         if skip_wake:
             return account
 
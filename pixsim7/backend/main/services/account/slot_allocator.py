@@ -0,0 +1,105 @@
+"""
+Redis-resident account slot counters for ``select_and_reserve_account``.
+
+The candidate scan still decides *who* is eligible and in what order (status,
+cooldown, credits, routing, grants, discounts all stay in SQL/Python). What
+moves to Redis is the race: one Lua call walks the ranked candidates and
+claims a slot on the first one with room, so concurrent workers that ranked
+the same accounts split them in one round-trip instead of each losing
+``SKIP LOCKED`` races row by row.
+
+Postgres stays authoritative. The winner is still reserved with the
+conditional ``UPDATE`` in ``reserve_account_if_available``; if that fails the
+Redis slot is handed back. A counter is only trusted over the scanned
+``current_processing_jobs`` for ``ACCOUNT_SLOTS_SETTLE_SECONDS`` after its
+last claim (the window in which the DB may not show the reservation yet);
+after that the DB value wins, so decrements made outside
+``release_account`` heal on the next claim. ``reconcile_account_counters``
+also drops the counters outright.
+
+Layout:
+- ``pixsim7:account_slots:{provider_id}`` — HASH ``{account_id}`` -> slots in
+  use, ``{account_id}:at`` -> time of the last claim
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence
+
+ACCOUNT_SLOTS_KEY_PREFIX = "pixsim7:account_slots"
+
+# Idle counters are re-seeded from Postgres after this long.
+ACCOUNT_SLOTS_TTL_SECONDS = 120
+
+# How long after a claim the Redis count may run ahead of the DB count.
+ACCOUNT_SLOTS_SETTLE_SECONDS = 5
+
+# KEYS[1] = slot hash; ARGV[1] = ttl, ARGV[2] = settle seconds; then
+# (account_id, db_jobs, max_jobs) triples in rank order. Returns the claimed
+# account id, or false.
+_CLAIM_SLOT_LUA = """
+local key = KEYS[1]
+local now = tonumber(redis.call('TIME')[1])
+local settle = tonumber(ARGV[2])
+local claimed = false
+for i = 3, #ARGV, 3 do
+    local account_id = ARGV[i]
+    local db_used = tonumber(ARGV[i + 1])
+    local used = tonumber(redis.call('HGET', key, account_id) or '0')
+    local claimed_at = tonumber(redis.call('HGET', key, account_id .. ':at') or '0')
+    if db_used > used or now - claimed_at > settle then
+        used = db_used
+    end
+    if used < tonumber(ARGV[i + 2]) then
+        redis.call('HSET', key, account_id, used + 1, account_id .. ':at', now)
+        claimed = account_id
+        break
+    end
+    redis.call('HSET', key, account_id, used)
+end
+redis.call('EXPIRE', key, ARGV[1])
+return claimed
+"""
+
+_RELEASE_SLOT_LUA = """
+local used = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if used > 0 then
+    redis.call('HSET', KEYS[1], ARGV[1], used - 1)
+end
+return used
+"""
+
+
+def account_slots_key(provider_id: str) -> str:
+    return f"{ACCOUNT_SLOTS_KEY_PREFIX}:{provider_id}"
+
+
+async def claim_account_slot(
+    redis,
+    provider_id: str,
+    candidates: Sequence[tuple[int, int, int]],
+) -> Optional[int]:
+    """Claim a slot on the first ``(account_id, db_jobs, max_jobs)`` with room.
+
+    ``candidates`` must be in rank order. Returns the account id, or None
+    when every candidate is full.
+    """
+    if not candidates:
+        return None
+    args: list = [ACCOUNT_SLOTS_TTL_SECONDS, ACCOUNT_SLOTS_SETTLE_SECONDS]
+    for account_id, db_jobs, max_jobs in candidates:
+        args.extend((int(account_id), int(db_jobs or 0), int(max_jobs or 0)))
+    claimed = await redis.eval(_CLAIM_SLOT_LUA, 1, account_slots_key(provider_id), *args)
+    if not claimed:
+        return None
+    return int(claimed.decode() if isinstance(claimed, bytes) else claimed)
+
+
+async def release_account_slot(redis, provider_id: str, account_id: int) -> None:
+    await redis.eval(_RELEASE_SLOT_LUA, 1, account_slots_key(provider_id), int(account_id))
+
+
+async def reset_account_slots(redis, provider_ids: Iterable[str]) -> None:
+    """Drop the counters so the next claim re-seeds them from Postgres."""
+    keys = [account_slots_key(provider_id) for provider_id in provider_ids]
+    if keys:
+        await redis.delete(*keys)
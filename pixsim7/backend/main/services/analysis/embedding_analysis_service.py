@@ -15,6 +15,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from pixsim7.backend.main.domain.assets.analysis import AssetAnalysis
 from pixsim7.backend.main.services.analysis import AnalysisService
+from pixsim7.backend.main.services.embedding.content_cache import (
+    ContentEmbeddingCache,
+    config_variant,
+)
 from pixsim7.backend.main.services.storage import get_storage_service
 from pixsim7.backend.main.services.media.embedding_input_config import (
     resolve_embedding_input_config,
@@ -39,6 +43,10 @@ async def run_embedding_analysis(
     analysis completed with the resulting vector. Videos are embedded from
     extracted JPEG frames, never the raw ``.mp4``. The applier picks the result
     up via the standard `mark_completed` hook.
+
+    Byte-identical media (same ``Asset.sha256``) embedded earlier with the same
+    embedder/model/input config is served from the content-hash cache without
+    touching storage or the daemon.
     """
     from pixsim7.embedding.locator import get_embedding_service
     from pixsim7.embedding.protocol import EmbedRequest, EmbeddingServiceError
@@ -68,6 +76,35 @@ async def run_embedding_analysis(
         duration_sec=asset.duration_sec,
         media_metadata=asset.media_metadata,
     )
+    # Cache key needs the requested (not daemon-resolved) model so the lookup
+    # and the write agree; analyses without one skip the cache.
+    content_sha = asset.sha256 if (embedder_id and model_id) else None
+    variant = config_variant(config)
+    cache = ContentEmbeddingCache(db)
+
+    if content_sha:
+        cached = await cache.get_many(
+            [content_sha], embedder_id=embedder_id, model_id=model_id, variant=variant
+        )
+        if content_sha in cached:
+            await analysis_service.mark_started(analysis_id)
+            await analysis_service.mark_completed(
+                analysis_id,
+                {"embedding": cached[content_sha]},
+            )
+            analysis_logger.info(
+                "embedding_cache_hit",
+                asset_id=asset_id,
+                embedder_id=embedder_id,
+                model_id=model_id,
+            )
+            return {
+                "status": "completed",
+                "analysis_id": analysis_id,
+                "dim": len(cached[content_sha]),
+                "cache_hit": True,
+            }
+
     storage = get_storage_service()
 
     await analysis_service.mark_started(analysis_id)
@@ -127,7 +164,7 @@ async def run_embedding_analysis(
     finally:
         cleanup_embedding_input_paths(cleanup_paths, log=analysis_logger)
 
-    if not result.vectors:
+    if len(result.vectors) == 0:
         await analysis_service.mark_failed(analysis_id, "embedding service returned no vectors")
         return {"status": "failed", "reason": "empty_result"}
 
@@ -156,6 +193,21 @@ async def run_embedding_analysis(
         input_count=len(embed_paths),
     )
 
+    if content_sha:
+        # Best-effort: the analysis is already completed, a cache write
+        # failure only costs the next duplicate a forward pass.
+        try:
+            await cache.put_many(
+                {content_sha: embedding},
+                embedder_id=embedder_id,
+                model_id=model_id,
+                variant=variant,
+            )
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            analysis_logger.warning("embedding_cache_write_failed", error=str(exc))
+
     return {
         "status": "completed",
         "analysis_id": analysis_id,
@@ -289,3 +289,188 @@ async def get_reference_fingerprints_cached(
     c["at"] = now
     c["refs"] = refs
     return refs
+
+
+# ---------- bulk library rematch ----------
+#
+# The per-clip matcher above is right for ingest and batch rescores, but a new
+# reference otherwise means walking all 96k+ stored fingerprints one clip at a
+# time. The bulk path stacks every stored fingerprint into one contiguous
+# float32 tensor and scores it against each category's pre-rotated references
+# with chunked (clips × refs) matmuls per lag — the same ``max over ref ×
+# rotation × lag`` normalized cross-correlation as ``_best_xcorr_over_refs``.
+
+# Candidate rows per matmul chunk — bounds the windowed float32 copy.
+_MATRIX_CHUNK = 2048
+# Time blocks per lag window in the prefilter bound: more blocks = tighter
+# bound (exact at one block per bin) but costlier; a 48-bin window → 4-bin blocks.
+_BOUND_BLOCKS = 12
+
+
+def stack_fingerprints(fps: list[Any]) -> dict[int, tuple[list[int], Any]]:
+    """Group stored flat fingerprints by width into contiguous tensors.
+
+    Returns ``{width: (row_indexes, (n, 12, width) float32)}`` where
+    ``row_indexes`` are positions in ``fps``. Missing/malformed fingerprints
+    are dropped (they can't be matched, exactly like :func:`_to_chroma`).
+    """
+    import numpy as np
+
+    by_w: dict[int, tuple[list[int], list[Any]]] = {}
+    for i, fp in enumerate(fps):
+        arr = _to_chroma(fp)
+        if arr is None:
+            continue
+        idx, arrs = by_w.setdefault(int(arr.shape[1]), ([], []))
+        idx.append(i)
+        arrs.append(arr)
+    return {
+        w: (idx, np.ascontiguousarray(np.stack(arrs), dtype=np.float32))
+        for w, (idx, arrs) in by_w.items()
+    }
+
+
+def _prefix_sums(x: Any) -> tuple[Any, Any]:
+    """Time-axis prefix sums of ``x`` and ``x²`` (float64, leading zero column),
+    so any window's block statistics cost O(1) — see :func:`_bound_features`."""
+    import numpy as np
+
+    pad = np.zeros(x.shape[:2] + (1,))
+    c1 = np.concatenate([pad, np.cumsum(x, axis=2, dtype=np.float64)], axis=2)
+    c2 = np.concatenate([pad, np.cumsum(np.square(x, dtype=np.float64), axis=2)], axis=2)
+    return c1, c2
+
+
+def _lag_windows(tc: int, tr: int):
+    """``(cand_start, ref_start, width)`` for each lag of the ±_MAX_LAG search."""
+    t = min(tc, tr)
+    for lag in range(-_MAX_LAG, _MAX_LAG + 1):
+        w = t - abs(lag)
+        if w <= 0:
+            continue
+        yield (lag if lag >= 0 else 0), (0 if lag >= 0 else -lag), w
+
+
+def _bound_features(prefix: tuple[Any, Any], start: int, w: int) -> tuple[Any, Any]:
+    """Block-pooled features of each ``[start, start+w)`` window for the bound.
+
+    The centered window is cut into ``_BOUND_BLOCKS`` time blocks; per block it
+    splits into a pooled-chroma part (per-pitch block mean, minus the window
+    mean) and a zero-mean residual. Returns ``(features (n, 13·K), norm (n,))``
+    where features are the ``√w_k``-weighted pooled parts followed by the
+    per-block residual norms, and ``norm`` is the total centered norm.
+    """
+    import numpy as np
+
+    c1, c2 = prefix
+    edges = start + np.linspace(0, w, min(_BOUND_BLOCKS, w) + 1).astype(int)
+    bw = np.diff(edges).astype(np.float64)                      # (K,)
+    rows = c1[:, :, edges[1:]] - c1[:, :, edges[:-1]]           # (n, 12, K)
+    sq = c2[:, :, edges[1:]] - c2[:, :, edges[:-1]]
+    mean = rows.sum(axis=(1, 2)) / (12 * w)                     # (n,)
+    pooled = (rows / bw - mean[:, None, None]) * np.sqrt(bw)    # (n, 12, K)
+    # Σ_t (x - block_row_mean)² = Σx² - (Σx)²/w_k, summed over the 12 rows.
+    resid = np.sqrt(np.maximum((sq - rows * rows / bw).sum(axis=1), 0.0))  # (n, K)
+    energy = np.maximum(sq.sum(axis=(1, 2)) - 12 * w * mean * mean, 0.0)
+    feats = np.concatenate([pooled.reshape(len(pooled), -1), resid], axis=1)
+    return feats, np.sqrt(energy)
+
+
+def _xcorr_upper_bound(cands: Any, refs: Any, ref_prefix: tuple[Any, Any]) -> Any:
+    """Per-candidate upper bound on the best normalized xcorr vs ``refs``.
+
+    Per block the pooled and residual parts are orthogonal, so
+    ``<A, B> = Σ_k w_k·p̃ᴬ_k·p̃ᴮ_k + Σ_k <Rᴬ_k, Rᴮ_k>``, and Cauchy–Schwarz on the
+    residuals alone bounds it: ``≤ Σ_k w_k·p̃ᴬ_k·p̃ᴮ_k + Σ_k ||Rᴬ_k||·||Rᴮ_k||``
+    — a single dot product of :func:`_bound_features`. That is a 13·K-wide
+    matmul per lag instead of the exact 12·w one: the coarse prefilter.
+    """
+    import numpy as np
+
+    cand_prefix = _prefix_sums(cands)
+    best = np.full(cands.shape[0], -1.0)
+    for sa, sb, w in _lag_windows(cands.shape[2], refs.shape[2]):
+        fa, na = _bound_features(cand_prefix, sa, w)
+        fb, nb = _bound_features(ref_prefix, sb, w)
+        denom = na[:, None] * nb[None, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            bound = np.where(denom > 0, (fa @ fb.T) / denom, -1.0)
+        np.maximum(best, bound.max(axis=1), out=best)
+    return best
+
+
+def _xcorr_exact(cands: Any, refs: Any) -> Any:
+    """Exact best normalized xcorr of each candidate vs ANY of ``refs``.
+
+    ``cands`` ``(n, 12, Tc)``, ``refs`` ``(G, 12, Tr)``; per lag the windows are
+    flattened and scored with one ``(n, 12w) @ (12w, G)`` matmul. Same result as
+    :func:`_best_xcorr_over_refs` per candidate (-1.0 when no valid overlap).
+    """
+    import numpy as np
+
+    best = np.full(cands.shape[0], -1.0, dtype=np.float32)
+    for sa, sb, w in _lag_windows(cands.shape[2], refs.shape[2]):
+        xb = refs[:, :, sb:sb + w]
+        xb = (xb - xb.mean(axis=(1, 2), keepdims=True)).reshape(len(refs), -1)
+        xa = cands[:, :, sa:sa + w]
+        xa = (xa - xa.mean(axis=(1, 2), keepdims=True)).reshape(len(cands), -1)
+        denom = np.sqrt((xa * xa).sum(axis=1)[:, None] * (xb * xb).sum(axis=1)[None, :])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.where(denom > 0, (xa @ xb.T) / denom, -1.0)
+        np.maximum(best, corr.max(axis=1), out=best)
+    return best
+
+
+def match_fingerprint_matrix(
+    fps: list[Any],
+    references_by_label: dict[str, list[Any]],
+    *,
+    min_score: Optional[float] = None,
+) -> tuple[list[dict[str, float]], dict[str, int]]:
+    """Bulk :func:`match_fingerprint_labeled` over many stored fingerprints.
+
+    Returns one ``{category: score}`` map per input (same order; empty for a
+    missing/malformed fingerprint) plus counters: ``clips`` matched, ``pairs``
+    (clip × reference-group) considered and ``prefiltered`` pairs whose exact
+    pass was skipped. Scores are rounded / floored at 0 like the per-clip path.
+
+    ``min_score`` enables the prefilter: a pair whose upper bound
+    (:func:`_xcorr_upper_bound`) is below it can't reach that score, so its
+    exact pass is skipped, and any category scoring below ``min_score`` is left
+    OUT of the clip's map. That scores identically (no points) as long as
+    ``min_score`` is at or below the lowest ladder threshold in use. ``None`` =
+    exact scores for every category.
+    """
+    import numpy as np
+
+    out: list[dict[str, float]] = [{} for _ in fps]
+    stats = {"clips": 0, "pairs": 0, "prefiltered": 0}
+    # Width-grouped reference stacks (+ their prefix sums for the bound), built
+    # once per call rather than per candidate chunk.
+    ref_groups = {
+        label: [
+            (stack, _prefix_sums(stack) if min_score is not None else None)
+            for stack in _grouped_ref_stacks(refs).values()
+        ]
+        for label, refs in references_by_label.items()
+        if refs
+    }
+    for idx, tensor in stack_fingerprints(fps).values():
+        stats["clips"] += len(idx)
+        for j in range(0, len(idx), _MATRIX_CHUNK):
+            cands = tensor[j:j + _MATRIX_CHUNK]
+            rows = idx[j:j + _MATRIX_CHUNK]
+            for label, groups in ref_groups.items():
+                best = np.full(len(cands), -1.0, dtype=np.float32)
+                for stack, prefix in groups:
+                    stats["pairs"] += len(cands)
+                    keep = np.arange(len(cands))
+                    if prefix is not None:
+                        keep = np.flatnonzero(_xcorr_upper_bound(cands, stack, prefix) >= min_score)
+                        stats["prefiltered"] += len(cands) - keep.size
+                    if keep.size:
+                        best[keep] = np.maximum(best[keep], _xcorr_exact(cands[keep], stack))
+                for r, score in zip(rows, best.tolist()):
+                    if min_score is None or score >= min_score:
+                        out[r][label] = round(max(0.0, score), 4)
+    return out, stats
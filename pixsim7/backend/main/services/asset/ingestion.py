@@ -16,7 +16,10 @@ Design principles:
 - Independent steps: metadata and thumbnails have separate "done" flags
 - No user param: permissions derived from asset.user_id
 - Storage abstraction: stored_key is stable, local_path is cache
+- One read per step: a download's streamed hash and one ffprobe result per
+  file are kept for the job and reused by every later step
 """
+import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
@@ -26,7 +29,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import attributes
 
 from pixsim7.backend.main.domain import Asset
-from pixsim7.backend.main.domain.enums import SyncStatus
+from pixsim7.backend.main.domain.enums import MediaType, SyncStatus
 from pixsim7.backend.main.services.storage import get_storage_service
 from pixsim7.backend.main.services.storage.roots import LOCAL_ROOT_ID
 from pixsim7.backend.main.shared.storage_utils import compute_sha256 as shared_compute_sha256
@@ -36,9 +39,10 @@ from pixsim7.backend.main.services.asset._deletion import (
     mark_provider_copy_removed,
 )
 from pixsim7.backend.main.services.media.settings import MediaSettings, get_media_settings
-from pixsim7.backend.main.services.media.download import download_file
+from pixsim7.backend.main.services.media.download import download_to_storage
 from pixsim7.backend.main.services.media.metadata import extract_metadata
-from pixsim7.backend.main.services.media.derivatives import generate_thumbnail, generate_preview
+from pixsim7.backend.main.services.media.derivatives import generate_asset_derivatives
+from pixsim7.backend.main.services.media.probe import MediaProbe, probe_media_file
 from pixsim7.backend.main.infrastructure.events.bus import event_bus
 from pixsim7.backend.main.services.asset.events import ASSET_UPDATED
 from pixsim_logging import get_logger
@@ -80,6 +84,10 @@ class AssetIngestionService:
         self.settings = get_media_settings()
         # Temp working copies pulled from non-local roots, cleaned up per job.
         self._temp_paths: list[str] = []
+        # Per-job caches keyed by local path: digests computed while
+        # downloading, and the single ffprobe result each step reuses.
+        self._file_digests: dict[str, str] = {}
+        self._media_probes: dict[str, MediaProbe] = {}
 
     async def ingest_asset(
         self,
@@ -177,8 +185,11 @@ class AssetIngestionService:
             if not local_path:
                 raise ValueError("No source available (no remote_url or local_path)")
 
-            # Step 2: Check hash for deduplication
-            file_hash = shared_compute_sha256(local_path)
+            # Step 2: Check hash for deduplication (a fresh download already
+            # hashed the bytes as they streamed to disk)
+            file_hash = self._file_digests.get(local_path)
+            if file_hash is None:
+                file_hash = await asyncio.to_thread(shared_compute_sha256, local_path)
             is_content_addressed = asset.stored_key and '/content/' in asset.stored_key
             if asset.sha256 and asset.sha256 == file_hash and is_content_addressed and not force:
                 logger.debug(
@@ -205,7 +216,9 @@ class AssetIngestionService:
 
             # Step 4: Extract metadata
             if extract_metadata and (force or not asset.metadata_extracted_at):
-                await self._do_extract_metadata(asset, local_path)
+                await self._do_extract_metadata(
+                    asset, local_path, probe=await self._media_probe(asset, local_path)
+                )
                 asset.metadata_extracted_at = datetime.now(timezone.utc)
 
             if not effective_async:
@@ -218,7 +231,7 @@ class AssetIngestionService:
                     generate_previews=generate_previews,
                 )
                 # Step 7.5: Stamp signal-quality metrics on video assets.
-                await self._trigger_signal_analysis(asset)
+                await self._trigger_signal_analysis(asset, local_path)
 
             # Step 7: Trigger on-ingest analyzers (best-effort).
             # Runs regardless of derivatives mode — analyzers fall back to
@@ -470,7 +483,7 @@ class AssetIngestionService:
                 generate_thumbnails=generate_thumbnails,
                 generate_previews=generate_previews,
             )
-            await self._trigger_signal_analysis(asset)
+            await self._trigger_signal_analysis(asset, local_path)
 
             attributes.flag_modified(asset, "media_metadata")
             await self.db.commit()
@@ -513,28 +526,36 @@ class AssetIngestionService:
         the exact same logic.  Does NOT commit or emit events — the caller
         owns the transaction boundary.
         """
-        # Step 5: Generate thumbnails
+        # Steps 5 + 6: Generate thumbnails and previews. For videos both
+        # frames come out of a single ffmpeg decode.
         # Self-heal: also retry if timestamp is set but key is missing
         # (previous run marked it done but generation actually failed).
         thumb_needed = force or not asset.thumbnail_generated_at or (
             asset.thumbnail_generated_at and not asset.thumbnail_key
         )
-        if generate_thumbnails and thumb_needed:
-            await generate_thumbnail(asset, local_path, self.settings)
-            # generate_thumbnail silently returns on ffmpeg failure without
-            # setting the key.  Leaving thumbnail_generated_at unset allows
-            # future ingestion runs to retry.
+        preview_needed = force or not asset.preview_generated_at or (
+            asset.preview_generated_at and not asset.preview_key
+        )
+        do_thumbnail = bool(generate_thumbnails and thumb_needed)
+        do_preview = bool(generate_previews and preview_needed)
+        if do_thumbnail or do_preview:
+            await generate_asset_derivatives(
+                asset, local_path, self.settings,
+                thumbnail=do_thumbnail,
+                preview=do_preview,
+                probe=await self._media_probe(asset, local_path),
+            )
+
+        if do_thumbnail:
+            # Generation silently returns on ffmpeg failure without setting
+            # the key.  Leaving thumbnail_generated_at unset allows future
+            # ingestion runs to retry.
             if asset.thumbnail_key:
                 asset.thumbnail_generated_at = datetime.now(timezone.utc)
             elif asset.thumbnail_generated_at:
                 asset.thumbnail_generated_at = None
 
-        # Step 6: Generate previews
-        preview_needed = force or not asset.preview_generated_at or (
-            asset.preview_generated_at and not asset.preview_key
-        )
-        if generate_previews and preview_needed:
-            await generate_preview(asset, local_path, self.settings)
+        if do_preview:
             if asset.preview_key:
                 asset.preview_generated_at = datetime.now(timezone.utc)
             elif asset.preview_generated_at:
@@ -594,10 +615,29 @@ class AssetIngestionService:
         if not asset.remote_url:
             return None
 
-        return await download_file(asset, self.settings)
+        downloaded = await download_to_storage(asset, self.settings)
+        self._file_digests[downloaded.path] = downloaded.sha256
+        return downloaded.path
+
+    async def _media_probe(self, asset: Asset, local_path: str) -> Optional[MediaProbe]:
+        """The job's single ffprobe result for a video file (None for images).
+
+        Metadata extraction, rotation lookup, thumbnail/preview validation and
+        the signal-analysis fallback all read this instead of re-probing.
+        """
+        if asset.media_type != MediaType.VIDEO:
+            return None
+        probe = self._media_probes.get(local_path)
+        if probe is None:
+            probe = await asyncio.to_thread(probe_media_file, local_path)
+            self._media_probes[local_path] = probe
+        return probe
 
     def _cleanup_temp_files(self) -> None:
-        """Remove temp working copies pulled from a non-local root (per job)."""
+        """Remove temp working copies pulled from a non-local root and drop the
+        per-job digest/probe caches."""
+        self._file_digests.clear()
+        self._media_probes.clear()
         while self._temp_paths:
             p = self._temp_paths.pop()
             try:
@@ -632,11 +672,13 @@ class AssetIngestionService:
 
         return key
 
-    async def _do_extract_metadata(self, asset: Asset, local_path: str) -> None:
+    async def _do_extract_metadata(
+        self, asset: Asset, local_path: str, *, probe: Optional[MediaProbe] = None,
+    ) -> None:
         """Delegate metadata extraction to media module."""
-        await extract_metadata(asset, local_path)
+        await extract_metadata(asset, local_path, probe=probe)
 
-    async def _trigger_signal_analysis(self, asset: Asset) -> None:
+    async def _trigger_signal_analysis(self, asset: Asset, local_path: Optional[str] = None) -> None:
         """Stamp signal-quality metrics for video assets at ingest time.
 
         Best-effort: never blocks ingestion. Service is idempotent — re-runs
@@ -655,8 +697,9 @@ class AssetIngestionService:
                 load_cohort_baselines,
             )
             baselines = await load_cohort_baselines(self.db)
+            media_probe = await self._media_probe(asset, local_path) if local_path else None
             await SignalAnalysisService(self.db).probe_and_stamp(
-                asset, commit=False, cohort_baselines=baselines
+                asset, commit=False, cohort_baselines=baselines, media_probe=media_probe,
             )
         except Exception as e:  # noqa: BLE001 — never let a probe block ingest
             logger.warning("signal_analysis_ingest_failed", asset_id=asset.id, error=str(e))
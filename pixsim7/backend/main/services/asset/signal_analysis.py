@@ -63,9 +63,10 @@ import re
 import shutil
 import statistics
 import subprocess
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -73,6 +74,9 @@ from pixsim7.backend.main.domain.assets.models import Asset
 from pixsim7.backend.main.services.asset.signal_scoring_params import ScoringParams
 from pixsim_logging import get_logger
 
+if TYPE_CHECKING:
+    from pixsim7.backend.main.services.media.probe import MediaProbe
+
 logger = get_logger()
 
 # Bump when scoring changes so re-scans can be detected via prev_scanner_version.
@@ -266,6 +270,9 @@ SPECTRAL_HOP = 1024        # hop between frames (samples)
 # rather than risk a false "broken". Real broken hums are tonal throughout (100+
 # frames), so this only mutes genuinely under-sampled clips.
 MIN_SPECTRAL_FRAMES = 15
+# Frames per batched rfft in the spectral probe — bounds the float64 frame copy
+# (~4 MB at SPECTRAL_WIN=2048) on long clips without a per-frame Python loop.
+_STFT_CHUNK_FRAMES = 256
 # Chroma fingerprint: the (T×12) chromagram is mean-pooled to this many time bins
 # so it's fixed-size + storable (12×48 = 576 floats ≈ ~3KB/clip in signal_metrics).
 # 48 bins over a ~10s clip ≈ 4–5 bins/sec — enough melodic contour for lag/rotation
@@ -346,6 +353,23 @@ def probe_streams(source: str) -> dict[str, Optional[float]]:
     return out
 
 
+def stream_info_from_probe(probe: "MediaProbe") -> dict[str, Optional[float]]:
+    """:func:`probe_streams` keys read from a shared ffprobe JSON result, so an
+    ingest job that already probed the file needs no second ffprobe spawn."""
+    out: dict[str, Optional[Any]] = {"audio_sample_rate": None, "audio_channels": None, "duration_sec": None}
+    audio = probe.first_stream("audio") or {}
+    rate, channels = str(audio.get("sample_rate") or ""), audio.get("channels")
+    if rate.isdigit():
+        out["audio_sample_rate"] = int(rate)
+    if isinstance(channels, int):
+        out["audio_channels"] = channels
+    try:
+        out["duration_sec"] = float(probe.format["duration"])
+    except (KeyError, TypeError, ValueError):
+        pass
+    return out
+
+
 def _dhash_8x8(gray: bytes, w: int = 9, h: int = 8) -> int:
     bits = 0
     for y in range(h):
@@ -359,20 +383,8 @@ def _hamming(a: int, b: int) -> int:
     return bin(a ^ b).count("1")
 
 
-def probe_phash(source: str, fps: int = 4, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dict[str, Optional[float]]:
-    """Decode at low fps/res to grayscale, dhash each frame, return divergence stats.
-
-    Cheap (~1s per 15s clip): ffmpeg drops to 9x8 grayscale at 4fps and writes
-    raw bytes to stdout. `source` is a local file path or a fetchable URL.
-    """
-    r = _run([
-        "ffmpeg", "-hide_banner", "-nostats",
-        *_threads_arg(threads),
-        "-i", source,
-        "-vf", f"fps={fps},scale=9:8,format=gray",
-        "-f", "rawvideo", "-",
-    ])
-    raw = r.stdout
+def _phash_stats(raw: bytes) -> dict[str, Optional[float]]:
+    """dhash divergence stats over a raw 9x8 grayscale frame stream."""
     frame_size = 9 * 8
     n = len(raw) // frame_size
     if n < 2:
@@ -387,6 +399,26 @@ def probe_phash(source: str, fps: int = 4, *, threads: int = DEFAULT_FFMPEG_THRE
     }
 
 
+def _phash_vf(fps: int) -> str:
+    return f"fps={fps},scale=9:8,format=gray"
+
+
+def probe_phash(source: str, fps: int = 4, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dict[str, Optional[float]]:
+    """Decode at low fps/res to grayscale, dhash each frame, return divergence stats.
+
+    Cheap (~1s per 15s clip): ffmpeg drops to 9x8 grayscale at 4fps and writes
+    raw bytes to stdout. `source` is a local file path or a fetchable URL.
+    """
+    r = _run([
+        "ffmpeg", "-hide_banner", "-nostats",
+        *_threads_arg(threads),
+        "-i", source,
+        "-vf", _phash_vf(fps),
+        "-f", "rawvideo", "-",
+    ])
+    return _phash_stats(r.stdout)
+
+
 def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dict[str, Optional[Any]]:
     """Decode audio ONCE to mono PCM and derive every audio feature in one pass.
 
@@ -413,8 +445,6 @@ def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dic
     `source` is a local path or fetchable URL. numpy is imported lazily. Scalar
     fields are None / chroma_fp is None when there's < ~1s of audible audio.
     """
-    import numpy as np
-
     r = _run([
         "ffmpeg", "-hide_banner", "-nostats",
         *_threads_arg(threads),
@@ -422,7 +452,18 @@ def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dic
         "-ac", "1", "-ar", str(SPECTRAL_SR),
         "-f", "f32le", "-",
     ])
-    x = np.frombuffer(r.stdout, dtype=np.float32)
+    return _spectral_features(r.stdout)
+
+
+def _spectral_features(pcm: bytes) -> dict[str, Optional[Any]]:
+    """Every :func:`probe_spectral` feature from mono f32le PCM at SPECTRAL_SR.
+
+    Split from the decode so the unified probe (:func:`probe_unified`) can feed
+    the PCM it captured alongside the video frames through the same analysis.
+    """
+    import numpy as np
+
+    x = np.frombuffer(pcm, dtype=np.float32)
 
     # Overall loudness (RMS / peak in dBFS) from the SAME PCM — replaces a
     # separate ffmpeg `volumedetect` decode (one fewer decode per clip). Float
@@ -449,7 +490,7 @@ def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dic
     window = np.hanning(win)
 
     # Per-frame pitch-class map (bins → 0..11 semitone class), restricted to a
-    # musically meaningful band. Computed once per call (cheap vs the FFT loop).
+    # musically meaningful band. Computed once per call (cheap vs the FFT).
     freqs = np.fft.rfftfreq(win, 1.0 / SPECTRAL_SR)
     with np.errstate(divide="ignore"):
         midi = 69 + 12 * np.log2(np.where(freqs > 0, freqs, 1) / 440.0)
@@ -457,31 +498,36 @@ def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dic
     chroma_band = (freqs >= 60) & (freqs <= 5000)
     pc_band = pc[chroma_band]
 
-    flats: list[float] = []
-    tonal = 0
-    chroma_rows: list[Any] = []   # per audible frame: L1-normalized 12-vector
-    energy: list[float] = []      # per audible frame: linear power (for envelope)
-    loud: list[float] = []        # per audible frame: loudness in dB
-    flux: list[float] = []        # spectral flux between consecutive audible frames
-    prev_mag: Optional[Any] = None
-    for i in range(0, len(x) - win, hop):
-        mag = np.abs(np.fft.rfft(x[i:i + win] * window)) + 1e-9
-        if mag.sum() < 1e-3:  # silent frame — skip; also breaks the flux chain
-            prev_mag = None
-            continue
-        flat = float(np.exp(np.log(mag).mean()) / mag.mean())
-        flats.append(flat)
-        if flat < FRAME_TONAL_FLATNESS:
-            tonal += 1
-        c = np.bincount(pc_band, weights=mag[chroma_band], minlength=12)
-        c = c / (c.sum() + 1e-9)
-        chroma_rows.append(c)
-        p = float((mag * mag).sum())
-        energy.append(p)
-        loud.append(10.0 * np.log10(p + 1e-9))
-        if prev_mag is not None:
-            flux.append(float(np.maximum(mag - prev_mag, 0.0).sum()))
-        prev_mag = mag
+    # Batched STFT: frame the whole signal as a strided (read-only) view and run
+    # one 2-D rfft per chunk instead of a Python loop of per-hop rffts. Chunking
+    # only bounds the float64 frame copy; every feature below is an array op over
+    # the (frames × bins) magnitude matrix. Frame starts match the old loop
+    # exactly (``range(0, len(x) - win, hop)``).
+    n_frames = len(range(0, len(x) - win, hop))
+    framed = np.lib.stride_tricks.sliding_window_view(x, win)[::hop][:n_frames]
+    mag = np.concatenate([
+        np.abs(np.fft.rfft(framed[j:j + _STFT_CHUNK_FRAMES] * window, axis=1))
+        for j in range(0, n_frames, _STFT_CHUNK_FRAMES)
+    ]) + 1e-9  # (frames, win//2 + 1)
+
+    # Silent frames are skipped; a silent frame also breaks the flux chain, so
+    # flux only counts pairs of ADJACENT audible frames.
+    audible = mag.sum(axis=1) >= 1e-3
+    flux_pairs = audible[1:] & audible[:-1]
+    flux_all = np.maximum(mag[1:] - mag[:-1], 0.0).sum(axis=1)
+    flux = flux_all[flux_pairs]
+    mag = mag[audible]
+
+    flats = np.exp(np.log(mag).mean(axis=1)) / mag.mean(axis=1)
+    tonal = int((flats < FRAME_TONAL_FLATNESS).sum())
+    # Chroma via a (bins × 12) one-hot pitch-class matrix — the batched form of
+    # the per-frame ``np.bincount(pc_band, weights=...)``.
+    pc_onehot = np.zeros((pc_band.size, 12))
+    pc_onehot[np.arange(pc_band.size), pc_band] = 1.0
+    chroma_rows = mag[:, chroma_band] @ pc_onehot
+    chroma_rows = chroma_rows / (chroma_rows.sum(axis=1, keepdims=True) + 1e-9)
+    energy = (mag * mag).sum(axis=1)   # per audible frame: linear power (for envelope)
+    loud = 10.0 * np.log10(energy + 1e-9)
 
     if len(flats) < MIN_SPECTRAL_FRAMES:
         # Too little audible audio to judge — abstain (don't flag), keep the count.
@@ -527,6 +573,115 @@ def probe_spectral(source: str, *, threads: int = DEFAULT_FFMPEG_THREADS) -> dic
     }
 
 
+# ---------- unified single-decode probe ----------
+
+# ffmpeg channel-layout names → channel count (the input banner prints the
+# layout, not a number; "N channels" is handled separately).
+_CHANNEL_LAYOUTS = {
+    "mono": 1, "stereo": 2, "2.1": 3, "3.0": 3, "3.0(back)": 3,
+    "4.0": 4, "quad": 4, "quad(side)": 4, "3.1": 4,
+    "5.0": 5, "5.0(side)": 5, "4.1": 5,
+    "5.1": 6, "5.1(side)": 6, "6.0": 6, "6.0(front)": 6, "hexagonal": 6,
+    "6.1": 7, "6.1(back)": 7, "6.1(front)": 7, "7.0": 7, "7.0(front)": 7,
+    "7.1": 8, "7.1(wide)": 8, "7.1(wide-side)": 8, "octagonal": 8,
+}
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_AUDIO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*?: Audio: (.*)")
+_INPUT_STREAM_TYPE_RE = re.compile(r"Stream #\d+:\d+.*?: (Video|Audio): ")
+
+
+def _input_stream_types(stderr_txt: str) -> set[str]:
+    """``{"Video", "Audio"}`` subset listed in ffmpeg's ``Input #0`` banner.
+
+    ffmpeg prints the input streams before it rejects an unmatched ``-map``, so
+    this works on a failed run too.
+    """
+    txt = stderr_txt.split("Output #0", 1)[0].split("Stream mapping:", 1)[0]
+    return set(_INPUT_STREAM_TYPE_RE.findall(txt))
+
+
+def _parse_input_info(stderr_txt: str) -> dict[str, Optional[Any]]:
+    """Sample-rate / channels / duration from ffmpeg's input banner.
+
+    Same keys as :func:`probe_streams` (first audio stream wins), read from the
+    ``Input #0`` section ffmpeg prints anyway — so the unified probe needs no
+    separate ffprobe spawn. Output-section streams are ignored.
+    """
+    out: dict[str, Optional[Any]] = {"audio_sample_rate": None, "audio_channels": None, "duration_sec": None}
+    txt = stderr_txt.split("Output #0", 1)[0].split("Stream mapping:", 1)[0]
+    m = _DURATION_RE.search(txt)
+    if m:
+        h, mnt, sec = m.groups()
+        out["duration_sec"] = int(h) * 3600 + int(mnt) * 60 + float(sec)
+    m = _AUDIO_STREAM_RE.search(txt)
+    if m:
+        fields = [f.strip() for f in m.group(1).split(",")]
+        for i, field in enumerate(fields):
+            hz = re.fullmatch(r"(\d+) Hz", field)
+            if not hz:
+                continue
+            out["audio_sample_rate"] = int(hz.group(1))
+            if i + 1 < len(fields):
+                layout = fields[i + 1]
+                n = re.fullmatch(r"(\d+) channels", layout)
+                out["audio_channels"] = int(n.group(1)) if n else _CHANNEL_LAYOUTS.get(layout)
+            break
+    return out
+
+
+def probe_unified(
+    source: str,
+    fps: int = 4,
+    *,
+    threads: int = DEFAULT_FFMPEG_THREADS,
+    audio: bool = True,
+) -> Optional[dict[str, Any]]:
+    """Demux + decode ONCE and derive the stream, phash and spectral metrics.
+
+    A single ffmpeg process with two outputs: the 9x8 gray dhash frames go to
+    stdout and the mono f32 PCM to a scratch file, while sample-rate / channels /
+    duration are parsed from the same run's input banner. Replaces the three
+    separate spawns (ffprobe + video decode + audio decode) that each re-read the
+    file. Returns the same keys as :func:`probe_streams` + :func:`probe_phash` +
+    :func:`probe_spectral`, or ``None`` when the combined run can't produce them
+    (e.g. no video stream, or a decode error) so the caller can fall back to the
+    per-probe path.
+
+    ``audio=False`` maps the video only and reports the no-audio spectral
+    features, for a clip already known to be silent. A clip whose banner shows
+    video but no audio stream is retried that way instead of failing over.
+    """
+    fd, pcm_path = tempfile.mkstemp(prefix="pixsim_signal_", suffix=".f32")
+    os.close(fd)
+    try:
+        cmd = [
+            "ffmpeg", "-hide_banner", "-nostats", "-y",
+            *_threads_arg(threads),
+            "-i", source,
+            "-map", "0:v:0", "-vf", _phash_vf(fps), "-f", "rawvideo", "pipe:1",
+        ]
+        if audio:
+            cmd += ["-map", "0:a:0", "-ac", "1", "-ar", str(SPECTRAL_SR), "-f", "f32le", pcm_path]
+        r = _run(cmd)
+        # Any failure (even one that wrote some frames before dying) falls back:
+        # a partial decode would pass truncated phash / spectral stats as real.
+        if r.returncode != 0:
+            if audio and _input_stream_types(r.stderr.decode("utf-8", errors="ignore")) == {"Video"}:
+                return probe_unified(source, fps, threads=threads, audio=False)
+            return None
+        pcm = Path(pcm_path).read_bytes() if audio else b""
+    finally:
+        try:
+            os.unlink(pcm_path)
+        except OSError:
+            pass
+    out: dict[str, Any] = {}
+    out.update(_parse_input_info(r.stderr.decode("utf-8", errors="ignore")))
+    out.update(_phash_stats(r.stdout))
+    out.update(_spectral_features(pcm))
+    return out
+
+
 # ---------- scoring ----------
 
 def _render_points(render_ratio: Optional[float], params: ScoringParams = _DEFAULT_PARAMS) -> int:
@@ -671,15 +826,22 @@ def score_metrics(
 
 # ---------- combined per-file probe ----------
 
-def probe_path(source: str | Path, *, ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS) -> dict[str, Any]:
+def probe_path(
+    source: str | Path,
+    *,
+    ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS,
+    stream_info: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
     """Run all probes against a video and return the full metrics dict.
 
     `source` is a local file path OR a fetchable URL (e.g. a presigned S3/MinIO
     URL for an archive-tiered asset) — ffmpeg reads both, so no local copy is
     needed. ``ffmpeg_threads`` caps per-ffmpeg decode threads (0 = auto); the
-    batch reprobe lowers it to avoid CPU oversubscription under concurrency. Does
-    NOT include `score` / `suspicious` (call `score_metrics`) and does NOT touch
-    the database.
+    batch reprobe lowers it to avoid CPU oversubscription under concurrency.
+    ``stream_info`` (:func:`stream_info_from_probe` of an existing ffprobe
+    result) replaces the fallback's own ffprobe spawn. Does NOT include
+    `score` / `suspicious` (call `score_metrics`) and does NOT touch the
+    database.
 
     Raises:
         FileNotFoundError: if a LOCAL path doesn't exist (URLs aren't checked)
@@ -692,8 +854,19 @@ def probe_path(source: str | Path, *, ffmpeg_threads: int = DEFAULT_FFMPEG_THREA
         raise FileNotFoundError(s)
     if not _ffmpeg_available():
         raise RuntimeError("ffmpeg/ffprobe not available in PATH")
+    # One spawn, one read of the file for the common (video + audio) clip. A
+    # shared ffprobe result that lists no audio stream skips the audio output.
+    has_audio = stream_info is None or (
+        stream_info.get("audio_sample_rate") is not None
+        or stream_info.get("audio_channels") is not None
+    )
+    unified = probe_unified(s, threads=ffmpeg_threads, audio=has_audio)
+    if unified is not None:
+        return unified
+    # Fallback for clips the combined run can't map (no video stream) or decode.
+    logger.debug("signal_probe_unified_fallback", source=s if not is_url else "<url>")
     out: dict[str, Any] = {}
-    out.update(probe_streams(s))
+    out.update(stream_info if stream_info is not None else probe_streams(s))
     out.update(probe_phash(s, threads=ffmpeg_threads))
     # probe_spectral now also yields audio_rms_db/peak from its PCM decode, so the
     # separate probe_audio (volumedetect) pass is no longer needed.
@@ -701,6 +874,29 @@ def probe_path(source: str | Path, *, ffmpeg_threads: int = DEFAULT_FFMPEG_THREA
     return out
 
 
+def probe_source(
+    source: str,
+    *,
+    ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS,
+    asset_id: Optional[int] = None,
+    stream_info: Optional[dict[str, Any]] = None,
+) -> Optional[dict[str, Any]]:
+    """:func:`probe_path` with probe failures logged and mapped to ``None``.
+
+    Takes an already-resolved source (no ORM access), so besides backing
+    :meth:`SignalAnalysisService.probe_raw` it is safe to ship to a worker
+    process — the backfill's process-pool executor calls it there.
+    """
+    try:
+        return probe_path(source, ffmpeg_threads=ffmpeg_threads, stream_info=stream_info)
+    except (FileNotFoundError, RuntimeError, subprocess.TimeoutExpired) as e:
+        logger.warning("signal_analysis_probe_failed", asset_id=asset_id, error=str(e))
+        return None
+    except Exception as e:  # noqa: BLE001 — never let a probe crash ingest
+        logger.warning("signal_analysis_probe_unexpected", asset_id=asset_id, error=str(e), exc_info=True)
+        return None
+
+
 def load_scoring_params() -> ScoringParams:
     """The live, user-tuned score-time thresholds from ``MediaSettings.signal_scoring``.
 
@@ -905,7 +1101,11 @@ class SignalAnalysisService:
             return None
 
     def probe_raw(
-        self, asset: Asset, *, ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS
+        self,
+        asset: Asset,
+        *,
+        ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS,
+        media_probe: Optional["MediaProbe"] = None,
     ) -> Optional[dict[str, Any]]:
         """Resolve a ffmpeg source and run the full probe — the heavy, DB-FREE
         half of :meth:`probe_and_stamp`.
@@ -913,8 +1113,10 @@ class SignalAnalysisService:
         Touches no DB session, so it is safe to run off the event loop (e.g. via
         ``asyncio.to_thread``) to parallelise a batch's ffmpeg spawns.
         ``ffmpeg_threads`` caps per-ffmpeg decode threads under that concurrency.
-        Returns the raw metrics dict, or ``None`` if the asset is ineligible, has
-        no resolvable source, or the probe failed.
+        ``media_probe`` is the ingest job's ffprobe result; it is reused only
+        when it describes the resolved source. Returns the raw metrics dict,
+        or ``None`` if the asset is ineligible, has no resolvable source, or
+        the probe failed.
         """
         if not self.is_eligible(asset):
             return None
@@ -922,14 +1124,12 @@ class SignalAnalysisService:
         if source is None:
             logger.debug("signal_analysis_skip_no_source", asset_id=asset.id)
             return None
-        try:
-            return probe_path(source, ffmpeg_threads=ffmpeg_threads)
-        except (FileNotFoundError, RuntimeError, subprocess.TimeoutExpired) as e:
-            logger.warning("signal_analysis_probe_failed", asset_id=asset.id, error=str(e))
-            return None
-        except Exception as e:  # noqa: BLE001 — never let a probe crash ingest
-            logger.warning("signal_analysis_probe_unexpected", asset_id=asset.id, error=str(e), exc_info=True)
-            return None
+        stream_info = None
+        if media_probe is not None and media_probe.ok and media_probe.path == source:
+            stream_info = stream_info_from_probe(media_probe)
+        return probe_source(
+            source, ffmpeg_threads=ffmpeg_threads, asset_id=asset.id, stream_info=stream_info,
+        )
 
     async def probe_and_stamp(
         self,
@@ -940,6 +1140,7 @@ class SignalAnalysisService:
         cohort_baselines: Optional[dict[str, Any]] = None,
         ref_fingerprints: Optional[list[Any]] = None,
         prefetched: Any = _UNSET,
+        media_probe: Optional["MediaProbe"] = None,
     ) -> Optional[dict[str, Any]]:
         """Probe `asset` and stamp signal_metrics on it.
 
@@ -952,6 +1153,8 @@ class SignalAnalysisService:
                 ``cohort_baselines.load_cohort_baselines``). When provided, the
                 asset's cohort-relative render time becomes the primary signal.
                 Omit it (or pass an empty map) for corroboration-only scoring.
+            media_probe: shared ffprobe result from the ingest job (see
+                :meth:`probe_raw`).
 
         Returns:
             The new signal_metrics dict on success, or None if the asset was
@@ -967,7 +1170,7 @@ class SignalAnalysisService:
         # Use a batch-prefetched probe when supplied (parallel ffmpeg pre-pass);
         # otherwise probe inline. ``None`` is a valid prefetched value meaning
         # "no usable source / probe failed" — hence the ``_UNSET`` sentinel.
-        raw = self.probe_raw(asset) if prefetched is _UNSET else prefetched
+        raw = self.probe_raw(asset, media_probe=media_probe) if prefetched is _UNSET else prefetched
         if raw is None:
             return None
 
@@ -16,6 +16,12 @@ Both modes load the ``signalref:*`` reference fingerprints once per batch and
 feed them to the scorer, so a reprobe run after references exist computes
 ``audio_ref_match`` too.
 
+Reprobe batches fan probes out either over worker threads (default) or, with
+``MediaSettings.signal_reprobe_process_pool``, over a bounded process pool sized
+so workers × ffmpeg threads fits the cores. Either way each batch reports its
+throughput (clips/s, decode seconds, scoring seconds) in the ARQ job result via
+``last_batch_metrics``.
+
 All run lifecycle (state machine, cursor paging, re-enqueue) lives in
 ``BackfillRunServiceBase``; this subclass supplies only the per-mode scope query
 and the per-asset work.
@@ -23,6 +29,11 @@ and the per-asset work.
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -38,9 +49,13 @@ from pixsim7.backend.main.services.asset.signal_analysis import (
     _match_audio_ref,
     SCANNER_VERSION,
     SignalAnalysisService,
+    probe_source,
     stale_signal_video_conditions,
 )
 from pixsim7.backend.main.shared.errors import InvalidOperationError
+from pixsim_logging import get_logger
+
+logger = get_logger()
 
 # Run modes. "reprobe" = full ffmpeg; "rescore" = stored-metrics re-score.
 REPROBE_MODE = "reprobe"
@@ -53,6 +68,57 @@ LOCAL_REPROBE_MODE = "reprobe_local"
 VALID_MODES = (REPROBE_MODE, RESCORE_MODE, LOCAL_REPROBE_MODE)
 
 
+# ---- process-pool probe executor -------------------------------------------
+# One pool per worker process, reused across batches and rebuilt only when the
+# budgeted size changes. ``spawn`` (not fork) so children never inherit the
+# worker's event loop, DB connections or threads — and it matches Windows.
+_probe_pool: Optional[ProcessPoolExecutor] = None
+_probe_pool_workers = 0
+
+
+def _pool_budget(
+    concurrency: int, ffmpeg_threads: int, cpu_count: Optional[int] = None
+) -> Tuple[int, int]:
+    """``(workers, ffmpeg_threads)`` for the probe process pool.
+
+    Each worker runs one ffmpeg at a time plus the (GIL-free, in its own
+    process) phash/spectral analysis, so the pool is sized to keep
+    workers × ffmpeg threads within the core count, and never above the
+    caller's concurrency ceiling. ffmpeg "auto" threads (0) is pinned to 1 —
+    every worker grabbing all cores is exactly the oversubscription to avoid.
+    """
+    cores = max(1, cpu_count or os.cpu_count() or 1)
+    threads = min(max(1, ffmpeg_threads), cores)
+    workers = max(1, min(concurrency, cores // threads))
+    return workers, threads
+
+
+def _get_probe_pool(workers: int) -> ProcessPoolExecutor:
+    global _probe_pool, _probe_pool_workers
+    if _probe_pool is None or _probe_pool_workers != workers:
+        _reset_probe_pool()
+        _probe_pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _probe_pool_workers = workers
+    return _probe_pool
+
+
+def _reset_probe_pool() -> None:
+    """Drop the shared pool (size change, or a worker died → BrokenProcessPool)."""
+    global _probe_pool, _probe_pool_workers
+    if _probe_pool is not None:
+        _probe_pool.shutdown(wait=False)
+    _probe_pool, _probe_pool_workers = None, 0
+
+
+def _timed_probe(source: str, ffmpeg_threads: int) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Pool entrypoint: ``(raw_metrics | None, decode_seconds)`` for one source."""
+    started = time.perf_counter()
+    raw = probe_source(source, ffmpeg_threads=ffmpeg_threads)
+    return raw, time.perf_counter() - started
+
+
 class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
     """Durable signal-scan reprobe run lifecycle and batch execution."""
 
@@ -64,23 +130,23 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
     queue_name = MEDIA_MAINTENANCE_QUEUE_NAME
 
     # ffmpeg probing is process-spawn-bound, not compute-bound — each asset spawns
-    # 4 ffmpeg/ffprobe calls. Probe a bounded fan-out of assets concurrently off
-    # the event loop (the DB stamping stays serial — the async session isn't
-    # concurrency-safe). Live-tuned via MediaSettings; these are the fallbacks if
-    # settings can't be read.
+    # one combined ffmpeg decode (see probe_unified). Probe a bounded fan-out of
+    # assets concurrently off the event loop (the DB stamping stays serial — the
+    # async session isn't concurrency-safe). Live-tuned via MediaSettings; these
+    # are the fallbacks if settings can't be read.
     _PROBE_CONCURRENCY = 6
     _FFMPEG_THREADS = 1
 
-    async def _probe_tunables(self) -> Tuple[int, int]:
-        """(concurrency, ffmpeg_threads) for this batch, read fresh from
-        MediaSettings so a frontend change applies on the next batch without a
-        worker restart.
+    async def _probe_tunables(self) -> Tuple[int, int, bool]:
+        """(concurrency, ffmpeg_threads, use_process_pool) for this batch, read
+        fresh from MediaSettings so a frontend change applies on the next batch
+        without a worker restart.
 
         Concurrency adapts to box load: the lower ``signal_reprobe_concurrency``
         while any generation is active (the sweep shares CPU with the hot path),
         the higher ``signal_reprobe_concurrency_idle`` when the box is idle so a
-        background sweep drains faster. Falls back to the class defaults if
-        settings are unavailable (e.g. cache not yet hydrated)."""
+        background sweep drains faster. Falls back to the class defaults (thread
+        executor) if settings are unavailable (e.g. cache not yet hydrated)."""
         try:
             from pixsim7.backend.main.services.media.settings import get_media_settings
 
@@ -93,9 +159,9 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
                 if busy
                 else settings.signal_reprobe_concurrency_idle
             )
-            return max(1, int(raw)), threads
+            return max(1, int(raw)), threads, bool(settings.signal_reprobe_process_pool)
         except Exception:  # noqa: BLE001 — never let config reads break a batch
-            return self._PROBE_CONCURRENCY, self._FFMPEG_THREADS
+            return self._PROBE_CONCURRENCY, self._FFMPEG_THREADS, False
 
     async def _rescore_concurrency(self) -> int:
         """Thread count for the rescore matcher fan-out, from MediaSettings
@@ -137,6 +203,14 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
     # (e.g. unit tests calling _process_asset directly → inline probe).
     _probe_cache: Optional[Dict[int, Any]] = None
 
+    # Per-batch throughput accumulators (reset in ``_prepare_batch``): wall-clock
+    # start, summed per-probe decode seconds, summed stamp/score seconds, and
+    # which executor ran the probes. Folded into ``last_batch_metrics``.
+    _batch_started: Optional[float] = None
+    _decode_sec: float = 0.0
+    _score_sec: float = 0.0
+    _executor: Dict[str, Any] = {}
+
     async def create_run(
         self,
         *,
@@ -243,6 +317,10 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
             load_reference_fingerprints,
         )
 
+        self._batch_started = time.perf_counter()
+        self._decode_sec = self._score_sec = 0.0
+        self._executor = {}
+
         # Refresh the per-cohort render baselines ONCE, at the start of the run
         # (cursor still 0), rather than synchronously in create_run — which is what
         # blew past the client's create timeout. Later batches just load the cache.
@@ -306,7 +384,7 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
             return
         self._match_cache = None
         signal_service, _, _ = ctx
-        concurrency, ffmpeg_threads = await self._probe_tunables()
+        concurrency, ffmpeg_threads, use_pool = await self._probe_tunables()
         # Release the read transaction opened by _load_batch/_prepare_batch before
         # the (potentially minute-long) probe fan-out. Holding it idle across the
         # probe phase trips Postgres' idle_in_transaction_session_timeout (30s),
@@ -314,23 +392,104 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
         # loop. expire_on_commit=False keeps the already-loaded assets usable, and
         # nothing has been written yet, so this only ends a read-only transaction.
         await self.db.commit()
+        if use_pool:
+            self._probe_cache = await self._prefetch_via_pool(
+                assets, signal_service, concurrency, ffmpeg_threads
+            )
+            return
+        self._executor = {
+            "executor": "thread", "workers": concurrency, "ffmpeg_threads": ffmpeg_threads,
+        }
         sem = asyncio.Semaphore(concurrency)
         cache: Dict[int, Any] = {}
 
+        def _timed(asset: Asset) -> Tuple[Any, float]:
+            started = time.perf_counter()
+            raw = signal_service.probe_raw(asset, ffmpeg_threads=ffmpeg_threads)
+            return raw, time.perf_counter() - started
+
         async def _probe(asset: Asset) -> None:
             async with sem:
-                cache[asset.id] = await asyncio.to_thread(
-                    signal_service.probe_raw, asset, ffmpeg_threads=ffmpeg_threads
-                )
+                cache[asset.id], elapsed = await asyncio.to_thread(_timed, asset)
+                self._decode_sec += elapsed
 
         await asyncio.gather(*(_probe(a) for a in assets))
         self._probe_cache = cache
 
+    async def _prefetch_via_pool(
+        self,
+        assets: List[Asset],
+        signal_service: SignalAnalysisService,
+        concurrency: int,
+        ffmpeg_threads: int,
+    ) -> Dict[int, Any]:
+        """Probe the batch in the shared process pool, streaming each result
+        into the cache as it completes.
+
+        Sources are resolved here on the loop thread — eligibility and storage
+        resolution read ORM attributes, which must not cross the process
+        boundary — so workers only ever receive a path/URL string. A dead worker
+        (BrokenProcessPool) resets the pool for the next batch and leaves its
+        clips uncached-as-failed (``None`` → skipped), like any failed probe.
+        """
+        workers, threads = _pool_budget(concurrency, ffmpeg_threads)
+        self._executor = {"executor": "process", "workers": workers, "ffmpeg_threads": threads}
+        cache: Dict[int, Any] = {}
+        jobs: List[Tuple[int, str]] = []
+        for asset in assets:
+            source = (
+                signal_service._resolve_probe_source(asset)
+                if signal_service.is_eligible(asset)
+                else None
+            )
+            if source is None:
+                cache[asset.id] = None
+            else:
+                jobs.append((asset.id, source))
+        if not jobs:
+            return cache
+
+        loop = asyncio.get_running_loop()
+        pool = _get_probe_pool(workers)
+
+        broken = False
+
+        async def _probe(asset_id: int, source: str) -> None:
+            nonlocal broken
+            try:
+                raw, elapsed = await loop.run_in_executor(pool, _timed_probe, source, threads)
+            except Exception as e:  # noqa: BLE001 — one bad clip must not kill the batch
+                logger.warning("signal_backfill_pool_probe_failed", asset_id=asset_id, error=str(e))
+                broken = broken or isinstance(e, BrokenProcessPool)
+                raw, elapsed = None, 0.0
+            cache[asset_id] = raw
+            self._decode_sec += elapsed
+
+        # The pool's own worker count bounds parallelism; no semaphore needed.
+        await asyncio.gather(*(_probe(aid, src) for aid, src in jobs))
+        # Only once every sibling has settled: resetting mid-gather would
+        # cancel their futures out from under them.
+        if broken:
+            _reset_probe_pool()
+        return cache
+
     async def _process_asset(
         self,
         asset: Asset,
         run: SignalBackfillRun,
         ctx: Tuple[SignalAnalysisService, Dict[str, Any], List[Any]],
+    ) -> Dict[str, int]:
+        started = time.perf_counter()
+        try:
+            return await self._stamp_asset(asset, run, ctx)
+        finally:
+            self._score_sec += time.perf_counter() - started
+
+    async def _stamp_asset(
+        self,
+        asset: Asset,
+        run: SignalBackfillRun,
+        ctx: Tuple[SignalAnalysisService, Dict[str, Any], List[Any]],
     ) -> Dict[str, int]:
         signal_service, baselines, ref_fingerprints = ctx
         if run.mode == RESCORE_MODE:
@@ -371,7 +530,31 @@ class SignalBackfillService(BackfillRunServiceBase[SignalBackfillRun]):
         run.broken_assets += totals.get("broken", 0)
         run.skipped_assets += totals.get("skipped", 0)
 
+    def _throughput_report(self, totals: Dict[str, int]) -> Dict[str, Any]:
+        """Batch throughput for the job result: clips/s over the batch's wall
+        time, plus summed probe-decode and stamp/score seconds (decode seconds
+        add up across parallel probes, so they can exceed wall time)."""
+        wall = (
+            time.perf_counter() - self._batch_started
+            if self._batch_started is not None
+            else 0.0
+        )
+        clips = sum(totals.get(k, 0) for k in ("scanned", "skipped"))
+        return {
+            **self._executor,
+            "clips": clips,
+            "wall_sec": round(wall, 3),
+            "clips_per_sec": round(clips / wall, 2) if wall > 0 else None,
+            "decode_sec": round(self._decode_sec, 3),
+            "scoring_sec": round(self._score_sec, 3),
+        }
+
     async def _after_batch(self, run: SignalBackfillRun, totals: Dict[str, int]) -> None:
+        self.last_batch_metrics = {"throughput": self._throughput_report(totals)}
+        logger.info(
+            "signal_backfill_batch_throughput",
+            run_id=run.id, mode=run.mode, **self.last_batch_metrics["throughput"],
+        )
         # Scores changed -> drop the cached coverage snapshot so the dashboard's
         # broken-count recomputes.
         if totals.get("scanned"):
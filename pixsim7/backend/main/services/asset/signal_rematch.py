@@ -0,0 +1,220 @@
+"""Library rematch — re-apply the `signalref:*` references to every stored clip.
+
+Reference curation is iterative: tag a new broken clip as ``signalref:squeal``,
+listen, trim, repeat. Each change only moves the fingerprint-match axis, so a
+full rescore run (render context, per-asset ORM writes) is far more than it
+needs. This pass instead:
+
+  * pages the user's scored videos' stored ``signal_metrics`` (no ORM objects),
+  * scores each page against all references in one bulk matrix call
+    (``audio_fingerprint.match_fingerprint_matrix``) on a worker thread, with
+    the prefilter floored at the lowest ladder threshold in use,
+  * re-scores with the stored render ratio and the live tuned thresholds, and
+  * writes only the rows whose result changed back in one UPDATE per page,
+    merged into ``signal_metrics`` server-side so ``user_override`` and the
+    probe metrics are never round-tripped.
+
+Render baselines are NOT refreshed here — a cohort change still goes through
+the durable rescore run (``SignalBackfillService``).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pixsim7.backend.main.domain.assets.models import Asset
+from pixsim7.backend.main.services.asset.signal_scoring_params import ScoringParams
+from pixsim_logging import get_logger
+
+logger = get_logger()
+
+# Stored fingerprints matched per page — bounds the JSON decode + float32 stack
+# (~2.3 KB per 12×48 clip) while keeping the matmuls large.
+REMATCH_PAGE_SIZE = 10_000
+
+# Fields the rematch owns inside signal_metrics; everything else is preserved.
+_PATCH_KEYS = ("score", "suspicious", "audio_ref_match", "audio_ref_label", "audio_ref_scores")
+
+_BULK_UPDATE_SQL = text(
+    """
+    UPDATE assets AS a
+    SET media_metadata = jsonb_set(
+            COALESCE(a.media_metadata::jsonb, '{}'::jsonb),
+            '{signal_metrics}',
+            COALESCE(a.media_metadata::jsonb -> 'signal_metrics', '{}'::jsonb) || v.patch::jsonb
+        )::json,
+        signal_score = v.score,
+        signal_scanner_version = :version
+    FROM unnest(CAST(:ids AS bigint[]), CAST(:patches AS text[]), CAST(:scores AS int[]))
+        AS v(id, patch, score)
+    WHERE a.id = v.id
+    """
+)
+
+
+def _match_floor(labels: Any, params: ScoringParams) -> float:
+    """Lowest ladder threshold any of ``labels`` scores points at.
+
+    A category match below it earns no points, so the bulk matcher can skip
+    (and omit) it without changing any clip's score.
+    """
+    from pixsim7.backend.main.services.asset.signal_analysis import _audio_ref_cat_config
+
+    floors = []
+    for label in labels:
+        cfg = _audio_ref_cat_config(label, params)
+        floors.append(min(v for v in (cfg["hi"], cfg["strong"], cfg["weak"]) if v is not None))
+    return min(floors, default=params.audio_ref_match_weak)
+
+
+def _rematch_patch(
+    metrics: dict[str, Any],
+    scores: dict[str, float],
+    params: ScoringParams,
+    scanner_version: str,
+    floor: Optional[float] = None,
+) -> Optional[dict[str, Any]]:
+    """The ``signal_metrics`` patch for one clip, or None when nothing changed.
+
+    Mirrors ``_match_audio_ref`` (best score across categories; label only at
+    WEAK or above) and ``build_signal_metrics_payload`` (score from the stored
+    render ratio). Unchanged rows are skipped so a reference tweak that moves
+    a handful of clips writes a handful of rows.
+
+    ``floor`` is the ``min_score`` the scores were prefiltered with: stored
+    values below it (written by an exact rescore) compare as absent, so a
+    rematch doesn't rewrite rows only to drop sub-floor noise.
+    """
+    from pixsim7.backend.main.services.asset.signal_analysis import (
+        AUDIO_REF_MATCH_WEAK,
+        score_metrics,
+    )
+
+    best_label, best = None, None
+    for label, s in scores.items():
+        if best is None or s > best:
+            best_label, best = label, s
+    if best is None or best < AUDIO_REF_MATCH_WEAK:
+        best_label = None
+    score, suspicious = score_metrics(
+        metrics, render_ratio=metrics.get("render_ratio"),
+        audio_ref_match=best, audio_ref_scores=scores, params=params,
+    )
+    patch = {
+        "score": score,
+        "suspicious": suspicious,
+        "audio_ref_match": best,
+        "audio_ref_label": best_label,
+        "audio_ref_scores": scores or None,
+    }
+    stored = {k: metrics.get(k) for k in _PATCH_KEYS}
+    if floor is not None:
+        if stored["audio_ref_match"] is not None and stored["audio_ref_match"] < floor:
+            stored["audio_ref_match"] = None
+        if stored["audio_ref_scores"]:
+            stored["audio_ref_scores"] = {
+                k: v for k, v in stored["audio_ref_scores"].items() if v >= floor
+            } or None
+    if (
+        metrics.get("scanner_version") == scanner_version
+        and all(stored[k] == patch[k] for k in _PATCH_KEYS)
+    ):
+        return None
+    return patch
+
+
+async def rematch_library(
+    db: AsyncSession,
+    user_id: int,
+    *,
+    params: Optional[ScoringParams] = None,
+    page_size: int = REMATCH_PAGE_SIZE,
+) -> dict[str, Any]:
+    """Re-match every scored video of ``user_id`` against the current references.
+
+    Same scope as the rescore run (non-archived videos with a ``signal_score``);
+    clips without a stored fingerprint score with no audio-match points, as in a
+    rescore. Commits once at the end and busts the coverage-stats cache when
+    anything moved. Returns counters: ``clips``, ``updated``, ``suspicious``
+    (of the updated rows) and ``elapsed_sec``.
+    """
+    from pixsim7.backend.main.services.asset.audio_fingerprint import (
+        load_reference_fingerprints,
+        match_fingerprint_matrix,
+    )
+    from pixsim7.backend.main.services.asset.signal_analysis import (
+        SCANNER_VERSION,
+        load_scoring_params,
+    )
+    from pixsim7.backend.main.services.asset.signal_stats_cache import (
+        invalidate_signal_stats_cache,
+    )
+
+    started = time.monotonic()
+    p = params or load_scoring_params()
+    references = await load_reference_fingerprints(db)
+    floor = _match_floor(references.keys(), p)
+    scanned_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    totals = {"clips": 0, "updated": 0, "suspicious": 0}
+
+    cursor = 0
+    while True:
+        rows = (
+            await db.execute(
+                select(Asset.id, Asset.media_metadata["signal_metrics"])
+                .where(
+                    Asset.user_id == user_id,
+                    Asset.media_type == "VIDEO",
+                    Asset.is_archived == False,  # noqa: E712
+                    Asset.signal_score.isnot(None),
+                    Asset.id > cursor,
+                )
+                .order_by(Asset.id)
+                .limit(page_size)
+            )
+        ).all()
+        if not rows:
+            break
+        cursor = rows[-1][0]
+        metrics = [m or {} for _, m in rows]
+        # CPU-bound numpy over the whole page — keep it off the event loop.
+        scores, _ = await asyncio.to_thread(
+            match_fingerprint_matrix,
+            [m.get("chroma_fp") for m in metrics],
+            references,
+            min_score=floor,
+        )
+
+        ids, patches, new_scores = [], [], []
+        for (asset_id, _), m, s in zip(rows, metrics, scores):
+            patch = _rematch_patch(m, s, p, SCANNER_VERSION, floor)
+            if patch is None:
+                continue
+            patch["scanned_at"] = scanned_at
+            patch["scanner_version"] = SCANNER_VERSION
+            ids.append(asset_id)
+            patches.append(json.dumps(patch))
+            new_scores.append(patch["score"])
+            totals["suspicious"] += int(patch["suspicious"])
+        if ids:
+            await db.execute(
+                _BULK_UPDATE_SQL,
+                {"ids": ids, "patches": patches, "scores": new_scores, "version": SCANNER_VERSION},
+            )
+        totals["clips"] += len(rows)
+        totals["updated"] += len(ids)
+        if len(rows) < page_size:
+            break
+
+    await db.commit()
+    if totals["updated"]:
+        await invalidate_signal_stats_cache(db, user_id)
+    totals["elapsed_sec"] = round(time.monotonic() - started, 2)
+    logger.info("signal_library_rematch", user_id=user_id, **totals)
+    return totals
@@ -51,6 +51,10 @@ class BackfillRunServiceBase(ABC, Generic[TRun]):
     # default) enqueues onto the main/generation queue; set it to route slow
     # sweeps onto an isolated worker (e.g. media-maintenance).
     queue_name: Optional[str] = None
+    # Optional extra fields for the ARQ job result of the batch just processed
+    # (e.g. throughput). Set by a subclass during the batch — typically in
+    # ``_after_batch`` — and merged into the progress dict by the worker glue.
+    last_batch_metrics: Optional[Dict[str, Any]] = None
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -0,0 +1,97 @@
+"""
+ContentEmbeddingCache — ``(sha256, embedder_id, model_id, variant) -> vector``.
+
+Checked by the embedding pipelines before they call a daemon/provider:
+``EntityEmbeddingService.embed_batch`` / ``embed_one`` (keyed off the
+subclass's ``_content_hash``) and the ``asset:embedding`` analyzer (keyed off
+``Asset.sha256``). Byte-identical content then costs one primary-key lookup
+instead of a forward pass, whichever row, user or re-import it arrives on.
+
+Like the embedding storages, the cache never commits — writes ride the
+caller's transaction.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pixsim7.backend.main.domain.embedding_cache import EmbeddingCacheEntry
+from pixsim7.backend.main.shared.datetime_utils import utcnow
+
+
+def text_content_hash(text: str) -> str:
+    """sha256 hex of the exact text sent to a text embedder."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def config_variant(config: Mapping[str, Any] | None) -> str:
+    """Short stable digest of input-shaping config ('' for none), so the same
+    bytes embedded under different frame sampling / aggregation don't share a
+    vector."""
+    if not config:
+        return ""
+    blob = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class ContentEmbeddingCache:
+    """DB-backed content-hash vector cache (the ``embedding_cache`` table)."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_many(
+        self,
+        hashes: Iterable[str],
+        *,
+        embedder_id: str,
+        model_id: str,
+        variant: str = "",
+    ) -> dict[str, list[float]]:
+        """Cached vectors for whichever of ``hashes`` are present (one query)."""
+        keys = sorted({h for h in hashes if h})
+        if not keys:
+            return {}
+        rows = await self.db.execute(
+            select(EmbeddingCacheEntry.content_sha256, EmbeddingCacheEntry.vector).where(
+                EmbeddingCacheEntry.content_sha256.in_(keys),
+                EmbeddingCacheEntry.embedder_id == embedder_id,
+                EmbeddingCacheEntry.model_id == model_id,
+                EmbeddingCacheEntry.variant == variant,
+            )
+        )
+        return {sha: [float(x) for x in vector] for sha, vector in rows.all()}
+
+    async def put_many(
+        self,
+        vectors: Mapping[str, list[float]],
+        *,
+        embedder_id: str,
+        model_id: str,
+        variant: str = "",
+    ) -> None:
+        """Insert vectors for new hashes. First writer wins on a concurrent
+        insert of the same key — both computed the same vector. Does NOT commit."""
+        if not vectors:
+            return
+        now = utcnow()
+        stmt = pg_insert(EmbeddingCacheEntry).values(
+            [
+                {
+                    "content_sha256": sha,
+                    "embedder_id": embedder_id,
+                    "model_id": model_id,
+                    "variant": variant,
+                    "vector": list(vector),
+                    "dim": len(vector),
+                    "created_at": now,
+                }
+                for sha, vector in vectors.items()
+            ]
+        )
+        await self.db.execute(stmt.on_conflict_do_nothing())
@@ -27,6 +27,7 @@ from pixsim7.backend.main.services.ai_model.defaults import (
     FALLBACK_DEFAULTS,
     get_default_model,
 )
+from pixsim7.backend.main.services.embedding.content_cache import text_content_hash
 from pixsim7.backend.main.services.embedding.generic_service import (
     EntityEmbeddingService,
     EntityNotEmbeddedError,
@@ -88,7 +89,7 @@ def validate_embeddings(
     embeddings: list,
     expected_count: int,
     expected_dimensions: int = EXPECTED_DIMENSIONS,
-) -> list[list[float]]:
+) -> Sequence[Sequence[float]]:
     """Validate embedding output (count, list[float]-compatible, dims, finite).
 
     Raises EmbeddingDimensionError on any validation failure.
@@ -159,6 +160,9 @@ class BlockEmbeddingService(EntityEmbeddingService[BlockPrimitive]):
         # misconfigured provider whose vectors wouldn't fit BlockPrimitive.embedding.
         return validate_embeddings(result.vectors, expected_count=len(texts))
 
+    def _content_hash(self, entity: BlockPrimitive) -> str | None:
+        return text_content_hash(_build_embed_text(entity))
+
     async def _embed_query(self, query: Any, *, model_id: str) -> list[float]:
         result = await get_embedding_service().embed_texts(
             EmbedTextRequest(
@@ -279,6 +283,8 @@ class BlockEmbeddingService(EntityEmbeddingService[BlockPrimitive]):
             "skipped_count": stats.skipped_count,
             "total": stats.total,
             "model_id": stats.model_id,
+            "cache_hits": stats.cache_hits,
+            "cache_misses": stats.cache_misses,
         }
 
     async def find_similar(
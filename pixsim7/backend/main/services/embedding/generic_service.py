@@ -7,7 +7,8 @@ Subclasses parameterize three things via abstract hooks:
 - entity-specific filters + keyset pagination: `_entity_filters` + `_keyset_columns`
 
 Everything else — storage delegation, batch loop with keyset pagination,
-similarity orchestration, threshold + skip-if-cached logic, commit
+similarity orchestration, threshold + skip-if-cached logic, the
+content-hash vector cache (opt-in via `_content_hash`), commit
 boundaries — lives here once.
 
 Note on type parameters: the original plan signature was
@@ -26,6 +27,7 @@ from typing import Any, Generic, Mapping, Sequence, TypeVar
 from sqlalchemy import ColumnElement, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .content_cache import ContentEmbeddingCache
 from .storage import EmbeddingStorage, SimilarityResult, StoredEmbedding
 
 
@@ -40,12 +42,19 @@ DEFAULT_EMBEDDER_ID = "primary"
 
 @dataclass(frozen=True, slots=True)
 class BatchStats:
-    """Return shape for embed_batch."""
+    """Return shape for embed_batch.
+
+    `cache_hits` counts entities whose vector came from the content-hash cache
+    (including repeats within the run); `cache_misses` the ones sent to the
+    provider. Both stay 0 for services without a `_content_hash`.
+    """
 
     embedded_count: int
     skipped_count: int
     total: int
     model_id: str
+    cache_hits: int = 0
+    cache_misses: int = 0
 
 
 class EntityEmbeddingService(ABC, Generic[EntityT]):
@@ -68,11 +77,13 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
         *,
         embedder_id: str = DEFAULT_EMBEDDER_ID,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        content_cache: ContentEmbeddingCache | None = None,
     ) -> None:
         self.db = db
         self.storage = storage
         self.embedder_id = embedder_id
         self.batch_size = batch_size
+        self.content_cache = content_cache or ContentEmbeddingCache(db)
 
     # ===== subclass hooks =====
 
@@ -101,6 +112,11 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
     async def _resolve_model_id(self, model_id: str | None) -> str:
         """Resolve the model_id to use: explicit > capability default > fallback."""
 
+    def _content_hash(self, entity: EntityT) -> str | None:
+        """sha256 of exactly what `_embed_entities` would send for `entity`,
+        used as the content-hash cache key. Default None: no caching."""
+        return None
+
     def _entity_filters(
         self, **kwargs: Any
     ) -> Sequence[ColumnElement[bool]]:
@@ -145,11 +161,7 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
                 )
                 return existing
 
-        vectors = await self._embed_entities([entity], model_id=resolved_model)
-        if len(vectors) != 1:
-            raise RuntimeError(
-                f"_embed_entities returned {len(vectors)} vectors for 1 entity"
-            )
+        vectors, _hits = await self._embed_with_cache([entity], model_id=resolved_model)
         vector = vectors[0]
 
         await self.storage.upsert(
@@ -200,6 +212,7 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
 
         embedded_count = 0
         skipped_count = 0
+        cache_hits = 0
         cursor: tuple | None = None
 
         while True:
@@ -223,12 +236,7 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
             cursor = tuple(getattr(batch[-1], col.key) for col in keyset_cols)
 
             try:
-                vectors = await self._embed_entities(batch, model_id=resolved_model)
-                if len(vectors) != len(batch):
-                    raise RuntimeError(
-                        f"_embed_entities returned {len(vectors)} vectors "
-                        f"for {len(batch)} entities"
-                    )
+                vectors, hits = await self._embed_with_cache(batch, model_id=resolved_model)
             except Exception as exc:
                 logger.error(
                     "Batch embedding failed (cursor=%s): %s", cursor, exc
@@ -237,6 +245,7 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
                 await self.db.rollback()
                 continue
 
+            cache_hits += hits
             for entity, vector in zip(batch, vectors):
                 await self.storage.upsert(
                     entity,
@@ -262,8 +271,60 @@ class EntityEmbeddingService(ABC, Generic[EntityT]):
             skipped_count=skipped_count,
             total=total,
             model_id=resolved_model,
+            cache_hits=cache_hits,
+            cache_misses=embedded_count - cache_hits,
         )
 
+    async def _embed_with_cache(
+        self, entities: Sequence[EntityT], *, model_id: str
+    ) -> tuple[list[list[float]], int]:
+        """`_embed_entities` behind the content-hash cache.
+
+        Entities whose content hash is cached — or repeats a hash earlier in
+        the same call — reuse that vector; only the rest reach the provider,
+        and their vectors are added to the cache (uncommitted, like storage
+        writes). Returns (vectors aligned with `entities`, cache-hit count).
+        """
+        hashes = [self._content_hash(e) for e in entities]
+        cached: dict[str, list[float]] = {}
+        if any(hashes):
+            cached = await self.content_cache.get_many(
+                (h for h in hashes if h), embedder_id=self.embedder_id, model_id=model_id
+            )
+
+        to_embed: list[int] = []
+        seen: set[str] = set()
+        for i, h in enumerate(hashes):
+            if h is None:
+                to_embed.append(i)
+            elif h not in cached and h not in seen:
+                seen.add(h)
+                to_embed.append(i)
+
+        fresh: list[list[float]] = []
+        if to_embed:
+            fresh = await self._embed_entities(
+                [entities[i] for i in to_embed], model_id=model_id
+            )
+            if len(fresh) != len(to_embed):
+                raise RuntimeError(
+                    f"_embed_entities returned {len(fresh)} vectors "
+                    f"for {len(to_embed)} entities"
+                )
+        by_index = dict(zip(to_embed, fresh))
+        new_entries = {hashes[i]: v for i, v in by_index.items() if hashes[i]}
+        if new_entries:
+            await self.content_cache.put_many(
+                new_entries, embedder_id=self.embedder_id, model_id=model_id
+            )
+
+        lookup = {**cached, **new_entries}
+        vectors = [
+            by_index[i] if i in by_index else lookup[h]
+            for i, h in enumerate(hashes)
+        ]
+        return vectors, len(entities) - len(to_embed)
+
     @staticmethod
     def _keyset_cursor_predicate(
         keyset_cols: tuple[ColumnElement, ...], cursor: tuple
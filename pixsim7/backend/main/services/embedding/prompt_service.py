@@ -36,6 +36,7 @@ from pixsim7.backend.main.services.ai_model.defaults import (
     FALLBACK_DEFAULTS,
     get_default_model,
 )
+from pixsim7.backend.main.services.embedding.content_cache import text_content_hash
 from pixsim7.backend.main.services.embedding.generic_service import (
     EntityEmbeddingService,
     EntityNotEmbeddedError,
@@ -121,6 +122,9 @@ class PromptEmbeddingService(EntityEmbeddingService[PromptVersion]):
             expected_dimensions=EXPECTED_DIMENSIONS,
         )
 
+    def _content_hash(self, entity: PromptVersion) -> str | None:
+        return text_content_hash(entity.prompt_text)
+
     async def _embed_query(self, query: Any, *, model_id: str) -> list[float]:
         # Cache query vectors (deterministic per model+text). The default text
         # embedder (cmd:embedding-default) spawns a one-shot subprocess that
@@ -243,6 +247,8 @@ class PromptEmbeddingService(EntityEmbeddingService[PromptVersion]):
             "skipped_count": stats.skipped_count,
             "total": stats.total,
             "model_id": stats.model_id,
+            "cache_hits": stats.cache_hits,
+            "cache_misses": stats.cache_misses,
         }
 
     async def find_similar(
@@ -5,7 +5,8 @@ Provides fast spatial queries over SpatialObjects (NPCs, items, props, etc.)
 using in-memory indexing. Designed to be 2D-first but 3D-ready.
 
 Architecture:
-- In-memory index for MVP (can be swapped for R-tree/KD-tree later)
+- In-memory index: per (world, location) sparse uniform hash grid, maintained
+  incrementally on register/update/remove
 - Entity-agnostic: works with any SpatialObject (NPCs, items, props, players)
 - Safe to rebuild from authoritative state (NPCState, ItemState, etc.)
 - Emits game:entity_moved events when transforms update
@@ -39,13 +40,23 @@ Usage:
         x=50, y=50,
         radius=10
     )
+
+    # k nearest neighbours
+    entities = await spatial_service.query_nearest(
+        world_id=1,
+        location_id=42,
+        x=50, y=50,
+        k=5
+    )
 """
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterator, Tuple
 from dataclasses import dataclass, field
 import asyncio
+import heapq
 import logging
+import math
 
 from pixsim7.backend.main.infrastructure.events.bus import event_bus, register_event_type
 
@@ -54,6 +65,10 @@ logger = logging.getLogger(__name__)
 # Type alias for entity IDs (supports both int and UUID string)
 EntityId = Union[int, str]
 
+# Default grid cell edge, in world units. Queries touch the cells overlapping
+# their bounds, so this should be on the order of a typical query radius.
+DEFAULT_CELL_SIZE = 64.0
+
 
 # ===== EVENT REGISTRATION =====
 
@@ -138,6 +153,140 @@ class IndexedEntity:
         self._z = self.position.get("z", 0.0)
 
 
+class _SpatialGrid:
+    """
+    Sparse uniform hash grid over the entities of one (world, location)
+
+    Only occupied cells are stored, so sparse maps cost memory proportional
+    to their entities, not their extent. A query whose bounds would touch more
+    cells than are occupied walks the occupied cells instead, which bounds
+    huge-radius queries by the entity count (the old linear scan) rather than
+    by the map area.
+
+    Not locked: owned by SpatialQueryService, which holds its lock.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        # {(cx, cy): {(kind, id): IndexedEntity}}
+        self._cells: Dict[Tuple[int, int], Dict[Tuple[str, EntityId], IndexedEntity]] = {}
+        # {(kind, id): (cx, cy)} - where each entity was filed
+        self._cell_of: Dict[Tuple[str, EntityId], Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, entity: IndexedEntity) -> None:
+        key = (entity.kind, entity.id)
+        self.remove(key)
+        cell = self._cell(entity._x, entity._y)
+        self._cells.setdefault(cell, {})[key] = entity
+        self._cell_of[key] = cell
+
+    def remove(self, key: Tuple[str, EntityId]) -> None:
+        cell = self._cell_of.pop(key, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.pop(key, None)
+        if not bucket:
+            del self._cells[cell]
+
+    def in_rect(
+        self, min_x: float, max_x: float, min_y: float, max_y: float
+    ) -> Iterator[IndexedEntity]:
+        """Entities in cells overlapping the rect (a superset of the hits)."""
+        cx0, cy0 = self._cell(min_x, min_y)
+        cx1, cy1 = self._cell(max_x, max_y)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            for (cx, cy), bucket in self._cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    yield from bucket.values()
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    yield from bucket.values()
+
+    def _ring(self, cx: int, cy: int, r: int) -> Iterator[Tuple[int, int]]:
+        """Cells at Chebyshev distance exactly ``r`` from (cx, cy)."""
+        if r == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-r, r + 1):
+            yield (cx + dx, cy - r)
+            yield (cx + dx, cy + r)
+        for dy in range(-r + 1, r):
+            yield (cx - r, cy + dy)
+            yield (cx + r, cy + dy)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        dist_sq,
+        accept,
+        max_dist_sq: float = math.inf,
+    ) -> List[Tuple[float, IndexedEntity]]:
+        """
+        Up to ``k`` accepted entities nearest to (x, y), as (dist_sq, entity)
+        sorted ascending.
+
+        Expands rings of cells outward. After ring ``r`` every unvisited
+        entity is at least ``r * cell_size`` away in the plane, so the search
+        stops once k hits are closer than that. ``dist_sq`` may add a z term -
+        it only grows the distance, so the planar bound stays valid.
+        """
+        if k <= 0 or not self._cells:
+            return []
+        # Max-heap of the best k so far: (-dist_sq, tiebreak, entity)
+        best: List[Tuple[float, int, IndexedEntity]] = []
+        seq = 0
+
+        def consider(entity: IndexedEntity) -> None:
+            nonlocal seq
+            if not accept(entity):
+                return
+            d = dist_sq(entity)
+            if d > max_dist_sq:
+                return
+            seq += 1
+            if len(best) < k:
+                heapq.heappush(best, (-d, seq, entity))
+            elif d < -best[0][0]:
+                heapq.heapreplace(best, (-d, seq, entity))
+
+        cx, cy = self._cell(x, y)
+        r = 0
+        while True:
+            if (2 * r + 1) ** 2 > len(self._cells):
+                # The ring would cover more cells than exist: finish by
+                # walking the occupied cells not visited yet.
+                for (ox, oy), bucket in self._cells.items():
+                    if max(abs(ox - cx), abs(oy - cy)) >= r:
+                        for entity in bucket.values():
+                            consider(entity)
+                break
+            for cell in self._ring(cx, cy, r):
+                bucket = self._cells.get(cell)
+                if bucket:
+                    for entity in bucket.values():
+                        consider(entity)
+            reach_sq = (r * self.cell_size) ** 2
+            if reach_sq > max_dist_sq:
+                break
+            if len(best) == k and -best[0][0] <= reach_sq:
+                break
+            r += 1
+
+        return sorted(((-nd, e) for nd, _, e in best), key=lambda t: t[0])
+
+
 class SpatialQueryService:
     """
     Spatial query service for fast entity lookups
@@ -146,15 +295,16 @@ class SpatialQueryService:
     data (position, bounds, etc.) and provides efficient queries.
 
     Performance notes:
-    - Query complexity: O(n) linear scan within location (MVP implementation)
-    - For large worlds (>1000 entities/location), consider R-tree or KD-tree
+    - Bounds/radius/nearest queries visit only the grid cells they overlap
+      (see _SpatialGrid); index updates are O(1) per entity
+    - Result dicts are built only for hits, never for candidates
     - Batch updates recommended for many concurrent changes
 
     Thread-safe: Uses asyncio locks for concurrent access.
     Rebuildable: Index is in-memory and can be rebuilt from authoritative state.
     """
 
-    def __init__(self):
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
         # Primary index: {kind: {id: IndexedEntity}}
         self._entities: Dict[str, Dict[EntityId, IndexedEntity]] = {}
 
@@ -162,6 +312,10 @@ class SpatialQueryService:
         # {world_id: {location_id: {kind: set(entity_ids)}}}
         self._by_location: Dict[int, Dict[Optional[int], Dict[str, set]]] = {}
 
+        # Spatial index: {world_id: {location_id: _SpatialGrid}}
+        self._cell_size = cell_size
+        self._grids: Dict[int, Dict[Optional[int], _SpatialGrid]] = {}
+
         # Lock for thread-safe updates
         self._lock = asyncio.Lock()
 
@@ -272,7 +426,10 @@ class SpatialQueryService:
                 self._entities[kind] = {}
 
             # Check if this is a new entity or an update
-            is_new = entity_id not in self._entities[kind]
+            previous = self._entities[kind].get(entity_id)
+            is_new = previous is None
+            if previous is not None:
+                self._unindex_by_location(previous)
 
             self._entities[kind][entity_id] = entity
 
@@ -498,32 +655,20 @@ class SpatialQueryService:
         Returns:
             List of SpatialObject dicts within bounds
         """
-        # First get all entities at location (or world)
-        candidates = await self.query_by_location(
-            world_id=world_id,
-            location_id=location_id,
-            kinds=kinds,
-            tags=tags
-        )
-
-        # Filter by bounds
+        kind_set = set(kinds) if kinds else None
+        check_z = min_z is not None and max_z is not None
         results = []
-        for entity_dict in candidates:
-            pos = entity_dict["transform"]["position"]
-            x = pos.get("x", 0.0)
-            y = pos.get("y", 0.0)
-            z = pos.get("z", 0.0)
-
-            # Check 2D bounds
-            if not (min_x <= x <= max_x and min_y <= y <= max_y):
-                continue
-
-            # Check 3D bounds if specified
-            if min_z is not None and max_z is not None:
-                if not (min_z <= z <= max_z):
-                    continue
 
-            results.append(entity_dict)
+        async with self._lock:
+            for grid in self._grids_for(world_id, location_id):
+                for entity in grid.in_rect(min_x, max_x, min_y, max_y):
+                    if not (min_x <= entity._x <= max_x and min_y <= entity._y <= max_y):
+                        continue
+                    if check_z and not (min_z <= entity._z <= max_z):
+                        continue
+                    if not self._matches(entity, kind_set, tags):
+                        continue
+                    results.append(self._entity_to_dict(entity))
 
         return results
 
@@ -553,38 +698,80 @@ class SpatialQueryService:
         Returns:
             List of SpatialObject dicts within radius
         """
-        # Use bounds query as first pass (optimized AABB)
-        candidates = await self.query_by_bounds(
-            world_id=world_id,
-            min_x=x - radius,
-            max_x=x + radius,
-            min_y=y - radius,
-            max_y=y + radius,
-            min_z=z - radius if z is not None else None,
-            max_z=z + radius if z is not None else None,
-            location_id=location_id,
-            kinds=kinds,
-            tags=tags
-        )
-
-        # Filter by actual distance
-        results = []
+        kind_set = set(kinds) if kinds else None
         radius_sq = radius * radius
+        results = []
 
-        for entity_dict in candidates:
-            pos = entity_dict["transform"]["position"]
-            ex = pos.get("x", 0.0)
-            ey = pos.get("y", 0.0)
-            ez = pos.get("z", 0.0)
+        async with self._lock:
+            for grid in self._grids_for(world_id, location_id):
+                # Grid cells overlapping the bounding square are the candidates
+                for entity in grid.in_rect(x - radius, x + radius, y - radius, y + radius):
+                    dx = entity._x - x
+                    dy = entity._y - y
+                    dz = (entity._z - z) if z is not None else 0.0
+                    if dx*dx + dy*dy + dz*dz > radius_sq:
+                        continue
+                    if not self._matches(entity, kind_set, tags):
+                        continue
+                    results.append(self._entity_to_dict(entity))
 
-            # Calculate distance squared
-            dx = ex - x
-            dy = ey - y
-            dz = (ez - z) if z is not None else 0.0
+        return results
 
-            dist_sq = dx*dx + dy*dy + dz*dz
+    async def query_nearest(
+        self,
+        world_id: int,
+        x: float,
+        y: float,
+        k: int = 1,
+        z: Optional[float] = None,
+        max_distance: Optional[float] = None,
+        location_id: Optional[int] = None,
+        kinds: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        exclude: Optional[tuple[str, EntityId]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the k entities nearest to a point
 
-            if dist_sq <= radius_sq:
+        Args:
+            world_id: World ID
+            x, y: Query position
+            k: Maximum number of entities to return
+            z: Optional Z coordinate for 3D distance
+            max_distance: Optional cutoff - farther entities are never returned
+            location_id: Optional location filter (None = all locations in world)
+            kinds: Optional kinds filter
+            tags: Optional tags filter
+            exclude: Optional (kind, entity_id) to skip, e.g. the querying entity
+
+        Returns:
+            List of SpatialObject dicts, nearest first, each with a
+            "distance" field added
+        """
+        kind_set = set(kinds) if kinds else None
+        max_dist_sq = max_distance * max_distance if max_distance is not None else math.inf
+
+        def dist_sq(entity: IndexedEntity) -> float:
+            dx = entity._x - x
+            dy = entity._y - y
+            dz = (entity._z - z) if z is not None else 0.0
+            return dx*dx + dy*dy + dz*dz
+
+        def accept(entity: IndexedEntity) -> bool:
+            if exclude is not None and (entity.kind, entity.id) == exclude:
+                return False
+            return self._matches(entity, kind_set, tags)
+
+        async with self._lock:
+            hits: List[Tuple[float, IndexedEntity]] = []
+            for grid in self._grids_for(world_id, location_id):
+                hits.extend(grid.nearest(x, y, k, dist_sq, accept, max_dist_sq))
+            hits.sort(key=lambda t: t[0])
+
+            results = []
+            for d, entity in hits[:k]:
+                entity_dict = self._entity_to_dict(entity)
+                entity_dict["distance"] = math.sqrt(d)
                 results.append(entity_dict)
 
         return results
@@ -682,7 +869,10 @@ class SpatialQueryService:
                 if kind not in self._entities:
                     self._entities[kind] = {}
 
-                is_new = entity_id not in self._entities[kind]
+                previous = self._entities[kind].get(entity_id)
+                is_new = previous is None
+                if previous is not None:
+                    self._unindex_by_location(previous)
                 self._entities[kind][entity_id] = entity
                 self._index_by_location(entity)
 
@@ -794,6 +984,7 @@ class SpatialQueryService:
         async with self._lock:
             self._entities.clear()
             self._by_location.clear()
+            self._grids.clear()
             logger.info("Cleared spatial index")
 
     # ===== INTERNAL HELPERS =====
@@ -816,6 +1007,12 @@ class SpatialQueryService:
 
         self._by_location[world_id][location_id][kind].add(entity_id)
 
+        world_grids = self._grids.setdefault(world_id, {})
+        grid = world_grids.get(location_id)
+        if grid is None:
+            grid = world_grids[location_id] = _SpatialGrid(self._cell_size)
+        grid.insert(entity)
+
     def _unindex_by_location(self, entity: IndexedEntity) -> None:
         """Remove entity from location index (caller must hold lock)"""
         world_id = entity.world_id
@@ -839,6 +1036,40 @@ class SpatialQueryService:
             if not self._by_location[world_id]:
                 del self._by_location[world_id]
 
+        world_grids = self._grids.get(world_id)
+        grid = world_grids.get(location_id) if world_grids else None
+        if grid is not None:
+            grid.remove((kind, entity_id))
+            if not grid:
+                del world_grids[location_id]
+                if not world_grids:
+                    del self._grids[world_id]
+
+    def _grids_for(
+        self, world_id: int, location_id: Optional[int]
+    ) -> List[_SpatialGrid]:
+        """Grids to search: one location, or every location in the world (caller must hold lock)"""
+        world_grids = self._grids.get(world_id)
+        if not world_grids:
+            return []
+        if location_id is not None:
+            grid = world_grids.get(location_id)
+            return [grid] if grid is not None else []
+        return list(world_grids.values())
+
+    @staticmethod
+    def _matches(
+        entity: IndexedEntity,
+        kinds: Optional[set],
+        tags: Optional[List[str]]
+    ) -> bool:
+        """Kind/tag filters shared by the spatial queries"""
+        if kinds is not None and entity.kind not in kinds:
+            return False
+        if tags and not any(tag in entity.tags for tag in tags):
+            return False
+        return True
+
     def _entity_to_dict(self, entity: IndexedEntity) -> Dict[str, Any]:
         """Convert IndexedEntity to SpatialObject dict"""
         transform = {
@@ -11,4 +11,4 @@ JOB_RESUMED = register_event_type("job:resumed")
 # retry loop). Status stays pending/processing, so the frontend treats this
 # like a terminal event — it refetches the generation so retry/attempt
 # counters don't freeze at their first-observed value.
-JOB_RETRYING = register_event_type("job:retrying")
+JOB_RETRYING = register_event_type("job:retrying", coalesce_by="generation_id")
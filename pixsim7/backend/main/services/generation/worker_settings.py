@@ -5,6 +5,8 @@ Declarative configuration for worker runtime behavior:
 - Content filter retry / backoff
 - Provider concurrency & cooldowns
 - Dispatch stagger
+- Status poll scheduling
+- Account slot allocation
 - Adaptive concurrency probing
 
 Single source of truth — the API models, applier, and OpenAPI spec
@@ -103,6 +105,31 @@ class GenerationWorkerSettings(SettingsBase):
         ),
     )
 
+    # ── Status Poll Scheduling ────────────────────────────────────────────
+
+    poll_schedule_enabled: bool = Field(
+        True,
+        description=(
+            "Poll PROCESSING generations from the Redis deadline schedule "
+            "(each tick polls only generations that are due, sharded across "
+            "poller workers). When off, or when Redis is unavailable, every "
+            "tick scans and polls all PROCESSING generations."
+        ),
+    )
+
+    # ── Account Slot Allocation ───────────────────────────────────────────
+
+    account_slot_allocator_enabled: bool = Field(
+        True,
+        description=(
+            "Claim account concurrency slots through an atomic Redis script "
+            "over the ranked candidates before the Postgres reserve, so "
+            "concurrent workers do not race row by row for the same top "
+            "accounts. When off, or when Redis is unavailable, candidates "
+            "are reserved one row lock at a time."
+        ),
+    )
+
     # ── Dispatch Stagger ──────────────────────────────────────────────────
 
     dispatch_stagger_per_slot_seconds: float = Field(
@@ -4,18 +4,41 @@ Log ingestion and query service.
 Handles centralized structured log storage and retrieval.
 """
 from __future__ import annotations
+import base64
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc, func, delete, text, cast, String
+from sqlalchemy import select, and_, or_, desc, func, delete, text, cast, String, tuple_, bindparam, DateTime
 from sqlmodel import col
 
 from pixsim7.backend.main.domain import LogEntry
+from pixsim7.backend.main.domain.log_entry import LogFacet
 from pixsim_logging import get_logger
 from pixsim_logging.schema import LOG_ENTRY_COLUMNS
 
 logger = get_logger()
 
+# Columns whose distinct values are kept in log_facets (filter dropdowns).
+LOG_FACET_FIELDS = (
+    "service", "level", "channel", "domain", "provider_id", "operation_type", "stage", "error_type",
+)
+
+
+def encode_log_cursor(timestamp: datetime, log_id: int) -> str:
+    """Opaque keyset cursor for the page that ends at (timestamp, id)."""
+    raw = f"{timestamp.isoformat()}|{log_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of :func:`encode_log_cursor`. Raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts_text, id_text = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts_text), int(id_text)
+    except ValueError as exc:
+        raise ValueError(f"Invalid log cursor: {cursor!r}") from exc
+
 
 class LogService:
     """Service for log ingestion and querying."""
@@ -126,9 +149,16 @@ class LogService:
         search: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[List[LogEntry], int]:
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None,
+    ) -> tuple[List[LogEntry], Optional[int]]:
         """
-        Query logs with filters.
+        Query logs with filters, newest first.
+
+        Prefer ``cursor`` over ``offset`` for paging: the cursor from
+        :func:`encode_log_cursor` on the last row of a page continues strictly
+        after it on (timestamp, id), so each page is an index range scan
+        instead of skipping ``offset`` rows.
 
         Args:
             service: Filter by service name
@@ -145,9 +175,12 @@ class LogService:
             search: Text search in msg and error fields
             limit: Maximum results to return
             offset: Offset for pagination
+            cursor: Keyset cursor from the previous page
+            include_total: Count all matching rows; defaults to the first page
+                only (no cursor), since the count scans the whole filtered range
 
         Returns:
-            Tuple of (log entries, total count)
+            Tuple of (log entries, total count or None when not counted)
         """
         # Build filters
         filters = []
@@ -192,21 +225,31 @@ class LogService:
                 )
             )
 
+        # Get total count (before the cursor bound, so it covers every page)
+        if include_total is None:
+            include_total = cursor is None
+        total: Optional[int] = None
+        if include_total:
+            count_query = select(func.count()).select_from(LogEntry)
+            if filters:
+                count_query = count_query.where(and_(*filters))
+            result = await self.db.execute(count_query)
+            total = result.scalar_one()
+
+        if cursor:
+            cursor_ts, cursor_id = decode_log_cursor(cursor)
+            filters.append(tuple_(LogEntry.timestamp, LogEntry.id) < tuple_(cursor_ts, cursor_id))
+
         # Build query
         query = select(LogEntry)
         if filters:
             query = query.where(and_(*filters))
 
-        # Get total count
-        count_query = select(func.count()).select_from(LogEntry)
-        if filters:
-            count_query = count_query.where(and_(*filters))
-        result = await self.db.execute(count_query)
-        total = result.scalar_one()
-
-        # Apply ordering and pagination
-        query = query.order_by(desc(LogEntry.timestamp))
-        query = query.limit(limit).offset(offset)
+        # Apply ordering (id breaks timestamp ties) and pagination
+        query = query.order_by(desc(LogEntry.timestamp), desc(LogEntry.id))
+        query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
 
         # Execute
         result = await self.db.execute(query)
@@ -312,10 +355,80 @@ class LogService:
         allowed = {"service", "channel", "domain", "level", "provider_id", "operation_type", "stage"}
         if column not in allowed:
             raise ValueError(f"Column {column!r} not allowed; pick from {allowed}")
+        values = await self._facet_values(column)
+        if values is not None:
+            return values
         sql = text(f"SELECT DISTINCT {column} FROM log_entries WHERE {column} IS NOT NULL ORDER BY {column}")
         rows = (await self.db.execute(sql)).all()
         return [row[0] for row in rows]
 
+    async def _facet_values(
+        self,
+        field: str,
+        *,
+        service: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[list[str]]:
+        """Distinct values from log_facets; None if the facets were never refreshed."""
+        query = select(LogFacet.value).where(LogFacet.field == field)
+        if service is not None:
+            query = query.where(LogFacet.service == service)
+        query = query.group_by(LogFacet.value).order_by(LogFacet.value)
+        if limit is not None:
+            query = query.limit(limit)
+        values = list((await self.db.execute(query)).scalars().all())
+        if not values:
+            populated = (await self.db.execute(select(LogFacet.field).limit(1))).first()
+            if populated is None:
+                return None
+        return values
+
+    async def refresh_facets(
+        self,
+        *,
+        retention_days: int = 30,
+        id_overlap: int = 10_000,
+    ) -> int:
+        """
+        Fold distinct filter values from recent log_entries into log_facets.
+
+        Scans only logs inserted after the last refresh, keyed on
+        ``log_entries.id`` rather than the event timestamp: spill replay and
+        clients with skewed clocks insert rows whose timestamps are already
+        behind any time watermark. The last ``id_overlap`` ids are rescanned
+        for inserts that committed out of id order. The first run scans the
+        retention window. Facets not seen within ``retention_days`` are pruned.
+
+        Returns:
+            Number of facet rows inserted or updated
+        """
+        now = datetime.now(timezone.utc)
+        since = now - timedelta(days=retention_days)
+        last_log_id = (await self.db.execute(select(func.max(LogFacet.last_log_id)))).scalar_one_or_none()
+        after_id = max((last_log_id or 0) - id_overlap, 0)
+
+        upserted = 0
+        for field in LOG_FACET_FIELDS:
+            result = await self.db.execute(
+                text(
+                    f"INSERT INTO log_facets (field, value, service, last_seen, last_log_id) "
+                    f"SELECT :field, {field}, service, max(timestamp), max(id) FROM log_entries "
+                    f"WHERE id > :after_id AND timestamp >= :since AND {field} IS NOT NULL "
+                    f"GROUP BY {field}, service "
+                    f"ON CONFLICT (field, value, service) DO UPDATE SET "
+                    f"last_seen = CASE WHEN excluded.last_seen > log_facets.last_seen "
+                    f"THEN excluded.last_seen ELSE log_facets.last_seen END, "
+                    f"last_log_id = CASE WHEN excluded.last_log_id > log_facets.last_log_id "
+                    f"THEN excluded.last_log_id ELSE log_facets.last_log_id END"
+                ).bindparams(bindparam("since", type_=DateTime(timezone=True))),
+                {"field": field, "after_id": after_id, "since": since},
+            )
+            upserted += result.rowcount or 0
+
+        await self.db.execute(delete(LogFacet).where(LogFacet.last_seen < since))
+        await self.db.commit()
+        return upserted
+
     async def get_fields(
         self,
         *,
@@ -477,6 +590,14 @@ class LogService:
         }
 
         is_base = field in base_cols
+
+        # Dropdown facets (no filters beyond service) come from log_facets.
+        narrowing = (provider_id, operation_type, stage, domain, request_id, trace_id, job_id, user_id)
+        if field in LOG_FACET_FIELDS and all(value is None for value in narrowing):
+            values = await self._facet_values(field, service=service, limit=limit)
+            if values is not None:
+                return {"field": field, "count": len(values), "values": values}
+
         bind = self.db.get_bind()
         dialect = bind.dialect.name if bind is not None else ""
 
@@ -6,6 +6,7 @@ Central home for media pipeline concerns:
 - download: Remote file download + format conversion
 - derivatives: Thumbnail and preview generation
 - metadata: Dimension/duration/codec extraction
+- probe: One shared ffprobe result per file
 """
 from typing import TYPE_CHECKING
 
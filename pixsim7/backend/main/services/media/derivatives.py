@@ -2,22 +2,26 @@
 Media Derivatives
 
 Generates thumbnails and preview images for assets.
-Handles both image (Pillow) and video (ffmpeg) sources.
+Handles both image (Pillow) and video (ffmpeg) sources. Video frames an
+asset needs (thumbnail, preview, embedding grabs, last frame) are planned
+together and written by one ffmpeg decode with a multi-output filter graph.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from pixsim7.backend.main.domain.enums import MediaType
+from pixsim7.backend.main.services.media.probe import probe_media_file
 from pixsim7.backend.main.services.storage import get_storage_service
 from pixsim_logging import get_logger
 
 if TYPE_CHECKING:
     from pixsim7.backend.main.domain import Asset
+    from pixsim7.backend.main.services.media.probe import MediaProbe
     from pixsim7.backend.main.services.media.settings import MediaSettings
 
 logger = get_logger()
@@ -30,47 +34,115 @@ logger = get_logger()
 DEFAULT_FRAME_SIZE = (384, 384)
 
 
-async def extract_video_frame(
+@dataclass(frozen=True)
+class FrameOutput:
+    """One JPEG for :func:`extract_video_frames` to write.
+
+    ``timestamp=None`` asks for the last frame of the clip.
+    """
+
+    output_path: str
+    timestamp: Optional[float]
+    target_size: tuple[int, int]
+    qscale: int = 3
+
+
+# Window decoded (and overwritten frame by frame) to land on the last frame
+# when the duration is known — mirrors ``extract_last_frame_ffmpeg``'s -sseof.
+_LAST_FRAME_WINDOW_SEC = 0.5
+
+
+def build_frame_extraction_cmd(
     local_path: str,
-    output_path: str,
+    outputs: list[FrameOutput],
     *,
-    timestamp: float,
-    target_size: tuple[int, int],
     rotation_filters: list[str] | None = None,
-    qscale: int = 3,
-    timeout: int = 30,
-    asset_id: int | None = None,
-    op: str = "frame",
-) -> bool:
-    """Extract one frame from ``local_path`` at ``timestamp``, scaled to fit
-    ``target_size`` (aspect-ratio preserved), written as JPEG to ``output_path``.
+    duration_sec: float | None = None,
+) -> list[str]:
+    """ffmpeg argv that writes every ``outputs`` entry from ONE demux/decode.
+
+    The input is fast-seeked to the earliest requested time, rotation is
+    applied once, and a ``split`` fans the decoded frames out to one branch
+    per output. Each branch ``select``s its own timestamp (relative to the
+    seek point) and scales to its size; ``-frames:v 1`` closes it, so ffmpeg
+    stops once the latest requested frame has been written. A last-frame
+    output keeps only the final frame it sees (``-update 1``) over the last
+    ``_LAST_FRAME_WINDOW_SEC`` of the clip, or over the whole decode when the
+    duration is unknown.
+    """
+    if not outputs:
+        raise ValueError("no frame outputs requested")
+
+    duration = float(duration_sec or 0.0)
+    starts: list[float] = []
+    for out in outputs:
+        if out.timestamp is not None:
+            starts.append(max(0.0, float(out.timestamp)))
+        elif duration > 0:
+            starts.append(max(0.0, duration - _LAST_FRAME_WINDOW_SEC))
+        else:
+            starts.append(0.0)
+    seek = min(starts)
+
+    # A lone output needs no split: its chain hangs straight off the input.
+    if len(outputs) == 1:
+        branches = ["[0:v]"]
+        graph = []
+        head = list(rotation_filters or [])
+    else:
+        branches = [f"[s{i}]" for i in range(len(outputs))]
+        split = ",".join([*(rotation_filters or []), f"split={len(outputs)}"])
+        graph = [f"[0:v]{split}{''.join(branches)}"]
+        head = []
+    for i, (out, start) in enumerate(zip(outputs, starts)):
+        chain = list(head)
+        offset = start - seek
+        if offset > 0:
+            chain.append(f"select=gte(t\\,{offset:.3f})")
+        chain.append(
+            f"scale={out.target_size[0]}:{out.target_size[1]}:force_original_aspect_ratio=decrease"
+        )
+        graph.append(f"{branches[i]}{','.join(chain)}[o{i}]")
 
-    Shared by thumbnail/preview generation and the embedding frame-grab. The
-    caller owns content validation (``_validate_extracted_frame``) and rotation
-    discovery (``ensure_video_rotation`` + ``_get_video_rotation_filters``); this
-    just runs ffmpeg.
+    cmd = ["ffmpeg", "-y"]
+    if seek > 0:
+        cmd += ["-ss", f"{seek:.3f}"]
+    cmd += ["-i", local_path, "-filter_complex", ";".join(graph)]
+    for i, out in enumerate(outputs):
+        limit = ["-update", "1"] if out.timestamp is None else ["-frames:v", "1"]
+        cmd += ["-map", f"[o{i}]", *limit, "-q:v", str(out.qscale), out.output_path]
+    return cmd
 
-    Returns True iff ffmpeg exited 0 and produced a file. ``op`` is woven into
-    the structured-log event name (``ffmpeg_{op}_failed`` / ``_timeout``) so
-    callers keep distinct log signals.
-    """
-    vf_parts = list(rotation_filters or [])
-    vf_parts.append(
-        f"scale={target_size[0]}:{target_size[1]}:force_original_aspect_ratio=decrease"
-    )
 
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+async def extract_video_frames(
+    local_path: str,
+    outputs: list[FrameOutput],
+    *,
+    rotation_filters: list[str] | None = None,
+    duration_sec: float | None = None,
+    timeout: int = 60,
+    asset_id: int | None = None,
+    op: str = "frames",
+) -> list[bool]:
+    """Write every ``outputs`` frame from a single ffmpeg run (see
+    :func:`build_frame_extraction_cmd`), straight to each ``output_path``.
+
+    Shared by thumbnail/preview generation and the embedding frame-grab so an
+    asset's frames cost one demux/decode instead of one per frame. The caller
+    owns content validation (``_validate_extracted_frame``) and rotation
+    discovery (``ensure_video_rotation`` + ``_get_video_rotation_filters``).
+
+    Returns one flag per output: True iff ffmpeg exited 0 and produced that
+    file. ``op`` is woven into the structured-log event name
+    (``ffmpeg_{op}_failed`` / ``_timeout``) so callers keep distinct signals.
+    """
+    for out in outputs:
+        Path(out.output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-ss", str(timestamp),
-        "-i", local_path,
-        "-vframes", "1",
-        "-vf", ",".join(vf_parts),
-        "-q:v", str(qscale),
-        output_path,
-    ]
+    cmd = build_frame_extraction_cmd(
+        local_path, outputs, rotation_filters=rotation_filters, duration_sec=duration_sec,
+    )
+    timestamps = [out.timestamp for out in outputs]
 
     try:
         loop = asyncio.get_event_loop()
@@ -79,26 +151,55 @@ async def extract_video_frame(
             lambda: subprocess.run(cmd, capture_output=True, timeout=timeout),
         )
     except subprocess.TimeoutExpired:
-        logger.warning(f"ffmpeg_{op}_timeout", asset_id=asset_id, timestamp=timestamp)
-        return False
+        logger.warning(f"ffmpeg_{op}_timeout", asset_id=asset_id, timestamps=timestamps)
+        return [False] * len(outputs)
     except FileNotFoundError:
         logger.warning(
             "ffmpeg_not_found",
             asset_id=asset_id,
             detail=f"ffmpeg not available for video {op} generation",
         )
-        return False
+        return [False] * len(outputs)
 
     if result.returncode != 0:
         logger.warning(
             f"ffmpeg_{op}_failed",
             asset_id=asset_id,
-            timestamp=timestamp,
+            timestamps=timestamps,
             stderr=result.stderr.decode()[:200],
         )
-        return False
+        return [False] * len(outputs)
 
-    return Path(output_path).exists()
+    return [Path(out.output_path).exists() for out in outputs]
+
+
+async def extract_video_frame(
+    local_path: str,
+    output_path: str,
+    *,
+    timestamp: float,
+    target_size: tuple[int, int],
+    rotation_filters: list[str] | None = None,
+    qscale: int = 3,
+    timeout: int = 30,
+    asset_id: int | None = None,
+    op: str = "frame",
+) -> bool:
+    """Extract one frame from ``local_path`` at ``timestamp``, scaled to fit
+    ``target_size`` (aspect-ratio preserved), written as JPEG to ``output_path``.
+
+    Single-output form of :func:`extract_video_frames`; prefer that one when
+    an asset needs several frames.
+    """
+    (ok,) = await extract_video_frames(
+        local_path,
+        [FrameOutput(output_path, timestamp, target_size, qscale)],
+        rotation_filters=rotation_filters,
+        timeout=timeout,
+        asset_id=asset_id,
+        op=op,
+    )
+    return ok
 
 
 def evenly_spaced_timestamps(duration_sec: float | None, count: int) -> list[float]:
@@ -119,19 +220,26 @@ def evenly_spaced_timestamps(duration_sec: float | None, count: int) -> list[flo
 # ── Thumbnails ────────────────────────────────────────────────────────────
 
 async def generate_thumbnail(
-    asset: "Asset", local_path: str, settings: "MediaSettings",
+    asset: "Asset",
+    local_path: str,
+    settings: "MediaSettings",
+    *,
+    probe: Optional["MediaProbe"] = None,
 ) -> None:
     """
     Generate thumbnail for asset.
 
     For images: Resize to thumbnail size
-    For videos: Extract frame and resize
+    For videos: Extract frame and resize (``probe`` is reused for the
+    playability check and rotation lookup instead of re-running ffprobe)
     """
     try:
         if asset.media_type == MediaType.IMAGE:
             await _generate_image_thumbnail(asset, local_path, settings)
         elif asset.media_type == MediaType.VIDEO:
-            await _generate_video_thumbnail(asset, local_path, settings)
+            await generate_video_derivatives(
+                asset, local_path, settings, thumbnail=True, preview=False, probe=probe,
+            )
 
     except Exception as e:
         logger.warning(
@@ -176,61 +284,6 @@ async def _generate_image_thumbnail(
     )
 
 
-async def _generate_video_thumbnail(
-    asset: "Asset", local_path: str, settings: "MediaSettings",
-) -> None:
-    """Generate thumbnail for video by extracting a frame."""
-    from .metadata import ensure_video_rotation
-
-    storage = get_storage_service()
-
-    # Validate video is actually playable before attempting frame extraction.
-    # Provider CDNs can return HTTP 200 for not-yet-encoded videos; these
-    # files either make ffmpeg fail or produce blank grey frames.
-    if not _validate_video_for_thumbnail(asset, local_path):
-        return
-
-    # Ensure rotation metadata is available so thumbnails are oriented correctly.
-    ensure_video_rotation(asset, local_path)
-
-    # Extract frame at 1 second (or middle if shorter)
-    timestamp = min(1.0, (asset.duration_sec or 0) / 2)
-
-    thumb_key = get_thumbnail_key(asset)
-    thumb_path = storage.get_path(thumb_key)
-
-    ok = await extract_video_frame(
-        local_path,
-        thumb_path,
-        timestamp=timestamp,
-        target_size=settings.thumbnail_size,
-        rotation_filters=_get_video_rotation_filters(asset),
-        qscale=3,
-        asset_id=asset.id,
-        op="thumbnail",
-    )
-    if not ok:
-        return
-
-    # Verify the extracted frame is a valid, non-degenerate image.
-    # Partially-encoded videos can produce tiny grey placeholder frames.
-    if not _validate_extracted_frame(thumb_path, asset.id):
-        try:
-            Path(thumb_path).unlink(missing_ok=True)
-        except OSError:
-            pass
-        return
-
-    asset.thumbnail_key = thumb_key
-
-    logger.debug(
-        "video_thumbnail_generated",
-        asset_id=asset.id,
-        sha256=asset.sha256[:16] if asset.sha256 else None,
-        key=thumb_key,
-    )
-
-
 # ── Previews ──────────────────────────────────────────────────────────────
 
 # Below this source dimension we skip preview generation entirely — the asset
@@ -243,19 +296,25 @@ _MIN_PREVIEW_SOURCE_SIZE = 800
 
 
 async def generate_preview(
-    asset: "Asset", local_path: str, settings: "MediaSettings",
+    asset: "Asset",
+    local_path: str,
+    settings: "MediaSettings",
+    *,
+    probe: Optional["MediaProbe"] = None,
 ) -> None:
     """
     Generate preview derivative for asset.
 
     For images: Larger, higher-quality resize
-    For videos: Extract HD poster frame
+    For videos: Extract HD poster frame (``probe`` as for thumbnails)
     """
     try:
         if asset.media_type == MediaType.IMAGE:
             await _generate_image_preview(asset, local_path, settings)
         elif asset.media_type == MediaType.VIDEO:
-            await _generate_video_preview(asset, local_path, settings)
+            await generate_video_derivatives(
+                asset, local_path, settings, thumbnail=False, preview=True, probe=probe,
+            )
     except Exception as e:
         logger.warning(
             "preview_generation_failed",
@@ -306,7 +365,7 @@ async def _generate_image_preview(
         img.thumbnail(preview_size, Image.Resampling.LANCZOS)
 
         # Save to storage
-        preview_key = f"u/{asset.user_id}/previews/{asset.id}.jpg"
+        preview_key = get_preview_key(asset)
         preview_path = storage.get_path(preview_key)
 
         Path(preview_path).parent.mkdir(parents=True, exist_ok=True)
@@ -323,75 +382,145 @@ async def _generate_image_preview(
     )
 
 
-async def _generate_video_preview(
-    asset: "Asset", local_path: str, settings: "MediaSettings",
-) -> None:
-    """Generate high-quality poster frame for video."""
-    from .metadata import ensure_video_rotation
-
-    storage = get_storage_service()
+def _video_preview_too_small(asset: "Asset") -> bool:
+    """Skip preview generation only when source is too small to add value
+    over the thumbnail.  See _MIN_PREVIEW_SOURCE_SIZE comment above."""
+    if not (asset.width and asset.height):
+        return False
+    max_dimension = max(asset.width, asset.height)
+    if max_dimension >= _MIN_PREVIEW_SOURCE_SIZE:
+        return False
+    logger.debug(
+        "skip_video_preview_low_quality",
+        asset_id=asset.id,
+        resolution=f"{asset.width}x{asset.height}",
+        reason=f"Video resolution ({max_dimension}p) below preview source threshold ({_MIN_PREVIEW_SOURCE_SIZE}px)",
+    )
+    return True
 
-    # Validate video is playable (same check as thumbnail)
-    if not _validate_video_for_thumbnail(asset, local_path):
-        return
 
-    # Ensure rotation metadata is available so previews are oriented correctly.
-    ensure_video_rotation(asset, local_path)
+# ── One-pass derivatives ──────────────────────────────────────────────────
 
-    preview_size = settings.preview_size
+async def generate_asset_derivatives(
+    asset: "Asset",
+    local_path: str,
+    settings: "MediaSettings",
+    *,
+    thumbnail: bool,
+    preview: bool,
+    probe: Optional["MediaProbe"] = None,
+) -> None:
+    """
+    Generate the requested derivatives for an asset in as few passes as possible.
 
-    # Skip preview generation only when source is too small to add value
-    # over the thumbnail.  See _MIN_PREVIEW_SOURCE_SIZE comment above.
-    if asset.width and asset.height:
-        max_dimension = max(asset.width, asset.height)
-        if max_dimension < _MIN_PREVIEW_SOURCE_SIZE:
-            logger.debug(
-                "skip_video_preview_low_quality",
+    For videos: thumbnail and preview come from one ffmpeg decode
+    For images: the Pillow thumbnail/preview paths
+    """
+    if asset.media_type == MediaType.VIDEO:
+        try:
+            await generate_video_derivatives(
+                asset, local_path, settings, thumbnail=thumbnail, preview=preview, probe=probe,
+            )
+        except Exception as e:
+            logger.warning(
+                "video_derivatives_generation_failed",
                 asset_id=asset.id,
-                resolution=f"{asset.width}x{asset.height}",
-                reason=f"Video resolution ({max_dimension}p) below preview source threshold ({_MIN_PREVIEW_SOURCE_SIZE}px)",
+                error=str(e),
             )
-            return
+        return
 
-    # Extract frame at 1 second (or middle if shorter)
-    timestamp = min(1.0, (asset.duration_sec or 0) / 2)
+    if thumbnail:
+        await generate_thumbnail(asset, local_path, settings)
+    if preview:
+        await generate_preview(asset, local_path, settings)
 
-    preview_key = f"u/{asset.user_id}/previews/{asset.id}.jpg"
-    preview_path = storage.get_path(preview_key)
 
-    preview_quality = settings.preview_quality
+async def generate_video_derivatives(
+    asset: "Asset",
+    local_path: str,
+    settings: "MediaSettings",
+    *,
+    thumbnail: bool = True,
+    preview: bool = True,
+    probe: Optional["MediaProbe"] = None,
+) -> None:
+    """Thumbnail and/or preview poster frame for a video from ONE decode.
 
-    # Map quality (1-100) to ffmpeg qscale (2-31, lower is better)
-    qscale = max(2, min(31, int(2 + (100 - preview_quality) / 10)))
+    Playability and rotation are checked once, the requested frames are
+    planned together and :func:`extract_video_frames` writes them straight to
+    their storage paths. Each frame is validated on its own; only frames that
+    pass set ``thumbnail_key`` / ``preview_key``.
+    """
+    from .metadata import ensure_video_rotation
 
-    ok = await extract_video_frame(
-        local_path,
-        preview_path,
-        timestamp=timestamp,
-        target_size=preview_size,
-        rotation_filters=_get_video_rotation_filters(asset),
-        qscale=qscale,
-        asset_id=asset.id,
-        op="preview",
-    )
-    if not ok:
+    # Validate video is actually playable before attempting frame extraction.
+    # Provider CDNs can return HTTP 200 for not-yet-encoded videos; these
+    # files either make ffmpeg fail or produce blank grey frames.
+    if not _validate_video_for_thumbnail(asset, local_path, probe=probe):
         return
 
-    if not _validate_extracted_frame(preview_path, asset.id):
-        try:
-            Path(preview_path).unlink(missing_ok=True)
-        except OSError:
-            pass
-        return
+    # Ensure rotation metadata is available so frames are oriented correctly.
+    ensure_video_rotation(asset, local_path, probe=probe)
 
-    asset.preview_key = preview_key
+    if preview and _video_preview_too_small(asset):
+        preview = False
 
-    logger.debug(
-        "video_preview_generated",
+    storage = get_storage_service()
+    # Extract frame at 1 second (or middle if shorter)
+    timestamp = min(1.0, (asset.duration_sec or 0) / 2)
+
+    planned: list[tuple[str, str]] = []
+    outputs: list[FrameOutput] = []
+    if thumbnail:
+        thumb_key = get_thumbnail_key(asset)
+        planned.append(("thumbnail", thumb_key))
+        outputs.append(FrameOutput(
+            storage.get_path(thumb_key), timestamp, settings.thumbnail_size, qscale=3,
+        ))
+    if preview:
+        preview_key = get_preview_key(asset)
+        # Map quality (1-100) to ffmpeg qscale (2-31, lower is better)
+        qscale = max(2, min(31, int(2 + (100 - settings.preview_quality) / 10)))
+        planned.append(("preview", preview_key))
+        outputs.append(FrameOutput(
+            storage.get_path(preview_key), timestamp, settings.preview_size, qscale=qscale,
+        ))
+    if not outputs:
+        return
+
+    results = await extract_video_frames(
+        local_path,
+        outputs,
+        rotation_filters=_get_video_rotation_filters(asset),
+        duration_sec=asset.duration_sec,
         asset_id=asset.id,
-        key=preview_key,
+        op=planned[0][0] if len(planned) == 1 else "derivatives",
     )
 
+    for (kind, key), output, ok in zip(planned, outputs, results):
+        if not ok:
+            continue
+        # Verify the extracted frame is a valid, non-degenerate image.
+        # Partially-encoded videos can produce tiny grey placeholder frames.
+        if not _validate_extracted_frame(output.output_path, asset.id):
+            try:
+                Path(output.output_path).unlink(missing_ok=True)
+            except OSError:
+                pass
+            continue
+
+        if kind == "thumbnail":
+            asset.thumbnail_key = key
+        else:
+            asset.preview_key = key
+
+        logger.debug(
+            f"video_{kind}_generated",
+            asset_id=asset.id,
+            sha256=asset.sha256[:16] if asset.sha256 else None,
+            key=key,
+        )
+
 
 # ── Validation ────────────────────────────────────────────────────────────
 
@@ -400,36 +529,31 @@ async def _generate_video_preview(
 _MIN_FRAME_SIZE_BYTES = 1024
 
 
-def _validate_video_for_thumbnail(asset: "Asset", local_path: str) -> bool:
+def _validate_video_for_thumbnail(
+    asset: "Asset", local_path: str, *, probe: Optional["MediaProbe"] = None,
+) -> bool:
     """
     Quick-check that a downloaded video is complete enough for frame extraction.
 
     Provider CDNs sometimes return HTTP 200 with a file that is still being
     encoded.  ffmpeg may then either fail or extract a blank grey frame.
     We use ffprobe to verify the file has a decodable video stream with
-    non-zero duration before attempting extraction.
+    non-zero duration before attempting extraction.  A shared ``probe`` of
+    ``local_path`` is used as-is; otherwise the file is probed here.
     """
     try:
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=duration,nb_frames,codec_name:format=duration",
-            "-of", "json",
-            local_path,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-        if result.returncode != 0:
+        if probe is None:
+            probe = probe_media_file(local_path, timeout=15)
+        if not probe.ok:
             logger.warning(
                 "video_thumbnail_skipped_probe_failed",
                 asset_id=asset.id,
-                stderr=result.stderr[:200],
+                stderr=(probe.error or "")[:200],
             )
             return False
 
-        data = json.loads(result.stdout)
-        streams = data.get("streams", [])
-        if not streams:
+        stream = probe.first_stream("video")
+        if stream is None:
             logger.warning(
                 "video_thumbnail_skipped_no_stream",
                 asset_id=asset.id,
@@ -437,9 +561,7 @@ def _validate_video_for_thumbnail(asset: "Asset", local_path: str) -> bool:
             return False
 
         # Check for non-zero duration (prefer stream, fallback to format)
-        stream_dur = streams[0].get("duration")
-        format_dur = (data.get("format") or {}).get("duration")
-        duration = float(stream_dur or format_dur or 0)
+        duration = float(stream.get("duration") or probe.format.get("duration") or 0)
         if duration <= 0:
             logger.warning(
                 "video_thumbnail_skipped_zero_duration",
@@ -450,7 +572,7 @@ def _validate_video_for_thumbnail(asset: "Asset", local_path: str) -> bool:
 
         return True
 
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+    except Exception as e:
         logger.warning(
             "video_thumbnail_skipped_probe_error",
             asset_id=asset.id,
@@ -536,6 +658,11 @@ def get_thumbnail_key(asset: "Asset") -> str:
         return f"u/{asset.user_id}/thumbnails/{asset.id}.jpg"
 
 
+def get_preview_key(asset: "Asset") -> str:
+    """Get the storage key for an asset's preview (one per asset id)."""
+    return f"u/{asset.user_id}/previews/{asset.id}.jpg"
+
+
 def _get_video_rotation_filters(asset: "Asset") -> list[str]:
     """
     Get ffmpeg video filter parts for rotation correction.
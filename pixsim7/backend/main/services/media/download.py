@@ -10,10 +10,13 @@ import asyncio
 import hashlib
 import io
 import mimetypes
+import os
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Tuple, TYPE_CHECKING
+from typing import NamedTuple, Tuple, TYPE_CHECKING
 
+import aiofiles
 import httpx
 
 from pixsim7.backend.main.domain.enums import MediaType, SyncStatus
@@ -32,6 +35,18 @@ if TYPE_CHECKING:
 
 logger = get_logger()
 
+# Staged downloads older than this belong to a dead process (a live one is
+# bounded by 6 attempts x 120s timeouts plus backoff).
+STALE_STAGING_SEC = 3600
+
+
+class DownloadedFile(NamedTuple):
+    """Where a download landed, plus the digest computed while streaming it."""
+
+    path: str
+    sha256: str
+    size_bytes: int
+
 
 async def download_file(
     asset: "Asset",
@@ -42,8 +57,33 @@ async def download_file(
     """
     Download file from remote URL to content-addressed storage.
 
+    Thin wrapper over :func:`download_to_storage` for callers that only need
+    the local path. Returns:
+        Path to downloaded file
+    """
+    downloaded = await download_to_storage(
+        asset, settings, fast_single_attempt=fast_single_attempt,
+    )
+    return downloaded.path
+
+
+async def download_to_storage(
+    asset: "Asset",
+    settings: "MediaSettings",
+    *,
+    fast_single_attempt: bool = False,
+) -> DownloadedFile:
+    """
+    Download file from remote URL to content-addressed storage.
+
     Uses StorageService with SHA256-based naming for automatic deduplication.
-    Updates asset.local_path, stored_key, sha256, file_size_bytes, sync_status.
+    Updates asset.local_path, stored_key, file_size_bytes, sync_status.
+
+    Bytes are streamed straight to a staging file next to the content
+    directory while SHA256 and size are computed incrementally, then the
+    staging file is renamed into its content-addressed key — the payload is
+    never buffered in memory and never re-read for hashing. Only images that
+    ``maybe_convert_image`` actually re-encodes are read back (and re-hashed).
 
     ``fast_single_attempt=True`` is used by the status poller's inline-prefetch
     path to race the short-lived early-CDN window (Pixverse moderated content
@@ -54,7 +94,7 @@ async def download_file(
     ends up in the same state either way.
 
     Returns:
-        Path to downloaded file
+        DownloadedFile with the local path and the digest/size of what was stored
     """
     url = asset.remote_url
     if not url:
@@ -94,6 +134,12 @@ async def download_file(
 
     ext = guess_extension(asset)
 
+    # Stage on the same root as the user's content so the final move into the
+    # content-addressed key is a same-filesystem rename, but in a directory of
+    # its own so a killed download never leaves a .part among the content.
+    staging_dir = Path(storage.get_path(f"u/{asset.user_id}/.staging"))
+    await asyncio.to_thread(_prepare_staging_dir, staging_dir)
+
     if fast_single_attempt:
         max_retries = 1
         retry_delay = 0.0
@@ -104,9 +150,10 @@ async def download_file(
         http_timeout = 120.0
 
     for attempt in range(max_retries):
+        fd, staged_path = tempfile.mkstemp(dir=str(staging_dir), suffix=".part")
+        os.close(fd)
         try:
-            # Download to memory while computing hash
-            content_chunks: list[bytes] = []
+            # Stream to disk while computing hash and size
             total_size = 0
             sha256_hash = hashlib.sha256()
 
@@ -131,33 +178,46 @@ async def download_file(
                 async with client.stream("GET", url) as resp:
                     resp.raise_for_status()
 
-                    async for chunk in resp.aiter_bytes(chunk_size=1024*1024):
-                        if total_size + len(chunk) > max_size:
-                            raise ValueError(
-                                f"Download exceeded max size: {settings.max_download_size_mb}MB"
-                            )
-                        content_chunks.append(chunk)
-                        sha256_hash.update(chunk)
-                        total_size += len(chunk)
+                    async with aiofiles.open(staged_path, "wb") as out:
+                        async for chunk in resp.aiter_bytes(chunk_size=1024*1024):
+                            if total_size + len(chunk) > max_size:
+                                raise ValueError(
+                                    f"Download exceeded max size: {settings.max_download_size_mb}MB"
+                                )
+                            sha256_hash.update(chunk)
+                            total_size += len(chunk)
+                            await out.write(chunk)
 
-            # Combine chunks
-            content = b''.join(content_chunks)
+            sha256 = sha256_hash.hexdigest()
 
             # Optional format conversion for images (e.g. PNG→WebP)
-            content, ext = maybe_convert_image(
-                asset, content, ext, settings,
-            )
-            # Recompute hash if content was converted
-            sha256 = hashlib.sha256(content).hexdigest()
-            total_size = len(content)
+            converted = None
+            if asset.media_type == MediaType.IMAGE and settings.storage_format_normalized:
+                content = await asyncio.to_thread(Path(staged_path).read_bytes)
+                new_content, new_ext = maybe_convert_image(
+                    asset, content, ext, settings,
+                )
+                if new_content is not content:
+                    converted, ext = new_content, new_ext
 
             # Store using content-addressed key (automatic deduplication)
-            stored_key = await storage.store_with_hash(
-                user_id=asset.user_id,
-                sha256=sha256,
-                content=content,
-                extension=ext,
-            )
+            if converted is not None:
+                sha256 = hashlib.sha256(converted).hexdigest()
+                total_size = len(converted)
+                stored_key = await storage.store_with_hash(
+                    user_id=asset.user_id,
+                    sha256=sha256,
+                    content=converted,
+                    extension=ext,
+                )
+            else:
+                stored_key = await storage.store_from_path_with_hash(
+                    asset.user_id,
+                    sha256,
+                    staged_path,
+                    ext,
+                    move=True,
+                )
 
             # Download always lands on the local (hot) root — derive a real
             # local_path and (re)assert the root so a previously-archived row
@@ -181,7 +241,7 @@ async def download_file(
                 local_path=local_path,
             )
 
-            return local_path
+            return DownloadedFile(path=local_path, sha256=sha256, size_bytes=total_size)
 
         except (httpx.TimeoutException, httpx.NetworkError) as e:
             if attempt < max_retries - 1:
@@ -214,6 +274,25 @@ async def download_file(
                 await asyncio.sleep(propagation_delay)
             else:
                 raise
+        finally:
+            # Moved into storage on success; a partial file otherwise.
+            try:
+                os.unlink(staged_path)
+            except OSError:
+                pass
+
+
+def _prepare_staging_dir(staging_dir: Path) -> None:
+    """Create the staging directory and drop ``.part`` files left behind by a
+    process that died mid-download (anything older than any live download)."""
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    cutoff = datetime.now(timezone.utc).timestamp() - STALE_STAGING_SEC
+    for part in staging_dir.glob("*.part"):
+        try:
+            if part.stat().st_mtime < cutoff:
+                part.unlink()
+        except OSError:
+            pass
 
 
 def guess_extension(asset: "Asset") -> str:
@@ -17,16 +17,18 @@ import math
 import os
 import tempfile
 from pathlib import Path
+from collections.abc import Sequence
 from typing import Any
 
 from pixsim7.backend.main.domain.enums import MediaType
 from pixsim7.backend.main.services.media.derivatives import (
     DEFAULT_FRAME_SIZE,
+    FrameOutput,
     _get_video_rotation_filters,
     _validate_extracted_frame,
     _validate_video_for_thumbnail,
     evenly_spaced_timestamps,
-    extract_video_frame,
+    extract_video_frames,
 )
 
 
@@ -160,39 +162,46 @@ async def _extract_video_embedding_frames(
     timestamps = _video_embedding_timestamps(asset, config)
     rotation_filters = _get_video_rotation_filters(asset)
 
-    paths: list[str] = []
-    cleanup_paths: list[str] = []
-    for index, timestamp in enumerate(timestamps):
+    frame_paths: list[str] = []
+    for index in range(len(timestamps)):
         fd, frame_path = tempfile.mkstemp(
             prefix=f"pixsim_embed_{asset.id}_{index}_",
             suffix=".jpg",
         )
         os.close(fd)
-        try:
-            Path(frame_path).unlink(missing_ok=True)
-            ok = await extract_video_frame(
-                video_path,
-                frame_path,
-                timestamp=timestamp,
-                target_size=target_size,
-                rotation_filters=rotation_filters,
-                qscale=3,
+        Path(frame_path).unlink(missing_ok=True)
+        frame_paths.append(frame_path)
+
+    # Every requested frame from one decode of the clip.
+    try:
+        results = await extract_video_frames(
+            video_path,
+            [
+                FrameOutput(frame_path, timestamp, target_size, qscale=3)
+                for frame_path, timestamp in zip(frame_paths, timestamps)
+            ],
+            rotation_filters=rotation_filters,
+            duration_sec=getattr(asset, "duration_sec", None),
+            asset_id=asset.id,
+            op="embedding",
+        )
+    except Exception as exc:
+        if log is not None:
+            log.warning(
+                "embedding_frame_extract_error",
                 asset_id=asset.id,
-                op="embedding",
+                timestamps=timestamps,
+                error=str(exc),
             )
-            if ok and _validate_extracted_frame(frame_path, asset.id):
-                paths.append(frame_path)
-                cleanup_paths.append(frame_path)
-                continue
-        except Exception as exc:
-            if log is not None:
-                log.warning(
-                    "embedding_frame_extract_error",
-                    asset_id=asset.id,
-                    timestamp=timestamp,
-                    error=str(exc),
-                )
+        results = [False] * len(frame_paths)
 
+    paths: list[str] = []
+    cleanup_paths: list[str] = []
+    for frame_path, ok in zip(frame_paths, results):
+        if ok and _validate_extracted_frame(frame_path, asset.id):
+            paths.append(frame_path)
+            cleanup_paths.append(frame_path)
+            continue
         try:
             Path(frame_path).unlink(missing_ok=True)
         except OSError:
@@ -260,13 +269,17 @@ async def resolve_embedding_input_paths(
 
 
 def aggregate_embedding_vectors(
-    vectors: list[list[float]],
+    vectors: Sequence[Sequence[float]],
     *,
     input_kind: str,
     config: dict[str, Any],
 ) -> list[float]:
-    if not vectors:
+    if len(vectors) == 0:
         return []
+    if hasattr(vectors, "tolist"):
+        # Binary wire format: pool the float32 array in numpy and only build
+        # Python floats for the one vector that is persisted.
+        return _aggregate_array(vectors, input_kind=input_kind, config=config)
     if len(vectors) == 1 or not input_kind.startswith("video_"):
         return vectors[0]
 
@@ -288,6 +301,23 @@ def aggregate_embedding_vectors(
     return pooled
 
 
+def _aggregate_array(vectors: Any, *, input_kind: str, config: dict[str, Any]) -> list[float]:
+    import numpy as np
+
+    if len(vectors) == 1 or not input_kind.startswith("video_"):
+        return vectors[0].tolist()
+
+    aggregation = str(config.get("video_frame_aggregation") or "mean")
+    if aggregation != "mean":
+        raise ValueError(f"Unsupported video frame aggregation: {aggregation}")
+
+    pooled = np.asarray(vectors, dtype=np.float64).mean(axis=0)
+    norm = float(np.sqrt(np.dot(pooled, pooled)))
+    if norm > 0:
+        pooled /= norm
+    return pooled.tolist()
+
+
 def cleanup_embedding_input_paths(paths: list[str], *, log=None) -> None:
     for path in paths:
         try:
@@ -14,15 +14,21 @@ from pixsim_logging import get_logger
 
 if TYPE_CHECKING:
     from pixsim7.backend.main.domain import Asset
+    from pixsim7.backend.main.services.media.probe import MediaProbe
 
 logger = get_logger()
 
 
-async def extract_metadata(asset: "Asset", local_path: str) -> None:
+async def extract_metadata(
+    asset: "Asset", local_path: str, *, probe: Optional["MediaProbe"] = None,
+) -> None:
     """
     Extract metadata from file.
 
     Updates: width, height, duration_sec, fps, mime_type
+
+    ``probe`` is a shared ffprobe result for ``local_path``; videos are probed
+    here only when it is absent or failed.
     """
     path = Path(local_path)
 
@@ -34,7 +40,7 @@ async def extract_metadata(asset: "Asset", local_path: str) -> None:
     if asset.media_type == MediaType.IMAGE:
         await extract_image_metadata(asset, local_path)
     elif asset.media_type == MediaType.VIDEO:
-        await extract_video_metadata(asset, local_path)
+        await extract_video_metadata(asset, local_path, probe=probe)
 
 
 async def extract_image_metadata(asset: "Asset", local_path: str) -> None:
@@ -61,12 +67,12 @@ async def extract_image_metadata(asset: "Asset", local_path: str) -> None:
         )
 
 
-async def extract_video_metadata(asset: "Asset", local_path: str) -> None:
+async def extract_video_metadata(
+    asset: "Asset", local_path: str, *, probe: Optional["MediaProbe"] = None,
+) -> None:
     """Extract metadata from video file using ffprobe."""
     try:
-        from pixsim7.backend.main.shared.video_utils import get_video_metadata
-
-        metadata = get_video_metadata(local_path)
+        metadata = _video_metadata(local_path, probe)
         apply_video_metadata(asset, metadata)
 
         logger.debug(
@@ -120,7 +126,21 @@ def apply_video_metadata(
     asset.media_metadata["video_info"] = video_info
 
 
-def ensure_video_rotation(asset: "Asset", local_path: str) -> Optional[int]:
+def _video_metadata(local_path: str, probe: Optional["MediaProbe"]) -> Dict[str, Any]:
+    """``get_video_metadata`` output, from ``probe`` when it succeeded."""
+    from pixsim7.backend.main.shared.video_utils import (
+        get_video_metadata,
+        parse_video_metadata,
+    )
+
+    if probe is not None and probe.ok:
+        return parse_video_metadata(probe.data)
+    return get_video_metadata(local_path)
+
+
+def ensure_video_rotation(
+    asset: "Asset", local_path: str, *, probe: Optional["MediaProbe"] = None,
+) -> Optional[int]:
     """
     Ensure rotation metadata is available for video thumbnails/previews.
 
@@ -135,9 +155,7 @@ def ensure_video_rotation(asset: "Asset", local_path: str) -> Optional[int]:
         return rotation
 
     try:
-        from pixsim7.backend.main.shared.video_utils import get_video_metadata
-
-        metadata = get_video_metadata(local_path)
+        metadata = _video_metadata(local_path, probe)
         apply_video_metadata(asset, metadata, fill_missing_only=True)
         return metadata.get("rotation")
     except Exception:
@@ -0,0 +1,77 @@
+"""
+Media Probe
+
+One ffprobe JSON run per file, shared across an ingestion job. Metadata
+extraction, rotation detection, thumbnail/preview validation and the
+signal-analysis stream fallback each used to spawn their own ffprobe against
+the same file; they now accept a ``MediaProbe`` and only probe themselves
+when none is supplied.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+PROBE_TIMEOUT_SEC = 30
+
+
+@dataclass(frozen=True)
+class MediaProbe:
+    """Parsed ``ffprobe -show_streams -show_format`` output for one file.
+
+    ``data`` is None when the probe failed; ``error`` then carries the reason
+    (ffprobe stderr, a timeout, a missing binary).
+    """
+
+    path: str
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.data is not None
+
+    @property
+    def format(self) -> Dict[str, Any]:
+        return (self.data or {}).get("format") or {}
+
+    def first_stream(self, codec_type: str) -> Optional[Dict[str, Any]]:
+        for stream in (self.data or {}).get("streams") or []:
+            if stream.get("codec_type") == codec_type:
+                return stream
+        return None
+
+
+def probe_media_file(path: str, *, timeout: int = PROBE_TIMEOUT_SEC) -> MediaProbe:
+    """Run ffprobe once over every stream and the container of ``path``.
+
+    Never raises — failures come back as ``MediaProbe(data=None, error=...)``
+    so each consumer keeps its own failure handling.
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_streams",
+        "-show_format",
+        "-of", "json",
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return MediaProbe(path=path, error=f"ffprobe timed out ({timeout}s)")
+    except OSError as e:
+        return MediaProbe(path=path, error=str(e))
+
+    if result.returncode != 0:
+        return MediaProbe(
+            path=path,
+            error=(result.stderr or "").strip() or f"ffprobe exited {result.returncode}",
+        )
+    try:
+        data = json.loads(result.stdout or "{}")
+    except json.JSONDecodeError as e:
+        return MediaProbe(path=path, error=f"unparseable ffprobe output: {e}")
+    return MediaProbe(path=path, data=data)
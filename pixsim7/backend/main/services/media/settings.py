@@ -90,6 +90,17 @@ class MediaSettings(SettingsBase):
             "CPU and starve the UI. Live-tunable — applies on the next batch."
         ),
     )
+    signal_reprobe_process_pool: bool = Field(
+        False,
+        description=(
+            "Run reprobe probes in a bounded process pool instead of worker "
+            "threads. The per-clip phash/spectral analysis then runs outside the "
+            "worker's GIL, and the pool is sized so workers × ffmpeg threads fits "
+            "the machine's cores (still capped by the concurrency knobs above). "
+            "Worth enabling for full-library rescans on a many-core box. "
+            "Live-tunable — applies on the next batch."
+        ),
+    )
     signal_rescore_concurrency: int = Field(
         4,
         ge=1,
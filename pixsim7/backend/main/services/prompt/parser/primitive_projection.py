@@ -11,7 +11,7 @@ import logging
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Sequence, Tuple
 
 from pixsim7.backend.main.services.prompt.block.content_pack_loader import (
     CONTENT_PACKS_DIR,
@@ -282,8 +282,11 @@ def normalize_primitive_projection_mode(mode: Any) -> str:
 
 def refresh_primitive_projection_cache() -> None:
     """Clear cached primitive index (used by tests/dev tooling)."""
+    global _explicit_index_lookup
     _get_primitive_index.cache_clear()
     _get_domain_signal_tokens.cache_clear()
+    _get_index_lookup.cache_clear()
+    _explicit_index_lookup = None
 
 
 def _as_text(value: Any) -> str | None:
@@ -860,6 +863,53 @@ def _get_domain_signal_tokens() -> Dict[str, frozenset[str]]:
     return _build_domain_signal_tokens(_get_primitive_index())
 
 
+class _IndexLookup(NamedTuple):
+    """Per-index structures derived once, alongside the primitive index."""
+
+    # Stem-expanded `tokens` of each entry, by index position.
+    expanded_tokens: Tuple[frozenset[str], ...]
+    # Inverted index: stem-expanded token -> positions of entries carrying it.
+    postings: Dict[str, Tuple[int, ...]]
+    domain_signal_tokens: Dict[str, frozenset[str]]
+
+
+def _build_index_lookup(index: Sequence[Mapping[str, Any]]) -> _IndexLookup:
+    expanded_tokens = tuple(
+        frozenset(_stem_expand(set(entry.get("tokens") or set()))) for entry in index
+    )
+    postings: Dict[str, List[int]] = {}
+    for position, tokens in enumerate(expanded_tokens):
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+    return _IndexLookup(
+        expanded_tokens=expanded_tokens,
+        postings={token: tuple(positions) for token, positions in postings.items()},
+        domain_signal_tokens=_build_domain_signal_tokens(index),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_index_lookup() -> _IndexLookup:
+    """Cached lookup structures for the default (global) primitive index."""
+    return _build_index_lookup(_get_primitive_index())
+
+
+# Last explicitly supplied index and its lookup. Batch callers
+# (`enrich_candidates_with_primitive_projection`) pass the same index object
+# for every candidate, so one slot is enough to build it once per batch.
+_explicit_index_lookup: Tuple[Sequence[Mapping[str, Any]], _IndexLookup] | None = None
+
+
+def _lookup_for_index(index: Sequence[Mapping[str, Any]]) -> _IndexLookup:
+    global _explicit_index_lookup
+    cached = _explicit_index_lookup
+    if cached is not None and cached[0] is index:
+        return cached[1]
+    lookup = _build_index_lookup(index)
+    _explicit_index_lookup = (index, lookup)
+    return lookup
+
+
 def _extract_candidate_evidence(candidate: Mapping[str, Any]) -> Dict[str, Any]:
     role = _as_text(candidate.get("role"))
     category = _as_text(candidate.get("category"))
@@ -909,6 +959,10 @@ def _extract_candidate_evidence(candidate: Mapping[str, Any]) -> Dict[str, Any]:
     return {
         "text_tokens": text_tokens,
         "keyword_tokens": keyword_tokens,
+        # Stem expansions are per-candidate; computing them here keeps them out
+        # of the per-entry loop in `_score_entry`.
+        "expanded_text_tokens": _stem_expand(text_tokens),
+        "expanded_keyword_tokens": _stem_expand(keyword_tokens),
         "role": role,
         "category": category,
         "phrase_hints": phrase_hints,
@@ -924,6 +978,7 @@ def _score_entry(
     *,
     evidence: Mapping[str, Any],
     entry: Mapping[str, Any],
+    expanded_entry_tokens: frozenset[str] | None = None,
 ) -> Dict[str, Any] | None:
     text_tokens = set(evidence.get("text_tokens") or set())
     keyword_tokens = set(evidence.get("keyword_tokens") or set())
@@ -939,9 +994,17 @@ def _score_entry(
     overlap_exact = (text_tokens & entry_tokens) | (keyword_tokens & entry_tokens)
 
     # Stem-expanded overlap: "lighting" matches "light", "walking" matches "walk", etc.
-    expanded_text = _stem_expand(text_tokens)
-    expanded_keywords = _stem_expand(keyword_tokens)
-    expanded_entry = _stem_expand(entry_tokens)
+    expanded_text = evidence.get("expanded_text_tokens")
+    if expanded_text is None:
+        expanded_text = _stem_expand(text_tokens)
+    expanded_keywords = evidence.get("expanded_keyword_tokens")
+    if expanded_keywords is None:
+        expanded_keywords = _stem_expand(keyword_tokens)
+    expanded_entry = (
+        expanded_entry_tokens
+        if expanded_entry_tokens is not None
+        else _stem_expand(entry_tokens)
+    )
 
     overlap_text_set = expanded_text & expanded_entry
     overlap_keywords_set = expanded_keywords & expanded_entry
@@ -1332,6 +1395,53 @@ def _score_entry(
     }
 
 
+def _score_upper_bound(
+    *,
+    evidence: Mapping[str, Any],
+    entry: Mapping[str, Any],
+    shared_tokens: int,
+    probe_tokens: set[str],
+    normalized_probe_weight: float,
+) -> float:
+    """Cheap ceiling on `_score_entry(...)["score"]` for pruning.
+
+    Mirrors `_score_entry` term by term, taking each term at its maximum:
+    overlap is at most the stem-expanded tokens shared with the candidate
+    (each weighing <= 1), gates/penalties are assumed not to fire, and the
+    domain multiplier sits at its cap. Only the exact role/category bonuses
+    are computed as-is.
+    """
+    role = _as_text(evidence.get("role"))
+    category = _as_text(evidence.get("category"))
+    entry_role = _as_text(entry.get("role"))
+    entry_category = _as_text(entry.get("category"))
+
+    bound = (shared_tokens / normalized_probe_weight) * 0.6
+    if evidence.get("keyword_tokens"):
+        bound += 0.2
+    bound += 0.1  # specific_bonus
+    block_tokens = entry.get("block_tokens") or frozenset()
+    bound += min(0.24, 0.12 * len(probe_tokens & block_tokens))
+    if entry.get("phrases") and evidence.get("phrase_haystack"):
+        bound += 0.2
+    if role and entry_role and role == entry_role:
+        bound += 0.2
+    if category and entry_category and category == entry_category:
+        bound += 0.2
+    if role and entry_category and role == entry_category:
+        bound += 0.1
+    if category and entry_role and category == entry_role:
+        bound += 0.1
+
+    op_id = _as_text(entry.get("op_id")) or ""
+    is_scene_anchor = op_id.startswith("scene.anchor.place") or op_id.startswith("scene.relation.place")
+    bound = min(1.0, bound) * (1.5 if is_scene_anchor else 1.35)
+
+    family_tokens = entry.get("family_signal_tokens") or frozenset()
+    bound += min(0.15, 0.05 * len(probe_tokens & family_tokens))
+    return bound
+
+
 def _competing_group_key(entry: Mapping[str, Any]) -> str:
     """Group entries that compete for the same slot in a candidate.
 
@@ -1451,6 +1561,86 @@ def _select_op_preferred_index(hypotheses: Sequence[Mapping[str, Any]]) -> int:
     return 0
 
 
+def _score_index_candidates(
+    *,
+    evidence: Mapping[str, Any],
+    index: Sequence[Mapping[str, Any]],
+    lookup: _IndexLookup,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Score the entries that can match `evidence`, as (position, scored) pairs.
+
+    `_score_entry` returns None for any entry sharing no stem-expanded token
+    with the candidate, so only entries reached through the inverted index are
+    considered. They are scored in descending upper-bound order, stopping once
+    no remaining entry can change the projection envelope: every one left is
+    below both the current third-best competing group (so it cannot reach the
+    hypotheses) and `max(_MIN_MATCH_SCORE, best - ambiguity delta)` (so it can
+    neither lead nor make the leader cross-domain ambiguous).
+    """
+    probe_tokens = set(evidence.get("text_tokens") or set()) | set(
+        evidence.get("keyword_tokens") or set()
+    )
+    if not probe_tokens:
+        return []
+
+    shared: Dict[int, int] = {}
+    postings = lookup.postings
+    for token in evidence["expanded_text_tokens"] | evidence["expanded_keyword_tokens"]:
+        for position in postings.get(token, ()):
+            shared[position] = shared.get(position, 0) + 1
+    if not shared:
+        return []
+
+    probe_weight = sum(_token_weight(token) for token in probe_tokens)
+    normalized_probe_weight = max(min(probe_weight, 3.0), 1.0)
+    bounded = sorted(
+        (
+            (
+                _score_upper_bound(
+                    evidence=evidence,
+                    entry=index[position],
+                    shared_tokens=count,
+                    probe_tokens=probe_tokens,
+                    normalized_probe_weight=normalized_probe_weight,
+                ),
+                position,
+            )
+            for position, count in shared.items()
+        ),
+        key=lambda item: -item[0],
+    )
+
+    scored_positions: List[Tuple[int, Dict[str, Any]]] = []
+    best_by_group: Dict[str, float] = {}
+    cutoff = float("-inf")
+    for bound, position in bounded:
+        # Strictly below: ties on score still order by overlap / block_id.
+        if bound + 1e-9 < cutoff:
+            break
+        entry = index[position]
+        scored = _score_entry(
+            evidence=evidence,
+            entry=entry,
+            expanded_entry_tokens=lookup.expanded_tokens[position],
+        )
+        if scored is None:
+            continue
+        scored_positions.append((position, scored))
+
+        score = float(scored.get("score") or 0.0)
+        group_key = _competing_group_key(entry)
+        if score > best_by_group.get(group_key, float("-inf")):
+            best_by_group[group_key] = score
+        if len(best_by_group) >= _MAX_HYPOTHESES:
+            hypothesis_floor = sorted(best_by_group.values(), reverse=True)[_MAX_HYPOTHESES - 1]
+            best_score = max(best_by_group.values())
+            cutoff = min(
+                hypothesis_floor,
+                max(_MIN_MATCH_SCORE, best_score - _CROSS_DOMAIN_AMBIGUITY_DELTA),
+            )
+    return scored_positions
+
+
 def project_candidate_to_primitives(
     candidate: Mapping[str, Any],
     *,
@@ -1486,20 +1676,20 @@ def project_candidate_to_primitives(
         return projection
 
     evidence = _extract_candidate_evidence(candidate)
-    # Domain-signal sets are a property of the index, not the candidate. Use the
-    # cached global build for the default index; recompute for an explicitly
+    # Domain-signal sets, stem expansions and the token inverted index are
+    # properties of the index, not the candidate. Use the cached global build
+    # for the default index; build (once per index object) for an explicitly
     # supplied (e.g. test) index so synthetic entries still gate correctly.
-    if primitive_index is None:
-        evidence["domain_signal_tokens"] = _get_domain_signal_tokens()
-    else:
-        evidence["domain_signal_tokens"] = _build_domain_signal_tokens(index)
-    ranked_matches: List[Tuple[Dict[str, Any], Mapping[str, Any]]] = []
-
-    for entry in index:
-        scored = _score_entry(evidence=evidence, entry=entry)
-        if scored is None:
-            continue
-        ranked_matches.append((scored, entry))
+    lookup = _get_index_lookup() if primitive_index is None else _lookup_for_index(index)
+    evidence["domain_signal_tokens"] = lookup.domain_signal_tokens
+
+    scored_positions = _score_index_candidates(evidence=evidence, index=index, lookup=lookup)
+    # Index order first, so the stable sort below breaks full ties exactly as
+    # a front-to-back scan of the index would.
+    scored_positions.sort(key=lambda item: item[0])
+    ranked_matches: List[Tuple[Dict[str, Any], Mapping[str, Any]]] = [
+        (scored, index[position]) for position, scored in scored_positions
+    ]
 
     if not ranked_matches:
         projection["suppression_reason"] = "no_signal"
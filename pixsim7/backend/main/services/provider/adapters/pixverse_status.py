@@ -4,7 +4,7 @@ Pixverse status checking operations
 Handles video/image status polling, list-based fallbacks,
 and the canonical Pixverse status code mapping.
 """
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 
 from pixsim_logging import get_logger
 from pixsim7.backend.main.domain import OperationType, ProviderStatus
@@ -207,6 +207,39 @@ def pixverse_status_batch_cache_key(account_id: Any, *, is_image: bool) -> str:
     return f"pixverse:{kind}_status_batch:{account_id}"
 
 
+async def _scan_list_pages(
+    fetch_page: Callable[[int], Awaitable[Optional[List[Any]]]],
+    collect: Callable[[List[Any]], None],
+    results: Dict[str, Any],
+    *,
+    limit: int,
+    offset: int,
+    wanted_ids: Optional[Iterable[str]],
+    max_pages: int,
+    scan_stats: Optional[Dict[str, int]],
+) -> None:
+    """
+    Page through a personal media list for the batch status lookups.
+
+    Without ``wanted_ids`` only the first page is read (the original
+    single-page behaviour). With them, paging continues while at least two
+    wanted ids are still unseen -- one more page only pays off if it can
+    replace more than one per-id ``get`` -- until a short page marks the end
+    of the list or ``max_pages`` is reached.
+    """
+    wanted = {str(i) for i in wanted_ids} if wanted_ids else set()
+    page_offset = offset
+    for _ in range(max(1, max_pages)):
+        items = await fetch_page(page_offset)
+        if scan_stats is not None:
+            scan_stats["list_calls"] = scan_stats.get("list_calls", 0) + 1
+        items = items or []
+        collect(items)
+        if len(wanted.difference(results)) < 2 or len(items) < limit:
+            return
+        page_offset += limit
+
+
 async def _scan_video_list(
     client: Any,
     video_id: str,
@@ -646,17 +679,25 @@ class PixverseStatusMixin:
         *,
         limit: int = 200,
         offset: int = 0,
+        wanted_ids: Optional[Iterable[str]] = None,
+        max_pages: int = 1,
+        scan_stats: Optional[Dict[str, int]] = None,
     ) -> Dict[str, ProviderStatusResult]:
         """
         Batch video status lookup using the personal video list.
 
         Returns a mapping of ``video_id -> ProviderStatusResult`` for videos
-        present in the fetched page.  One ``list_videos`` call satisfies many
-        per-generation ``get_video`` checks on the same account, reducing
+        present in the fetched page(s).  One ``list_videos`` call satisfies
+        many per-generation ``get_video`` checks on the same account, reducing
         the poll load from O(N) to O(1) per account per tick.
 
+        With ``wanted_ids`` the scan pages on (up to ``max_pages``) while
+        enough wanted ids are still unseen to beat per-id lookups; without it
+        only the first page is read. ``scan_stats["list_calls"]`` is
+        incremented per page fetched.
+
         Caller should treat an absent id as "batch miss" and fall back to a
-        per-id ``check_status`` (e.g. the job is older than ``limit`` items).
+        per-id ``check_status`` (e.g. the job is older than the scanned pages).
         The batch result does NOT apply the extend-silent-filter candidate
         logic; callers doing video-extend ops should bypass this batch and
         go through the per-job path.
@@ -664,47 +705,17 @@ class PixverseStatusMixin:
 
         async def _operation(session: PixverseSessionData) -> Dict[str, ProviderStatusResult]:
             client = self._create_client_from_session(session, account)
-            videos = await client.list_videos(limit=limit, offset=offset)
-
             results: Dict[str, ProviderStatusResult] = {}
-            for video in videos or []:
-                raw_video_id = _get_field(video, "video_id", "VideoId", "id")
-                if raw_video_id is None:
-                    continue
-                video_id = str(raw_video_id)
-
-                raw_status = _get_field(video, "video_status", "status")
-                status = self._map_pixverse_status(video)
-                video_url_raw = _get_field(video, "url", "video_url")
-                # Strict: only accept the last-frame URL. `first_frame`,
-                # `thumbnail_url`, and `thumbnail` are semantically ambiguous
-                # — stamping them here would poison submission.response
-                # and self-heal asset.media_metadata.provider_thumbnail_url
-                # with a first-frame value, silently breaking the synthetic
-                # extend seed path.
-                thumb_raw = _get_field(video, "customer_video_last_frame_url", "last_frame")
-                video_url, thumb_url, media_url_signals = (
-                    _extract_sanitized_video_urls(video_url_raw, thumb_raw)
-                )
-
-                results[video_id] = ProviderStatusResult(
-                    status=status,
-                    video_url=video_url,
-                    thumbnail_url=thumb_url,
-                    width=_get_field(video, "output_width", "width"),
-                    height=_get_field(video, "output_height", "height"),
-                    duration_sec=_get_field(video, "video_duration", "duration"),
-                    provider_video_id=video_id,
-                    suppress_thumbnail=True,
-                    has_retrievable_media_url=media_url_signals["has_retrievable_media_url"],
-                    metadata={
-                        "provider_status": raw_status,
-                        "is_image": False,
-                        "source": "list_batch",
-                        **media_url_signals,
-                    },
-                )
-
+            await _scan_list_pages(
+                lambda page_offset: client.list_videos(limit=limit, offset=page_offset),
+                lambda videos: self._collect_video_statuses(videos, results),
+                results,
+                limit=limit,
+                offset=offset,
+                wanted_ids=wanted_ids,
+                max_pages=max_pages,
+                scan_stats=scan_stats,
+            )
             return results
 
         return await self.session_manager.run_with_session(
@@ -714,55 +725,83 @@ class PixverseStatusMixin:
             retry_on_session_error=True,
         )
 
+    def _collect_video_statuses(
+        self, videos: Any, results: Dict[str, ProviderStatusResult],
+    ) -> None:
+        for video in videos or []:
+            raw_video_id = _get_field(video, "video_id", "VideoId", "id")
+            if raw_video_id is None:
+                continue
+            video_id = str(raw_video_id)
+
+            raw_status = _get_field(video, "video_status", "status")
+            status = self._map_pixverse_status(video)
+            video_url_raw = _get_field(video, "url", "video_url")
+            # Strict: only accept the last-frame URL. `first_frame`,
+            # `thumbnail_url`, and `thumbnail` are semantically ambiguous
+            # — stamping them here would poison submission.response
+            # and self-heal asset.media_metadata.provider_thumbnail_url
+            # with a first-frame value, silently breaking the synthetic
+            # extend seed path.
+            thumb_raw = _get_field(video, "customer_video_last_frame_url", "last_frame")
+            video_url, thumb_url, media_url_signals = (
+                _extract_sanitized_video_urls(video_url_raw, thumb_raw)
+            )
+
+            results[video_id] = ProviderStatusResult(
+                status=status,
+                video_url=video_url,
+                thumbnail_url=thumb_url,
+                width=_get_field(video, "output_width", "width"),
+                height=_get_field(video, "output_height", "height"),
+                duration_sec=_get_field(video, "video_duration", "duration"),
+                provider_video_id=video_id,
+                suppress_thumbnail=True,
+                has_retrievable_media_url=media_url_signals["has_retrievable_media_url"],
+                metadata={
+                    "provider_status": raw_status,
+                    "is_image": False,
+                    "source": "list_batch",
+                    **media_url_signals,
+                },
+            )
+
     async def check_image_statuses_from_list(
         self,
         account: ProviderAccount,
         *,
         limit: int = 200,
         offset: int = 0,
+        wanted_ids: Optional[Iterable[str]] = None,
+        max_pages: int = 1,
+        scan_stats: Optional[Dict[str, int]] = None,
     ) -> Dict[str, ProviderStatusResult]:
         """
         Batch image status lookup using the personal image list.
 
         Returns a mapping of ``image_id -> ProviderStatusResult`` for images
-        present in the fetched page. Intended for per-poll caching in the
+        present in the fetched page(s). Intended for per-poll caching in the
         status poller to reduce one-request-per-generation status checks.
+        Paging follows ``check_video_statuses_from_list``.
         """
 
         async def _operation(session: PixverseSessionData) -> Dict[str, ProviderStatusResult]:
             client = self._create_client_from_session(session, account)
-            images = await client.api._image_ops.list_images(  # type: ignore[attr-defined]
-                account=client.pool.get_next(),
+            results: Dict[str, ProviderStatusResult] = {}
+            await _scan_list_pages(
+                lambda page_offset: client.api._image_ops.list_images(  # type: ignore[attr-defined]
+                    account=client.pool.get_next(),
+                    limit=limit,
+                    offset=page_offset,
+                ),
+                lambda images: self._collect_image_statuses(images, results),
+                results,
                 limit=limit,
                 offset=offset,
+                wanted_ids=wanted_ids,
+                max_pages=max_pages,
+                scan_stats=scan_stats,
             )
-
-            results: Dict[str, ProviderStatusResult] = {}
-            for img in images:
-                raw_image_id = img.get("image_id") or img.get("id")
-                if raw_image_id is None:
-                    continue
-                image_id = str(raw_image_id)
-                image_url_raw = img.get("image_url") or img.get("url")
-                image_url = _sanitize_pixverse_url(image_url_raw)
-                status = self._map_pixverse_image_status(img)
-                raw_status = img.get("image_status") or img.get("status") or 0
-
-                results[image_id] = ProviderStatusResult(
-                    status=status,
-                    video_url=image_url,
-                    thumbnail_url=image_url,
-                    width=img.get("width"),
-                    height=img.get("height"),
-                    duration_sec=None,
-                    provider_video_id=image_id,
-                    metadata={
-                        "provider_status": raw_status,
-                        "is_image": True,
-                        "source": "list_batch",
-                    },
-                )
-
             return results
 
         return await self.session_manager.run_with_session(
@@ -772,3 +811,31 @@ class PixverseStatusMixin:
             retry_on_session_error=True,
         )
 
+    def _collect_image_statuses(
+        self, images: Any, results: Dict[str, ProviderStatusResult],
+    ) -> None:
+        for img in images or []:
+            raw_image_id = img.get("image_id") or img.get("id")
+            if raw_image_id is None:
+                continue
+            image_id = str(raw_image_id)
+            image_url_raw = img.get("image_url") or img.get("url")
+            image_url = _sanitize_pixverse_url(image_url_raw)
+            status = self._map_pixverse_image_status(img)
+            raw_status = img.get("image_status") or img.get("status") or 0
+
+            results[image_id] = ProviderStatusResult(
+                status=status,
+                video_url=image_url,
+                thumbnail_url=image_url,
+                width=img.get("width"),
+                height=img.get("height"),
+                duration_sec=None,
+                provider_video_id=image_id,
+                metadata={
+                    "provider_status": raw_status,
+                    "is_image": True,
+                    "source": "list_batch",
+                },
+            )
+
@@ -5,7 +5,7 @@ Clean service for provider interaction and submission tracking.
 """
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -1114,6 +1114,86 @@ class ProviderService:
         else:
             poll_cache[key] = {str(provider_job_id): result}
 
+    @staticmethod
+    def batch_status_kind(
+        provider_id: Optional[str],
+        operation_type: Optional[OperationType],
+    ) -> Optional[bool]:
+        """Which per-account list batch can answer a status check.
+
+        Returns ``True`` for the Pixverse image list, ``False`` for the
+        video list and ``None`` when the check must go through the per-job
+        path (other providers, video-extend).
+        """
+        if provider_id != "pixverse" or operation_type is None:
+            return None
+        if operation_type in get_image_operations():
+            return True
+        if (
+            operation_type in get_video_operations()
+            and operation_type != OperationType.VIDEO_EXTEND
+        ):
+            return False
+        return None
+
+    @staticmethod
+    async def prefetch_batch_statuses(
+        poll_cache: Dict[str, Any],
+        *,
+        account: ProviderAccount,
+        is_image: bool,
+        provider_job_ids: Iterable[str],
+        max_pages: int = 1,
+        scan_stats: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Resolve many jobs on one account with list calls, ahead of polling.
+
+        Fills the same per-tick cache entry the ``check_status`` fast-paths
+        read, but pages until the wanted ids are found (bounded by
+        ``max_pages``) instead of reading one page on the first miss. Ids
+        still absent fall back to per-job checks as before. On failure the
+        batch-failed sentinel is stored, exactly like the lazy path.
+
+        Returns how many of ``provider_job_ids`` were resolved.
+        """
+        provider = registry.get("pixverse")
+        method_name = (
+            "check_image_statuses_from_list" if is_image else "check_video_statuses_from_list"
+        )
+        fetch = getattr(provider, method_name, None)
+        if fetch is None:
+            return 0
+
+        wanted = {str(job_id) for job_id in provider_job_ids}
+        cache_key = pixverse_status_batch_cache_key(account.id, is_image=is_image)
+        try:
+            status_map = await fetch(
+                account=account,
+                limit=200,
+                offset=0,
+                wanted_ids=wanted,
+                max_pages=max_pages,
+                scan_stats=scan_stats,
+            )
+        except Exception as batch_err:
+            logger.debug(
+                "pixverse_status_batch_prefetch_failed",
+                account_id=account.id,
+                is_image=is_image,
+                wanted=len(wanted),
+                error=str(batch_err),
+            )
+            if not isinstance(poll_cache.get(cache_key), dict):
+                poll_cache[cache_key] = PIXVERSE_BATCH_FAILED_SENTINEL
+            return 0
+
+        existing = poll_cache.get(cache_key)
+        if isinstance(existing, dict):
+            # Keep results seeded earlier in the tick (last-ditch recovery).
+            status_map = {**status_map, **existing}
+        poll_cache[cache_key] = status_map
+        return len(wanted.intersection(status_map))
+
     async def check_status(
         self,
         submission: ProviderSubmission,
@@ -1143,10 +1223,10 @@ class ProviderService:
 
         # Pixverse image status batch fast-path (per-poll cache): one image list
         # call can satisfy many IMAGE_TO_IMAGE checks on the same account.
+        batch_kind = self.batch_status_kind(submission.provider_id, operation_type)
         if (
             poll_cache is not None
-            and submission.provider_id == "pixverse"
-            and operation_type in get_image_operations()
+            and batch_kind is True
             and submission.provider_job_id
             and hasattr(provider, "check_image_statuses_from_list")
         ):
@@ -1186,9 +1266,7 @@ class ProviderService:
         if (
             status_result is None
             and poll_cache is not None
-            and submission.provider_id == "pixverse"
-            and operation_type in get_video_operations()
-            and operation_type != OperationType.VIDEO_EXTEND
+            and batch_kind is False
             and submission.provider_job_id
             and hasattr(provider, "check_video_statuses_from_list")
         ):
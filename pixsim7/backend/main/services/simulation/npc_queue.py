@@ -0,0 +1,229 @@
+"""
+NPC Tick Queues
+
+Per-world NPC rosters and per-session next-tick priority queues, so a
+scheduler tick only touches the NPCs that are due instead of re-evaluating
+every NPC for every session.
+
+The authoritative due time stays in session state
+(``flags.npcs["npc:<id>"].state.next_tick_at``, written by the behavior
+system). The queues are a process-level index over it:
+
+- seeded from session state when first needed, when the world's NPC roster
+  changes, or when the session's ``version`` moves (an API edit may have
+  rewritten NPC state);
+- drained up to the tick budget, ordered by (next_tick_at, tier rank);
+- re-filled after simulation from the freshly written session state.
+
+Losing the process only loses the index - the next tick reseeds it.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Both readers below are side-effect free on purpose: seeding walks every NPC
+# in the roster, and the ECS accessors (get_npc_entity) fill in missing
+# structure on the session flags as they read.
+
+def _npc_flags(session: Any, npc_id: int) -> Dict[str, Any]:
+    flags = getattr(session, "flags", None) or {}
+    npc_data = (flags.get("npcs") or {}).get(f"npc:{npc_id}")
+    return npc_data if isinstance(npc_data, dict) else {}
+
+
+def stored_next_tick_at(session: Any, npc_id: int) -> float:
+    """next_tick_at for an NPC from session state (0 = due now)."""
+    state = _npc_flags(session, npc_id).get("state") or {}
+    value = state.get("next_tick_at", 0) if isinstance(state, dict) else 0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def stored_simulation_tier(session: Any, npc_id: int) -> Optional[str]:
+    """Tier recorded by the scheduler on the NPC's behavior component, if any."""
+    components = _npc_flags(session, npc_id).get("components") or {}
+    behavior = components.get("behavior") if isinstance(components, dict) else None
+    tier = behavior.get("simulationTier") if isinstance(behavior, dict) else None
+    return tier if isinstance(tier, str) else None
+
+
+class NpcTickQueue:
+    """
+    Min-heap of (next_tick_at, tier_rank, npc_id) for one session.
+
+    Rescheduling pushes a new entry and leaves the old one in the heap;
+    stale entries are skipped on pop and compacted away when they dominate.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, int]] = []
+        self._entries: Dict[int, Tuple[float, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, npc_id: int) -> bool:
+        return npc_id in self._entries
+
+    def push(self, npc_id: int, next_tick_at: float, tier_rank: int) -> None:
+        entry = (next_tick_at, tier_rank)
+        if self._entries.get(npc_id) == entry:
+            return
+        self._entries[npc_id] = entry
+        heapq.heappush(self._heap, (next_tick_at, tier_rank, npc_id))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+    def discard(self, npc_id: int) -> None:
+        self._entries.pop(npc_id, None)
+
+    def pop_due(self, world_time: float, limit: Optional[int] = None) -> List[int]:
+        """Remove and return up to ``limit`` NPC ids due at ``world_time``."""
+        due: List[int] = []
+        heap = self._heap
+        while heap and heap[0][0] <= world_time:
+            if limit is not None and len(due) >= limit:
+                break
+            next_tick_at, tier_rank, npc_id = heapq.heappop(heap)
+            if self._entries.get(npc_id) != (next_tick_at, tier_rank):
+                continue  # superseded or discarded
+            del self._entries[npc_id]
+            due.append(npc_id)
+        return due
+
+    def next_due_at(self) -> Optional[float]:
+        while self._heap:
+            next_tick_at, tier_rank, npc_id = self._heap[0]
+            if self._entries.get(npc_id) == (next_tick_at, tier_rank):
+                return next_tick_at
+            heapq.heappop(self._heap)
+        return None
+
+    def _compact(self) -> None:
+        self._heap = [(t, r, npc_id) for npc_id, (t, r) in self._entries.items()]
+        heapq.heapify(self._heap)
+
+
+@dataclass
+class _SessionQueue:
+    queue: NpcTickQueue = field(default_factory=NpcTickQueue)
+    roster_version: int = -1
+    session_version: Optional[int] = None
+
+
+@dataclass
+class _WorldRoster:
+    npc_ids: Set[int] = field(default_factory=set)
+    fingerprint: Optional[int] = None
+    version: int = 0
+    sessions: Dict[int, _SessionQueue] = field(default_factory=dict)
+
+
+class NpcScheduleRegistry:
+    """
+    Process-level rosters and tick queues, keyed by world and session.
+
+    Shared by every WorldScheduler in the process (the ARQ cron builds a
+    new scheduler per tick), so the queues outlive individual ticks.
+    """
+
+    def __init__(self) -> None:
+        self._worlds: Dict[int, _WorldRoster] = {}
+
+    def roster(self, world_id: int) -> Set[int]:
+        world = self._worlds.get(world_id)
+        return world.npc_ids if world else set()
+
+    def roster_fingerprint(self, world_id: int) -> Optional[int]:
+        world = self._worlds.get(world_id)
+        return world.fingerprint if world else None
+
+    def set_roster(
+        self,
+        world_id: int,
+        npc_ids: Iterable[int],
+        fingerprint: int,
+    ) -> None:
+        """Replace a world's roster; queued NPCs no longer in it are dropped."""
+        world = self._worlds.setdefault(world_id, _WorldRoster())
+        new_ids = set(npc_ids)
+        for npc_id in world.npc_ids - new_ids:
+            for entry in world.sessions.values():
+                entry.queue.discard(npc_id)
+        world.npc_ids = new_ids
+        world.fingerprint = fingerprint
+        world.version += 1
+
+    def session_queue(
+        self,
+        world_id: int,
+        session: Any,
+        tier_ranks: Dict[str, int],
+        default_rank: int,
+    ) -> NpcTickQueue:
+        """The session's queue, (re)seeded from session state when stale."""
+        world = self._worlds.setdefault(world_id, _WorldRoster())
+        entry = world.sessions.get(session.id)
+        if entry is None:
+            entry = world.sessions[session.id] = _SessionQueue()
+        session_version = getattr(session, "version", None)
+        if entry.roster_version != world.version or entry.session_version != session_version:
+            for npc_id in world.npc_ids:
+                tier = stored_simulation_tier(session, npc_id)
+                entry.queue.push(
+                    npc_id,
+                    stored_next_tick_at(session, npc_id),
+                    tier_ranks.get(tier, default_rank) if tier else default_rank,
+                )
+            entry.roster_version = world.version
+            entry.session_version = session_version
+        return entry.queue
+
+    def requeue(
+        self,
+        world_id: int,
+        session: Any,
+        npc_ids: Iterable[int],
+        tier_ranks: Dict[str, int],
+        default_rank: int,
+    ) -> None:
+        """Put drained NPCs back at their freshly stored next_tick_at."""
+        world = self._worlds.get(world_id)
+        entry = world.sessions.get(session.id) if world else None
+        if entry is None:
+            return
+        for npc_id in npc_ids:
+            if npc_id not in world.npc_ids:
+                continue
+            tier = stored_simulation_tier(session, npc_id)
+            entry.queue.push(
+                npc_id,
+                stored_next_tick_at(session, npc_id),
+                tier_ranks.get(tier, default_rank) if tier else default_rank,
+            )
+
+    def prune_sessions(self, world_id: int, session_ids: Iterable[int]) -> None:
+        """Forget queues of sessions that no longer belong to the world."""
+        world = self._worlds.get(world_id)
+        if not world:
+            return
+        keep = set(session_ids)
+        for session_id in list(world.sessions):
+            if session_id not in keep:
+                del world.sessions[session_id]
+
+    def forget_world(self, world_id: int) -> None:
+        self._worlds.pop(world_id, None)
+
+    def clear(self) -> None:
+        self._worlds.clear()
+
+
+# Process-wide registry used by WorldScheduler unless one is injected.
+npc_schedule_registry = NpcScheduleRegistry()
@@ -17,7 +17,7 @@ import time
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import or_, select
 
 # Use domain entry modules for cross-domain imports
 from pixsim7.backend.game import (
@@ -33,6 +33,7 @@ from pixsim7.backend.game import (
 # Import behavior system functions directly to avoid circular import
 # (pixsim7.backend.simulation re-exports these but also imports this module)
 from pixsim7.backend.main.domain.game.behavior import (
+    get_default_simulation_config,
     get_npcs_to_simulate,
     determine_simulation_tier,
     choose_npc_activity,
@@ -46,6 +47,10 @@ from pixsim7.backend.main.infrastructure.plugins.world_scoping import (
     get_enabled_plugins_for_world,
 )
 from pixsim7.backend.main.services.simulation.context import WorldSimulationContext
+from pixsim7.backend.main.services.simulation.npc_queue import (
+    NpcScheduleRegistry,
+    npc_schedule_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,15 +69,24 @@ class WorldScheduler:
     and calls into specialized services (behavior system, generation service, etc.)
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        npc_schedule: Optional[NpcScheduleRegistry] = None,
+    ):
         """
         Initialize scheduler.
 
         Args:
             db: Database session
+            npc_schedule: NPC roster/tick-queue registry (defaults to the
+                process-wide one, so queues survive per-tick schedulers)
         """
         self.db = db
         self._contexts: Dict[int, WorldSimulationContext] = {}  # world_id -> context
+        self._npc_schedule = npc_schedule or npc_schedule_registry
+        # world_id -> NPCs drained from the tick queues this tick, per session
+        self._drained: Dict[int, Dict[str, Any]] = {}
 
     async def register_world(self, world_id: int) -> None:
         """
@@ -179,30 +193,35 @@ class WorldScheduler:
             f"(real: {delta_real_seconds:.2f}s, scale: {context.config.timeScale})"
         )
 
-        # 2. Build work plan: which NPCs to simulate
-        npcs_by_tier = await self._select_npcs_for_simulation(
-            world_id, context
-        )
+        try:
+            # 2. Build work plan: which NPCs to simulate
+            npcs_by_tier = await self._select_npcs_for_simulation(
+                world_id, context
+            )
 
-        # 3. Simulate selected NPCs (grouped by tier)
-        for tier, npcs in npcs_by_tier.items():
-            for npc_data in npcs:
-                if not context.can_simulate_more_npcs():
-                    logger.debug(
-                        f"Reached max NPC ticks ({context.config.maxNpcTicksPerStep}) "
-                        f"for world {world_id}"
+            # 3. Simulate selected NPCs (grouped by tier)
+            for tier, npcs in npcs_by_tier.items():
+                for npc_data in npcs:
+                    if not context.can_simulate_more_npcs():
+                        logger.debug(
+                            f"Reached max NPC ticks ({context.config.maxNpcTicksPerStep}) "
+                            f"for world {world_id}"
+                        )
+                        break
+
+                    # Simulate NPC
+                    await self._simulate_npc(
+                        npc_data["npc"],
+                        npc_data["session"],
+                        npc_data["world"],
+                        tier,
+                        context
                     )
-                    break
-
-                # Simulate NPC
-                await self._simulate_npc(
-                    npc_data["npc"],
-                    npc_data["session"],
-                    npc_data["world"],
-                    tier,
-                    context
-                )
-                context.record_npc_simulated(tier)
+                    context.record_npc_simulated(tier)
+        finally:
+            # Drained NPCs go back in the queues at whatever next tick the
+            # behavior system stored, simulated or not
+            self._requeue_drained(world_id)
 
         # 4. Enqueue generation jobs (with backpressure)
         # (Phase 21.5 will implement this)
@@ -255,7 +274,10 @@ class WorldScheduler:
         """
         Select which NPCs should be simulated this tick.
 
-        Uses behavior system's tier-based selection and respects work budgets.
+        Drains the NPCs that are due from each session's tick queue (see
+        services/simulation/npc_queue.py), loads just those, and runs the
+        behavior system's tier-based selection over them. Cost scales with
+        due NPCs, not world NPCs x sessions. Respects work budgets.
 
         Args:
             world_id: World ID
@@ -294,28 +316,67 @@ class WorldScheduler:
         if world.meta and "simulation" in world.meta:
             simulation_config = world.meta["simulation"]
 
-        # Collect all NPCs that might need simulation
-        # For now, we'll query NPCs and check them against all sessions
-        # In a more optimized version, we'd track which NPCs are relevant per session
-        result = await self.db.execute(select(GameNPC))
-        all_npcs = list(result.scalars().all())
+        roster = await self._refresh_npc_roster(world_id)
+        if not roster:
+            logger.debug(f"No NPCs found for world {world_id}")
+            return {}
+        self._npc_schedule.prune_sessions(world_id, [session.id for session in sessions])
+
+        # Drain due NPCs from each session's tick queue, within the step budget
+        # and the behavior config's per-session cap. Only these NPCs are loaded
+        # and handed to the behavior system.
+        effective_config = simulation_config or get_default_simulation_config()
+        tier_ranks = {
+            tier.get("id"): rank
+            for rank, tier in enumerate(effective_config.get("tiers") or [])
+            if isinstance(tier, dict)
+        }
+        default_rank = tier_ranks.get(
+            effective_config.get("defaultTier", "background"), len(tier_ranks)
+        )
+        max_per_session = effective_config.get("maxNpcsPerTick")
+        budget = context.config.maxNpcTicksPerStep
 
-        if not all_npcs:
-            logger.debug(f"No NPCs found in database")
+        drained: List[tuple[GameSession, List[int]]] = []
+        total_drained = 0
+        for session in sessions:
+            remaining = budget - total_drained
+            if remaining <= 0:
+                break
+            limit = min(remaining, max_per_session) if max_per_session else remaining
+            queue = self._npc_schedule.session_queue(
+                world_id, session, tier_ranks, default_rank
+            )
+            due_ids = queue.pop_due(context.current_world_time, limit)
+            if due_ids:
+                drained.append((session, due_ids))
+                total_drained += len(due_ids)
+
+        self._drained[world_id] = {
+            "sessions": drained,
+            "tier_ranks": tier_ranks,
+            "default_rank": default_rank,
+        }
+        if not drained:
             return {}
 
+        due_npc_ids = {npc_id for _, ids in drained for npc_id in ids}
+        result = await self.db.execute(
+            select(GameNPC).where(GameNPC.id.in_(due_npc_ids))
+        )
+        npcs_by_id = {npc.id: npc for npc in result.scalars().all()}
+
         # Group NPCs to simulate by tier (across all sessions)
         npcs_by_tier: Dict[str, List[Dict[str, Any]]] = {}
         total_selected = 0
 
-        # For each session, determine which NPCs need simulation
-        for session in sessions:
+        # For each session, let the behavior system tier and stamp its due NPCs
+        for session, due_ids in drained:
             if total_selected >= context.config.maxNpcTicksPerStep:
                 break
 
-            # Use behavior system to select NPCs for this session
             session_npcs_by_tier = get_npcs_to_simulate(
-                npcs=all_npcs,
+                npcs=[npcs_by_id[npc_id] for npc_id in due_ids if npc_id in npcs_by_id],
                 world=world,
                 session=session,
                 world_time=context.current_world_time,
@@ -346,6 +407,45 @@ class WorldScheduler:
 
         return npcs_by_tier
 
+    async def _refresh_npc_roster(self, world_id: int) -> set:
+        """
+        Return the world's NPC ids, reloading them only when the roster changed.
+
+        Change detection reads game_worlds.npc_roster_version (a primary-key
+        lookup), which the GameNPC hooks bump on insert, delete and world
+        reassignment. NPCs without a world are included, as they always were.
+        """
+        version = (
+            await self.db.execute(
+                select(GameWorld.npc_roster_version).where(GameWorld.id == world_id)
+            )
+        ).scalar_one_or_none() or 0
+
+        if version != self._npc_schedule.roster_fingerprint(world_id):
+            scope = or_(GameNPC.world_id == world_id, GameNPC.world_id.is_(None))
+            npc_ids = (await self.db.execute(select(GameNPC.id).where(scope))).scalars().all()
+            self._npc_schedule.set_roster(world_id, npc_ids, version)
+            logger.debug(
+                f"Reloaded NPC roster for world {world_id}: {len(npc_ids)} NPCs "
+                f"(roster version {version})"
+            )
+
+        return self._npc_schedule.roster(world_id)
+
+    def _requeue_drained(self, world_id: int) -> None:
+        """Return this tick's drained NPCs to their session queues."""
+        drained = self._drained.pop(world_id, None)
+        if not drained:
+            return
+        for session, npc_ids in drained["sessions"]:
+            self._npc_schedule.requeue(
+                world_id,
+                session,
+                npc_ids,
+                drained["tier_ranks"],
+                drained["default_rank"],
+            )
+
     async def _simulate_npc(
         self,
         npc: GameNPC,
@@ -8,10 +8,12 @@ See plan ``media-storage-tiering``.
 from .roots import LOCAL_ROOT_ID, RootSpec, get_root_specs, reset_root_specs_cache
 from .storage_service import (
     LocalStorageService,
+    RangeNotSatisfiable,
     S3StorageService,
     StorageService,
     TieredStorageService,
     get_storage_service,
+    local_file_etag,
     set_storage_service,
 )
 
@@ -20,6 +22,8 @@ __all__ = [
     "LocalStorageService",
     "S3StorageService",
     "TieredStorageService",
+    "RangeNotSatisfiable",
+    "local_file_etag",
     "get_storage_service",
     "set_storage_service",
     "RootSpec",
@@ -22,8 +22,9 @@ import asyncio
 import hashlib
 import tempfile
 from pathlib import Path
-from typing import Optional, BinaryIO, Union
+from typing import Optional, BinaryIO, Tuple, Union
 from datetime import datetime
+from email.utils import formatdate
 import aiofiles
 import aiofiles.os
 
@@ -41,6 +42,58 @@ logger = get_logger()
 # can't block on an unreachable archive (laptop off the archive's LAN/ZeroTier).
 _PROBE_TIMEOUT_SECONDS = 5.0
 
+# Read size for streamed local files and hashing (matches the S3 proxy chunking).
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """A ``Range`` request that starts past the end of the object (HTTP 416)."""
+
+    def __init__(self, size: int):
+        super().__init__(f"range not satisfiable for a {size}-byte object")
+        self.size = size
+
+
+def local_file_etag(stat_result: os.stat_result) -> str:
+    """Strong ETag for a local file from its mtime and size (no content read)."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def parse_byte_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a single ``bytes=`` Range header against a ``size``-byte object.
+
+    Returns the inclusive ``(start, end)`` to send, or None when the whole
+    object should be sent instead: no header, another unit, several ranges or
+    a malformed spec (RFC 9110 lets a server ignore those with a plain 200,
+    which is also what S3 does for multi-range requests). Raises
+    ``RangeNotSatisfiable`` when the range starts at or past the end.
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    try:
+        if not sep:
+            return None
+        if not first:
+            # Suffix range: the final N bytes.
+            length = int(last)
+            if length <= 0:
+                raise RangeNotSatisfiable(size)
+            return max(size - length, 0), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(size)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
 
 class StorageService:
     """
@@ -266,15 +319,20 @@ class LocalStorageService(StorageService):
         return key
 
     async def get(self, key: str) -> Optional[bytes]:
-        """Retrieve content by key."""
+        """
+        Retrieve content by key.
+
+        Loads the whole file into memory — only for callers that genuinely
+        need the bytes. Serving goes through ``open_stream``/``FileResponse``,
+        processing through ``get_path`` and hashing through ``compute_hash``.
+        """
         path = self._key_to_path(key)
 
-        if not path.exists():
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
             return None
 
-        async with aiofiles.open(path, 'rb') as f:
-            return await f.read()
-
     async def delete(self, key: str) -> bool:
         """Delete content by key."""
         path = self._key_to_path(key)
@@ -314,8 +372,8 @@ class LocalStorageService(StorageService):
 
         stat = path.stat()
 
-        # Compute ETag from file hash (or use mtime+size for speed)
-        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        # mtime+size ETag: cheap, and shared with open_stream / the serve path
+        etag = local_file_etag(stat)
 
         # Guess content type from extension
         import mimetypes
@@ -332,19 +390,75 @@ class LocalStorageService(StorageService):
         """Compute SHA256 hash of stored file."""
         path = self._key_to_path(key)
 
-        if not path.exists():
+        def _digest() -> str:
+            # One worker-thread hop for the whole file; file_digest reads
+            # into a reused buffer instead of allocating a chunk per read.
+            with open(path, 'rb') as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+        try:
+            return await asyncio.to_thread(_digest)
+        except FileNotFoundError:
             return None
 
-        # Read in chunks for memory efficiency
-        sha256_hash = hashlib.sha256()
-        async with aiofiles.open(path, 'rb') as f:
-            while True:
-                chunk = await f.read(1024 * 1024)  # 1MB chunks
-                if not chunk:
-                    break
-                sha256_hash.update(chunk)
+    async def open_stream(self, key: str, range_header: Optional[str] = None):
+        """
+        Open a streaming read of a stored file (mirrors ``S3StorageService.open_stream``).
 
-        return sha256_hash.hexdigest()
+        Returns ``(status_code, headers, content_type, async_iter)`` where status
+        is 206 for a satisfied single Range request else 200. Headers carry the
+        same mtime/size ETag as ``get_metadata`` plus Last-Modified. The file is
+        read in 1MB chunks off the event loop; the iterator owns the handle and
+        closes it when consumed or closed.
+
+        Raises FileNotFoundError for a missing key and ``RangeNotSatisfiable``
+        for a range past the end of the file. The serve route prefers
+        ``get_path`` + ``FileResponse`` (sendfile-capable); this path is for
+        callers that proxy or post-process a byte stream.
+        """
+        path = self._key_to_path(key)
+        f = await asyncio.to_thread(open, path, 'rb')
+        try:
+            st = os.fstat(f.fileno())
+            byte_range = parse_byte_range(range_header, st.st_size)
+        except BaseException:
+            f.close()
+            raise
+
+        headers = {
+            "Accept-Ranges": "bytes",
+            "ETag": local_file_etag(st),
+            "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        }
+        if byte_range is None:
+            status, start, remaining = 200, 0, st.st_size
+        else:
+            start, end = byte_range
+            status, remaining = 206, end - start + 1
+            headers["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+        headers["Content-Length"] = str(remaining)
+
+        import mimetypes
+        content_type, _ = mimetypes.guess_type(str(path))
+
+        def _read(offset: int, size: int) -> bytes:
+            f.seek(offset)
+            return f.read(size)
+
+        async def _iter():
+            offset, left = start, remaining
+            try:
+                while left > 0:
+                    chunk = await asyncio.to_thread(_read, offset, min(_STREAM_CHUNK_SIZE, left))
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+                    left -= len(chunk)
+                    yield chunk
+            finally:
+                f.close()
+
+        return status, headers, content_type or "application/octet-stream", _iter()
 
     async def store_with_hash(
         self,
@@ -400,6 +514,8 @@ class LocalStorageService(StorageService):
         sha256: str,
         source_path: str,
         extension: str = "",
+        *,
+        move: bool = False,
     ) -> str:
         """
         Store content from local file using content-addressed key.
@@ -412,6 +528,9 @@ class LocalStorageService(StorageService):
             sha256: SHA256 hash of content
             source_path: Path to source file
             extension: File extension including dot
+            move: Consume ``source_path`` — rename it into place (it must be on
+                the same filesystem) instead of copying, and delete it when
+                the key already exists.
 
         Returns:
             The content-addressed storage key
@@ -426,6 +545,19 @@ class LocalStorageService(StorageService):
                 sha256=sha256[:16],
                 source=source_path
             )
+            if move:
+                Path(source_path).unlink(missing_ok=True)
+            return key
+
+        if move:
+            path = self._key_to_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source_path, str(path))
+            logger.debug(
+                "file_moved_content_addressed",
+                key=key,
+                sha256=sha256[:16],
+            )
             return key
 
         # Copy file to content-addressed location
@@ -621,10 +753,15 @@ class S3StorageService(StorageService):
         }
 
     async def compute_hash(self, key):
-        data = await self.get(key)
-        if data is None:
+        # Stream the object through the hash rather than buffering it whole.
+        try:
+            _, _, _, body = await self.open_stream(key)
+        except FileNotFoundError:
             return None
-        return hashlib.sha256(data).hexdigest()
+        sha256_hash = hashlib.sha256()
+        async for chunk in body:
+            sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
 
     async def store_with_hash(self, user_id, sha256, content, extension="", content_type=None):
         key = self.get_content_addressed_key(user_id, sha256, extension)
@@ -633,11 +770,12 @@ class S3StorageService(StorageService):
         await self.store(key, content, content_type)
         return key
 
-    async def store_from_path_with_hash(self, user_id, sha256, source_path, extension=""):
+    async def store_from_path_with_hash(self, user_id, sha256, source_path, extension="", *, move=False):
         key = self.get_content_addressed_key(user_id, sha256, extension)
-        if await self.exists(key):  # root-scoped dedup
-            return key
-        await self.store_from_path(key, source_path)
+        if not await self.exists(key):  # root-scoped dedup
+            await self.store_from_path(key, source_path)
+        if move:
+            Path(source_path).unlink(missing_ok=True)
         return key
 
     async def health_check(self) -> None:
@@ -864,10 +1002,10 @@ class TieredStorageService(StorageService):
         )
 
     async def store_from_path_with_hash(
-        self, user_id, sha256, source_path, extension="", root_id=None
+        self, user_id, sha256, source_path, extension="", root_id=None, *, move=False
     ):
         return await self._backend(root_id).store_from_path_with_hash(
-            user_id, sha256, source_path, extension
+            user_id, sha256, source_path, extension, move=move
         )
 
     def get_content_addressed_key(self, user_id, sha256, extension=""):
@@ -877,7 +1015,7 @@ class TieredStorageService(StorageService):
         )
 
     async def open_stream(self, key, root_id=None, range_header: Optional[str] = None):
-        """Open a proxy stream from the backend for ``root_id`` (non-local only)."""
+        """Open a byte stream from the backend for ``root_id`` (local or S3)."""
         backend = self._backend(root_id)
         opener = getattr(backend, "open_stream", None)
         if opener is None:
@@ -898,7 +1036,8 @@ class TieredStorageService(StorageService):
         Return a local filesystem path to the object's bytes for processing.
 
         For local roots this is the real stored path and no copy is made. For
-        non-local backends (S3) the object is downloaded to a temp file.
+        non-local backends (S3) the object is streamed to a temp file chunk by
+        chunk, so large videos are never held in memory.
 
         Returns ``(path, is_temp)`` — when ``is_temp`` is True the CALLER must
         delete ``path`` when done.
@@ -907,14 +1046,28 @@ class TieredStorageService(StorageService):
         if isinstance(backend, LocalStorageService):
             return backend.get_path(key), False
 
-        data = await backend.get(key)
-        if data is None:
-            raise FileNotFoundError(f"object not found: root={root_id!r} key={key!r}")
+        opener = getattr(backend, "open_stream", None)
+        if opener is not None:
+            try:
+                _, _, _, chunks = await opener(key)
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"object not found: root={root_id!r} key={key!r}"
+                ) from None
+        else:
+            data = await backend.get(key)
+            if data is None:
+                raise FileNotFoundError(f"object not found: root={root_id!r} key={key!r}")
+            chunks = None
         suffix = Path(key).suffix
         fd, tmp_path = tempfile.mkstemp(suffix=suffix)
         try:
             with os.fdopen(fd, "wb") as f:
-                f.write(data)
+                if chunks is None:
+                    f.write(data)
+                else:
+                    async for chunk in chunks:
+                        await asyncio.to_thread(f.write, chunk)
         except BaseException:
             try:
                 os.unlink(tmp_path)
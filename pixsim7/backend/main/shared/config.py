@@ -80,6 +80,26 @@ class Settings(BaseSettings):
         description="Redis connection URL (cache + queue)"
     )
 
+    event_bridge_mode: str = Field(
+        default="immediate",
+        description=(
+            "Redis event bridge mode. 'immediate' publishes every event on the "
+            "shared channel as it happens. 'batched' micro-batches events into "
+            "one pipelined publish per window, coalesces superseded updates and "
+            "uses one channel per event family. All processes must agree."
+        ),
+    )
+    event_bridge_batch_window_ms: int = Field(
+        default=10,
+        ge=0,
+        description="Batched event bridge: how long to collect events before publishing",
+    )
+    event_bridge_max_batch: int = Field(
+        default=500,
+        ge=1,
+        description="Batched event bridge: publish early once this many events are pending",
+    )
+
     # ===== SECURITY =====
     secret_key: str = Field(
         default="change-this-in-production",
@@ -392,6 +412,22 @@ class Settings(BaseSettings):
         default="adb",
         description="Path to ADB executable (or 'adb' if in PATH)"
     )
+    adb_transport: str = Field(
+        default="server",
+        description=(
+            "How automation talks to ADB: 'server' speaks the adb server socket "
+            "protocol directly (no process per command, falls back to the adb "
+            "binary when the server is down); 'subprocess' runs adb every time."
+        ),
+    )
+    adb_server_host: str = Field(
+        default="127.0.0.1",
+        description="adb server host for the 'server' ADB transport"
+    )
+    adb_server_port: int = Field(
+        default=5037,
+        description="adb server port for the 'server' ADB transport"
+    )
 
     # ===== WEBHOOKS =====
     webhook_config_json: str | None = Field(
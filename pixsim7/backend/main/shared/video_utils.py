@@ -65,13 +65,38 @@ def get_video_metadata(video_path: str) -> Dict[str, Any]:
         if result.returncode != 0:
             raise InvalidOperationError(f"ffprobe failed: {result.stderr}")
 
-        data = json.loads(result.stdout)
+        return parse_video_metadata(json.loads(result.stdout))
 
-        # Extract stream info (video track)
-        if "streams" not in data or len(data["streams"]) == 0:
+    except subprocess.TimeoutExpired:
+        raise InvalidOperationError("Video metadata extraction timed out (30s)")
+    except (json.JSONDecodeError, ValueError, KeyError) as e:
+        raise InvalidOperationError(f"Failed to parse video metadata: {e}")
+    except Exception as e:
+        raise InvalidOperationError(f"Video metadata extraction failed: {e}")
+
+
+def parse_video_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the :func:`get_video_metadata` dict from parsed ffprobe JSON.
+
+    Accepts either the narrow ``-select_streams v:0`` output or a full
+    ``-show_streams -show_format`` probe (see ``services.media.probe``), so a
+    file probed once can feed every consumer.
+
+    Raises:
+        InvalidOperationError: If there is no video stream or a field is malformed
+    """
+    try:
+        # Extract stream info (first video track). The narrow probe omits
+        # codec_type; a full -show_streams probe lists audio streams too.
+        streams = [
+            s for s in data.get("streams") or []
+            if s.get("codec_type", "video") == "video"
+        ]
+        if not streams:
             raise InvalidOperationError("No video stream found in file")
 
-        stream = data["streams"][0]
+        stream = streams[0]
         format_info = data.get("format", {})
 
         # Parse frame rate (format: "30/1" or "30000/1001")
@@ -125,12 +150,8 @@ def get_video_metadata(video_path: str) -> Dict[str, Any]:
             "rotation": rotation,
         }
 
-    except subprocess.TimeoutExpired:
-        raise InvalidOperationError("Video metadata extraction timed out (30s)")
-    except (json.JSONDecodeError, ValueError, KeyError) as e:
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
         raise InvalidOperationError(f"Failed to parse video metadata: {e}")
-    except Exception as e:
-        raise InvalidOperationError(f"Video metadata extraction failed: {e}")
 
 
 def validate_video_for_provider(
@@ -12,7 +12,8 @@ Holds:
   generation's *current* attempt (vs. an older retry's submission).
 - Submission-error mapping (``_map_submit_error_to_generation_error_code``)
   and the ``_is_stale_unsubmitted_error_submission`` heuristic.
-- The PROCESSING-generation loader.
+- The PROCESSING-generation loaders (full, by id, ids only) and the
+  provider-job lookup used to batch status checks per account.
 """
 from __future__ import annotations
 
@@ -119,6 +120,9 @@ class _PollGenerationResult:
     generation_id: int
     outcome: str  # 'completed', 'failed', 'still_processing', 'error'
     missing_provider_job: bool = False
+    # Set when the poll was skipped for a backoff/cooldown: seconds until the
+    # provider may be asked again (the scheduler won't wake it sooner).
+    retry_after_seconds: float | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -477,8 +481,11 @@ def _is_stale_unsubmitted_error_submission(
 
 async def _load_processing_generation_snapshots(
     db: AsyncSession,
+    generation_ids: Iterable[int] | None = None,
 ) -> list[_ProcessingGenerationSnapshot]:
-    result = await db.execute(
+    """PROCESSING generations, optionally restricted to ``generation_ids``
+    (the scheduled poller loads only the ids that came due)."""
+    query = (
         select(
             Generation.id,
             Generation.account_id,
@@ -492,9 +499,64 @@ async def _load_processing_generation_snapshots(
         .where(Generation.status == GenerationStatus.PROCESSING)
         .order_by(Generation.started_at)
     )
+    if generation_ids is not None:
+        query = query.where(Generation.id.in_(list(generation_ids)))
+    result = await db.execute(query)
     return _to_processing_generation_snapshots(result.all())
 
 
+async def _load_processing_generation_ids(db: AsyncSession) -> set[int]:
+    """Ids of all PROCESSING generations (schedule reconciliation only)."""
+    result = await db.execute(
+        select(Generation.id).where(Generation.status == GenerationStatus.PROCESSING)
+    )
+    return set(result.scalars().all())
+
+
+async def _load_polled_provider_jobs(
+    db: AsyncSession,
+    generations: Iterable[_ProcessingGenerationSnapshot],
+) -> dict[int, tuple[int, int, str]]:
+    """``generation_id -> (submission_id, account_id, provider_job_id)`` in one query.
+
+    Picks the latest submission with a job id, preferring the generation's
+    current attempt. Only a hint for batching status checks; the per-
+    generation poll still selects its submission authoritatively.
+    """
+    attempts: dict[int, int] = {}
+    for generation in generations:
+        try:
+            attempts[generation.id] = int(generation.attempt_id or 0)
+        except (TypeError, ValueError):
+            attempts[generation.id] = 0
+    if not attempts:
+        return {}
+
+    result = await db.execute(
+        select(
+            ProviderSubmission.generation_id,
+            ProviderSubmission.generation_attempt_id,
+            ProviderSubmission.id,
+            ProviderSubmission.account_id,
+            ProviderSubmission.provider_job_id,
+        )
+        .where(ProviderSubmission.generation_id.in_(list(attempts)))
+        .where(ProviderSubmission.provider_job_id.is_not(None))
+        .order_by(ProviderSubmission.generation_id, ProviderSubmission.submitted_at.desc())
+    )
+    jobs: dict[int, tuple[int, int, str]] = {}
+    attempt_matched: set[int] = set()
+    for generation_id, attempt_id, submission_id, account_id, provider_job_id in result.all():
+        if generation_id in attempt_matched:
+            continue
+        if attempts[generation_id] > 0 and attempt_id == attempts[generation_id]:
+            jobs[generation_id] = (submission_id, account_id, str(provider_job_id))
+            attempt_matched.add(generation_id)
+        elif generation_id not in jobs:
+            jobs[generation_id] = (submission_id, account_id, str(provider_job_id))
+    return jobs
+
+
 async def _load_processing_generation_snapshot(
     db: AsyncSession, generation_id: int,
 ) -> _ProcessingGenerationSnapshot | None:
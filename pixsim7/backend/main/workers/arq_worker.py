@@ -25,7 +25,11 @@ from arq import cron
 from arq.connections import RedisSettings
 from pixsim7.backend.main.workers.job_processor import process_generation
 from pixsim7.automation.workers.automation import process_automation, run_automation_loops, queue_pending_executions
-from pixsim7.backend.main.workers.status_poller import poll_job_statuses, poll_generation_once
+from pixsim7.backend.main.workers.status_poller import (
+    leave_poll_schedule,
+    poll_generation_once,
+    poll_job_statuses,
+)
 from pixsim7.backend.main.workers.status_poller_maintenance import (
     requeue_pending_generations,
     reconcile_account_counters,
@@ -55,7 +59,7 @@ from pixsim7.backend.main.workers.health import (
     update_media_maintenance_heartbeat,
     update_derivatives_heartbeat,
 )
-from pixsim7.backend.main.workers.log_cleanup import cleanup_old_logs
+from pixsim7.backend.main.workers.log_cleanup import cleanup_old_logs, refresh_log_facets
 from pixsim7.backend.main.workers.world_simulation import tick_active_worlds
 from pixsim7.backend.main.shared.config import settings
 from pixsim7.backend.main.workers.worker_families import (
@@ -155,14 +159,21 @@ def _register_system_config_subscriber() -> None:
 
 _register_system_config_subscriber()
 
+# Event families the worker bridges receive from other processes (batched bridge
+# mode). system_config:reloaded is the only event any worker handles locally;
+# everything else a worker emits is publish-only. Add a family here when a
+# worker starts subscribing to its events.
+WORKER_EVENT_FAMILIES = ("system_config",)
+
 
 # ---------------------------------------------------------------------------
 # Per-family lifecycle handlers, built from the shared build_worker_lifecycle
 # skeleton. Only the genuine per-family variation lives below: the startup
-# reconcilers (self-guarding coroutines), the component-registered "announcement"
-# logs (pure data), and the factory flags. The uniform core (logger normalize ->
-# health tracker -> worker_start -> persisted-config load -> heartbeat; and, on
-# shutdown, drain -> close_database) lives once in workers/lifecycle.py.
+# reconcilers and shutdown hooks (self-guarding coroutines), the
+# component-registered "announcement" logs (pure data), and the factory flags.
+# The uniform core (logger normalize -> health tracker -> worker_start ->
+# persisted-config load -> heartbeat; and, on shutdown, drain ->
+# close_database) lives once in workers/lifecycle.py.
 # ---------------------------------------------------------------------------
 
 
@@ -195,6 +206,12 @@ async def _startup_reconcile_counters(ctx: dict) -> None:
         logger.warning("startup_reconciliation_failed", error=str(e))
 
 
+async def _shutdown_leave_poll_schedule(ctx: dict) -> None:
+    """Hand this worker's status-poll slots to the other pollers right away.
+    Self-guarding: logs its own failure."""
+    await leave_poll_schedule()
+
+
 async def _reconcile_relocation_on_startup() -> Optional[str]:
     from pixsim7.backend.main.workers.relocation_processor import (
         reconcile_orphaned_relocation_job,
@@ -312,9 +329,11 @@ _MAIN_LIFECYCLE = dict(
     bind_host="main_worker",
     unbind_on_shutdown=True,
     event_bridge_role="arq_worker",
+    event_bridge_families=WORKER_EVENT_FAMILIES,
     inhibit_sleep_while_active=True,
     announcements=_MAIN_ANNOUNCEMENTS,
     startup_reconcilers=(_startup_recover_stale, _startup_reconcile_counters),
+    shutdown_hooks=(_shutdown_leave_poll_schedule,),
 )
 
 # Deferred/retry generation worker: providers + event bridge + sleep-inhibit,
@@ -327,6 +346,7 @@ _RETRY_LIFECYCLE = dict(
     account_events=True,
     register_providers=True,
     event_bridge_role="arq_generation_retry_worker",
+    event_bridge_families=WORKER_EVENT_FAMILIES,
     inhibit_sleep_while_active=True,
     announcements=_RETRY_ANNOUNCEMENTS,
 )
@@ -429,6 +449,7 @@ class WorkerSettings:
         requeue_pending_analyses,
         refresh_stale_account_credits,
         cleanup_old_logs,
+        refresh_log_facets,
         reload_logging_config,
     ]
 
@@ -483,6 +504,12 @@ class WorkerSettings:
             second={0},
             run_at_startup=False,
         ),
+        # Refresh log viewer filter facets once per minute
+        cron(
+            refresh_log_facets,
+            second={40},
+            run_at_startup=True,
+        ),
         # Reload logging config from DB every 60s (picks up UI changes)
         cron(
             reload_logging_config,
@@ -1,7 +1,8 @@
 """Shared ARQ glue for durable backfill batches.
 
 Every backfill domain's ARQ task is the same five lines: open a DB session,
-process one batch via its ``BackfillRunServiceBase``, return a progress dict,
+process one batch via its ``BackfillRunServiceBase``, return a progress dict
+(plus any ``last_batch_metrics`` the service reported),
 and on failure mark the run failed and re-raise. That boilerplate lives here so
 each domain's worker module is a thin wrapper.
 """
@@ -29,7 +30,7 @@ async def run_backfill_batch(
         service = service_cls(db)
         try:
             run = await service.process_run_batch(backfill_run_id)
-            return run.to_progress_dict()
+            return {**run.to_progress_dict(), **(service.last_batch_metrics or {})}
         except Exception as exc:
             logger.error(
                 "%s_batch_failed run_id=%s error=%s",
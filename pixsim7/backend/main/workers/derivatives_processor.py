@@ -11,6 +11,10 @@ to be missing on disk.  The task is idempotent — it re-applies the same
 self-heal rules used by the inline path, so re-running on an already-derived
 asset is a no-op.
 
+For videos the thumbnail and preview poster come out of a single ffmpeg
+demux/decode (``generate_asset_derivatives``), so a job costs one pass over
+the file rather than one per derivative.
+
 Selective flags (``generate_thumbnails`` / ``generate_previews``) are
 forwarded to ``service.generate_derivatives`` so callers that only need one
 side can scope the work.  ``None`` falls back to the media-settings defaults.
@@ -26,6 +26,7 @@ Canonical **startup** order (each bracketed step guarded by a param):
 Canonical **shutdown** order (mirror):
 
     worker_shutdown log
+    [shutdown hooks]                        shutdown_hooks (self-guarding coroutines)
     [stop_event_bus_bridge]                 event_bridge_role (only if a bridge was started)
     [AccountEventService.shutdown]          account_events
     [shutdown_for_host]                     bind_host + unbind_on_shutdown
@@ -248,9 +249,11 @@ def build_worker_lifecycle(
     bind_host: Optional[str] = None,
     unbind_on_shutdown: bool = False,
     event_bridge_role: Optional[str] = None,
+    event_bridge_families: Optional[Sequence[str]] = None,
     inhibit_sleep_while_active: bool = False,
     announcements: Sequence[Tuple[str, dict]] = (),
     startup_reconcilers: Sequence[AsyncHook] = (),
+    shutdown_hooks: Sequence[AsyncHook] = (),
 ) -> Tuple[AsyncHook, AsyncHook]:
     """Build ``(on_startup, on_shutdown)`` for one ARQ worker family.
 
@@ -259,6 +262,9 @@ def build_worker_lifecycle(
     effective-config lines are pure data). ``startup_reconcilers`` are
     self-guarding coroutines run after announcements and before the event bridge —
     each owns its own try/except + logging so the factory stays generic.
+    ``shutdown_hooks`` are the same kind of coroutine, run first on shutdown
+    while Redis and the database are still up. ``event_bridge_families`` limits
+    the event families the bridge receives in batched mode (None = all).
     """
     # Per-lifecycle event-bridge handle (replaces the old module globals).
     _bridge = {"handle": None}
@@ -306,7 +312,9 @@ def build_worker_lifecycle(
             await reconciler(ctx)
 
         if event_bridge_role:
-            _bridge["handle"] = await start_event_bus_bridge(role=event_bridge_role)
+            _bridge["handle"] = await start_event_bus_bridge(
+                role=event_bridge_role, families=event_bridge_families
+            )
 
         await heartbeat(ctx)
 
@@ -316,6 +324,9 @@ def build_worker_lifecycle(
     async def on_shutdown(ctx: Ctx) -> None:
         logger.info("worker_shutdown", msg=shutdown_msg)
 
+        for hook in shutdown_hooks:
+            await hook(ctx)
+
         if event_bridge_role and _bridge["handle"]:
             try:
                 await stop_event_bus_bridge()
@@ -2,6 +2,8 @@
 Log retention cleanup — purges log_entries older than the configured retention period.
 
 Runs as an arq cron job (daily). Reads retention_days from LoggingSettings.
+Also hosts the log_facets refresh (every minute) that feeds the log viewer's
+filter dropdowns.
 """
 from __future__ import annotations
 
@@ -55,3 +57,21 @@ async def cleanup_old_logs(ctx: dict) -> dict:
             domain="system",
         )
         return {"deleted": 0, "error": str(e)}
+
+
+async def refresh_log_facets(ctx: dict) -> dict:
+    """Fold new distinct filter values from log_entries into log_facets."""
+    from pixsim7.backend.main.services.logging_config.settings import get_logging_settings
+    from pixsim7.backend.main.infrastructure.database.session import AsyncLogSessionLocal
+    from pixsim7.backend.main.services.log_service import LogService
+
+    retention_days = get_logging_settings().log_retention_days
+
+    try:
+        async with AsyncLogSessionLocal() as db:
+            upserted = await LogService(db).refresh_facets(retention_days=retention_days)
+        logger.debug("log_facets_refreshed", upserted=upserted, domain="system")
+        return {"upserted": upserted}
+    except Exception as e:
+        logger.warning("log_facets_refresh_failed", error=str(e), domain="system")
+        return {"upserted": 0, "error": str(e)}
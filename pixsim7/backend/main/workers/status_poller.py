@@ -83,6 +83,8 @@ from pixsim7.backend.main.workers._poller_snapshots import (
     _is_stale_unsubmitted_error_submission,
     _load_processing_generation_snapshots,
     _load_processing_generation_snapshot,
+    _load_processing_generation_ids,
+    _load_polled_provider_jobs,
 )
 from pixsim7.backend.main.domain.assets.models import Asset
 from pixsim7.backend.main.domain.assets.analysis import AssetAnalysis, AnalysisStatus
@@ -100,6 +102,17 @@ from pixsim7.backend.main.infrastructure.queue import (
     GENERATION_RETRY_QUEUE_NAME,
     get_generation_wait_metadata,
 )
+from pixsim7.backend.main.infrastructure.queue.poll_schedule import (
+    claim_due_generation_polls,
+    heartbeat_poll_worker,
+    leave_poll_workers,
+    poll_schedule_slot,
+    poll_worker_id,
+    schedule_generation_polls,
+    scheduled_generation_ids,
+    unschedule_generation_polls,
+)
+from pixsim7.backend.main.infrastructure.redis import get_redis
 from pixsim7.backend.main.shared.debug import (
     get_global_debug_logger,
     load_global_debug_from_env,
@@ -438,6 +451,62 @@ def _compute_adaptive_poll_defer_seconds(
     return 0
 
 
+# Deadline scheduling (see ``infrastructure.queue.poll_schedule``).  The
+# cron still ticks every 2 s, but each tick only polls generations whose
+# ``next_poll_at`` has come due.
+_POLL_TICK_SEC = 2
+# Non-image ops still running after this long are deep in a render (or
+# heading for the 2 h timeout): poll them less often.
+_LONG_RUNNING_POLL_AGE_SEC = 600
+_LONG_RUNNING_POLL_INTERVAL_SEC = 10
+# Upper bound on generations claimed per tick; the rest stay due for the next.
+_POLL_CLAIM_LIMIT = 500
+# Claimed generations are pushed out this far until rescheduled, so claims
+# held by a worker that dies mid-cycle are picked up again.
+_POLL_LEASE_SEC = 60
+# How often each poller re-syncs its slots against PROCESSING rows (adds
+# generations the submit hook missed, drops ones finalised elsewhere).
+_POLL_SCHEDULE_RECONCILE_INTERVAL_SEC = 30
+
+_poll_schedule_next_reconcile = 0.0
+_poll_schedule_slots: tuple[int, ...] = ()
+
+# Per-account batch prefetch: list pages one account may read per tick to
+# resolve its due jobs before the per-generation fan-out.
+_BATCH_PREFETCH_MAX_PAGES = 3
+
+
+def _compute_next_poll_delay_seconds(
+    *,
+    provider_id: str | None,
+    operation_type: Any,
+    generation_started_at: Any,
+    now: datetime,
+) -> int:
+    """Seconds until a still-running generation should be polled again.
+
+    Pixverse video ops follow the adaptive tiers; everything else polls every
+    tick, relaxing to ``_LONG_RUNNING_POLL_INTERVAL_SEC`` once a non-image op
+    has been running for ``_LONG_RUNNING_POLL_AGE_SEC``.
+    """
+    adaptive = _compute_adaptive_poll_defer_seconds(
+        provider_id=provider_id,
+        operation_type=operation_type,
+        generation_started_at=generation_started_at,
+        now=now,
+    )
+    if adaptive > 0:
+        return adaptive
+    if generation_started_at is not None and operation_type not in get_image_operations():
+        try:
+            elapsed = (now - generation_started_at).total_seconds()
+        except Exception:
+            elapsed = 0.0
+        if elapsed >= _LONG_RUNNING_POLL_AGE_SEC:
+            return _LONG_RUNNING_POLL_INTERVAL_SEC
+    return _POLL_TICK_SEC
+
+
 
 def _moderation_recheck_eligible(
     *,
@@ -1552,6 +1621,7 @@ async def _poll_single_generation(
                         generation_id=generation_id,
                         outcome='still_processing',
                         missing_provider_job=missing_provider_job,
+                        retry_after_seconds=cooldown_remaining,
                     )
 
                 # Release the read transaction opened by the SELECTs above
@@ -2097,6 +2167,8 @@ class _GenerationPhaseStats:
     still_processing: int = 0
     still_processing_ids: list[int] = field(default_factory=list)
     missing_provider_job_ids: list[int] = field(default_factory=list)
+    batch_list_calls: int = 0
+    batch_resolved: int = 0
 
 
 @dataclass
@@ -2107,17 +2179,284 @@ class _AnalysisPhaseStats:
     still_processing: int = 0
 
 
+def _poll_schedule_enabled() -> bool:
+    from pixsim7.backend.main.services.generation.worker_settings import get_worker_settings
+    return bool(getattr(get_worker_settings(), "poll_schedule_enabled", True))
+
+
+async def _reconcile_poll_schedule(db: AsyncSession, redis: Any, slots: list[int], *, now: float) -> None:
+    """Sync owned slots with PROCESSING rows: add missing (due now), drop finished.
+
+    The schedule is read before the rows so a generation scheduled by the
+    submit hook in between is never mistaken for a finished one.
+    """
+    scheduled = await scheduled_generation_ids(redis, slots)
+    owned = set(slots)
+    processing = {
+        generation_id
+        for generation_id in await _load_processing_generation_ids(db)
+        if poll_schedule_slot(generation_id) in owned
+    }
+    missing = processing - scheduled
+    finished = scheduled - processing
+    if missing:
+        await schedule_generation_polls(redis, {gid: now for gid in missing}, only_new=True)
+    if finished:
+        await unschedule_generation_polls(redis, finished)
+    if missing or finished:
+        logger.info(
+            "poll_schedule_reconciled",
+            slots=len(slots),
+            processing=len(processing),
+            added=len(missing),
+            removed=len(finished),
+        )
+
+
+async def _claim_scheduled_generations(
+    db: AsyncSession,
+) -> tuple[Any, list[_ProcessingGenerationSnapshot]] | None:
+    """Snapshots of the generations due in this poller's slots.
+
+    Returns ``(redis, snapshots)``, or None when scheduling is disabled or
+    Redis is unavailable — the caller then falls back to a full scan.
+    """
+    global _poll_schedule_next_reconcile, _poll_schedule_slots
+    if not _poll_schedule_enabled():
+        return None
+    try:
+        redis = await get_redis()
+        now = time.time()
+        slots = await heartbeat_poll_worker(redis, poll_worker_id(), now=now)
+        now_mono = time.monotonic()
+        if tuple(slots) != _poll_schedule_slots or now_mono >= _poll_schedule_next_reconcile:
+            await _reconcile_poll_schedule(db, redis, slots, now=now)
+            _poll_schedule_slots = tuple(slots)
+            _poll_schedule_next_reconcile = now_mono + _POLL_SCHEDULE_RECONCILE_INTERVAL_SEC
+        due_ids = await claim_due_generation_polls(
+            redis,
+            slots,
+            now=now,
+            limit=_POLL_CLAIM_LIMIT,
+            lease_seconds=_POLL_LEASE_SEC,
+        )
+    except Exception as e:
+        logger.warning("poll_schedule_unavailable_full_scan", error=str(e))
+        await db.rollback()
+        return None
+
+    if not due_ids:
+        return redis, []
+    snapshots = await _load_processing_generation_snapshots(db, generation_ids=due_ids)
+    finished = set(due_ids) - {generation.id for generation in snapshots}
+    if finished:
+        try:
+            await unschedule_generation_polls(redis, finished)
+        except Exception as e:
+            logger.warning("poll_schedule_update_failed", error=str(e))
+    logger.debug(
+        "poll_schedule_claimed",
+        slots=len(slots),
+        due=len(due_ids),
+        processing=len(snapshots),
+    )
+    return redis, snapshots
+
+
+async def _reschedule_polled_generations(
+    redis: Any,
+    generations: list[_ProcessingGenerationSnapshot],
+    poll_results: list[Any],
+) -> None:
+    """Set each polled generation's next deadline (terminal ones are dropped).
+
+    Best-effort: if Redis rejects the update, the claim lease expires and the
+    generation is polled again ``_POLL_LEASE_SEC`` later.
+    """
+    now = time.time()
+    now_dt = datetime.now(timezone.utc)
+    due_at: dict[int, float] = {}
+    finished: list[int] = []
+    for generation, poll_result in zip(generations, poll_results):
+        if isinstance(poll_result, _PollGenerationResult) and poll_result.outcome in ('completed', 'failed'):
+            finished.append(generation.id)
+            continue
+        delay = float(_compute_next_poll_delay_seconds(
+            provider_id=generation.provider_id,
+            operation_type=generation.operation_type,
+            generation_started_at=generation.started_at,
+            now=now_dt,
+        ))
+        retry_after = getattr(poll_result, "retry_after_seconds", None)
+        if retry_after:
+            delay = max(delay, retry_after)
+        due_at[generation.id] = now + delay
+    try:
+        if due_at:
+            await schedule_generation_polls(redis, due_at)
+        if finished:
+            await unschedule_generation_polls(redis, finished)
+    except Exception as e:
+        logger.warning(
+            "poll_schedule_update_failed",
+            error=str(e),
+            rescheduled=len(due_at),
+            finished=len(finished),
+        )
+
+
+async def leave_poll_schedule() -> None:
+    """Give up this poller's slots on worker shutdown (best-effort).
+
+    Without it the other pollers only take the slots over once the
+    heartbeat ages out, leaving them unpolled for up to
+    ``POLL_MEMBER_TTL_SECONDS``.
+    """
+    global _poll_schedule_slots
+    if not _poll_schedule_enabled():
+        return
+    try:
+        redis = await get_redis()
+        await leave_poll_workers(redis, poll_worker_id())
+    except Exception as e:
+        logger.warning("poll_schedule_leave_failed", error=str(e))
+        return
+    _poll_schedule_slots = ()
+
+
+async def _prefetch_account_batch(
+    account_id: int,
+    is_image: bool,
+    provider_job_ids: set[str],
+    poll_cache: dict[str, object],
+    scan_stats: dict[str, int],
+) -> int:
+    """Resolve one account's due jobs with list calls, in its own session."""
+    async with get_async_session() as db:
+        account = await db.get(ProviderAccount, account_id)
+        if account is None:
+            return 0
+        # Don't hold a transaction open across the provider round-trips.
+        await db.commit()
+        resolved = await ProviderService.prefetch_batch_statuses(
+            poll_cache,
+            account=account,
+            is_image=is_image,
+            provider_job_ids=provider_job_ids,
+            max_pages=_BATCH_PREFETCH_MAX_PAGES,
+            scan_stats=scan_stats,
+        )
+        # Persist session refreshes the provider call may have applied.
+        await db.commit()
+        return resolved
+
+
+async def _prefetch_batch_statuses(
+    db: AsyncSession,
+    generations: list[_ProcessingGenerationSnapshot],
+    poll_cache: dict[str, object],
+    *,
+    max_concurrency: int,
+) -> tuple[int, int]:
+    """Warm the per-tick status cache one account at a time.
+
+    Groups the due generations that a provider list can answer by
+    (account, image/video) and resolves each group with as few list calls
+    as it needs, concurrently across accounts. ``_poll_single_generation``
+    then finds its status in ``poll_cache``; anything not resolved falls
+    back to the per-job path as before.
+
+    Jobs under a transient / non-transient backoff or an adaptive defer are
+    left out (``_poll_single_generation`` would skip them without a provider
+    call), so a backed-off account gets no list calls at all.
+
+    Returns ``(list_calls, resolved)``.
+    """
+    batchable = [
+        generation
+        for generation in generations
+        if ProviderService.batch_status_kind(generation.provider_id, generation.operation_type) is not None
+    ]
+    if not batchable:
+        return 0, 0
+
+    jobs = await _load_polled_provider_jobs(db, batchable)
+    await db.rollback()
+
+    groups: dict[tuple[int, bool], set[str]] = {}
+    now_mono = time.monotonic()
+    for generation in batchable:
+        job = jobs.get(generation.id)
+        if job is None:
+            continue
+        submission_id, account_id, provider_job_id = job
+        backoff_key = _transient_poll_key(
+            generation_id=generation.id,
+            submission_id=submission_id,
+            account_id=account_id,
+            provider_job_id=provider_job_id,
+        )
+        if max(
+            _get_transient_poll_backoff_remaining(backoff_key, now_mono=now_mono),
+            _get_non_transient_poll_backoff_remaining(backoff_key, now_mono=now_mono),
+            _get_adaptive_poll_defer_remaining(backoff_key, now_mono=now_mono),
+        ) > 0:
+            continue
+        is_image = ProviderService.batch_status_kind(generation.provider_id, generation.operation_type)
+        groups.setdefault((account_id, is_image), set()).add(provider_job_id)
+    if not groups:
+        return 0, 0
+
+    scan_stats: dict[str, int] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(key, provider_job_ids):
+        async with semaphore:
+            return await _prefetch_account_batch(*key, provider_job_ids, poll_cache, scan_stats)
+
+    results = await asyncio.gather(
+        *[_bounded(key, ids) for key, ids in groups.items()],
+        return_exceptions=True,
+    )
+    resolved = 0
+    for (account_id, is_image), result in zip(groups, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "poll_batch_prefetch_error",
+                account_id=account_id,
+                is_image=is_image,
+                error=str(result),
+            )
+            continue
+        resolved += result
+    return scan_stats.get("list_calls", 0), resolved
+
+
 async def _poll_generations_phase(
     db: AsyncSession,
     *,
     poll_status_cache: dict[str, object],
     worker_debug: Any,
 ) -> _GenerationPhaseStats:
-    """Load PROCESSING generations and fan out to ``_poll_single_generation``."""
+    """Load due PROCESSING generations and fan out to ``_poll_single_generation``.
+
+    With deadline scheduling (the default) only generations whose
+    ``next_poll_at`` has passed in this poller's slots are loaded; without it
+    (disabled, or Redis unavailable) every PROCESSING generation is.
+    """
     stats = _GenerationPhaseStats()
 
-    processing_generations = await _load_processing_generation_snapshots(db)
-    logger.info("poll_loaded", count=len(processing_generations))
+    claimed = await _claim_scheduled_generations(db)
+    if claimed is None:
+        schedule_redis = None
+        processing_generations = await _load_processing_generation_snapshots(db)
+    else:
+        schedule_redis, processing_generations = claimed
+    logger.info(
+        "poll_loaded",
+        count=len(processing_generations),
+        scheduled=schedule_redis is not None,
+    )
 
     # Release the read transaction the SELECT above opened on the shared
     # connection BEFORE the concurrent HTTP fan-out below. The fan-out polls
@@ -2168,6 +2507,25 @@ async def _poll_generations_phase(
         )
     poll_semaphore = asyncio.Semaphore(max_concurrent_polls)
 
+    try:
+        stats.batch_list_calls, stats.batch_resolved = await _prefetch_batch_statuses(
+            db,
+            processing_generations,
+            poll_status_cache,
+            max_concurrency=max_concurrent_polls,
+        )
+    except Exception as e:
+        # Best-effort: the per-generation path still resolves everything.
+        await db.rollback()
+        logger.warning("poll_batch_prefetch_failed", error=str(e))
+    if stats.batch_list_calls:
+        logger.info(
+            "poll_batch_prefetch",
+            list_calls=stats.batch_list_calls,
+            resolved=stats.batch_resolved,
+            provider_calls_saved=max(0, stats.batch_resolved - stats.batch_list_calls),
+        )
+
     async def _bounded_poll(gen):
         if gen.id in _poll_in_flight:
             return None  # Already being polled by an overlapping cycle
@@ -2188,6 +2546,8 @@ async def _poll_generations_phase(
         *[_bounded_poll(gen) for gen in processing_generations],
         return_exceptions=True,
     )
+    if schedule_redis is not None:
+        await _reschedule_polled_generations(schedule_redis, processing_generations, poll_results)
 
     for poll_result in poll_results:
         if poll_result is None:
@@ -2533,7 +2893,7 @@ async def poll_job_statuses(ctx: dict) -> dict:
     Poll status of all processing generations.
 
     Runs periodically (e.g. every 10 seconds). Three phases per cycle:
-      1. Poll PROCESSING generations.
+      1. Poll PROCESSING generations that are due (deadline schedule).
       2. Run due moderation re-checks (post-delivery flagging).
       3. Poll PROCESSING analyses.
     """
@@ -2574,6 +2934,9 @@ async def poll_job_statuses(ctx: dict) -> dict:
                 "completed": gen_stats.completed,
                 "failed": gen_stats.failed,
                 "still_processing": gen_stats.still_processing,
+                "batch_list_calls": gen_stats.batch_list_calls,
+                "batch_resolved": gen_stats.batch_resolved,
+                "provider_calls_saved": max(0, gen_stats.batch_resolved - gen_stats.batch_list_calls),
                 "analyses_checked": analysis_stats.checked,
                 "analyses_completed": analysis_stats.completed,
                 "analyses_failed": analysis_stats.failed,
@@ -2671,6 +3034,12 @@ async def poll_generation_once(ctx: dict, generation_id: int) -> dict:
     finally:
         _poll_in_flight.discard(snapshot.id)
 
+    if _poll_schedule_enabled():
+        try:
+            await _reschedule_polled_generations(await get_redis(), [snapshot], [result])
+        except Exception as e:
+            logger.warning("poll_schedule_update_failed", generation_id=generation_id, error=str(e))
+
     outcome = getattr(result, "outcome", None)
     logger.info(
         "poll_generation_once_done",
@@ -2692,7 +3061,8 @@ async def on_startup(ctx: dict) -> None:
     """ARQ worker startup"""
     global _event_bridge
     logger.info("status_poller_started")
-    _event_bridge = await start_event_bus_bridge(role="status_poller")
+    # Publish-only: nothing in the poller reacts to remote events.
+    _event_bridge = await start_event_bus_bridge(role="status_poller", families=())
 
 
 async def on_shutdown(ctx: dict) -> None:
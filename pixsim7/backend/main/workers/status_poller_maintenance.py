@@ -35,6 +35,19 @@ from pixsim7.backend.main.workers.status_poller import (
 logger = get_logger()
 
 
+async def _reset_account_slot_counters(db) -> None:
+    """Drop the Redis slot-allocator counters after a DB reconcile so the next
+    reservation re-seeds them from the corrected ``current_processing_jobs``."""
+    from pixsim7.backend.main.infrastructure.redis import get_redis
+    from pixsim7.backend.main.services.account.slot_allocator import reset_account_slots
+
+    try:
+        result = await db.execute(select(distinct(ProviderAccount.provider_id)))
+        await reset_account_slots(await get_redis(), result.scalars().all())
+    except Exception as e:
+        logger.warning("reconcile_account_slots_reset_failed", error=str(e))
+
+
 async def recover_stale_processing_generations(ctx: dict) -> dict:
     """
     On startup, log PROCESSING generations but leave them for the poller.
@@ -93,6 +106,8 @@ async def reconcile_account_counters(ctx: dict) -> dict:
 
     For each account with current_processing_jobs > 0, we count actual
     PROCESSING generations + analyses and reset the counter to match reality.
+    The Redis slot-allocator counters are then dropped so they re-seed from
+    the corrected values.
     """
     reconciled = 0
     errors = 0
@@ -108,6 +123,7 @@ async def reconcile_account_counters(ctx: dict) -> dict:
 
             if not accounts_with_jobs:
                 logger.debug("reconcile_idle", msg="No accounts with elevated counters")
+                await _reset_account_slot_counters(db)
                 return {"reconciled": 0, "errors": 0}
 
             logger.info("reconcile_found_accounts", count=len(accounts_with_jobs))
@@ -158,6 +174,7 @@ async def reconcile_account_counters(ctx: dict) -> dict:
                     errors += 1
 
             await db.commit()
+            await _reset_account_slot_counters(db)
 
             logger.info(
                 "reconcile_complete",
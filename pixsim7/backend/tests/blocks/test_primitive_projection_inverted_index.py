@@ -0,0 +1,92 @@
+"""Inverted-index projection must match a full scan of the primitive index."""
+
+import asyncio
+
+from pixsim7.backend.main.services.prompt.parser import primitive_projection as projection_module
+from pixsim7.backend.main.services.prompt.parser.dsl_adapter import (
+    parse_prompt_to_candidates,
+)
+from pixsim7.backend.main.services.prompt.parser.primitive_projection import (
+    _get_primitive_index,
+    enrich_candidates_with_primitive_projection,
+    project_candidate_to_primitives,
+)
+
+_PROMPTS = [
+    "The camera slowly dollies in toward her face as warm backlight rims her hair.",
+    "Wide establishing shot of a rainy cityscape at night, neon reflections on the street.",
+    "She turns around and holds eye contact, hands resting on the table to the left of the lamp.",
+    "Over the shoulder shot, shallow focus, golden hour light, then the scene continues.",
+    "A dog runs across the field while the camera pans right.",
+]
+
+
+def _full_scan(*, evidence, index, lookup):
+    """Pre-index behaviour: score every entry, no pruning."""
+    scored_positions = []
+    for position, entry in enumerate(index):
+        scored = projection_module._score_entry(evidence=evidence, entry=entry)
+        if scored is not None:
+            scored_positions.append((position, scored))
+    return scored_positions
+
+
+def _candidates():
+    candidates = []
+    for prompt in _PROMPTS:
+        parsed = asyncio.run(
+            parse_prompt_to_candidates(
+                prompt,
+                parser_config={"primitive_projection_mode": "off"},
+            )
+        )
+        candidates.extend(parsed.get("candidates", []))
+    return candidates
+
+
+def test_indexed_projection_matches_full_scan(monkeypatch):
+    candidates = _candidates()
+    assert candidates
+    indexed = [project_candidate_to_primitives(candidate) for candidate in candidates]
+
+    monkeypatch.setattr(projection_module, "_score_index_candidates", _full_scan)
+    scanned = [project_candidate_to_primitives(candidate) for candidate in candidates]
+
+    assert indexed == scanned
+    assert any(envelope["status"] == "matched" for envelope in indexed)
+
+
+def test_projection_scores_only_entries_sharing_a_token(monkeypatch):
+    index = _get_primitive_index()
+    scored_block_ids = []
+    real_score_entry = projection_module._score_entry
+
+    def counting_score_entry(**kwargs):
+        scored_block_ids.append(kwargs["entry"]["block_id"])
+        return real_score_entry(**kwargs)
+
+    monkeypatch.setattr(projection_module, "_score_entry", counting_score_entry)
+    envelope = project_candidate_to_primitives(
+        {"text": "slow dolly in", "role": "camera", "matched_keywords": ["dolly"], "metadata": {}}
+    )
+
+    assert envelope["status"] == "matched"
+    assert 0 < len(scored_block_ids) < len(index) // 4
+
+
+def test_enrich_builds_lookup_once_per_index(monkeypatch):
+    index = tuple(_get_primitive_index())[:200]
+    builds = []
+    real_build = projection_module._build_index_lookup
+
+    def counting_build(idx):
+        builds.append(idx)
+        return real_build(idx)
+
+    monkeypatch.setattr(projection_module, "_build_index_lookup", counting_build)
+    monkeypatch.setattr(projection_module, "_explicit_index_lookup", None)
+    candidates = _candidates()
+    enrich_candidates_with_primitive_projection(candidates, primitive_index=index)
+
+    assert len(builds) == 1
+    assert all("primitive_projection" in candidate for candidate in candidates)
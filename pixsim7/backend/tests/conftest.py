@@ -1,3 +1,5 @@
+import pytest_asyncio
+
 TEST_SUITE = {
     "id": "backend-tests",
     "label": "Backend Tests",
@@ -7,3 +9,16 @@ TEST_SUITE = {
     "covers": ["pixsim7/backend/tests"],
     "order": 20,
 }
+
+
+@pytest_asyncio.fixture
+async def lua_redis():
+    """In-memory Redis that runs Lua scripts (``fakeredis[lua]``, a declared test
+    dependency: a missing install fails the Lua tests instead of skipping them)."""
+    import fakeredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    try:
+        yield redis
+    finally:
+        await redis.aclose()
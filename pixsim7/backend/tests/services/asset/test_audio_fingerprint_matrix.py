@@ -0,0 +1,95 @@
+"""Bulk fingerprint matcher vs the per-clip matcher (numpy only, no DB).
+
+``match_fingerprint_matrix`` backs the library rematch; it must agree with
+``match_fingerprint_labeled`` — the matcher ingest and the rescore run use —
+and its prefilter must only ever skip pairs that can't reach ``min_score``.
+"""
+from __future__ import annotations
+
+import pytest
+
+from pixsim7.backend.main.services.asset import audio_fingerprint as _af
+from pixsim7.backend.main.services.asset.signal_rematch import _rematch_patch
+from pixsim7.backend.main.services.asset.signal_scoring_params import ScoringParams
+
+np = pytest.importorskip("numpy")
+
+
+def _fp(rng, bins=48):
+    """A random stored-layout fingerprint: flat row-major (bins, 12)."""
+    c = rng.random((bins, 12)) ** 3
+    return [round(float(v), 4) for v in (c / c.sum(axis=1, keepdims=True)).flatten()]
+
+
+def _library(seed=3, n=60):
+    rng = np.random.default_rng(seed)
+    raw = {"squeal": [_fp(rng) for _ in range(3)], "hum": [_fp(rng, bins=40)]}
+    # Pre-rotated, as load_reference_fingerprints hands them to the matchers.
+    refs = {
+        label: _af.expand_reference_rotations([_af._to_chroma(fp) for fp in fps])
+        for label, fps in raw.items()
+    }
+    fps = [_fp(rng) for _ in range(n)]
+    # Near-copy of a reference (pitch-shifted one semitone) that must match.
+    base = np.asarray(raw["squeal"][0]).reshape(48, 12)
+    fps[5] = [float(v) for v in np.roll(base, 1, axis=1).flatten()]
+    fps[7] = None
+    fps[9] = [0.1] * 7  # malformed → unmatched
+    return fps, refs
+
+
+def test_matrix_matches_per_clip_matcher():
+    fps, refs = _library()
+    got, stats = _af.match_fingerprint_matrix(fps, refs)
+    assert stats["clips"] == len(fps) - 2
+    assert got[7] == {} and got[9] == {}
+    assert got[5]["squeal"] > 0.99
+    for fp, scores in zip(fps, got):
+        if not scores:
+            continue
+        _, _, want = _af.match_fingerprint_labeled(fp, refs)
+        assert scores.keys() == want.keys()
+        for label, s in want.items():
+            assert scores[label] == pytest.approx(s, abs=1e-3)
+
+
+def test_prefilter_only_drops_pairs_below_min_score():
+    fps, refs = _library(seed=11)
+    exact, _ = _af.match_fingerprint_matrix(fps, refs)
+    floor = 0.5
+    got, stats = _af.match_fingerprint_matrix(fps, refs, min_score=floor)
+    assert stats["prefiltered"] <= stats["pairs"]
+    for e, g in zip(exact, got):
+        assert g == {k: v for k, v in e.items() if v >= floor}
+
+
+def test_rematch_patch_skips_unchanged_rows():
+    params = ScoringParams()
+    metrics = {"audio_rms_db": -20.0, "render_ratio": 1.0}
+    scores = {"squeal": 0.97, "hum": 0.2}
+    patch = _rematch_patch(metrics, scores, params, "v5")
+    assert patch["audio_ref_match"] == 0.97
+    assert patch["audio_ref_label"] == "squeal"
+    assert patch["suspicious"]
+    # Stamped with the same result → nothing to write.
+    assert _rematch_patch({**metrics, **patch, "scanner_version": "v5"}, scores, params, "v5") is None
+    # Below WEAK the nearest category isn't surfaced as a label.
+    assert _rematch_patch(metrics, {"hum": 0.1}, params, "v5")["audio_ref_label"] is None
+
+
+def test_rematch_floor_keeps_scores_and_skips_sub_floor_rows():
+    from pixsim7.backend.main.services.asset.signal_rematch import _match_floor
+
+    params = ScoringParams()
+    # squeal is strong-only, hum keeps the default weak band.
+    assert _match_floor(["squeal"], params) == params.audio_ref_match_strong
+    floor = _match_floor(["squeal", "hum"], params)
+    assert floor == params.audio_ref_match_weak
+
+    metrics = {"audio_rms_db": -20.0, "render_ratio": 1.0}
+    exact = _rematch_patch(metrics, {"squeal": 0.3, "hum": 0.2}, params, "v5")
+    floored = _rematch_patch(metrics, {}, params, "v5", floor)
+    assert floored["score"] == exact["score"]
+    # A row written by an exact rescore carries sub-floor noise; the
+    # prefiltered rematch treats it as unchanged.
+    assert _rematch_patch({**metrics, **exact, "scanner_version": "v5"}, {}, params, "v5", floor) is None
@@ -0,0 +1,230 @@
+"""Unit tests for the signal-scan probe helpers (no ffmpeg required).
+
+Covers the pieces the unified single-decode probe (``probe_unified``) composes:
+the input-banner parser that replaces the separate ffprobe spawn, the dhash
+stats shared with the legacy per-probe path, the batched STFT in
+``_spectral_features`` (locked against the old per-hop loop), and the
+combined ffmpeg command itself with ``subprocess.run`` stubbed.
+"""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from pixsim7.backend.main.services.asset import signal_analysis as _sa
+from pixsim7.backend.main.services.asset.signal_analysis import (
+    _parse_input_info,
+    _phash_stats,
+)
+
+_BANNER = """\
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'clip.mp4':
+  Metadata:
+    major_brand     : isom
+  Duration: 00:00:05.04, start: 0.000000, bitrate: 2185 kb/s
+  Stream #0:0[0x1](und): Video: h264 (High) (avc1 / 0x31637661), yuv420p(progressive), 1280x720, 2050 kb/s, 24 fps (default)
+  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, stereo, fltp, 128 kb/s (default)
+Stream mapping:
+  Stream #0:0 -> #0:0 (h264 (native) -> rawvideo (native))
+  Stream #0:1 -> #1:0 (aac (native) -> pcm_f32le (native))
+Output #0, rawvideo, to 'pipe:1':
+  Stream #0:0(und): Video: rawvideo (Y800 / 0x30303859), gray, 9x8, q=2-31, 4 fps
+Output #1, f32le, to 'scratch.f32':
+  Stream #1:0(und): Audio: pcm_f32le, 16000 Hz, mono, flt, 512 kb/s (default)
+"""
+
+
+def test_parse_input_info_reads_input_section_only():
+    info = _parse_input_info(_BANNER)
+    # 44100/stereo from the INPUT stream, not the 16000/mono output stream.
+    assert info == {"audio_sample_rate": 44100, "audio_channels": 2, "duration_sec": 5.04}
+
+
+def test_parse_input_info_numeric_channel_count_and_missing_audio():
+    txt = (
+        "  Duration: 01:02:03.50, start: 0.0\n"
+        "  Stream #0:1: Audio: pcm_s16le, 48000 Hz, 3 channels, s16\n"
+    )
+    assert _parse_input_info(txt) == {
+        "audio_sample_rate": 48000, "audio_channels": 3, "duration_sec": 3723.5,
+    }
+    assert _parse_input_info("  Duration: N/A\n") == {
+        "audio_sample_rate": None, "audio_channels": None, "duration_sec": None,
+    }
+
+
+def test_phash_stats_static_vs_changing_frames():
+    flat = bytes(range(72))
+    flipped = bytes(reversed(range(72)))
+    static = _phash_stats(flat * 4)
+    assert static["phash_frames"] == 4
+    assert static["phash_first_to_last"] == 0
+    moving = _phash_stats(flat + flipped)
+    assert moving["phash_first_to_last"] == 64
+    # Fewer than two frames can't be compared.
+    assert _phash_stats(flat)["phash_first_to_last"] is None
+
+
+def _stub_ffmpeg(monkeypatch, *, returncode):
+    """Stub ``subprocess.run`` with a combined-decode ffmpeg that writes 4 frames + 1s PCM."""
+    np = pytest.importorskip("numpy")
+    calls = []
+
+    def _run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[-1].endswith(".f32"):  # video-only runs end at pipe:1
+            pcm = np.zeros(_sa.SPECTRAL_SR, dtype=np.float32)
+            Path(cmd[-1]).write_bytes(pcm.tobytes())
+        return subprocess.CompletedProcess(
+            cmd, returncode, stdout=bytes(range(72)) * 4, stderr=_BANNER.encode()
+        )
+
+    monkeypatch.setattr(_sa.subprocess, "run", _run)
+    return calls
+
+
+def test_probe_unified_runs_one_two_output_decode(monkeypatch):
+    calls = _stub_ffmpeg(monkeypatch, returncode=0)
+
+    out = _sa.probe_unified("clip.mp4", fps=4, threads=2)
+
+    [cmd] = calls
+    assert cmd[cmd.index("-i") + 1] == "clip.mp4"
+    assert cmd[cmd.index("-threads") + 1] == "2"
+    video = cmd.index("0:v:0")
+    assert cmd[video + 1:video + 6] == ["-vf", _sa._phash_vf(4), "-f", "rawvideo", "pipe:1"]
+    audio = cmd.index("0:a:0")
+    assert cmd[audio + 1:audio + 7] == ["-ac", "1", "-ar", str(_sa.SPECTRAL_SR), "-f", "f32le"]
+    assert not Path(cmd[-1]).exists()  # the PCM scratch file is removed
+    assert (out["audio_sample_rate"], out["audio_channels"], out["duration_sec"]) == (44100, 2, 5.04)
+    assert out["phash_frames"] == 4
+    assert "spectral_frames" in out
+
+
+def test_probe_path_falls_back_when_the_combined_decode_fails(monkeypatch, tmp_path):
+    # ffmpeg can write some frames before failing; that must not count as a result.
+    calls = _stub_ffmpeg(monkeypatch, returncode=1)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"")
+    monkeypatch.setattr(_sa, "_ffmpeg_available", lambda: True)
+    monkeypatch.setattr(_sa, "probe_phash", lambda source, **kw: {"phash_frames": 0})
+    monkeypatch.setattr(_sa, "probe_spectral", lambda source, **kw: {"spectral_frames": 0})
+
+    assert _sa.probe_unified(str(clip)) is None
+    out = _sa.probe_path(str(clip), stream_info={"duration_sec": 1.0})
+    assert out == {"duration_sec": 1.0, "phash_frames": 0, "spectral_frames": 0}
+    assert len(calls) == 2
+
+
+_SILENT_BANNER = """\
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'silent.mp4':
+  Duration: 00:00:02.00, start: 0.000000, bitrate: 15 kb/s
+  Stream #0:0[0x1](und): Video: h264 (High), yuv420p(progressive), 64x48, 10 kb/s, 10 fps (default)
+Stream map '0:a:0' matches no streams.
+To ignore this, add a trailing '?' to the map.
+"""
+
+
+def _stub_silent_ffmpeg(monkeypatch):
+    """Stub ``subprocess.run`` with ffmpeg on a clip that has no audio stream."""
+    calls = []
+
+    def _run(cmd, **kwargs):
+        calls.append(cmd)
+        returncode = 1 if "0:a:0" in cmd else 0
+        return subprocess.CompletedProcess(
+            cmd, returncode, stdout=b"" if returncode else bytes(range(72)) * 4,
+            stderr=_SILENT_BANNER.encode(),
+        )
+
+    monkeypatch.setattr(_sa.subprocess, "run", _run)
+    return calls
+
+
+def test_probe_unified_retries_video_only_for_a_silent_clip(monkeypatch):
+    pytest.importorskip("numpy")
+    calls = _stub_silent_ffmpeg(monkeypatch)
+
+    out = _sa.probe_unified("silent.mp4")
+
+    # The failed combined run, then one video-only decode — no per-probe fallback.
+    assert len(calls) == 2
+    assert "0:a:0" not in calls[1]
+    assert (out["audio_sample_rate"], out["duration_sec"], out["phash_frames"]) == (None, 2.0, 4)
+    assert out["spectral_frames"] == 0 and out["chroma_fp"] is None
+
+
+def test_probe_path_skips_audio_when_stream_info_has_none(monkeypatch, tmp_path):
+    pytest.importorskip("numpy")
+    calls = _stub_silent_ffmpeg(monkeypatch)
+    clip = tmp_path / "silent.mp4"
+    clip.write_bytes(b"")
+    monkeypatch.setattr(_sa, "_ffmpeg_available", lambda: True)
+
+    stream_info = {"audio_sample_rate": None, "audio_channels": None, "duration_sec": 2.0}
+    out = _sa.probe_path(str(clip), stream_info=stream_info)
+
+    [cmd] = calls
+    assert "0:a:0" not in cmd
+    assert out["phash_frames"] == 4
+
+
+# ---- vectorized spectral features vs the per-frame reference loop ----
+def _reference_spectral(x):
+    """The pre-vectorization per-hop loop (flatness / chroma_fp only), kept as
+    the regression oracle for ``_spectral_features``."""
+    import numpy as np
+
+    win, hop, sr = _sa.SPECTRAL_WIN, _sa.SPECTRAL_HOP, _sa.SPECTRAL_SR
+    window = np.hanning(win)
+    freqs = np.fft.rfftfreq(win, 1.0 / sr)
+    with np.errstate(divide="ignore"):
+        midi = 69 + 12 * np.log2(np.where(freqs > 0, freqs, 1) / 440.0)
+    pc = np.mod(np.round(midi).astype(int), 12)
+    chroma_band = (freqs >= 60) & (freqs <= 5000)
+    pc_band = pc[chroma_band]
+    flats, rows, flux, prev = [], [], [], None
+    for i in range(0, len(x) - win, hop):
+        mag = np.abs(np.fft.rfft(x[i:i + win] * window)) + 1e-9
+        if mag.sum() < 1e-3:
+            prev = None
+            continue
+        flats.append(float(np.exp(np.log(mag).mean()) / mag.mean()))
+        c = np.bincount(pc_band, weights=mag[chroma_band], minlength=12)
+        rows.append(c / (c.sum() + 1e-9))
+        if prev is not None:
+            flux.append(float(np.maximum(mag - prev, 0.0).sum()))
+        prev = mag
+    C = np.asarray(rows)
+    edges = np.linspace(0, len(C), _sa.CHROMA_POOL_BINS + 1).astype(int)
+    fp = np.stack([
+        C[edges[k]:max(edges[k] + 1, edges[k + 1])].mean(axis=0)
+        for k in range(_sa.CHROMA_POOL_BINS)
+    ])
+    return {
+        "spectral_flatness": round(float(np.median(flats)), 4),
+        "tonal_frac": round(sum(f < _sa.FRAME_TONAL_FLATNESS for f in flats) / len(flats), 4),
+        "spectral_frames": len(flats),
+        "chroma_fp": [round(float(v), 4) for v in fp.flatten()],
+    }
+
+
+def test_vectorized_spectral_matches_per_frame_loop():
+    np = pytest.importorskip("numpy")
+    sr = _sa.SPECTRAL_SR
+    rng = np.random.default_rng(7)
+    t = np.arange(int(sr * 4.3)) / sr
+    # A pitched melody over noise, with a digital-silence gap mid-clip so the
+    # silent-frame skip and the flux-chain break are both exercised.
+    x = 0.3 * np.sin(2 * np.pi * (440 + 220 * (t > 2.0)) * t) + 0.05 * rng.standard_normal(t.size)
+    x[int(sr * 1.5):int(sr * 1.9)] = 0.0
+    x = x.astype(np.float32)
+
+    got = _sa._spectral_features(x.tobytes())
+    ref = _reference_spectral(x)
+    assert got["spectral_frames"] == ref["spectral_frames"]
+    assert got["spectral_flatness"] == ref["spectral_flatness"]
+    assert got["tonal_frac"] == ref["tonal_frac"]
+    assert got["chroma_fp"] == ref["chroma_fp"]
@@ -0,0 +1,208 @@
+"""ADB server-protocol transport, exercised against a local fake adb server.
+
+The fake speaks just enough of the adb host protocol (length-prefixed
+requests, OKAY/FAIL replies, host:transport switching, shell v2 framing)
+to pin what ADB sends and how it reads replies - no adb binary involved.
+"""
+from __future__ import annotations
+
+import asyncio
+import struct
+
+import pytest
+
+from pixsim7.automation.services import adb as adb_module
+from pixsim7.automation.services.adb import ADB
+from pixsim7.automation.services.adb_protocol import AdbServerClient
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def _packet(packet_id: int, data: bytes) -> bytes:
+    return struct.pack("<BI", packet_id, len(data)) + data
+
+
+class FakeAdbServer:
+    def __init__(self, shell_v2: bool = True):
+        self.shell_v2 = shell_v2
+        self.requests: list[str] = []
+        self.connections = 0
+        self.files: dict[str, bytes] = {}
+        self._server = None
+        self.port = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        AdbServerClient._shell_v2.clear()
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        serial = None
+        try:
+            while True:
+                length = int(await reader.readexactly(4), 16)
+                request = (await reader.readexactly(length)).decode()
+                self.requests.append(request)
+
+                if request.startswith("host:transport:"):
+                    serial = request.split(":", 2)[2]
+                    if serial != "emu-1":
+                        self._fail(writer, f"device '{serial}' not found")
+                        break
+                    writer.write(b"OKAY")
+                    continue
+                if request == "host:devices":
+                    self._okay_string(writer, "emu-1\tdevice\nemu-2\toffline\n")
+                elif request.startswith("host:connect:"):
+                    self._okay_string(writer, f"connected to {request.split(':', 2)[2]}")
+                elif request.startswith("host-serial:"):
+                    features = "shell_v2,cmd,stat_v2" if self.shell_v2 else "cmd"
+                    self._okay_string(writer, features)
+                elif request.startswith("shell,v2,raw:"):
+                    out, err, code = self._run(request.split(":", 1)[1])
+                    writer.write(b"OKAY")
+                    writer.write(_packet(1, out))
+                    if err:
+                        writer.write(_packet(2, err))
+                    writer.write(_packet(3, bytes([code])))
+                elif request.startswith("shell:") or request.startswith("exec:"):
+                    out, err, _ = self._run(request.split(":", 1)[1])
+                    writer.write(b"OKAY" + out + err)
+                else:
+                    self._fail(writer, f"unknown service {request}")
+                break
+            await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    def _run(self, command: str):
+        if command == "wm size":
+            return b"Physical size: 720x1280\n", b"", 0
+        if command == "false":
+            return b"", b"nope\n", 1
+        if command.startswith("uiautomator dump /sdcard/uidump.xml"):
+            self.files["/sdcard/uidump.xml"] = b"<hierarchy><node text='Go' bounds='[0,0][10,10]'/></hierarchy>"
+            return self.files["/sdcard/uidump.xml"], b"", 0
+        if command == "screencap -p":
+            return b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64, b"", 0
+        return b"", f"/system/bin/sh: {command}: not found\n".encode(), 127
+
+    @staticmethod
+    def _okay_string(writer, text: str) -> None:
+        data = text.encode()
+        writer.write(b"OKAY" + b"%04x" % len(data) + data)
+
+    @staticmethod
+    def _fail(writer, message: str) -> None:
+        data = message.encode()
+        writer.write(b"FAIL" + b"%04x" % len(data) + data)
+
+
+@pytest.fixture
+def no_subprocess(monkeypatch):
+    def _spawn(*args, **kwargs):
+        raise AssertionError(f"adb process spawned: {args}")
+
+    monkeypatch.setattr(adb_module.subprocess, "run", _spawn)
+
+
+def _adb(server: FakeAdbServer) -> ADB:
+    adb = ADB(transport="server")
+    adb._server = AdbServerClient("127.0.0.1", server.port)
+    return adb
+
+
+async def test_commands_go_over_the_socket(no_subprocess):
+    async with FakeAdbServer() as server:
+        adb = _adb(server)
+        assert await adb.devices() == [("emu-1", "device"), ("emu-2", "offline")]
+        assert await adb.connect("127.0.0.1:7555") is True
+        assert await adb.get_screen_size("emu-1") == (720, 1280)
+        assert await adb.shell("emu-1", "false") == (1, "", "nope\n")
+        await adb.input_tap("emu-1", 5, 6)
+
+    assert "shell,v2,raw:wm size" in server.requests
+    assert "shell,v2,raw:input tap 5 6" in server.requests
+    # Feature probe happens once per device, not per command.
+    assert sum(r.startswith("host-serial:emu-1:features") for r in server.requests) == 1
+
+
+async def test_ui_dump_and_screenshot_stream_in_one_call(no_subprocess, tmp_path):
+    async with FakeAdbServer() as server:
+        adb = _adb(server)
+        xml_text = await adb.dump_ui_xml("emu-1")
+        png = await adb.screenshot("emu-1", tmp_path / "shot.png")
+
+    assert xml_text.startswith("<hierarchy>")
+    assert png.read_bytes().startswith(b"\x89PNG") and len(png.read_bytes()) == 8 + 256 * 64
+    device_services = [r for r in server.requests if r.startswith("exec:")]
+    assert device_services == [
+        "exec:uiautomator dump /sdcard/uidump.xml >/dev/null && cat /sdcard/uidump.xml",
+        "exec:screencap -p",
+    ]
+
+
+async def test_legacy_shell_and_device_errors(no_subprocess):
+    async with FakeAdbServer(shell_v2=False) as server:
+        adb = _adb(server)
+        code, out, _ = await adb.shell("emu-1", "wm", "size")
+        assert (code, out) == (0, "Physical size: 720x1280\n")
+
+        code, out, err = await adb.shell("ghost", "wm", "size")
+        assert code == 1 and "not found" in err
+        assert await adb.exec_out("ghost", "screencap", "-p") == b""
+
+    assert "shell:wm size" in server.requests
+    assert not any(r.startswith("shell,v2") for r in server.requests)
+
+
+async def test_falls_back_to_adb_binary_when_server_is_down(monkeypatch):
+    calls = []
+
+    def fake_run(args, capture_output=True, text=False):
+        calls.append(args)
+        return type("R", (), {"returncode": 0, "stdout": "Physical size: 1x2\n", "stderr": ""})()
+
+    monkeypatch.setattr(adb_module.subprocess, "run", fake_run)
+    adb = ADB(adb_path="adb", transport="server")
+    async with FakeAdbServer() as server:
+        port = server.port
+    adb._server = AdbServerClient("127.0.0.1", port)  # nothing listening any more
+
+    assert await adb.get_screen_size("emu-1") == (1, 2)
+    assert calls == [["adb", "-s", "emu-1", "shell", "wm", "size"]]
+
+
+async def test_concurrent_devices_share_the_server(no_subprocess):
+    async with FakeAdbServer() as server:
+        adb = _adb(server)
+        sizes = await asyncio.gather(*(adb.get_screen_size("emu-1") for _ in range(50)))
+    assert set(sizes) == {(720, 1280)}
+    assert server.connections >= 50
+
+
+async def test_stalled_server_times_out_without_replaying_through_binary(no_subprocess):
+    async def _silent(reader, writer):
+        await reader.read()  # accept the request, never answer
+
+    server = await asyncio.start_server(_silent, "127.0.0.1", 0)
+    try:
+        adb = ADB(transport="server")
+        adb._server = AdbServerClient(
+            "127.0.0.1", server.sockets[0].getsockname()[1], read_timeout=0.2
+        )
+        code, out, err = await adb.shell("emu-1", "input", "tap", "5", "6")
+        assert (code, out) == (1, "") and "no reply" in err
+        assert await adb.devices() == []
+    finally:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,137 @@
+"""UI snapshot cache + element index used by ActionExecutor's element steps."""
+from __future__ import annotations
+
+import pytest
+
+from pixsim7.automation.services.ui_snapshot import UiIndex, UiSnapshotCache
+
+_HOME = """<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>
+<hierarchy rotation="0">
+  <node index="0" text="" resource-id="" class="android.widget.FrameLayout" content-desc="" bounds="[0,0][720,1280]">
+    <node index="0" text="Create" resource-id="com.app:id/create" class="android.widget.Button" content-desc="" bounds="[100,200][300,260]" />
+    <node index="1" text="Create video" resource-id="com.app:id/title" class="android.widget.TextView" content-desc="" bounds="[0,0][720,80]" />
+    <node index="2" text="" resource-id="com.app:id/close" class="android.widget.ImageView" content-desc="Close ad" bounds="[650,20][700,70]" />
+  </node>
+</hierarchy>"""
+
+_LOADED = _HOME.replace("</node>\n</hierarchy>", (
+    '  <node index="3" text="Done" resource-id="com.app:id/done" class="android.widget.Button" '
+    'content-desc="" bounds="[0,1200][720,1280]" />\n  </node>\n</hierarchy>'
+))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Device:
+    """Serves a scripted sequence of dumps, repeating the last one."""
+
+    def __init__(self, *dumps):
+        self.dumps = list(dumps)
+        self.calls = 0
+
+    async def fetch(self, serial):
+        self.calls += 1
+        return self.dumps.pop(0) if len(self.dumps) > 1 else self.dumps[0]
+
+
+def test_index_resolves_selectors():
+    index = UiIndex.parse(_HOME)
+    assert index.find(resource_id="com.app:id/create").center == (200, 230)
+    assert index.find(text="Create").resource_id == "com.app:id/create"
+    assert index.find(text="video", text_match_mode="contains").resource_id == "com.app:id/title"
+    assert index.find(text="Create v.*", text_match_mode="regex").resource_id == "com.app:id/title"
+    # Regex mode matches the whole text, not a substring.
+    assert index.find(text="Create v", text_match_mode="regex") is None
+    assert index.find(content_desc="Close ad").resource_id == "com.app:id/close"
+    # Criteria combine (like UIAutomator selectors), they do not alternate.
+    assert index.find(resource_id="com.app:id/title", text="Create") is None
+    assert index.find() is None
+    assert UiIndex.parse("<hierarchy") is None
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reused_until_invalidated_or_stale():
+    clock = _Clock()
+    device = _Device(_HOME)
+    cache = UiSnapshotCache(device.fetch, max_age=1.0, clock=clock)
+
+    for _ in range(5):
+        assert await cache.find("emu-1", text="Create")
+    assert device.calls == 1
+
+    cache.invalidate("emu-1")
+    assert await cache.find("emu-1", content_desc="Close ad")
+    clock.now = 5.0
+    assert await cache.find("emu-1", text="Create")
+    # Three dumps of the same screen, parsed once.
+    assert (device.calls, cache.dumps, cache.parses) == (3, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_reparses_only_when_dump_changes(monkeypatch):
+    clock = _Clock()
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr("pixsim7.automation.services.ui_snapshot.asyncio.sleep", fake_sleep)
+    device = _Device(_HOME, _HOME, _HOME, _LOADED)
+    cache = UiSnapshotCache(device.fetch, clock=clock)
+
+    element = await cache.wait_for("emu-1", text="Done", timeout=10.0, interval=0.5)
+    assert element.resource_id == "com.app:id/done"
+    assert device.calls == 4
+    assert cache.parses == 2
+
+    cache.invalidate()
+    assert await cache.wait_for("emu-1", text="Missing", timeout=2.0, interval=0.5) is None
+    assert clock.now == pytest.approx(3.5)
+    assert cache.parses == 2
+
+
+@pytest.mark.asyncio
+async def test_unparseable_dump_yields_no_snapshot():
+    cache = UiSnapshotCache(_Device("").fetch)
+    assert await cache.snapshot("emu-1") is None
+    assert await cache.find("emu-1", text="Create") is None
+
+
+@pytest.mark.asyncio
+async def test_executor_steps_share_a_snapshot_until_the_screen_changes(monkeypatch):
+    pytest.importorskip("uiautomator2")
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from pixsim7.automation.services import action_executor
+    from pixsim7.automation.services.action_executor import ActionExecutor, ExecutionContext
+
+    dumps = []
+
+    async def dump_hierarchy(serial):
+        dumps.append(serial)
+        return _HOME
+
+    monkeypatch.setattr(action_executor.UIA2, "dump_hierarchy", dump_hierarchy)
+    adb = SimpleNamespace(input_tap=AsyncMock(), keyevent=AsyncMock())
+    executor = ActionExecutor(adb=adb)
+    preset = SimpleNamespace(variables=None, actions=[
+        {"type": "if_element_exists", "params": {"text": "Create"}},
+        {"type": "if_element_not_exists", "params": {"content_desc": "Close ad"}},
+        {"type": "click_element", "params": {"resource_id": "com.app:id/create"}},
+        {"type": "if_element_exists", "params": {"text": "Create"}},
+        {"type": "press_back"},
+        {"type": "wait_for_element", "params": {"text": "Create"}},
+    ])
+    ctx = ExecutionContext(serial="emu-1", variables={}, screenshots_dir=None)
+    await executor.execute(preset, ctx)
+
+    adb.input_tap.assert_awaited_once_with("emu-1", 200, 230)
+    assert ctx.condition_results == {"0": True, "1": False, "3": True}
+    # One dump for the first three steps, one after the tap, one after back.
+    assert len(dumps) == 3
@@ -7,13 +7,17 @@ probe result, so we stub the probe via the batch ctx.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from types import SimpleNamespace
 
 import pytest
 
 from pixsim7.backend.main.domain.assets.signal_backfill import SignalBackfillRun
+from pixsim7.backend.main.services.asset import signal_backfill_service as backfill_module
 from pixsim7.backend.main.services.asset.signal_backfill_service import (
     SignalBackfillService,
+    _pool_budget,
 )
 
 pytestmark = pytest.mark.asyncio
@@ -158,3 +162,86 @@ async def test_apply_outcome_tolerates_missing_keys():
     assert run.scanned_assets == 1
     assert run.broken_assets == 0
     assert run.skipped_assets == 0
+
+
+# ---- process-pool budgeting + throughput report ----
+def test_pool_budget_fits_workers_times_threads_to_cores():
+    # 16 cores, 2 ffmpeg threads → at most 8 workers, still capped by concurrency.
+    assert _pool_budget(32, 2, cpu_count=16) == (8, 2)
+    assert _pool_budget(6, 2, cpu_count=16) == (6, 2)
+    # ffmpeg "auto" (0) is pinned to 1 thread so workers don't all grab every core.
+    assert _pool_budget(32, 0, cpu_count=4) == (4, 1)
+    # Threads beyond the core count are clamped; always at least one worker.
+    assert _pool_budget(8, 16, cpu_count=4) == (1, 4)
+
+
+async def test_thread_prefetch_reports_throughput():
+    svc, run = _svc(), _run()
+
+    async def _noop():
+        return None
+    svc.db = SimpleNamespace(commit=_noop)
+    svc._batch_started = 0.0  # as if _prepare_batch ran
+    fake = _RecordingSignalService()
+    assets = [SimpleNamespace(id=i) for i in (1, 2)]
+    await svc._prefetch_batch(assets, run, _ctx(fake))
+    for a in assets:
+        await svc._process_asset(a, run, _ctx(fake))
+
+    report = svc._throughput_report({"scanned": 2})
+    assert report["executor"] == "thread"
+    assert report["clips"] == 2
+    assert report["clips_per_sec"] is not None
+    assert report["decode_sec"] >= 0.0 and report["scoring_sec"] >= 0.0
+
+
+class _PoolSignalService:
+    """Resolves every asset to a fake source string for the pool path."""
+
+    def is_eligible(self, asset):
+        return asset.id != 0
+
+    def _resolve_probe_source(self, asset):
+        return f"clip-{asset.id}"
+
+
+def _pool_probe(monkeypatch, failures):
+    """Run the pool path on threads; ``failures`` maps a source to the error it raises."""
+    resets = []
+    pool = ThreadPoolExecutor(max_workers=2)
+
+    def _fake_timed_probe(source, threads):
+        if source in failures:
+            raise failures[source]
+        return {"raw_for": source}, 0.01
+
+    monkeypatch.setattr(backfill_module, "_get_probe_pool", lambda workers: pool)
+    monkeypatch.setattr(backfill_module, "_timed_probe", _fake_timed_probe)
+    monkeypatch.setattr(backfill_module, "_reset_probe_pool", lambda: resets.append(True))
+    return pool, resets
+
+
+async def test_pool_prefetch_failed_clip_does_not_abort_batch(monkeypatch):
+    svc = _svc()
+    pool, resets = _pool_probe(monkeypatch, {"clip-2": RuntimeError("ffmpeg exploded")})
+    assets = [SimpleNamespace(id=i) for i in (0, 1, 2, 3)]
+
+    cache = await svc._prefetch_via_pool(assets, _PoolSignalService(), 4, 1)
+    pool.shutdown()
+
+    assert cache == {0: None, 1: {"raw_for": "clip-1"}, 2: None, 3: {"raw_for": "clip-3"}}
+    # An ordinary probe failure leaves the shared pool alone.
+    assert resets == []
+    assert svc._executor["executor"] == "process"
+
+
+async def test_pool_prefetch_resets_broken_pool_after_batch(monkeypatch):
+    svc = _svc()
+    pool, resets = _pool_probe(monkeypatch, {"clip-1": BrokenProcessPool("worker died")})
+    assets = [SimpleNamespace(id=i) for i in (1, 2, 3)]
+
+    cache = await svc._prefetch_via_pool(assets, _PoolSignalService(), 4, 1)
+    pool.shutdown()
+
+    assert cache == {1: None, 2: {"raw_for": "clip-2"}, 3: {"raw_for": "clip-3"}}
+    assert resets == [True]
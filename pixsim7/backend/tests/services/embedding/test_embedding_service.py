@@ -90,6 +90,13 @@ def _scalars_returning(blocks):
     return result
 
 
+def _cache_miss():
+    """Mock for the content-hash cache lookup: no cached rows."""
+    result = MagicMock()
+    result.all.return_value = []
+    return result
+
+
 # ===== validate_embeddings =====
 
 @pytest.mark.skipif(not IMPORTS_AVAILABLE, reason="Dependencies not available")
@@ -134,6 +141,18 @@ class TestValidateEmbeddings:
         embs = [_good_embedding(), _good_embedding()]
         assert validate_embeddings(embs, expected_count=2) == embs
 
+    def test_array_is_checked_and_returned_as_is(self):
+        np = pytest.importorskip("numpy")
+        arr = np.full((2, EXPECTED_DIMENSIONS), 0.01, dtype=np.float32)
+        assert validate_embeddings(arr, expected_count=2) is arr
+        with pytest.raises(EmbeddingDimensionError, match="Expected 3.*got 2"):
+            validate_embeddings(arr, expected_count=3)
+        with pytest.raises(EmbeddingDimensionError, match="512 dimensions.*expected 768"):
+            validate_embeddings(arr[:, :512], expected_count=2)
+        arr[1, 5] = np.inf
+        with pytest.raises(EmbeddingDimensionError, match=r"\[1\]\[5\] is non-finite"):
+            validate_embeddings(arr, expected_count=2)
+
 
 # ===== find_similar: missing block -> BlockNotFoundError =====
 
@@ -215,7 +234,10 @@ class TestBatchEmbeddingResilience:
         db.execute = AsyncMock(side_effect=[
             count_result,                       # count query
             _scalars_returning([block_a]),      # chunk 1
+            _cache_miss(),                      # chunk 1 cache lookup
             _scalars_returning([block_b]),      # chunk 2
+            _cache_miss(),                      # chunk 2 cache lookup
+            MagicMock(),                        # chunk 2 cache insert
             _scalars_returning([]),             # end
         ])
         db.commit = AsyncMock()
@@ -256,6 +278,8 @@ class TestBatchEmbeddingCommitFailure:
         db.execute = AsyncMock(side_effect=[
             count_result,
             _scalars_returning([block]),
+            _cache_miss(),
+            MagicMock(),  # cache insert
         ])
         db.commit = AsyncMock(side_effect=RuntimeError("commit failed"))
         db.rollback = AsyncMock()
@@ -3,6 +3,7 @@ EntityEmbeddingService orchestration tests — fakes for storage + provider.
 
 Proves the base's behaviour independent of any real entity or DB:
 - embed_one skip-if-cached vs. force vs. model change
+- the content-hash cache: hits skip the provider, in-call repeats embed once
 - find_similar source-unembedded guard + threshold filtering / result shaping
 - the portable OR-form keyset cursor predicate
 
@@ -97,10 +98,41 @@ class _DocService(EntityEmbeddingService[_Doc]):
         raise NotImplementedError
 
 
+class _FakeContentCache:
+    """In-memory ContentEmbeddingCache."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str, str], list[float]] = {}
+        self.lookups = 0
+
+    async def get_many(self, hashes, *, embedder_id, model_id, variant=""):
+        self.lookups += 1
+        return {
+            h: self.entries[(h, embedder_id, model_id)]
+            for h in hashes
+            if (h, embedder_id, model_id) in self.entries
+        }
+
+    async def put_many(self, vectors, *, embedder_id, model_id, variant=""):
+        for h, v in vectors.items():
+            self.entries.setdefault((h, embedder_id, model_id), v)
+
+
+class _HashedDocService(_DocService):
+    def _content_hash(self, entity):
+        return f"sha:{entity.text}"
+
+
 def _service(**kw) -> _DocService:
     return _DocService(_FakeSession(), _FakeStorage(), **kw)
 
 
+def _hashed_service() -> _HashedDocService:
+    return _HashedDocService(
+        _FakeSession(), _FakeStorage(), content_cache=_FakeContentCache()
+    )
+
+
 # ── embed_one ─────────────────────────────────────────────────────────
 
 
@@ -148,6 +180,60 @@ async def test_embed_one_reembeds_when_model_changes():
     assert svc.embed_calls == [["hello"]]  # different model => not skipped
 
 
+# ── content-hash cache ────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_embed_one_reuses_vector_for_identical_content():
+    svc = _hashed_service()
+    await svc.embed_one(_Doc(id=1, text="hello"))
+    svc.embed_calls.clear()
+
+    # A different row with byte-identical content never reaches the provider.
+    twin = await svc.embed_one(_Doc(id=2, text="hello"))
+    assert twin.vector == [5.0, 0.0]
+    assert svc.embed_calls == []
+    assert svc.storage.rows[(2, "primary")].vector == [5.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_model():
+    svc = _hashed_service()
+    await svc.embed_one(_Doc(id=1, text="hello"), model_id="m1")
+    svc.embed_calls.clear()
+    await svc.embed_one(_Doc(id=2, text="hello"), model_id="m2")
+    assert svc.embed_calls == [["hello"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_with_cache_dedupes_and_counts_hits():
+    svc = _hashed_service()
+    await svc.embed_one(_Doc(id=0, text="seen"))
+    svc.embed_calls.clear()
+
+    docs = [
+        _Doc(id=1, text="seen"),   # cache hit
+        _Doc(id=2, text="ab"),     # miss
+        _Doc(id=3, text="ab"),     # in-call repeat of a miss
+        _Doc(id=4, text="xyz"),    # miss
+    ]
+    vectors, hits = await svc._embed_with_cache(docs, model_id="fake:model")
+    assert svc.embed_calls == [["ab", "xyz"]]
+    assert vectors == [[4.0, 0.0], [2.0, 0.0], [2.0, 0.0], [3.0, 0.0]]
+    assert hits == 2
+    assert svc.content_cache.lookups == 2  # one per call, not per entity
+    assert ("sha:xyz", "primary", "fake:model") in svc.content_cache.entries
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_caches_nothing():
+    svc = _hashed_service()
+    svc.fail_on_text = "boom"
+    with pytest.raises(RuntimeError):
+        await svc._embed_with_cache([_Doc(id=1, text="boom")], model_id="m")
+    assert svc.content_cache.entries == {}
+
+
 # ── find_similar ──────────────────────────────────────────────────────
 
 
@@ -0,0 +1,175 @@
+"""
+SpatialQueryService grid index tests.
+
+Every query is checked against a brute-force scan over the same entities, so
+the grid can only ever be a faster way to get the same answer. The benchmark
+at the bottom holds a 10k-entity location to an absolute budget.
+"""
+from __future__ import annotations
+
+import math
+import random
+import time
+
+import pytest
+
+from pixsim7.backend.main.services.game.spatial_query import SpatialQueryService
+
+
+def _obj(i: int, x: float, y: float, *, kind: str = "npc", location: int = 1, tags=None) -> dict:
+    return {
+        "id": i,
+        "kind": kind,
+        "transform": {"worldId": 1, "locationId": location, "position": {"x": x, "y": y}},
+        "tags": tags or [],
+    }
+
+
+def _scatter(n: int, *, seed: int = 7, extent: float = 2000.0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        _obj(
+            i,
+            rng.uniform(-extent, extent),
+            rng.uniform(-extent, extent),
+            kind="npc" if i % 3 else "item",
+            tags=["friendly"] if i % 5 == 0 else [],
+        )
+        for i in range(n)
+    ]
+
+
+async def _service(objs: list[dict], cell_size: float = 64.0) -> SpatialQueryService:
+    svc = SpatialQueryService(cell_size=cell_size)
+    await svc.batch_register_entities(objs, emit_events=False)
+    return svc
+
+
+def _ids(results: list[dict]) -> set:
+    return {(r["kind"], r["id"]) for r in results}
+
+
+def _brute_radius(objs, x, y, r, kinds=None, tags=None) -> set:
+    out = set()
+    for o in objs:
+        p = o["transform"]["position"]
+        if kinds and o["kind"] not in kinds:
+            continue
+        if tags and not any(t in o["tags"] for t in tags):
+            continue
+        if (p["x"] - x) ** 2 + (p["y"] - y) ** 2 <= r * r:
+            out.add((o["kind"], o["id"]))
+    return out
+
+
+@pytest.mark.asyncio
+async def test_bounds_and_radius_match_brute_force():
+    objs = _scatter(3000)
+    svc = await _service(objs)
+    rng = random.Random(1)
+    for _ in range(40):
+        x, y = rng.uniform(-2000, 2000), rng.uniform(-2000, 2000)
+        r = rng.choice([5.0, 50.0, 300.0, 5000.0])
+        got = await svc.query_by_radius(world_id=1, x=x, y=y, radius=r, location_id=1)
+        assert _ids(got) == _brute_radius(objs, x, y, r)
+
+        got = await svc.query_by_bounds(
+            world_id=1, min_x=x - r, max_x=x + r, min_y=y - r / 2, max_y=y + r / 2
+        )
+        want = {
+            (o["kind"], o["id"]) for o in objs
+            if x - r <= o["transform"]["position"]["x"] <= x + r
+            and y - r / 2 <= o["transform"]["position"]["y"] <= y + r / 2
+        }
+        assert _ids(got) == want
+
+    got = await svc.query_by_radius(
+        world_id=1, x=0, y=0, radius=800, kinds=["item"], tags=["friendly"]
+    )
+    assert _ids(got) == _brute_radius(objs, 0, 0, 800, kinds=["item"], tags=["friendly"])
+
+
+@pytest.mark.asyncio
+async def test_index_follows_updates_and_removals():
+    svc = await _service([_obj(1, 0, 0), _obj(2, 10, 10), _obj(3, 500, 500, location=2)])
+
+    await svc.update_entity_transform(
+        "npc", 1, {"worldId": 1, "locationId": 1, "position": {"x": 1000, "y": 1000}},
+        emit_event=False,
+    )
+    await svc.batch_update_transforms(
+        [("npc", 3, {"worldId": 1, "locationId": 1, "position": {"x": 1001, "y": 1001}})],
+        emit_events=False,
+    )
+    assert _ids(await svc.query_by_radius(world_id=1, x=0, y=0, radius=50)) == {("npc", 2)}
+    near = await svc.query_by_radius(world_id=1, x=1000, y=1000, radius=5, location_id=1)
+    assert _ids(near) == {("npc", 1), ("npc", 3)}
+    assert await svc.query_by_radius(world_id=1, x=500, y=500, radius=5, location_id=2) == []
+
+    # Re-registering at a new location moves it rather than duplicating it.
+    await svc.register_entity(_obj(2, 0, 0, location=3), emit_event=False)
+    assert _ids(await svc.query_by_location(world_id=1, location_id=1)) == {("npc", 1), ("npc", 3)}
+
+    await svc.remove_entity("npc", 1, emit_event=False)
+    near = await svc.query_by_radius(world_id=1, x=1000, y=1000, radius=5)
+    assert _ids(near) == {("npc", 3)}
+
+
+@pytest.mark.asyncio
+async def test_nearest_matches_brute_force():
+    objs = _scatter(2000, seed=3)
+    svc = await _service(objs, cell_size=32.0)
+    rng = random.Random(9)
+    for _ in range(30):
+        x, y = rng.uniform(-2500, 2500), rng.uniform(-2500, 2500)
+        k = rng.choice([1, 5, 25])
+        got = await svc.query_nearest(world_id=1, x=x, y=y, k=k, kinds=["npc"])
+        want = sorted(
+            math.hypot(o["transform"]["position"]["x"] - x, o["transform"]["position"]["y"] - y)
+            for o in objs if o["kind"] == "npc"
+        )[:k]
+        assert [r["distance"] for r in got] == pytest.approx(want)
+
+
+@pytest.mark.asyncio
+async def test_nearest_max_distance_and_exclude():
+    svc = await _service([_obj(1, 0, 0), _obj(2, 3, 4), _obj(3, 30, 40)])
+    got = await svc.query_nearest(world_id=1, x=0, y=0, k=5, max_distance=10, exclude=("npc", 1))
+    assert [(r["id"], r["distance"]) for r in got] == [(2, 5.0)]
+    assert await svc.query_nearest(world_id=2, x=0, y=0, k=5) == []
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_benchmark_10k_entities_per_location():
+    objs = _scatter(10_000, extent=5000.0)
+    svc = await _service(objs)
+    rng = random.Random(2)
+    points = [(rng.uniform(-5000, 5000), rng.uniform(-5000, 5000)) for _ in range(200)]
+
+    start = time.perf_counter()
+    for x, y in points:
+        await svc.query_by_radius(world_id=1, x=x, y=y, radius=100, location_id=1)
+    radius_ms = (time.perf_counter() - start) * 1000 / len(points)
+
+    start = time.perf_counter()
+    for x, y in points:
+        await svc.query_nearest(world_id=1, x=x, y=y, k=10, location_id=1)
+    nearest_ms = (time.perf_counter() - start) * 1000 / len(points)
+
+    start = time.perf_counter()
+    await svc.batch_update_transforms(
+        [("npc" if i % 3 else "item", i, {"worldId": 1, "locationId": 1,
+          "position": {"x": rng.uniform(-5000, 5000), "y": rng.uniform(-5000, 5000)}})
+         for i in range(10_000)],
+        emit_events=False,
+    )
+    update_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n10k entities: radius {radius_ms:.3f} ms/query, "
+        f"nearest(k=10) {nearest_ms:.3f} ms/query, move-all {update_ms:.1f} ms"
+    )
+    # A linear scan building 10k dicts per query costs tens of ms here.
+    assert radius_ms < 2.0
+    assert nearest_ms < 5.0
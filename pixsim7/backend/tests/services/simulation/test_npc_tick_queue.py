@@ -0,0 +1,210 @@
+"""
+NPC tick queues + WorldScheduler selection over them.
+
+The scheduler half runs against a statement-inspecting fake session, so it
+can assert which NPC rows a tick actually loads.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from pixsim7.backend.game import GameWorld, GameWorldState
+from pixsim7.backend.main.services.simulation.context import WorldSimulationContext
+from pixsim7.backend.main.services.simulation.npc_queue import (
+    NpcScheduleRegistry,
+    NpcTickQueue,
+)
+from pixsim7.backend.main.services.simulation.scheduler import WorldScheduler
+
+
+# ── NpcTickQueue ──────────────────────────────────────────────────────
+
+
+def test_queue_pops_due_by_time_then_tier():
+    q = NpcTickQueue()
+    q.push(1, 10.0, 2)
+    q.push(2, 5.0, 2)
+    q.push(3, 5.0, 0)
+    q.push(4, 50.0, 0)
+    assert q.pop_due(20.0) == [3, 2, 1]
+    assert q.pop_due(20.0) == []
+    assert len(q) == 1 and q.next_due_at() == 50.0
+
+
+def test_queue_limit_and_reschedule_supersedes():
+    q = NpcTickQueue()
+    for npc_id in range(5):
+        q.push(npc_id, 0.0, 0)
+    q.push(0, 100.0, 0)  # rescheduled: the old entry must not pop
+    q.discard(1)
+    assert q.pop_due(1.0, limit=2) == [2, 3]
+    assert q.pop_due(1.0) == [4]
+    assert q.pop_due(100.0) == [0]
+
+
+# ── WorldScheduler selection ──────────────────────────────────────────
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeDB:
+    def __init__(self, world, npcs, sessions):
+        self.world = world
+        self.npcs = {npc.id: npc for npc in npcs}
+        self.sessions = sessions
+        self.loaded_npc_ids: list[set] = []
+
+    async def get(self, model, key):
+        if model is GameWorld:
+            return self.world
+        if model is GameWorldState:
+            return SimpleNamespace(world_id=key, world_time=0.0)
+        return None
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        if "FROM game_sessions" in sql:
+            return _Result(self.sessions)
+        if "npc_roster_version" in sql:
+            return _Result([self.world.npc_roster_version])
+        params = stmt.compile().params
+        in_ids = next((v for v in params.values() if isinstance(v, (list, tuple, set))), None)
+        if in_ids is not None:
+            self.loaded_npc_ids.append(set(in_ids))
+            return _Result([self.npcs[i] for i in in_ids if i in self.npcs])
+        return _Result(sorted(self.npcs))
+
+
+def _npc(npc_id):
+    return SimpleNamespace(id=npc_id, name=f"npc{npc_id}", personality={}, world_id=1)
+
+
+def _session(session_id, npc_ids):
+    flags = {"npcs": {f"npc:{i}": {"state": {"next_tick_at": 0}} for i in npc_ids}}
+    return SimpleNamespace(id=session_id, world_id=1, flags=flags, relationships={}, version=1)
+
+
+async def _select(scheduler, world_time):
+    context = WorldSimulationContext(world_id=1, current_world_time=world_time)
+    selected = await scheduler._select_npcs_for_simulation(1, context)
+    scheduler._requeue_drained(1)
+    return [d["npc"].id for npcs in selected.values() for d in npcs]
+
+
+@pytest.mark.asyncio
+async def test_tick_loads_only_due_npcs():
+    npc_ids = list(range(1, 121))
+    db = _FakeDB(SimpleNamespace(id=1, meta={}, npc_roster_version=0), [_npc(i) for i in npc_ids], [_session(7, npc_ids)])
+    scheduler = WorldScheduler(db, npc_schedule=NpcScheduleRegistry())
+
+    # Default behavior config caps a session at 50 NPCs per tick; everyone
+    # starts due, so the roster drains 50 at a time.
+    first = await _select(scheduler, 10.0)
+    second = await _select(scheduler, 11.0)
+    third = await _select(scheduler, 12.0)
+    assert len(first) == len(second) == 50 and len(third) == 20
+    assert set(first) | set(second) | set(third) == set(npc_ids)
+    assert [len(ids) for ids in db.loaded_npc_ids] == [50, 50, 20]
+
+    # Everyone is stamped a background tier ahead (3600s): nothing is due.
+    assert await _select(scheduler, 13.0) == []
+    assert len(db.loaded_npc_ids) == 3
+
+    # ...until their next tick comes around.
+    assert len(await _select(scheduler, 3700.0)) == 50
+
+
+@pytest.mark.asyncio
+async def test_roster_change_and_session_edit_reseed():
+    db = _FakeDB(SimpleNamespace(id=1, meta={}, npc_roster_version=0), [_npc(1), _npc(2)], [_session(7, [1, 2])])
+    registry = NpcScheduleRegistry()
+    scheduler = WorldScheduler(db, npc_schedule=registry)
+    assert sorted(await _select(scheduler, 1.0)) == [1, 2]
+    assert await _select(scheduler, 2.0) == []
+
+    # A new NPC shows up in the roster and is due at once.
+    db.npcs[3] = _npc(3)
+    db.world.npc_roster_version += 1  # as the GameNPC insert hook does
+    db.sessions[0].flags["npcs"]["npc:3"] = {"state": {"next_tick_at": 0}}
+    assert await _select(scheduler, 3.0) == [3]
+
+    # An API edit (version bump) pulls NPC 1's next tick forward.
+    db.sessions[0].flags["npcs"]["npc:1"]["state"]["next_tick_at"] = 0
+    db.sessions[0].version = 2
+    assert await _select(scheduler, 4.0) == [1]
+
+    # Deleted NPCs leave the queues.
+    del db.npcs[2]
+    db.world.npc_roster_version += 1
+    assert registry.roster(1) == {1, 2, 3}
+    await _select(scheduler, 5.0)
+    assert registry.roster(1) == {1, 3}
+
+
+@pytest.mark.asyncio
+async def test_roster_reloads_only_when_its_version_moves():
+    db = _FakeDB(SimpleNamespace(id=1, meta={}, npc_roster_version=0), [_npc(2), _npc(5)], [_session(7, [1, 2, 5])])
+    registry = NpcScheduleRegistry()
+    scheduler = WorldScheduler(db, npc_schedule=registry)
+    assert sorted(await _select(scheduler, 1.0)) == [2, 5]
+
+    # NPC 2 is deleted and NPC 1 created (same count and max id).
+    del db.npcs[2]
+    db.npcs[1] = _npc(1)
+    assert await _select(scheduler, 2.0) == []  # version unchanged: cached roster
+    db.world.npc_roster_version += 2
+    assert await _select(scheduler, 3.0) == [1]
+    assert registry.roster(1) == {1, 5}
+
+
+def test_npc_hooks_bump_world_roster_version():
+    from sqlalchemy import create_engine
+    from sqlmodel import Session, select
+
+    from pixsim7.backend.game import GameLocation, GameNPC
+
+    engine = create_engine("sqlite://")
+    tables = [GameWorld.__table__, GameLocation.__table__, GameNPC.__table__]
+    GameWorld.metadata.create_all(engine, tables=tables)
+
+    def versions(session):
+        session.expire_all()
+        return list(session.exec(select(GameWorld.npc_roster_version).order_by(GameWorld.id)))
+
+    with Session(engine) as session:
+        session.add_all([GameWorld(owner_user_id=1, name="a"), GameWorld(owner_user_id=1, name="b")])
+        session.commit()
+        npc = GameNPC(world_id=1, name="n")
+        session.add(npc)
+        session.commit()
+        assert versions(session) == [1, 0]
+
+        npc.name = "renamed"  # not a roster change
+        session.commit()
+        assert versions(session) == [1, 0]
+
+        npc.world_id = 2
+        session.commit()
+        assert versions(session) == [2, 1]
+
+        session.add(GameNPC(world_id=None, name="drifter"))  # in every roster
+        session.commit()
+        assert versions(session) == [3, 2]
+
+        session.delete(npc)
+        session.commit()
+        assert versions(session) == [3, 3]
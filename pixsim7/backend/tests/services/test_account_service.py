@@ -18,6 +18,7 @@ shape and is the user-visible contract.
 """
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -25,6 +26,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from pixsim7.backend.main.domain import AccountStatus
+from pixsim7.backend.main.services.account import account_service as account_service_module
 from pixsim7.backend.main.services.account.account_service import (
     AccountService,
     _account_discount_factor,
@@ -34,6 +36,11 @@ from pixsim7.backend.main.services.account.account_service import (
     _iter_route_patterns,
     _parse_route_pattern,
 )
+from pixsim7.backend.main.services.account.slot_allocator import (
+    account_slots_key,
+    claim_account_slot,
+    release_account_slot,
+)
 from pixsim7.backend.main.shared.errors import NoAccountAvailableError
 
 
@@ -248,6 +255,12 @@ def _service(db: _FakeDb, monkeypatch: pytest.MonkeyPatch) -> AccountService:
         "reserve_or_create_accountless_account",
         AsyncMock(return_value=None),
     )
+    # Row-by-row reserve path unless a test opts into the slot allocator.
+    monkeypatch.setattr(
+        account_service_module,
+        "_slot_allocator_redis",
+        AsyncMock(return_value=None),
+    )
     return service
 
 
@@ -813,3 +826,138 @@ async def test_select_and_reserve_raises_when_no_candidates_and_no_accountless(
 
     # No FOR UPDATE in the scan path anymore, so no rollback before fallback.
     assert db.rollbacks == 0
+
+
+# ---------------------------------------------------------------------------
+# select_and_reserve_account — Redis slot allocator
+# ---------------------------------------------------------------------------
+
+
+class _SlotAllocator:
+    """Stands in for the Lua claim: first candidate under its cap wins."""
+
+    def __init__(self, used: dict[int, int] | None = None, fail: bool = False):
+        self.used = dict(used or {})
+        self.fail = fail
+        self.claims: list[list[int]] = []
+        self.released: list[int] = []
+
+    async def claim(self, redis, provider_id, candidates):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.claims.append([account_id for account_id, _, _ in candidates])
+        for account_id, db_jobs, max_jobs in candidates:
+            used = max(self.used.get(account_id, 0), db_jobs)
+            if used < max_jobs:
+                self.used[account_id] = used + 1
+                return account_id
+        return None
+
+    async def release(self, redis, provider_id, account_id):
+        self.released.append(account_id)
+        self.used[account_id] -= 1
+
+
+def _allocator_service(
+    db: _FakeDb, monkeypatch: pytest.MonkeyPatch, allocator: _SlotAllocator
+) -> AccountService:
+    service = _service(db, monkeypatch)
+    monkeypatch.setattr(account_service_module, "_slot_allocator_redis", AsyncMock(return_value=object()))
+    monkeypatch.setattr(account_service_module, "claim_account_slot", allocator.claim)
+    monkeypatch.setattr(account_service_module, "release_account_slot", allocator.release)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_slot_allocator_reserves_only_the_claimed_account(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    best = _make_account(account_id=1, priority=10)
+    next_best = _make_account(account_id=2, priority=5)
+    allocator = _SlotAllocator(used={1: 2})  # another worker holds both slots on 1
+
+    db = _FakeDb(results=[_FakeResult([(best, 10), (next_best, 10)]), _FakeResult([(next_best,)])])
+    service = _allocator_service(db, monkeypatch, allocator)
+
+    selected = await service.select_and_reserve_account(
+        provider_id="pixverse", operation_type=OP, model=MODEL,
+    )
+
+    assert selected.id == next_best.id
+    assert allocator.claims == [[1, 2]]
+    assert db.execute_calls == 2  # scan + one reserve, no lost races
+    assert allocator.released == []
+
+
+@pytest.mark.asyncio
+async def test_slot_allocator_hands_back_slot_when_db_refuses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = _make_account(account_id=1, priority=10)
+    second = _make_account(account_id=2, priority=5)
+    allocator = _SlotAllocator()
+
+    # Reserve on 1 finds it ineligible in the DB (e.g. cooldown set since the scan).
+    db = _FakeDb(
+        results=[_FakeResult([(first, 10), (second, 10)]), _FakeResult([]), _FakeResult([(second,)])]
+    )
+    service = _allocator_service(db, monkeypatch, allocator)
+
+    selected = await service.select_and_reserve_account(
+        provider_id="pixverse", operation_type=OP, model=MODEL,
+    )
+
+    assert selected.id == second.id
+    assert allocator.claims == [[1, 2], [2]]
+    assert allocator.released == [1]
+    assert allocator.used == {1: 0, 2: 1}
+
+
+@pytest.mark.asyncio
+async def test_slot_allocator_falls_back_to_row_walk_without_redis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = _make_account(account_id=1, priority=10)
+    second = _make_account(account_id=2, priority=5)
+    allocator = _SlotAllocator(fail=True)
+
+    db = _FakeDb(
+        results=[_FakeResult([(first, 10), (second, 10)]), _FakeResult([]), _FakeResult([(second,)])]
+    )
+    service = _allocator_service(db, monkeypatch, allocator)
+
+    selected = await service.select_and_reserve_account(
+        provider_id="pixverse", operation_type=OP, model=MODEL,
+    )
+
+    assert selected.id == second.id
+    assert db.execute_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_claim_slot_script_counts_per_account(lua_redis) -> None:
+    candidates = [(1, 0, 1), (2, 0, 2)]
+    claims = [await claim_account_slot(lua_redis, "pixverse", candidates) for _ in range(4)]
+    assert claims == [1, 2, 2, None]
+    assert await lua_redis.ttl(account_slots_key("pixverse")) > 0
+
+    await release_account_slot(lua_redis, "pixverse", 2)
+    assert await claim_account_slot(lua_redis, "pixverse", candidates) == 2
+
+    # A DB count above the Redis count wins: the account is already full.
+    assert await claim_account_slot(lua_redis, "pixverse", [(3, 4, 4)]) is None
+    assert await claim_account_slot(lua_redis, "pixverse", [(3, 3, 4)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_never_exceed_the_per_account_cap(lua_redis) -> None:
+    # Each claim is one atomic script: 20 racing workers over 2+3 slots get
+    # exactly 5 claims, split along the caps, and the rest find no room.
+    candidates = [(1, 0, 2), (2, 0, 3)]
+    claims = await asyncio.gather(
+        *(claim_account_slot(lua_redis, "pixverse", candidates) for _ in range(20))
+    )
+    assert sorted(c for c in claims if c is not None) == [1, 1, 2, 2, 2]
+    assert claims.count(None) == 15
+    slots = await lua_redis.hgetall(account_slots_key("pixverse"))
+    assert (int(slots[b"1"]), int(slots[b"2"])) == (2, 3)
@@ -1,13 +1,24 @@
 """Unit tests for the shared video frame-grab helpers in derivatives.py.
 
 Covers the pure timestamp-spacing logic extracted in plan
-``embedding-input-selection-media-aware`` (c1). The ffmpeg-driven
-``extract_video_frame`` is exercised indirectly by thumbnail/preview generation
-and is not unit-tested here (requires an ffmpeg binary + a real clip).
+``embedding-input-selection-media-aware`` (c1) and the one-decode frame
+planner, checked through the argv it builds. One integration test runs that
+argv through a real ffmpeg on a generated clip; it skips without ffmpeg.
 """
+import shutil
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from pixsim7.backend.main.domain.enums import MediaType
+from pixsim7.backend.main.services.media import derivatives
 from pixsim7.backend.main.services.media.derivatives import (
     DEFAULT_FRAME_SIZE,
+    FrameOutput,
+    build_frame_extraction_cmd,
     evenly_spaced_timestamps,
+    extract_video_frames,
 )
 
 
@@ -38,3 +49,98 @@ def test_evenly_spaced_unknown_duration_falls_back_to_single_grab():
 def test_evenly_spaced_clamps_nonpositive_count():
     assert evenly_spaced_timestamps(10.0, 0) == [5.0]
     assert evenly_spaced_timestamps(10.0, -2) == [5.0]
+
+
+def test_frame_plan_decodes_once_for_every_output():
+    outputs = [
+        FrameOutput("thumb.jpg", 1.0, (320, 320)),
+        FrameOutput("preview.jpg", 1.0, (1600, 1600), qscale=5),
+        FrameOutput("frame.jpg", 2.5, (384, 384)),
+        FrameOutput("last.jpg", None, (384, 384)),
+    ]
+    cmd = build_frame_extraction_cmd(
+        "clip.mp4", outputs, rotation_filters=["transpose=1"], duration_sec=10.0,
+    )
+
+    assert cmd.count("-i") == 1
+    # Fast seek to the earliest frame; later frames select relative to it.
+    assert cmd[cmd.index("-ss") + 1] == "1.000"
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph.startswith("[0:v]transpose=1,split=4[s0][s1][s2][s3];")
+    assert "[s2]select=gte(t\\,1.500)," in graph
+    assert "[s3]select=gte(t\\,8.500)," in graph
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"] == ["[o0]", "[o1]", "[o2]", "[o3]"]
+    assert cmd[cmd.index("[o3]") + 1:cmd.index("[o3]") + 3] == ["-update", "1"]
+    assert cmd[cmd.index("[o1]") + 1:cmd.index("[o1]") + 5] == ["-frames:v", "1", "-q:v", "5"]
+
+
+def test_single_frame_plan_has_no_split():
+    cmd = build_frame_extraction_cmd("clip.mp4", [FrameOutput("t.jpg", 0.0, (320, 320))])
+    assert "-ss" not in cmd
+    assert cmd[cmd.index("-filter_complex") + 1] == (
+        "[0:v]scale=320:320:force_original_aspect_ratio=decrease[o0]"
+    )
+
+
+@pytest.mark.asyncio
+async def test_video_thumbnail_and_preview_share_one_run(monkeypatch, tmp_path):
+    runs = []
+
+    async def _extract(local_path, outputs, **kwargs):
+        runs.append((outputs, kwargs))
+        return [True] * len(outputs)
+
+    storage = SimpleNamespace(get_path=lambda key: str(tmp_path / key))
+    monkeypatch.setattr(derivatives, "extract_video_frames", _extract)
+    monkeypatch.setattr(derivatives, "get_storage_service", lambda: storage)
+    monkeypatch.setattr(derivatives, "_validate_video_for_thumbnail", lambda *_a, **_k: True)
+    monkeypatch.setattr(derivatives, "_validate_extracted_frame", lambda *_a: True)
+    asset = SimpleNamespace(
+        id=5, user_id=1, sha256="ab" * 32, media_type=MediaType.VIDEO,
+        width=1920, height=1080, duration_sec=6.0,
+        media_metadata={"video_info": {"rotation": 0}},
+        thumbnail_key=None, preview_key=None,
+    )
+    settings = SimpleNamespace(thumbnail_size=(320, 320), preview_size=(1600, 1600), preview_quality=90)
+
+    await derivatives.generate_asset_derivatives(
+        asset, "clip.mp4", settings, thumbnail=True, preview=True,
+    )
+
+    assert len(runs) == 1
+    outputs, kwargs = runs[0]
+    assert [o.target_size for o in outputs] == [(320, 320), (1600, 1600)]
+    assert kwargs["op"] == "derivatives"
+    assert asset.thumbnail_key == f"u/1/thumbnails/ab/{asset.sha256}.jpg"
+    assert asset.preview_key == "u/1/previews/5.jpg"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+@pytest.mark.parametrize("duration_sec", [3.0, None], ids=["known-duration", "unknown-duration"])
+async def test_one_run_writes_every_frame_of_a_real_clip(tmp_path, duration_sec):
+    clip = tmp_path / "clip.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=duration=3:size=320x240:rate=10",
+            "-pix_fmt", "yuv420p", str(clip),
+        ],
+        check=True,
+        timeout=60,
+    )
+    outputs = [
+        FrameOutput(str(tmp_path / "thumb.jpg"), 0.5, (160, 160)),
+        FrameOutput(str(tmp_path / "frames" / "mid.jpg"), 1.5, (384, 384)),
+        FrameOutput(str(tmp_path / "frames" / "late.jpg"), 2.5, (384, 384)),
+        FrameOutput(str(tmp_path / "last.jpg"), None, (320, 320)),
+    ]
+
+    written = await extract_video_frames(
+        str(clip), outputs, rotation_filters=["transpose=1"], duration_sec=duration_sec,
+    )
+
+    assert written == [True] * len(outputs)
+    for out in outputs:
+        with open(out.output_path, "rb") as f:
+            assert f.read(2) == b"\xff\xd8", out.output_path  # JPEG SOI
@@ -0,0 +1,159 @@
+"""
+Local media streaming — LocalStorageService.open_stream, hashing, and the
+local branch of serve_media (conditional requests, Range, header placement).
+
+Runs against LocalStorageService in a temp dir; the route is driven through a
+minimal FastAPI app so FileResponse's Range handling is exercised for real.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from pixsim7.backend.main.services.storage.roots import LOCAL_ROOT_ID
+from pixsim7.backend.main.services.storage.storage_service import (
+    LocalStorageService,
+    RangeNotSatisfiable,
+    TieredStorageService,
+    local_file_etag,
+    parse_byte_range,
+)
+
+_BODY = bytes(range(256)) * 10_000  # 2.5MB: spans several 1MB stream chunks
+_KEY = "u/1/content/ab/clip.mp4"
+
+
+@pytest.fixture
+def local(tmp_path):
+    svc = LocalStorageService(root_path=tmp_path)
+    path = svc._key_to_path(_KEY)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(_BODY)
+    return svc
+
+
+async def _drain(body):
+    return b"".join([chunk async for chunk in body])
+
+
+def test_parse_byte_range():
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=50-500", 100) == (50, 99)
+    # Ignored (served whole): multi-range, other units, garbage.
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    assert parse_byte_range("items=0-1", 100) is None
+    assert parse_byte_range("bytes=abc", 100) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range("bytes=100-", 100)
+
+
+@pytest.mark.asyncio
+async def test_open_stream_full_and_range(local):
+    meta = await local.get_metadata(_KEY)
+
+    status, headers, ctype, body = await local.open_stream(_KEY)
+    assert (status, ctype) == (200, "video/mp4")
+    assert headers["ETag"] == meta["etag"]
+    assert headers["Content-Length"] == str(len(_BODY))
+    assert await _drain(body) == _BODY
+
+    status, headers, _, body = await local.open_stream(_KEY, range_header="bytes=1048570-2097160")
+    assert status == 206
+    assert headers["Content-Range"] == f"bytes 1048570-2097160/{len(_BODY)}"
+    assert await _drain(body) == _BODY[1048570:2097161]
+
+    with pytest.raises(FileNotFoundError):
+        await local.open_stream("u/1/content/ab/missing.mp4")
+    with pytest.raises(RangeNotSatisfiable):
+        await local.open_stream(_KEY, range_header=f"bytes={len(_BODY)}-")
+
+
+@pytest.mark.asyncio
+async def test_hash_and_tiered_stream_do_not_need_get(local, monkeypatch):
+    async def no_get(key):
+        raise AssertionError("whole-file read")
+
+    monkeypatch.setattr(local, "get", no_get)
+    assert await local.compute_hash(_KEY) == hashlib.sha256(_BODY).hexdigest()
+    assert await local.compute_hash("u/1/nope.mp4") is None
+
+    tier = TieredStorageService({LOCAL_ROOT_ID: local})
+    status, _, _, body = await tier.open_stream(_KEY, range_header="bytes=0-3")
+    assert status == 206 and await _drain(body) == _BODY[:4]
+
+
+def _client(local, monkeypatch):
+    from pixsim7.backend.main.api.v1 import media as media_mod
+
+    monkeypatch.setattr(
+        media_mod, "get_storage_service", lambda: TieredStorageService({LOCAL_ROOT_ID: local})
+    )
+    monkeypatch.setattr(
+        media_mod, "get_media_settings", lambda: SimpleNamespace(cache_control_max_age_seconds=60)
+    )
+
+    app = FastAPI()
+
+    @app.get("/media/{key:path}")
+    async def serve(key: str, request: Request):
+        # Derivative-free content key on the local root: no DB lookup needed.
+        async def _root(db, user_id, key):
+            return LOCAL_ROOT_ID
+
+        monkeypatch.setattr(media_mod, "_resolve_storage_root_id", _root)
+        return await media_mod.serve_media(
+            key, SimpleNamespace(id=1), None, request=request, response=SimpleNamespace()
+        )
+
+    return TestClient(app)
+
+
+def test_serve_local_sets_validators_and_answers_conditionals(local, monkeypatch):
+    client = _client(local, monkeypatch)
+
+    resp = client.get(f"/media/{_KEY}")
+    assert resp.status_code == 200 and resp.content == _BODY
+    # The storage ETag, not FileResponse's own md5-based default.
+    etag = resp.headers["etag"]
+    assert etag == local_file_etag(local._key_to_path(_KEY).stat())
+    assert resp.headers["cache-control"] == "private, max-age=60"
+    assert resp.headers["accept-ranges"] == "bytes"
+
+    resp = client.get(f"/media/{_KEY}", headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert resp.status_code == 304 and resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    resp = client.get(f"/media/{_KEY}", headers={"If-Modified-Since": resp.headers["last-modified"]})
+    assert resp.status_code == 304
+
+    # A stale If-None-Match wins over a matching If-Modified-Since.
+    resp = client.get(
+        f"/media/{_KEY}",
+        headers={"If-None-Match": '"stale"', "If-Modified-Since": resp.headers["last-modified"]},
+    )
+    assert resp.status_code == 200
+
+
+def test_serve_local_range_and_if_range(local, monkeypatch):
+    client = _client(local, monkeypatch)
+    etag = client.get(f"/media/{_KEY}").headers["etag"]
+
+    resp = client.get(f"/media/{_KEY}", headers={"Range": "bytes=100-199"})
+    assert resp.status_code == 206
+    assert resp.content == _BODY[100:200]
+    assert resp.headers["content-range"] == f"bytes 100-199/{len(_BODY)}"
+
+    resp = client.get(f"/media/{_KEY}", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert resp.status_code == 206
+    # File changed since the client's copy: If-Range fails, whole body is sent.
+    os.utime(local._key_to_path(_KEY), ns=(0, 1_000_000_000))
+    resp = client.get(f"/media/{_KEY}", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert resp.status_code == 200 and len(resp.content) == len(_BODY)
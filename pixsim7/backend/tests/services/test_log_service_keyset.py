@@ -0,0 +1,136 @@
+"""LogService keyset paging and log_facets-backed distinct values.
+
+Runs on sqlite+aiosqlite (LogService carries sqlite branches for its JSON
+filters). The log tables are copied without the Postgres-only ``now()``
+server default so sqlite accepts the DDL.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import MetaData
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from pixsim7.backend.main.domain.log_entry import LogEntry, LogFacet
+from pixsim7.backend.main.services.log_service import LogService, decode_log_cursor, encode_log_cursor
+
+pytestmark = pytest.mark.asyncio
+
+_T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def db() -> AsyncIterator[AsyncSession]:
+    metadata = MetaData()
+    for table in (LogEntry.__table__, LogFacet.__table__):
+        copy = table.to_metadata(metadata)
+        for column in copy.columns:
+            column.server_default = None
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    session = AsyncSession(engine, expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+async def _seed(db: AsyncSession) -> None:
+    entries = []
+    for i in range(25):
+        entries.append(LogEntry(
+            # Pairs of rows share a timestamp so paging must break ties on id.
+            timestamp=_T0 + timedelta(seconds=i // 2),
+            level="ERROR" if i % 5 == 0 else "INFO",
+            service="worker" if i % 2 else "api",
+            msg=f"event {i}",
+            channel="pipeline" if i % 3 else "cron",
+            extra={"trace_id": "t-1"} if i < 4 else None,
+            created_at=_T0,
+        ))
+    db.add_all(entries)
+    await db.commit()
+
+
+async def test_cursor_pages_cover_every_row_once(db):
+    await _seed(db)
+    svc = LogService(db)
+
+    seen, cursor, totals = [], None, []
+    while True:
+        logs, total = await svc.query_logs(limit=7, cursor=cursor)
+        totals.append(total)
+        seen.extend(log.msg for log in logs)
+        if len(logs) < 7:
+            break
+        cursor = encode_log_cursor(logs[-1].timestamp, logs[-1].id)
+
+    assert seen == [f"event {i}" for i in reversed(range(25))]
+    # Counted once, on the first page.
+    assert totals == [25, None, None, None]
+
+
+async def test_cursor_combines_with_filters(db):
+    await _seed(db)
+    svc = LogService(db)
+
+    first, total = await svc.query_logs(service="worker", limit=5)
+    cursor = encode_log_cursor(first[-1].timestamp, first[-1].id)
+    rest, _ = await svc.query_logs(service="worker", limit=50, cursor=cursor, include_total=True)
+
+    assert total == 12
+    assert [log.msg for log in first + rest] == [f"event {i}" for i in reversed(range(1, 25, 2))]
+    traced, _ = await svc.query_logs(trace_id="t-1")
+    assert [log.msg for log in traced] == ["event 3", "event 2", "event 1", "event 0"]
+
+
+async def test_cursor_round_trip_and_rejects_garbage():
+    ts = datetime(2026, 10, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    assert decode_log_cursor(encode_log_cursor(ts, 42)) == (ts, 42)
+    with pytest.raises(ValueError):
+        decode_log_cursor("not-a-cursor")
+
+
+async def test_distinct_values_come_from_refreshed_facets(db):
+    await _seed(db)
+    svc = LogService(db)
+
+    # Before the first refresh: live DISTINCT fallback.
+    assert (await svc.get_distinct("channel"))["values"] == ["cron", "pipeline"]
+
+    await svc.refresh_facets(retention_days=36500)
+    db.add(LogEntry(timestamp=_T0, level="DEBUG", service="api", channel="api", created_at=_T0))
+    await db.commit()
+
+    # Facets are a snapshot until the next refresh.
+    assert (await svc.get_distinct("channel"))["values"] == ["cron", "pipeline"]
+    assert await svc.get_distinct_values("level") == ["ERROR", "INFO"]
+    assert (await svc.get_distinct("level", service="worker"))["values"] == ["ERROR", "INFO"]
+    # Narrowing filters still query log_entries directly.
+    assert (await svc.get_distinct("channel", stage="none"))["values"] == []
+
+    await svc.refresh_facets(retention_days=36500)
+    assert (await svc.get_distinct("channel"))["values"] == ["api", "cron", "pipeline"]
+    assert (await svc.get_distinct("level", service="worker"))["values"] == ["ERROR", "INFO"]
+
+
+async def test_facet_refresh_folds_late_rows_with_old_timestamps(db):
+    await _seed(db)
+    svc = LogService(db)
+    await svc.refresh_facets(retention_days=36500, id_overlap=0)
+
+    # A spill replay inserts a row stamped well behind the newest facet.
+    db.add(LogEntry(
+        timestamp=_T0 - timedelta(hours=6), level="WARNING", service="api",
+        channel="replayed", created_at=_T0,
+    ))
+    await db.commit()
+
+    await svc.refresh_facets(retention_days=36500, id_overlap=0)
+    assert (await svc.get_distinct("channel"))["values"] == ["cron", "pipeline", "replayed"]
+    assert await svc.get_distinct_values("level") == ["ERROR", "INFO", "WARNING"]
@@ -0,0 +1,164 @@
+"""Ingestion reads each file once: streamed download hashing and one shared
+ffprobe result (no ffmpeg/network required)."""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from pixsim7.backend.main.domain.enums import MediaType
+from pixsim7.backend.main.services.asset import ingestion
+from pixsim7.backend.main.services.asset.signal_analysis import stream_info_from_probe
+from pixsim7.backend.main.services.media import derivatives, download
+from pixsim7.backend.main.services.media.probe import MediaProbe
+from pixsim7.backend.main.services.storage.roots import LOCAL_ROOT_ID
+from pixsim7.backend.main.services.storage.storage_service import (
+    LocalStorageService,
+    TieredStorageService,
+)
+from pixsim7.backend.main.shared.video_utils import parse_video_metadata
+
+_FULL_PROBE = {
+    "streams": [
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2},
+        {
+            "codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720,
+            "r_frame_rate": "24/1", "duration": "5.04",
+            "side_data_list": [{"rotation": -90}],
+        },
+    ],
+    "format": {"format_name": "mov,mp4", "duration": "5.05", "size": "1000", "bit_rate": "2185000"},
+}
+
+
+def test_full_probe_feeds_metadata_and_signal_stream_info():
+    probe = MediaProbe(path="/clip.mp4", data=_FULL_PROBE)
+
+    meta = parse_video_metadata(probe.data)
+    # The audio stream listed first is skipped; -90 rotation swaps dimensions.
+    assert (meta["width"], meta["height"], meta["rotation"]) == (720, 1280, -90)
+    assert (meta["codec"], meta["fps"], meta["duration"]) == ("h264", 24.0, 5.04)
+    assert stream_info_from_probe(probe) == {
+        "audio_sample_rate": 44100, "audio_channels": 2, "duration_sec": 5.05,
+    }
+
+
+def test_thumbnail_validation_uses_shared_probe(monkeypatch):
+    def _no_spawn(*_args, **_kwargs):
+        raise AssertionError("validation must not re-probe")
+
+    monkeypatch.setattr(derivatives, "probe_media_file", _no_spawn)
+    asset = SimpleNamespace(id=1)
+
+    assert derivatives._validate_video_for_thumbnail(
+        asset, "/clip.mp4", probe=MediaProbe(path="/clip.mp4", data=_FULL_PROBE)
+    )
+    still_encoding = {"streams": [{"codec_type": "video"}], "format": {}}
+    assert not derivatives._validate_video_for_thumbnail(
+        asset, "/clip.mp4", probe=MediaProbe(path="/clip.mp4", data=still_encoding)
+    )
+    assert not derivatives._validate_video_for_thumbnail(
+        asset, "/clip.mp4", probe=MediaProbe(path="/clip.mp4", error="moov atom not found")
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingestion_probes_each_file_once(monkeypatch):
+    calls = []
+
+    def _probe(path):
+        calls.append(path)
+        return MediaProbe(path=path, data=_FULL_PROBE)
+
+    monkeypatch.setattr(ingestion, "probe_media_file", _probe)
+    svc = ingestion.AssetIngestionService.__new__(ingestion.AssetIngestionService)
+    svc._temp_paths, svc._file_digests, svc._media_probes = [], {}, {}
+    video = SimpleNamespace(id=1, media_type=MediaType.VIDEO)
+
+    first = await svc._media_probe(video, "/clip.mp4")
+    assert await svc._media_probe(video, "/clip.mp4") is first
+    assert await svc._media_probe(SimpleNamespace(id=2, media_type=MediaType.IMAGE), "/a.png") is None
+    assert calls == ["/clip.mp4"]
+
+    svc._cleanup_temp_files()
+    await svc._media_probe(video, "/clip.mp4")
+    assert calls == ["/clip.mp4", "/clip.mp4"]
+
+
+@pytest.mark.asyncio
+async def test_download_streams_to_content_key(monkeypatch, tmp_path):
+    payload = b"\x00video-bytes" * 50_000
+    storage = TieredStorageService({LOCAL_ROOT_ID: LocalStorageService(root_path=tmp_path)})
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=payload))
+    real_client = httpx.AsyncClient
+
+    monkeypatch.setattr(download, "get_storage_service", lambda: storage)
+    monkeypatch.setattr(
+        download.httpx, "AsyncClient", lambda **kw: real_client(transport=transport, **kw)
+    )
+    settings = SimpleNamespace(max_download_size_mb=5, storage_format_normalized=None)
+
+    def _asset(asset_id):
+        return SimpleNamespace(
+            id=asset_id, user_id=7, remote_url="https://cdn.example.com/clip.mp4",
+            media_type=MediaType.VIDEO, mime_type="video/mp4",
+            local_path=None, stored_key=None, storage_root_id=None,
+            file_size_bytes=None, sync_status=None, downloaded_at=None,
+        )
+
+    first, second = _asset(1), _asset(2)
+    got = await download.download_to_storage(first, settings)
+    again = await download.download_to_storage(second, settings)
+
+    digest = hashlib.sha256(payload).hexdigest()
+    assert (got.sha256, got.size_bytes) == (digest, len(payload))
+    assert Path(got.path).read_bytes() == payload
+    assert first.stored_key == second.stored_key and first.stored_key.endswith(f"{digest}.mp4")
+    assert first.file_size_bytes == len(payload)
+    # The deduplicated second download leaves no staging file behind.
+    assert again.path == got.path
+    assert not list(tmp_path.rglob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_download_stages_outside_content_and_sweeps_stale_parts(monkeypatch, tmp_path):
+    import os
+    import time
+
+    storage = TieredStorageService({LOCAL_ROOT_ID: LocalStorageService(root_path=tmp_path)})
+    staging = tmp_path / "u" / "7" / ".staging"
+    staging.mkdir(parents=True)
+    stale, fresh = staging / "tmpold.part", staging / "tmplive.part"
+    stale.write_bytes(b"x")
+    fresh.write_bytes(b"x")
+    old = time.time() - download.STALE_STAGING_SEC - 60
+    os.utime(stale, (old, old))
+
+    staged = []
+
+    def _fail(request):
+        staged.extend(p.name for p in staging.glob("*.part"))
+        return httpx.Response(500)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(download, "get_storage_service", lambda: storage)
+    monkeypatch.setattr(
+        download.httpx, "AsyncClient",
+        lambda **kw: real_client(transport=httpx.MockTransport(_fail), **kw),
+    )
+    settings = SimpleNamespace(max_download_size_mb=5, storage_format_normalized=None)
+    asset = SimpleNamespace(
+        id=3, user_id=7, remote_url="https://cdn.example.com/clip.mp4",
+        media_type=MediaType.VIDEO, mime_type="video/mp4",
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await download.download_to_storage(asset, settings, fast_single_attempt=True)
+
+    # The in-flight .part lived in .staging, never in the content directory.
+    assert len(set(staged)) == 2 and not list((tmp_path / "u" / "7").glob("content/*.part"))
+    assert not stale.exists() and fresh.exists()
+    assert sorted(p.name for p in staging.iterdir()) == ["tmplive.part"]
@@ -397,6 +397,8 @@ async def test_ensure_local_file_pulls_archived_original_to_temp():
     svc.storage = tier
     svc.settings = None
     svc._temp_paths = []
+    svc._file_digests = {}
+    svc._media_probes = {}
 
     asset = SimpleNamespace(
         id=1, local_path=None, storage_root_id="archive", stored_key=key, remote_url=None
@@ -427,6 +429,8 @@ async def test_ensure_local_file_archived_missing_returns_none():
     svc.storage = tier
     svc.settings = None
     svc._temp_paths = []
+    svc._file_digests = {}
+    svc._media_probes = {}
 
     asset = SimpleNamespace(
         id=1, local_path=None, storage_root_id="archive",
@@ -546,9 +550,12 @@ async def test_tiered_open_stream_routes_and_guards():
     status, headers, ct, body = await tier.open_stream("k", root_id="archive", range_header="bytes=0-9")
     assert status == 206 and ct == "video/mp4"
     assert b"".join([chunk async for chunk in body]) == b"abc"
-    # local backend has no open_stream -> NotImplementedError
+    # a backend without open_stream -> NotImplementedError
+    tier = TieredStorageService(
+        {LOCAL_ROOT_ID: LocalStorageService(root_path=tempfile.mkdtemp()), "archive": _NonLocalStub()}
+    )
     with pytest.raises(NotImplementedError):
-        await tier.open_stream("k", root_id=LOCAL_ROOT_ID)
+        await tier.open_stream("k", root_id="archive")
 
 
 @pytest.mark.asyncio
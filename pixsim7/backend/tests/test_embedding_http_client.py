@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 
 import httpx
+import numpy as np
 import pytest
 
 from pixsim7.embedding.http_client import HttpEmbeddingService, HttpTextEmbeddingService
@@ -177,3 +178,70 @@ async def test_text_caller_context_forwarded_as_headers() -> None:
     )
     assert res.vectors == [[0.2]]
     assert res.model_id == "text-m"
+
+
+# ── binary wire format ───────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_binary_wire_requested_and_decoded() -> None:
+    from pixsim7.embedding.wire import VECTORS_MEDIA_TYPE, encode_vectors
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content) == {"paths": ["/a.jpg", "/b.jpg"], "encoding": "f32"}
+        return httpx.Response(
+            200,
+            content=encode_vectors([[0.25, -0.5], [1.0, 0.125]], model_id="x"),
+            headers={"content-type": VECTORS_MEDIA_TYPE},
+        )
+
+    svc = _svc(handler)
+    svc._wire_encoding = "f32"
+    res = await svc.embed_images(EmbedRequest(paths=["/a.jpg", "/b.jpg"]))
+    # Handed back as the float32 array, not expanded into Python floats.
+    assert res.vectors.dtype == np.float32
+    assert res.vectors.tolist() == [[0.25, -0.5], [1.0, 0.125]]
+    assert res.dim == 2
+    assert res.model_id == "x"
+
+
+@pytest.mark.asyncio
+async def test_binary_wire_falls_back_to_json_reply() -> None:
+    # A daemon that predates the wire format ignores "encoding" and answers JSON.
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"embeddings": [[0.2]], "dim": 1})
+
+    svc = _text_svc(handler)
+    svc._wire_encoding = "f16"
+    res = await svc.embed_texts(EmbedTextRequest(texts=["hi"], model_id="text-m"))
+    assert res.vectors == [[0.2]]
+
+
+@pytest.mark.asyncio
+async def test_truncated_binary_body_is_service_error() -> None:
+    from pixsim7.embedding.wire import VECTORS_MEDIA_TYPE, encode_vectors
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = encode_vectors([[0.1, 0.2]], model_id="x")[:-2]
+        return httpx.Response(200, content=body, headers={"content-type": VECTORS_MEDIA_TYPE})
+
+    svc = _svc(handler)
+    svc._wire_encoding = "f32"
+    with pytest.raises(EmbeddingServiceError, match="malformed vector body"):
+        await svc.embed_images(EmbedRequest(paths=["/a.jpg"]))
+
+
+def test_wire_roundtrip_f16_and_empty() -> None:
+    import numpy as np
+
+    from pixsim7.embedding.wire import decode_vectors, encode_vectors
+
+    vecs = np.random.default_rng(0).standard_normal((3, 1152)).astype(np.float32)
+    arr, model_id = decode_vectors(encode_vectors(vecs, model_id="google/siglip2", encoding="f16"))
+    assert model_id == "google/siglip2"
+    assert arr.dtype == np.float32 and arr.shape == (3, 1152)
+    assert np.allclose(arr, vecs, atol=5e-3)
+    exact, _ = decode_vectors(encode_vectors(vecs, model_id="m"))
+    assert np.array_equal(exact, vecs)
+    empty, _ = decode_vectors(encode_vectors([], model_id="m"))
+    assert empty.shape == (0, 0)
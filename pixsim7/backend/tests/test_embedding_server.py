@@ -1,10 +1,11 @@
 """Unit tests for the embedding HTTP service's /health and /embed logic.
 
 Calls the route coroutines directly with a hand-built registry so no real model
-load (and no GPU / model download) happens — `load_model`/`embed_images` are
-monkeypatched. Validates: 503 while the default loads / errored, 200 once ready,
-503 'wedged' on a stuck in-flight request, default-model selection, allowed-set
-rejection (409), and lazy-load + LRU eviction with the default pinned.
+load (and no GPU / model download) happens — `load_model`/`prepare_inputs`/
+`embed_inputs` are monkeypatched. Validates: 503 while the default loads /
+errored, 200 once ready, 503 'wedged' on a stuck in-flight request,
+default-model selection, allowed-set rejection (409), lazy-load + LRU eviction
+with the default pinned, and cross-request micro-batching.
 """
 from __future__ import annotations
 
@@ -17,7 +18,9 @@ from pixsim7.embedding import server as srv
 from pixsim7.embedding.server import EmbedBody
 
 
-def _install_registry(monkeypatch, *, default="m/default", allowed=None, capacity=2):
+def _install_registry(
+    monkeypatch, *, default="m/default", allowed=None, capacity=2, max_batch=32, max_wait_sec=0.0
+):
     """Swap in a fresh registry whose loads are fake (no torch). Returns
     (registry, loads) where `loads` counts load_model calls per model_id."""
     allowed_set = set(allowed) if allowed is not None else {default}
@@ -29,14 +32,22 @@ def _install_registry(monkeypatch, *, default="m/default", allowed=None, capacit
         return (f"model:{model_id}", "proc", "cpu")
 
     monkeypatch.setattr(srv, "load_model", fake_load)
-    monkeypatch.setattr(
-        srv, "embed_images", lambda m, p, d, paths: [[0.5, 0.6] for _ in paths]
-    )
+    # Prepared "inputs" are just the path list; each forward pass is recorded.
+    monkeypatch.setattr(srv, "prepare_inputs", lambda proc, paths: list(paths))
+    forward_passes: list[list[list[str]]] = []
+
+    def fake_embed(model, device, batch):
+        forward_passes.append(batch)
+        return [[0.5, 0.6] for inputs in batch for _ in inputs]
+
+    monkeypatch.setattr(srv, "embed_inputs", fake_embed)
     reg = srv._ModelRegistry(
         default_model_id=default, allowed=allowed_set, capacity=capacity
     )
     srv.registry = reg
     srv.inflight = srv.InFlight()
+    srv.batcher = srv._EmbedBatcher(max_batch=max_batch, max_wait_sec=max_wait_sec)
+    reg.forward_passes = forward_passes
     return reg, loads
 
 
@@ -156,10 +167,10 @@ async def test_embed_rejects_non_image_paths_before_model_load(monkeypatch) -> N
 async def test_embed_rejects_unreadable_image_paths(monkeypatch) -> None:
     _reg, _loads = _install_registry(monkeypatch)
 
-    def fail_load(_model, _processor, _device, _paths):
+    def fail_load(_processor, _paths):
         raise srv.EmbeddingImageLoadError("/bad.jpg", "cannot identify image file")
 
-    monkeypatch.setattr(srv, "embed_images", fail_load)
+    monkeypatch.setattr(srv, "prepare_inputs", fail_load)
 
     code, body = _resp(await srv.embed(EmbedBody(paths=["/bad.jpg"])))
     assert code == 400
@@ -188,6 +199,70 @@ async def test_embed_model_load_failure_is_503(monkeypatch) -> None:
     assert body["model_id"] == "m/bad"
 
 
+# ── cross-request micro-batching ────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_forward_pass(monkeypatch) -> None:
+    import asyncio
+
+    reg, _ = _install_registry(monkeypatch, max_wait_sec=0.05)
+    await reg.ensure_default()
+    results = await asyncio.gather(
+        srv.embed(EmbedBody(paths=["/a.jpg"])),
+        srv.embed(EmbedBody(paths=["/b.jpg", "/c.jpg"])),
+        srv.embed(EmbedBody(paths=["/d.jpg"])),
+    )
+    # One pass over all three requests, each getting back its own slice.
+    assert reg.forward_passes == [[["/a.jpg"], ["/b.jpg", "/c.jpg"], ["/d.jpg"]]]
+    assert [len(r["embeddings"]) for r in results] == [1, 2, 1]
+    health = await srv.health()
+    assert health["batching"]["batches"] == 1
+    assert health["batching"]["batch_images_hist"] == {"4": 1}
+    assert health["batching"]["batch_requests_hist"] == {"4": 1}
+    assert health["batching"]["queue_depth"] == {}
+
+
+@pytest.mark.asyncio
+async def test_batches_close_at_max_batch(monkeypatch) -> None:
+    import asyncio
+
+    reg, _ = _install_registry(monkeypatch, max_batch=2, max_wait_sec=0.05)
+    await reg.ensure_default()
+    await asyncio.gather(
+        srv.embed(EmbedBody(paths=["/a.jpg"])),
+        srv.embed(EmbedBody(paths=["/b.jpg"])),
+        srv.embed(EmbedBody(paths=["/c.jpg", "/d.jpg", "/e.jpg"])),  # oversize: alone
+    )
+    assert [sum(len(i) for i in p) for p in reg.forward_passes] == [2, 3]
+
+
+def test_batch_env_allows_zero_wait_but_not_zero_batch(monkeypatch) -> None:
+    monkeypatch.setenv("PIXSIM_EMBEDDING_MAX_WAIT_MS", "0")
+    monkeypatch.setenv("PIXSIM_EMBEDDING_MAX_BATCH", "0")
+    assert srv._env_int("PIXSIM_EMBEDDING_MAX_WAIT_MS", 10, minimum=0) == 0
+    assert srv._env_int("PIXSIM_EMBEDDING_MAX_BATCH", 32) == 1
+
+
+@pytest.mark.asyncio
+async def test_forward_pass_failure_reaches_every_request(monkeypatch) -> None:
+    import asyncio
+
+    reg, _ = _install_registry(monkeypatch, max_wait_sec=0.05)
+
+    def boom(_model, _device, _batch):
+        raise RuntimeError("cuda oom")
+
+    monkeypatch.setattr(srv, "embed_inputs", boom)
+    results = await asyncio.gather(
+        srv.embed(EmbedBody(paths=["/a.jpg"])),
+        srv.embed(EmbedBody(paths=["/b.jpg"])),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert srv.inflight.count == 0
+
+
 # ── registry: lazy-load + LRU eviction (default pinned) ──────────────────
 
 
@@ -307,3 +382,16 @@ async def test_set_allowed_models_route_switches_default(monkeypatch) -> None:
             break
         await asyncio.sleep(0.01)
     assert reg.default_model_id == "m/new"
+
+
+@pytest.mark.asyncio
+async def test_embed_binary_encoding(monkeypatch) -> None:
+    from pixsim7.embedding.wire import VECTORS_MEDIA_TYPE, decode_vectors
+
+    reg, _ = _install_registry(monkeypatch)
+    res = await srv.embed(EmbedBody(paths=["/a.jpg", "/b.jpg"], encoding="f32"))
+    assert res.media_type == VECTORS_MEDIA_TYPE
+    arr, model_id = decode_vectors(res.body)
+    assert model_id == reg.default_model_id
+    assert arr.shape == (2, 2)
+    assert arr.tolist() == [[0.5, 0.6000000238418579]] * 2
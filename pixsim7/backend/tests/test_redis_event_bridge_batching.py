@@ -0,0 +1,160 @@
+"""Batched Redis event bridge: windowed pipelined publish, coalescing, family channels."""
+
+import asyncio
+import json
+
+import pytest
+
+from pixsim7.backend.main.infrastructure.events import redis_bridge
+from pixsim7.backend.main.infrastructure.events.bus import Event, EventBus, register_event_type
+from pixsim7.backend.main.infrastructure.events.redis_bridge import (
+    RedisEventBridge,
+    event_family,
+)
+
+register_event_type("bridgetest:progress", coalesce_by="generation_id")
+register_event_type("bridgetest:done")
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queued = []
+
+    def publish(self, channel, message):
+        self._queued.append((channel, message))
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        self._redis.published.extend(self._queued)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.published = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def publish(self, channel, message):
+        self.round_trips += 1
+        self.published.append((channel, message))
+
+
+def _bridge(mode="batched", **kwargs):
+    bridge = RedisEventBridge(role="test", mode=mode, batch_window_ms=5, **kwargs)
+    bridge._publisher = _FakeRedis()
+    return bridge
+
+
+def _events(bridge):
+    out = []
+    for channel, message in bridge._publisher.published:
+        for item in json.loads(message)["events"]:
+            out.append((channel, item["event_type"], item["data"]))
+    return out
+
+
+def test_event_family():
+    assert event_family("job:created") == "job"
+    assert event_family("analysis.completed") == "analysis"
+    assert event_family("system_config:reloaded") == "system_config"
+
+
+@pytest.mark.asyncio
+async def test_burst_is_one_pipelined_round_trip_per_window():
+    bridge = _bridge()
+    for i in range(20):
+        await bridge._publish_remote(Event("bridgetest:done", {"n": i}))
+        await bridge._publish_remote(Event("job:started", {"generation_id": i}))
+    assert bridge._publisher.published == []
+
+    await asyncio.sleep(0.02)
+    assert bridge._publisher.round_trips == 1
+    channels = [channel for channel, _ in bridge._publisher.published]
+    assert channels == ["pixsim7:events:v2:bridgetest", "pixsim7:events:v2:job"]
+    done = [data["n"] for _, event_type, data in _events(bridge) if event_type == "bridgetest:done"]
+    assert done == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_superseded_updates_coalesce_to_latest():
+    bridge = _bridge()
+    await bridge._publish_remote(Event("bridgetest:progress", {"generation_id": 1, "pct": 10}))
+    await bridge._publish_remote(Event("bridgetest:progress", {"generation_id": 2, "pct": 10}))
+    await bridge._publish_remote(Event("bridgetest:done", {"generation_id": 1}))
+    await bridge._publish_remote(Event("bridgetest:progress", {"generation_id": 1, "pct": 90}))
+    await bridge._publish_remote(Event("bridgetest:done", {"generation_id": 1}))
+    await bridge._flush()
+
+    assert [(t, d) for _, t, d in _events(bridge)] == [
+        ("bridgetest:progress", {"generation_id": 2, "pct": 10}),
+        ("bridgetest:done", {"generation_id": 1}),
+        ("bridgetest:progress", {"generation_id": 1, "pct": 90}),
+        ("bridgetest:done", {"generation_id": 1}),  # not registered for coalescing
+    ]
+    assert bridge.stats["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_batch_flushes_without_waiting_for_window():
+    bridge = _bridge(max_batch=3)
+    for i in range(3):
+        await bridge._publish_remote(Event("bridgetest:done", {"n": i}))
+    assert bridge._publisher.round_trips == 1
+    assert len(_events(bridge)) == 3
+    if bridge._flush_task:
+        bridge._flush_task.cancel()
+
+
+def test_subscriptions_follow_families():
+    assert _bridge(mode="immediate")._subscriptions() == ([RedisEventBridge.CHANNEL], [])
+    assert _bridge()._subscriptions() == ([], ["pixsim7:events:v2:*"])
+    assert _bridge(families=["job", "asset"])._subscriptions() == (
+        ["pixsim7:events:v2:asset", "pixsim7:events:v2:job"],
+        [],
+    )
+    assert _bridge(families=())._subscriptions() == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_listener_republishes_batches_locally(monkeypatch):
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append((event.event_type, event.data))
+
+    bus.subscribe("bridgetest:done", handler)
+    monkeypatch.setattr(redis_bridge, "event_bus", bus)
+
+    bridge = _bridge()
+    own = json.dumps({"origin": bridge._origin, "events": [{"event_type": "bridgetest:done", "data": {"n": 0}}]})
+    remote = json.dumps({
+        "origin": "other",
+        "events": [
+            {"event_type": "bridgetest:done", "data": {"n": 1}, "timestamp": "2026-01-01T00:00:00+00:00"},
+            {"event_type": "bridgetest:done", "data": {"n": 2}},
+        ],
+    })
+
+    class _PubSub:
+        async def listen(self):
+            for payload in (own, remote):
+                yield {"type": "pmessage", "channel": "pixsim7:events:v2:bridgetest", "data": payload}
+            bridge._stopping.set()
+
+    bridge._pubsub = _PubSub()
+    await bridge._listen_loop()
+    await asyncio.sleep(0)
+    assert received == [("bridgetest:done", {"n": 1}), ("bridgetest:done", {"n": 2})]
+
+
+@pytest.mark.asyncio
+async def test_immediate_mode_publishes_each_event():
+    bridge = _bridge(mode="immediate")
+    await bridge._publish_remote(Event("bridgetest:done", {"n": 1}))
+    await bridge._publish_remote(Event("bridgetest:done", {"n": 2}))
+    assert bridge._publisher.round_trips == 2
+    assert {channel for channel, _ in bridge._publisher.published} == {RedisEventBridge.CHANNEL}
@@ -43,6 +43,17 @@ async def test_embed_texts_happy() -> None:
     assert srv.inflight.count == 0  # wedge-guard bookkeeping cleaned up
 
 
+@pytest.mark.asyncio
+async def test_embed_texts_binary_encoding() -> None:
+    from pixsim7.embedding.wire import VECTORS_MEDIA_TYPE, decode_vectors
+
+    res = await srv.embed_texts(EmbedTextsBody(texts=["a", "b"], encoding="f16"))
+    assert res.media_type == VECTORS_MEDIA_TYPE
+    arr, model_id = decode_vectors(res.body)
+    assert model_id == srv.MODEL_ID
+    assert arr.shape == (2, 2)
+
+
 @pytest.mark.asyncio
 async def test_embed_reports_swapped_model() -> None:
     # After a /config warm-swap, embed + health report the now-served model id.
@@ -0,0 +1,198 @@
+"""ConnectionManager fanout: encode once, per-connection queues, overflow policy."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from pixsim7.backend.main.infrastructure.websocket import manager as manager_module
+from pixsim7.backend.main.infrastructure.websocket.manager import ConnectionManager
+from pixsim7.backend.main.infrastructure.websocket.outbound import OutboundQueue
+
+
+class _FakeSocket:
+    def __init__(self, *, gate: asyncio.Event | None = None, fail: bool = False):
+        self.gate = gate
+        self.fail = fail
+        self.received: list[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.fail:
+            raise RuntimeError("socket closed")
+        if self.gate is not None:
+            await self.gate.wait()
+        self.received.append(json.loads(text))
+
+    async def send_json(self, message: dict):
+        await self.send_text(json.dumps(message))
+
+
+async def _drain():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _close_all(manager: ConnectionManager) -> None:
+    for ws, user_id in list(manager._connection_users.items()):
+        manager.disconnect(ws, user_id)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_reaches_every_socket(monkeypatch):
+    encodes = []
+    real_encode = manager_module.encode_message
+    monkeypatch.setattr(
+        manager_module, "encode_message", lambda m: encodes.append(m) or real_encode(m)
+    )
+    manager = ConnectionManager()
+    sockets = [_FakeSocket() for _ in range(20)]
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, user_id=i % 2)
+
+    await manager.broadcast({"type": "asset:created", "asset_id": 1})
+    await manager.broadcast_to_user({"type": "message", "n": 2}, 1)
+    await _drain()
+
+    assert len(encodes) == 2
+    assert all(ws.received[0] == {"type": "asset:created", "asset_id": 1} for ws in sockets)
+    assert [len(ws.received) for ws in sockets] == [1, 2] * 10
+    _close_all(manager)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_stall_others():
+    manager = ConnectionManager(max_queue_size=3)
+    gate = asyncio.Event()
+    slow, fast = _FakeSocket(gate=gate), _FakeSocket()
+    await manager.connect(slow, 1)
+    await manager.connect(fast, 1)
+
+    for n in range(6):
+        await manager.broadcast({"type": "tick", "n": n})
+        await _drain()
+
+    assert [m["n"] for m in fast.received] == list(range(6))
+    assert slow.received == []
+    stats = manager.get_stats()
+    # n=0 is in flight on the slow socket; 1 and 2 were dropped to fit 3..5.
+    assert stats["queued"] == 3 and stats["dropped"] == 2
+
+    gate.set()
+    await _drain()
+    assert [m["n"] for m in slow.received] == [0, 3, 4, 5]
+    _close_all(manager)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_key_moves_latest_to_tail():
+    manager = ConnectionManager()
+    gate = asyncio.Event()
+    ws = _FakeSocket(gate=gate)
+    await manager.connect(ws, 1)
+
+    await manager.broadcast({"type": "first"})  # in flight
+    await _drain()
+    await manager.broadcast({"type": "bridge", "connected": False}, coalesce_key="bridge")
+    await manager.broadcast({"type": "asset:created"})
+    await manager.broadcast({"type": "bridge", "connected": True}, coalesce_key="bridge")
+    gate.set()
+    await _drain()
+
+    assert ws.received == [
+        {"type": "first"},
+        {"type": "asset:created"},
+        {"type": "bridge", "connected": True},
+    ]
+    stats = manager.get_stats()
+    assert stats["coalesced"] == 1
+    assert "per_connection" not in stats  # served on /health: aggregates only
+    assert manager.get_connection_stats() == [
+        {"user_id": 1, "depth": 0, "peak_depth": 2, "sent": 3, "dropped": 0, "coalesced": 1}
+    ]
+    _close_all(manager)
+
+
+@pytest.mark.asyncio
+async def test_failed_send_disconnects_connection():
+    manager = ConnectionManager()
+    dead, alive = _FakeSocket(fail=True), _FakeSocket()
+    await manager.connect(dead, 7)
+    await manager.connect(alive, 7)
+
+    await manager.broadcast({"type": "x"})
+    await _drain()
+
+    assert manager.get_connection_count() == 1
+    assert manager.get_user_connection_count(7) == 1
+    await manager.broadcast({"type": "y"})
+    await _drain()
+    assert [m["type"] for m in alive.received] == ["x", "y"]
+    _close_all(manager)
+    assert manager.get_stats()["sent"] == 2
+
+
+class _TextSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+async def _drain_queue(queue: OutboundQueue):
+    while queue.depth:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_update_is_not_sent_ahead_of_earlier_messages():
+    ws = _TextSocket()
+    queue = OutboundQueue(ws)
+
+    queue.put("progress 10%", coalesce_key="job:1")
+    queue.put("job:2 completed")
+    queue.put("progress 60%", coalesce_key="job:1")
+    queue.put("progress 5%", coalesce_key="job:3")
+    await _drain_queue(queue)
+
+    assert ws.sent == ["job:2 completed", "progress 60%", "progress 5%"]
+    assert (queue.sent, queue.coalesced, queue.dropped) == (3, 1, 0)
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_oldest_and_forgets_its_coalesce_key():
+    ws = _TextSocket()
+    queue = OutboundQueue(ws, max_size=2)
+
+    queue.put("state 1", coalesce_key="state")
+    queue.put("a")
+    queue.put("b")  # evicts "state 1"
+    queue.put("state 2", coalesce_key="state")  # evicts "a"
+    await _drain_queue(queue)
+
+    assert ws.sent == ["b", "state 2"]
+    assert (queue.dropped, queue.coalesced, queue.max_depth) == (2, 0, 2)
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_repeated_coalescing_compacts_dead_entries():
+    ws = _TextSocket()
+    queue = OutboundQueue(ws, max_size=4)
+
+    queue.put("head")
+    for n in range(50):
+        queue.put(f"progress {n}", coalesce_key="job")
+
+    assert queue.depth == 2
+    assert len(queue._items) <= 2 * queue.max_size
+    await _drain_queue(queue)
+    assert ws.sent == ["head", "progress 49"]
+    assert (queue.coalesced, queue.dropped) == (49, 0)
+    queue.close()
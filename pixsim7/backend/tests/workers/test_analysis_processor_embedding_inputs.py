@@ -49,12 +49,13 @@ async def test_video_embedding_extracts_jpeg_frames_instead_of_sending_mp4(
     monkeypatch.setattr(embedding_inputs, "_validate_video_for_thumbnail", lambda *_args: True)
     monkeypatch.setattr(embedding_inputs, "_validate_extracted_frame", lambda *_args: True)
 
-    async def _fake_extract(local_path: str, output_path: str, **kwargs) -> bool:
-        Path(output_path).write_bytes(b"jpeg")
-        calls.append({"local_path": local_path, "output_path": output_path, **kwargs})
-        return True
+    async def _fake_extract(local_path: str, outputs, **kwargs) -> list[bool]:
+        for output in outputs:
+            Path(output.output_path).write_bytes(b"jpeg")
+        calls.append({"local_path": local_path, "outputs": outputs, **kwargs})
+        return [True] * len(outputs)
 
-    monkeypatch.setattr(embedding_inputs, "extract_video_frame", _fake_extract)
+    monkeypatch.setattr(embedding_inputs, "extract_video_frames", _fake_extract)
 
     config = resolve_embedding_input_config({"video_frame_count": 3})
     paths, cleanup_paths, input_kind = await embedding_inputs.resolve_embedding_input_paths(
@@ -69,9 +70,12 @@ async def test_video_embedding_extracts_jpeg_frames_instead_of_sending_mp4(
         assert paths == cleanup_paths
         assert all(Path(path).suffix == ".jpg" for path in paths)
         assert str(video_path) not in paths
-        assert [call["local_path"] for call in calls] == [str(video_path)] * 3
-        assert [call["timestamp"] for call in calls] == pytest.approx([1.0, 2.0, 3.0])
-        assert all(call["target_size"] == (384, 384) for call in calls)
+        # All frames come from one decode of the source video.
+        assert [call["local_path"] for call in calls] == [str(video_path)]
+        outputs = calls[0]["outputs"]
+        assert [o.output_path for o in outputs] == paths
+        assert [o.timestamp for o in outputs] == pytest.approx([1.0, 2.0, 3.0])
+        assert all(o.target_size == (384, 384) for o in outputs)
     finally:
         embedding_inputs.cleanup_embedding_input_paths(cleanup_paths)
 
@@ -113,3 +117,21 @@ def test_video_embedding_mean_pool_is_l2_normalized() -> None:
     )
 
     assert pooled == pytest.approx([0.70710678, 0.70710678])
+
+
+def test_video_embedding_mean_pool_of_wire_array_matches_lists() -> None:
+    np = pytest.importorskip("numpy")
+    vectors = [[1.0, 0.0], [0.0, 1.0], [0.5, 0.25]]
+    config = {"video_frame_aggregation": "mean"}
+    pooled = embedding_inputs.aggregate_embedding_vectors(
+        np.asarray(vectors, dtype=np.float32), input_kind="video_frames", config=config,
+    )
+
+    assert all(isinstance(v, float) for v in pooled)
+    assert pooled == pytest.approx(
+        embedding_inputs.aggregate_embedding_vectors(vectors, input_kind="video_frames", config=config)
+    )
+    single = embedding_inputs.aggregate_embedding_vectors(
+        np.asarray(vectors[:1], dtype=np.float32), input_kind="image", config=config,
+    )
+    assert single == [1.0, 0.0]
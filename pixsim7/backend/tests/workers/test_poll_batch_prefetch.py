@@ -0,0 +1,199 @@
+"""Per-account batched status resolution ahead of the per-generation poll fan-out."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from pixsim7.backend.main.domain.enums import OperationType
+from pixsim7.backend.main.services.provider import provider_service as provider_service_module
+from pixsim7.backend.main.services.provider.adapters.pixverse_status import (
+    PIXVERSE_BATCH_FAILED_SENTINEL,
+    _scan_list_pages,
+    pixverse_status_batch_cache_key,
+)
+from pixsim7.backend.main.services.provider.provider_service import ProviderService
+from pixsim7.backend.main.workers import status_poller
+from pixsim7.backend.main.workers._poller_snapshots import _ProcessingGenerationSnapshot
+
+pytestmark = pytest.mark.asyncio
+
+
+def _pages(total, page_size):
+    ids = [str(i) for i in range(total)]
+    calls = []
+
+    async def fetch(offset):
+        calls.append(offset)
+        return [{"id": i} for i in ids[offset:offset + page_size]]
+
+    return fetch, calls
+
+
+async def _scan(fetch, wanted, *, max_pages=5, limit=10):
+    results, stats = {}, {}
+
+    def collect(items):
+        results.update({item["id"]: item for item in items})
+
+    await _scan_list_pages(
+        fetch, collect, results,
+        limit=limit, offset=0, wanted_ids=wanted, max_pages=max_pages, scan_stats=stats,
+    )
+    return results, stats
+
+
+async def test_scan_pages_until_wanted_ids_found():
+    fetch, calls = _pages(100, 10)
+    _, stats = await _scan(fetch, {"3", "25", "27"})
+    assert calls == [0, 10, 20]
+    assert stats == {"list_calls": 3}
+
+    # No wanted ids: original single-page read.
+    fetch, calls = _pages(100, 10)
+    await _scan(fetch, None)
+    assert calls == [0]
+
+    # A lone straggler is cheaper as one per-id get than as more pages.
+    fetch, calls = _pages(100, 10)
+    await _scan(fetch, {"3", "95"})
+    assert calls == [0]
+
+    # Short page = end of list; max_pages bounds the scan.
+    fetch, calls = _pages(15, 10)
+    await _scan(fetch, {"900", "901"})
+    assert calls == [0, 10]
+    fetch, calls = _pages(100, 10)
+    await _scan(fetch, {"900", "901"}, max_pages=3)
+    assert calls == [0, 10, 20]
+
+
+async def test_prefetch_fills_poll_cache_and_keeps_seeded_results(monkeypatch):
+    seen = {}
+
+    class _Provider:
+        async def check_video_statuses_from_list(self, account, *, limit, offset, wanted_ids, max_pages, scan_stats):
+            seen.update(wanted=set(wanted_ids), max_pages=max_pages)
+            scan_stats["list_calls"] = scan_stats.get("list_calls", 0) + 2
+            return {"a": "listed-a", "b": "listed-b", "z": "other"}
+
+        async def check_image_statuses_from_list(self, account, **kwargs):
+            raise RuntimeError("session expired")
+
+    monkeypatch.setattr(provider_service_module.registry, "get", lambda provider_id: _Provider())
+    account = SimpleNamespace(id=7)
+    video_key = pixverse_status_batch_cache_key(7, is_image=False)
+    poll_cache = {video_key: {"b": "recovered-b"}}
+    scan_stats = {}
+
+    resolved = await ProviderService.prefetch_batch_statuses(
+        poll_cache, account=account, is_image=False,
+        provider_job_ids=["a", "b", "c"], max_pages=3, scan_stats=scan_stats,
+    )
+
+    assert resolved == 2
+    assert seen == {"wanted": {"a", "b", "c"}, "max_pages": 3}
+    assert scan_stats == {"list_calls": 2}
+    assert poll_cache[video_key] == {"a": "listed-a", "b": "recovered-b", "z": "other"}
+
+    resolved = await ProviderService.prefetch_batch_statuses(
+        poll_cache, account=account, is_image=True, provider_job_ids=["x"],
+    )
+    assert resolved == 0
+    assert poll_cache[pixverse_status_batch_cache_key(7, is_image=True)] == PIXVERSE_BATCH_FAILED_SENTINEL
+
+
+def _generation(generation_id, op, provider="pixverse"):
+    return _ProcessingGenerationSnapshot(
+        id=generation_id,
+        account_id=1,
+        operation_type=op,
+        started_at=datetime.now(timezone.utc),
+        attempt_id=1,
+        provider_id=provider,
+    )
+
+
+async def test_poller_groups_due_jobs_per_account_and_kind(monkeypatch):
+    generations = [
+        _generation(1, OperationType.IMAGE_TO_VIDEO),
+        _generation(2, OperationType.TEXT_TO_VIDEO),
+        _generation(3, OperationType.IMAGE_TO_VIDEO),
+        _generation(4, OperationType.TEXT_TO_IMAGE),
+        _generation(5, OperationType.VIDEO_EXTEND),
+        _generation(6, OperationType.IMAGE_TO_VIDEO, provider="other"),
+        _generation(7, OperationType.IMAGE_TO_VIDEO),  # no job id yet
+    ]
+    loaded = []
+    prefetched = {}
+
+    async def _jobs(db, batchable):
+        loaded.append(sorted(g.id for g in batchable))
+        return {1: (101, 10, "j1"), 2: (102, 10, "j2"), 3: (103, 11, "j3"), 4: (104, 10, "j4")}
+
+    async def _account_batch(account_id, is_image, provider_job_ids, poll_cache, scan_stats):
+        prefetched[(account_id, is_image)] = set(provider_job_ids)
+        scan_stats["list_calls"] = scan_stats.get("list_calls", 0) + 1
+        if account_id == 11:
+            raise RuntimeError("account gone")
+        return len(provider_job_ids)
+
+    class _DB:
+        async def rollback(self):
+            pass
+
+    monkeypatch.setattr(status_poller, "_load_polled_provider_jobs", _jobs)
+    monkeypatch.setattr(status_poller, "_prefetch_account_batch", _account_batch)
+
+    list_calls, resolved = await status_poller._prefetch_batch_statuses(
+        _DB(), generations, {}, max_concurrency=4,
+    )
+
+    assert loaded == [[1, 2, 3, 4, 7]]
+    assert prefetched == {(10, False): {"j1", "j2"}, (11, False): {"j3"}, (10, True): {"j4"}}
+    assert (list_calls, resolved) == (3, 3)
+
+
+async def test_backed_off_jobs_are_left_out_of_the_prefetch(monkeypatch):
+    generations = [
+        _generation(1, OperationType.IMAGE_TO_VIDEO),
+        _generation(2, OperationType.IMAGE_TO_VIDEO),
+        _generation(3, OperationType.IMAGE_TO_VIDEO),
+    ]
+    prefetched = {}
+
+    async def _jobs(db, batchable):
+        return {1: (101, 10, "j1"), 2: (102, 10, "j2"), 3: (103, 11, "j3")}
+
+    async def _account_batch(account_id, is_image, provider_job_ids, poll_cache, scan_stats):
+        prefetched[account_id] = set(provider_job_ids)
+        scan_stats["list_calls"] = scan_stats.get("list_calls", 0) + 1
+        return len(provider_job_ids)
+
+    class _DB:
+        async def rollback(self):
+            pass
+
+    def _key(generation_id, submission_id, account_id, job_id):
+        return status_poller._transient_poll_key(
+            generation_id=generation_id, submission_id=submission_id,
+            account_id=account_id, provider_job_id=job_id,
+        )
+
+    monkeypatch.setattr(status_poller, "_load_polled_provider_jobs", _jobs)
+    monkeypatch.setattr(status_poller, "_prefetch_account_batch", _account_batch)
+    now = status_poller.time.monotonic()
+    # Account 10: one job rate-limited, the other adaptively deferred.
+    monkeypatch.setitem(status_poller._transient_poll_backoff, _key(1, 101, 10, "j1"),
+                        status_poller._TransientPollBackoffState(failures=1, cooldown_until_mono=now + 60))
+    status_poller._record_adaptive_poll_defer(_key(2, 102, 10, "j2"), 60, now_mono=now)
+    try:
+        list_calls, resolved = await status_poller._prefetch_batch_statuses(
+            _DB(), generations, {}, max_concurrency=4,
+        )
+    finally:
+        status_poller._clear_adaptive_poll_defer(_key(2, 102, 10, "j2"))
+
+    assert prefetched == {11: {"j3"}}
+    assert (list_calls, resolved) == (1, 1)
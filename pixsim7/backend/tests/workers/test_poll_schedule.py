@@ -0,0 +1,244 @@
+"""Deadline-scheduled status polling: slot ownership, due claims, rescheduling."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pixsim7.backend.main.domain.enums import OperationType
+from pixsim7.backend.main.infrastructure.queue import poll_schedule
+from pixsim7.backend.main.infrastructure.queue.poll_schedule import (
+    POLL_MEMBERS_KEY,
+    POLL_SCHEDULE_SLOTS,
+    claim_due_generation_polls,
+    heartbeat_poll_worker,
+    leave_poll_workers,
+    owned_slots,
+    poll_schedule_key,
+    poll_schedule_slot,
+    schedule_generation_polls,
+    unschedule_generation_polls,
+)
+from pixsim7.backend.main.workers import status_poller
+from pixsim7.backend.main.workers._poller_snapshots import (
+    _PollGenerationResult,
+    _ProcessingGenerationSnapshot,
+)
+
+
+class FakeRedis:
+    """Sorted-set subset used by the poll schedule."""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    async def zadd(self, key, mapping, nx=False, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if (nx and member in zset) or (xx and member not in zset):
+                continue
+            zset[member] = float(score)
+
+    def _in_range(self, key, lo, hi):
+        lo = float(lo)
+        hi = float(hi)
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]))
+        return [m for m, score in items if lo <= score <= hi]
+
+    async def zrangebyscore(self, key, lo, hi, start=None, num=None):
+        members = self._in_range(key, lo, hi)
+        if start is not None:
+            members = members[start:start + num]
+        return members
+
+    async def zremrangebyscore(self, key, lo, hi):
+        for member in self._in_range(key, lo, hi):
+            del self.zsets[key][member]
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    async def zrange(self, key, start, end):
+        return self._in_range(key, "-inf", "+inf")
+
+    async def eval(self, script, numkeys, *args):
+        # Python rendering of the claim script (the only one the schedule runs).
+        assert script == poll_schedule._CLAIM_DUE_LUA
+        keys, (now, limit, lease_until) = args[:numkeys], args[numkeys:]
+        claimed = []
+        for key in keys:
+            remaining = limit - len(claimed)
+            if remaining <= 0:
+                break
+            for member in self._in_range(key, "-inf", now)[:remaining]:
+                self.zsets[key][member] = float(lease_until)
+                claimed.append(member)
+        return claimed
+
+    def score(self, generation_id):
+        return self.zsets.get(poll_schedule_key(poll_schedule_slot(generation_id)), {}).get(str(generation_id))
+
+
+def _snapshot(generation_id, *, op=OperationType.IMAGE_TO_VIDEO, provider="pixverse", age=30.0):
+    return _ProcessingGenerationSnapshot(
+        id=generation_id,
+        account_id=1,
+        operation_type=op,
+        started_at=datetime.now(timezone.utc) - timedelta(seconds=age),
+        attempt_id=1,
+        provider_id=provider,
+    )
+
+
+def test_slot_ownership_partitions_and_moves_minimally():
+    workers = ["a:1", "b:2", "c:3"]
+    owners = {w: set(owned_slots(w, workers)) for w in workers}
+    assert set().union(*owners.values()) == set(range(POLL_SCHEDULE_SLOTS))
+    assert sum(len(slots) for slots in owners.values()) == POLL_SCHEDULE_SLOTS
+
+    # c leaves: a and b keep everything they had and split c's slots.
+    survivors = ["a:1", "b:2"]
+    for w in survivors:
+        assert owners[w] <= set(owned_slots(w, survivors))
+
+
+@pytest.mark.asyncio
+async def test_claim_returns_only_due_and_leases_them():
+    redis = FakeRedis()
+    now = 1_000.0
+    await schedule_generation_polls(redis, {1: now - 5, 2: now, 3: now + 30, 4: now - 1})
+    every_slot = range(POLL_SCHEDULE_SLOTS)
+
+    claimed = await claim_due_generation_polls(redis, every_slot, now=now, limit=2, lease_seconds=60)
+    assert len(claimed) == 2
+    assert all(redis.score(gid) == now + 60 for gid in claimed)
+    rest = await claim_due_generation_polls(redis, every_slot, now=now, limit=10, lease_seconds=60)
+    assert sorted(claimed + rest) == [1, 2, 4]
+    assert await claim_due_generation_polls(redis, every_slot, now=now, limit=10, lease_seconds=60) == []
+
+    # only_new keeps an existing deadline; unschedule removes it for good.
+    await schedule_generation_polls(redis, {3: now}, only_new=True)
+    assert redis.score(3) == now + 30
+    await unschedule_generation_polls(redis, [3])
+    assert redis.score(3) is None
+
+
+@pytest.mark.asyncio
+async def test_claim_script_leases_each_generation_once(lua_redis):
+    now = 1_000.0
+    await schedule_generation_polls(lua_redis, {gid: now - gid for gid in range(1, 9)})
+    await schedule_generation_polls(lua_redis, {9: now + 30})
+    every_slot = range(POLL_SCHEDULE_SLOTS)
+
+    # Two pollers that both think they own every slot race for the same ids.
+    first, second = await asyncio.gather(*(
+        claim_due_generation_polls(lua_redis, every_slot, now=now, limit=5, lease_seconds=60)
+        for _ in range(2)
+    ))
+    assert len(first) == 5
+    assert not set(first) & set(second)
+    assert sorted(first + second) == list(range(1, 9))
+    for gid in first + second:
+        key = poll_schedule_key(poll_schedule_slot(gid))
+        assert await lua_redis.zscore(key, str(gid)) == now + 60
+    assert await lua_redis.zscore(poll_schedule_key(poll_schedule_slot(9)), "9") == now + 30
+
+    # Expired leases come back; an unscheduled generation does not.
+    await unschedule_generation_polls(lua_redis, [9])
+    again = await claim_due_generation_polls(
+        lua_redis, every_slot, now=now + 100, limit=20, lease_seconds=60
+    )
+    assert sorted(again) == list(range(1, 9))
+
+
+@pytest.mark.asyncio
+async def test_leaving_poller_hands_its_slots_over_at_once():
+    redis = FakeRedis()
+    await heartbeat_poll_worker(redis, "a:1", now=100.0)
+    assert len(await heartbeat_poll_worker(redis, "b:2", now=100.0)) < POLL_SCHEDULE_SLOTS
+
+    await leave_poll_workers(redis, "a:1")
+    assert "a:1" not in redis.zsets[POLL_MEMBERS_KEY]
+    assert len(await heartbeat_poll_worker(redis, "b:2", now=101.0)) == POLL_SCHEDULE_SLOTS
+
+
+def test_next_poll_delay_by_operation_and_age():
+    now = datetime.now(timezone.utc)
+
+    def delay(op, provider, age):
+        return status_poller._compute_next_poll_delay_seconds(
+            provider_id=provider,
+            operation_type=op,
+            generation_started_at=now - timedelta(seconds=age),
+            now=now,
+        )
+
+    assert delay(OperationType.IMAGE_TO_VIDEO, "pixverse", 10) == 2
+    assert delay(OperationType.IMAGE_TO_VIDEO, "pixverse", 100) == 6
+    assert delay(OperationType.TEXT_TO_IMAGE, "pixverse", 3600) == 2
+    assert delay(OperationType.IMAGE_TO_VIDEO, "other", 30) == 2
+    assert delay(OperationType.IMAGE_TO_VIDEO, "other", 900) == 10
+
+
+@pytest.mark.asyncio
+async def test_reschedule_drops_terminal_and_honours_backoff(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(status_poller.time, "time", lambda: 5_000.0)
+    generations = [_snapshot(1), _snapshot(2), _snapshot(3), _snapshot(4)]
+    await schedule_generation_polls(redis, {g.id: 0 for g in generations})
+    results = [
+        _PollGenerationResult(generation_id=1, outcome="completed"),
+        _PollGenerationResult(generation_id=2, outcome="still_processing"),
+        _PollGenerationResult(generation_id=3, outcome="still_processing", retry_after_seconds=45.0),
+        None,  # skipped by the in-flight guard
+    ]
+
+    await status_poller._reschedule_polled_generations(redis, generations, results)
+
+    assert redis.score(1) is None
+    assert redis.score(2) == 5_004.0  # pixverse video at 30 s: half cadence
+    assert redis.score(3) == 5_045.0
+    assert redis.score(4) == 5_004.0
+
+
+@pytest.mark.asyncio
+async def test_claim_reconciles_then_loads_only_due(monkeypatch):
+    redis = FakeRedis()
+    now = 7_000.0
+    loaded_ids = []
+
+    async def _get_redis():
+        return redis
+
+    async def _processing_ids(db):
+        return {10, 11, 12}
+
+    async def _snapshots(db, generation_ids=None):
+        loaded_ids.append(sorted(generation_ids))
+        return [_snapshot(gid) for gid in generation_ids if gid in {10, 11, 12}]
+
+    class _DB:
+        async def rollback(self):
+            pass
+
+    monkeypatch.setattr(status_poller, "get_redis", _get_redis)
+    monkeypatch.setattr(status_poller, "_poll_schedule_enabled", lambda: True)
+    monkeypatch.setattr(status_poller, "_load_processing_generation_ids", _processing_ids)
+    monkeypatch.setattr(status_poller, "_load_processing_generation_snapshots", _snapshots)
+    monkeypatch.setattr(status_poller, "_poll_schedule_next_reconcile", 0.0)
+    monkeypatch.setattr(status_poller, "_poll_schedule_slots", ())
+    monkeypatch.setattr(status_poller.time, "time", lambda: now)
+    monkeypatch.setattr(poll_schedule, "_worker_id", "solo:1")
+
+    # 11 is already scheduled later; 99 finished elsewhere and is stale.
+    await schedule_generation_polls(redis, {11: now + 20, 99: now - 1})
+
+    _redis, snapshots = await status_poller._claim_scheduled_generations(_DB())
+
+    assert sorted(s.id for s in snapshots) == [10, 12]
+    assert loaded_ids == [[10, 12]]
+    assert redis.score(99) is None
+    assert redis.score(11) == now + 20
+    assert redis.score(10) == now + status_poller._POLL_LEASE_SEC
@@ -66,6 +66,7 @@ class _FakeDB:
         return self._assets.get(entity_id)
 
     async def commit(self) -> None: ...
+    async def rollback(self) -> None: ...
     async def close(self) -> None:
         self.closed += 1
 
@@ -98,6 +99,7 @@ def _make_asset(**over) -> SimpleNamespace:
         local_path=None,
         duration_sec=None,
         media_metadata={},
+        sha256=None,
     )
     base.update(over)
     return SimpleNamespace(**base)
@@ -190,6 +192,18 @@ def _install(
     )
     monkeypatch.setattr(EMBED_HOST, "cleanup_embedding_input_paths", lambda *a, **k: None)
 
+    cache_entries: dict[str, list[float]] = {}
+
+    class _FakeContentCache:
+        def __init__(self, db) -> None: ...
+        async def get_many(self, hashes, *, embedder_id, model_id, variant=""):
+            return {h: cache_entries[h] for h in hashes if h in cache_entries}
+        async def put_many(self, vectors, *, embedder_id, model_id, variant=""):
+            _rec("cache_put", dict(vectors), model_id=model_id)
+            cache_entries.update(vectors)
+
+    monkeypatch.setattr(EMBED_HOST, "ContentEmbeddingCache", _FakeContentCache)
+
     class _FakeEmbeddingService:
         async def embed_images(self, request):
             _rec("embed_images", paths=list(request.paths))
@@ -202,7 +216,7 @@ def _install(
         "pixsim7.embedding.locator.get_embedding_service", lambda: _FakeEmbeddingService()
     )
 
-    return SimpleNamespace(db=db, health=health, calls=calls)
+    return SimpleNamespace(db=db, health=health, calls=calls, cache=cache_entries)
 
 
 async def _run(analysis: SimpleNamespace) -> dict:
@@ -284,6 +298,23 @@ async def test_embedding_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert completed[0][1] == {"embedding": [0.5, 0.5]}
 
 
+@pytest.mark.asyncio
+async def test_embedding_caches_by_content_hash(monkeypatch: pytest.MonkeyPatch) -> None:
+    analysis = _make_analysis()
+    asset = _make_asset(sha256="ab" * 32)
+    env = _install(monkeypatch, analysis=analysis, asset=asset)
+    await _run(analysis)
+    assert env.calls["cache_put"] == [(({"ab" * 32: [0.5, 0.5]},), {"model_id": "siglip2-large"})]
+
+    # A duplicate upload of the same bytes: served from the cache, no daemon call.
+    env.calls.clear()
+    result = await _run(analysis)
+    assert result["status"] == "completed"
+    assert result["cache_hit"] is True
+    assert "embed_images" not in env.calls
+    assert env.calls["mark_completed"][0][0][1] == {"embedding": [0.5, 0.5]}
+
+
 @pytest.mark.asyncio
 async def test_embedding_missing_asset(monkeypatch: pytest.MonkeyPatch) -> None:
     analysis = _make_analysis(asset_id=999)
@@ -99,6 +99,7 @@ def recorder(monkeypatch):
     monkeypatch.setattr(aw, "reconcile_account_counters", rec.aio("reconcile_account_counters", ret={"reconciled": 0}))
     monkeypatch.setattr(aw, "_reconcile_relocation_on_startup", rec.aio("_reconcile_relocation_on_startup", ret=None))
     monkeypatch.setattr(aw, "_reconcile_restore_on_startup", rec.aio("_reconcile_restore_on_startup", ret=None))
+    monkeypatch.setattr(aw, "leave_poll_schedule", rec.aio("leave_poll_schedule"))
     return rec
 
 
@@ -151,6 +152,7 @@ MAIN_STARTUP = [
 ]
 MAIN_SHUTDOWN = [
     "log:worker_shutdown",
+    "leave_poll_schedule",
     "stop_event_bus_bridge",
     "AccountEventService.shutdown",
     "shutdown_for_host",
@@ -275,3 +277,23 @@ def test_production_handlers_are_wired_to_the_factory():
     ):
         assert asyncio.iscoroutinefunction(cls.on_startup), f"{cls.__name__}.on_startup not async"
         assert asyncio.iscoroutinefunction(cls.on_shutdown), f"{cls.__name__}.on_shutdown not async"
+
+
+@pytest.mark.parametrize("spec", [aw._MAIN_LIFECYCLE, aw._RETRY_LIFECYCLE], ids=["main", "retry"])
+def test_worker_bridges_subscribe_only_to_worker_event_families(recorder, monkeypatch, spec):
+    """The wired lifecycles hand their families to the bridge, so a batched-mode
+    worker listens on the system_config channel instead of every family."""
+    from pixsim7.backend.main.infrastructure.events.redis_bridge import RedisEventBridge
+
+    started = {}
+
+    async def _start(**kwargs):
+        started.update(kwargs)
+        return "BRIDGE"
+
+    monkeypatch.setattr(life, "start_event_bus_bridge", _start)
+    on_startup, _ = _build(spec, recorder)
+    _run(on_startup, recorder)
+
+    bridge = RedisEventBridge(role=started["role"], mode="batched", families=started["families"])
+    assert bridge._subscriptions() == (["pixsim7:events:v2:system_config"], [])
@@ -58,11 +58,14 @@ def empty_cuda_cache() -> None:
         torch.cuda.empty_cache()
 
 
-def embed_images(model, processor, device, paths: list[str]) -> list[list[float]]:
-    """L2-normalized SigLIP-2 image embeddings for the given paths.
-
-    All paths must be readable images. The HTTP layer translates load failures
-    into a 400 so invalid input cannot produce a plausible-but-wrong vector.
+def prepare_inputs(processor, paths: list[str]):
+    """Decode + resize/normalize ``paths`` into model-ready CPU tensors.
+
+    The CPU-bound half of embedding, split out so the daemon can run it in a
+    decode pool while the previous batch is still in the forward pass. All
+    paths must be readable images — a load failure raises
+    ``EmbeddingImageLoadError``, which the HTTP layer turns into a 400 so
+    invalid input cannot produce a plausible-but-wrong vector.
     """
     images = []
     for path in paths:
@@ -74,8 +77,24 @@ def embed_images(model, processor, device, paths: list[str]) -> list[list[float]
         except Exception as e:
             raise EmbeddingImageLoadError(path, str(e)) from e
         images.append(img)
+    return processor(images=images, return_tensors="pt")
 
-    inputs = processor(images=images, return_tensors="pt").to(device)
+
+def embed_inputs(model, device, batch: list):
+    """L2-normalized embeddings for one or more ``prepare_inputs`` results.
+
+    The prepared inputs are concatenated along the batch axis and run as ONE
+    forward pass; vectors come back as a float32 ``(n, dim)`` ndarray in input
+    order (first input's images first) — left as an array so the daemon can
+    write the binary wire format without a list round-trip. The processor
+    emits fixed-shape tensors per model, so inputs prepared by separate
+    requests stack cleanly.
+    """
+    if len(batch) == 1:
+        inputs = batch[0]
+    else:
+        inputs = {key: torch.cat([b[key] for b in batch], dim=0) for key in batch[0].keys()}
+    inputs = {key: value.to(device) for key, value in inputs.items()}
 
     with torch.no_grad():
         features = model.get_image_features(**inputs)
@@ -90,4 +109,13 @@ def embed_images(model, processor, device, paths: list[str]) -> list[list[float]
                 )
         features = torch.nn.functional.normalize(features, dim=-1)
 
-    return features.cpu().numpy().tolist()
+    return features.cpu().numpy()
+
+
+def embed_images(model, processor, device, paths: list[str]) -> list[list[float]]:
+    """L2-normalized SigLIP-2 image embeddings for the given paths.
+
+    One-shot ``prepare_inputs`` + ``embed_inputs`` for callers without a
+    batching scheduler.
+    """
+    return embed_inputs(model, device, [prepare_inputs(processor, paths)]).tolist()
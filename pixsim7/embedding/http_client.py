@@ -9,6 +9,11 @@ Graceful failure: if the service is unreachable / times out / returns a bad
 response, `embed_images` raises `EmbeddingServiceError`. The analysis worker
 already catches that, marks the analysis failed, and lets it retry later — so a
 down daemon never blocks other work.
+
+With ``wire_encoding="f32"`` / ``"f16"`` both clients ask for the binary vector
+wire format (``pixsim7.embedding.wire``) and decode it straight into a numpy
+array, which is returned as ``EmbedResult.vectors`` as-is; a daemon that
+answers JSON anyway (an older build) is parsed as before.
 """
 from __future__ import annotations
 
@@ -16,6 +21,7 @@ import json
 from collections.abc import Mapping
 
 import httpx
+import numpy as np
 
 from pixsim7.embedding.protocol import (
     EmbeddingService,
@@ -24,6 +30,12 @@ from pixsim7.embedding.protocol import (
     EmbedResult,
     EmbedTextRequest,
 )
+from pixsim7.embedding.wire import (
+    JSON_ENCODING,
+    VECTORS_MEDIA_TYPE,
+    decode_vectors,
+    is_binary_encoding,
+)
 
 
 _CONTEXT_HEADER_MAX_LEN = 2048
@@ -57,6 +69,22 @@ def _caller_headers(
     return headers
 
 
+def _decode_binary_vectors(
+    response: httpx.Response, *, service: str
+) -> tuple[np.ndarray, str] | None:
+    """``(vectors, model_id)`` if the daemon answered in the binary wire format,
+    else None (JSON — the caller parses it). ``vectors`` is the float32
+    ``(count, dim)`` array over the body — no per-float Python objects; pgvector
+    binds it directly and callers that need lists convert themselves."""
+    if not response.headers.get("content-type", "").startswith(VECTORS_MEDIA_TYPE):
+        return None
+    try:
+        array, model_id = decode_vectors(response.content)
+    except ValueError as exc:
+        raise EmbeddingServiceError(f"{service} returned a malformed vector body: {exc}") from exc
+    return array, model_id
+
+
 class HttpEmbeddingService(EmbeddingService):
     """Embeds images via the embedding-daemon HTTP service."""
 
@@ -68,10 +96,12 @@ class HttpEmbeddingService(EmbeddingService):
         caller: str = "backend:image-embedding",
         connect_timeout: float = 5.0,
         read_timeout: float = 180.0,
+        wire_encoding: str = JSON_ENCODING,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model_id = model_id
         self._caller = caller
+        self._wire_encoding = wire_encoding
         # Short connect timeout so an unreachable service fails fast (graceful
         # fallback); long read timeout to cover cold-batch inference.
         self._timeout = httpx.Timeout(
@@ -93,6 +123,8 @@ class HttpEmbeddingService(EmbeddingService):
         payload: dict[str, object] = {"paths": list(request.paths)}
         if request.model_id is not None:
             payload["model_id"] = request.model_id
+        if is_binary_encoding(self._wire_encoding):
+            payload["encoding"] = self._wire_encoding
         headers = _caller_headers(
             default_caller=self._caller,
             request_caller=request.caller,
@@ -118,6 +150,15 @@ class HttpEmbeddingService(EmbeddingService):
                 f"{response.text[:200]!r}"
             )
 
+        binary = _decode_binary_vectors(response, service="embedding service")
+        if binary is not None:
+            vectors, served_model_id = binary
+            return EmbedResult(
+                vectors=vectors,
+                dim=vectors.shape[1],
+                model_id=served_model_id or self._model_id,
+            )
+
         try:
             data = response.json()
         except ValueError as exc:
@@ -178,10 +219,12 @@ class HttpTextEmbeddingService(EmbeddingService):
         caller: str = "backend:text-embedding",
         connect_timeout: float = 2.0,
         read_timeout: float = 120.0,
+        wire_encoding: str = JSON_ENCODING,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model_id = model_id
         self._caller = caller
+        self._wire_encoding = wire_encoding
         # Short connect timeout so a down daemon fails fast into the fallback;
         # long read timeout to cover a cold warm-up window on first request.
         self._timeout = httpx.Timeout(
@@ -208,6 +251,8 @@ class HttpTextEmbeddingService(EmbeddingService):
             "texts": list(request.texts),
             "model": request.model_id,
         }
+        if is_binary_encoding(self._wire_encoding):
+            payload["encoding"] = self._wire_encoding
         headers = _caller_headers(
             default_caller=self._caller,
             request_caller=request.caller,
@@ -233,6 +278,11 @@ class HttpTextEmbeddingService(EmbeddingService):
                 f"{response.text[:200]!r}"
             )
 
+        binary = _decode_binary_vectors(response, service="text embedding service")
+        if binary is not None:
+            vectors, _served = binary
+            return EmbedResult(vectors=vectors, dim=vectors.shape[1], model_id=request.model_id)
+
         try:
             data = response.json()
         except ValueError as exc:
@@ -61,10 +61,12 @@ class EmbedResult:
 
     `dim` is implied by len(vectors[i]); kept on the result so callers can
     sanity-check before persisting. `model_id` is the model identifier the
-    embedder used (for provenance on the stored row).
+    embedder used (for provenance on the stored row). `vectors` is a list of
+    float lists, or a float32 ``(count, dim)`` numpy array when it came over
+    the binary wire format.
     """
 
-    vectors: list[list[float]]
+    vectors: Sequence[Sequence[float]]
     dim: int
     model_id: str
 
@@ -27,6 +27,11 @@ Endpoints:
                    {"embeddings":[[...]],"dim":N,"model_id":...}
                    `model_id` omitted -> the default model. A model_id not in the
                    allowed set returns 409 {"error":"model_not_served",...}.
+                   `"encoding": "f32"|"f16"` in the body returns the vectors in
+                   the binary wire format (pixsim7.embedding.wire) instead.
+                   Concurrent requests for the same model are coalesced into
+                   one forward pass (see _EmbedBatcher); /health reports the
+                   queue depth and batch-size histograms under `batching`.
   POST /config/allowed-models -> {"model_ids":[...], "default"?:...} -> updates
                    the allowed set (union with the env baseline) and optionally
                    switches the warm-loaded default. The backend pushes the set +
@@ -41,18 +46,24 @@ Configuration (env):
   PIXSIM_EMBEDDING_MAX_RESIDENT- max models resident in VRAM (default 2; LRU)
   PIXSIM_EMBEDDING_WEDGE_SEC   - in-flight age (s) past which /health reports
                                  'wedged' (default 120)
+  PIXSIM_EMBEDDING_MAX_BATCH   - max images per coalesced forward pass (default 32)
+  PIXSIM_EMBEDDING_MAX_WAIT_MS - how long a batch waits for more requests before
+                                 running (default 10; 0 = run immediately)
+  PIXSIM_EMBEDDING_DECODE_THREADS - image decode/resize pool size (default 4)
 """
 from __future__ import annotations
 
 import asyncio
 import logging
 import os
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from pixsim7.embedding._daemon import (
@@ -63,9 +74,16 @@ from pixsim7.embedding._daemon import (
 from pixsim7.embedding._siglip import (
     EmbeddingImageLoadError,
     MODEL_ID,
-    embed_images,
+    embed_inputs,
     empty_cuda_cache,
     load_model,
+    prepare_inputs,
+)
+from pixsim7.embedding.wire import (
+    JSON_ENCODING,
+    VECTORS_MEDIA_TYPE,
+    encode_vectors,
+    is_binary_encoding,
 )
 
 _WEDGE_THRESHOLD_SEC = float(os.environ.get("PIXSIM_EMBEDDING_WEDGE_SEC", "120"))
@@ -193,6 +211,160 @@ class _ModelRegistry:
             self.load_error = str(exc)
 
 
+def _env_int(name: str, default: int, *, minimum: int = 1) -> int:
+    try:
+        return max(minimum, int(os.environ.get(name, str(default))))
+    except ValueError:
+        return default
+
+
+class _Job:
+    """One /embed request's prepared inputs waiting for a batch slot."""
+
+    __slots__ = ("model", "device", "inputs", "size", "future", "enqueued")
+
+    def __init__(self, model, device, inputs, size: int, future: asyncio.Future) -> None:
+        self.model = model
+        self.device = device
+        self.inputs = inputs
+        self.size = size
+        self.future = future
+        self.enqueued = time.monotonic()
+
+
+def _bucket(n: int) -> str:
+    """Power-of-two histogram bucket label (upper bound) for a batch size."""
+    b = 1
+    while b < n:
+        b *= 2
+    return str(b)
+
+
+class _EmbedBatcher:
+    """Coalesces concurrent /embed requests for the same model into one pass.
+
+    Requests arrive already decoded (``prepare_inputs`` runs in the decode
+    pool, overlapping with whatever batch is in the forward pass) and are
+    queued per model_id. A per-model drain task — started on demand, exiting
+    once its queue is empty — closes a batch when it reaches ``max_batch``
+    images or when the oldest request has waited ``max_wait_sec``, runs it as
+    ONE ``embed_inputs`` call off the event loop, and hands each request its
+    slice of the vectors. A single request larger than ``max_batch`` runs on
+    its own rather than being split. One forward pass per model at a time, so
+    requests no longer race each other for the GPU."""
+
+    def __init__(self, *, max_batch: int, max_wait_sec: float) -> None:
+        self.max_batch = max_batch
+        self.max_wait_sec = max_wait_sec
+        self._pending: dict[str, list[_Job]] = {}
+        self._arrivals: dict[str, asyncio.Event] = {}
+        self._drainers: dict[str, asyncio.Task] = {}
+        self.batches = 0
+        self.images = 0
+        self.images_hist: dict[str, int] = {}
+        self.requests_hist: dict[str, int] = {}
+
+    async def submit(self, model_id: str, model, device, inputs, size: int) -> list[list[float]]:
+        """Queue one request's prepared inputs; resolves to its vectors."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(model_id, []).append(
+            _Job(model, device, inputs, size, future)
+        )
+        arrival = self._arrivals.get(model_id)
+        if arrival is not None:
+            arrival.set()
+        if model_id not in self._drainers:
+            self._drainers[model_id] = asyncio.create_task(self._drain(model_id))
+        return await future
+
+    def _queued_images(self, model_id: str) -> int:
+        return sum(job.size for job in self._pending.get(model_id, ()))
+
+    async def _drain(self, model_id: str) -> None:
+        try:
+            while self._pending.get(model_id):
+                await self._wait_for_fill(model_id)
+                await self._run(self._take_batch(model_id))
+        finally:
+            self._drainers.pop(model_id, None)
+            self._arrivals.pop(model_id, None)
+
+    async def _wait_for_fill(self, model_id: str) -> None:
+        """Hold the batch open until it is full or the oldest job's wait is up."""
+        deadline = self._pending[model_id][0].enqueued + self.max_wait_sec
+        while self._queued_images(model_id) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            arrival = self._arrivals[model_id] = asyncio.Event()
+            try:
+                await asyncio.wait_for(arrival.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _take_batch(self, model_id: str) -> list[_Job]:
+        queue = self._pending[model_id]
+        batch = [queue.pop(0)]
+        total = batch[0].size
+        while queue and total + queue[0].size <= self.max_batch:
+            total += queue[0].size
+            batch.append(queue.pop(0))
+        if not queue:
+            del self._pending[model_id]
+        return batch
+
+    async def _run(self, batch: list[_Job]) -> None:
+        jobs = [job for job in batch if not job.future.done()]  # drop disconnected callers
+        if not jobs:
+            return
+        size = sum(job.size for job in jobs)
+        self.batches += 1
+        self.images += size
+        self.images_hist[_bucket(size)] = self.images_hist.get(_bucket(size), 0) + 1
+        self.requests_hist[_bucket(len(jobs))] = self.requests_hist.get(_bucket(len(jobs)), 0) + 1
+        # Bracket the wedge guard around inference only (not loads / decode).
+        # torch inference is blocking — run off the event loop so /health stays
+        # responsive (and a genuine hang shows up via the wedge guard, not a
+        # frozen server).
+        with inflight.track():
+            try:
+                vectors = await asyncio.to_thread(
+                    embed_inputs, jobs[0].model, jobs[0].device, [job.inputs for job in jobs]
+                )
+            except Exception as exc:
+                for job in jobs:
+                    if not job.future.done():
+                        job.future.set_exception(exc)
+                return
+        offset = 0
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_result(vectors[offset:offset + job.size])
+            offset += job.size
+
+    def stats(self) -> dict:
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": round(self.max_wait_sec * 1000, 1),
+            "queue_depth": {
+                mid: {"requests": len(jobs), "images": sum(j.size for j in jobs)}
+                for mid, jobs in self._pending.items()
+            },
+            "batches": self.batches,
+            "images": self.images,
+            "avg_batch_images": round(self.images / self.batches, 2) if self.batches else 0.0,
+            "batch_images_hist": dict(sorted(self.images_hist.items(), key=lambda kv: int(kv[0]))),
+            "batch_requests_hist": dict(sorted(self.requests_hist.items(), key=lambda kv: int(kv[0]))),
+        }
+
+
+def _build_batcher() -> _EmbedBatcher:
+    return _EmbedBatcher(
+        max_batch=_env_int("PIXSIM_EMBEDDING_MAX_BATCH", 32),
+        max_wait_sec=_env_int("PIXSIM_EMBEDDING_MAX_WAIT_MS", 10, minimum=0) / 1000.0,
+    )
+
+
 def _build_registry() -> _ModelRegistry:
     default, allowed, capacity = _parse_config()
     return _ModelRegistry(default_model_id=default, allowed=allowed, capacity=capacity)
@@ -201,6 +373,13 @@ def _build_registry() -> _ModelRegistry:
 registry = _build_registry()
 # Wedge guard shared with the text daemon (pixsim7.embedding._daemon).
 inflight = InFlight()
+batcher = _build_batcher()
+# Image decode + resize runs here, off both the event loop and the inference
+# thread, so the next batch is being prepared while the current one runs.
+_decode_pool = ThreadPoolExecutor(
+    max_workers=_env_int("PIXSIM_EMBEDDING_DECODE_THREADS", 4),
+    thread_name_prefix="embed-decode",
+)
 
 
 @asynccontextmanager
@@ -229,6 +408,9 @@ class EmbedBody(BaseModel):
     # model_id outside the hosted/allowed set is rejected (409) so the caller
     # fails the analysis cleanly instead of embedding with the wrong model.
     model_id: str | None = None
+    # Response encoding: "json" (float lists) or a binary wire dtype ("f32" /
+    # "f16", see pixsim7.embedding.wire). Unknown values fall back to JSON.
+    encoding: str = JSON_ENCODING
 
 
 class AllowedModelsBody(BaseModel):
@@ -243,6 +425,7 @@ def _health_extra() -> dict:
         "model_id": registry.default_model_id,
         "model_ids": sorted(registry.allowed),
         "loaded_model_ids": registry.loaded_model_ids,
+        "batching": batcher.stats(),
     }
 
 
@@ -330,32 +513,36 @@ async def embed(body: EmbedBody):
             content={"error": "model_load_failed", "model_id": model_id, "detail": str(exc)},
         )
 
-    # Bracket the wedge guard around inference only (not the load above).
-    # torch inference is blocking — run off the event loop so /health stays
-    # responsive (and a genuine hang shows up via the wedge guard, not a frozen
-    # server).
-    with inflight.track():
-        try:
-            vectors = await asyncio.to_thread(
-                embed_images, model, processor, device, body.paths
-            )
-        except EmbeddingImageLoadError as exc:
-            logger.warning(
-                "embedding_image_load_failed model_id=%s path_count=%s detail=%s",
-                model_id,
-                len(body.paths),
-                str(exc),
-            )
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "image_load_failed",
-                    "model_id": model_id,
-                    "path_count": len(body.paths),
-                    "path": exc.path,
-                    "detail": str(exc),
-                },
-            )
+    try:
+        inputs = await asyncio.get_running_loop().run_in_executor(
+            _decode_pool, prepare_inputs, processor, body.paths
+        )
+    except EmbeddingImageLoadError as exc:
+        logger.warning(
+            "embedding_image_load_failed model_id=%s path_count=%s detail=%s",
+            model_id,
+            len(body.paths),
+            str(exc),
+        )
+        return JSONResponse(
+            status_code=400,
+            content={
+                "error": "image_load_failed",
+                "model_id": model_id,
+                "path_count": len(body.paths),
+                "path": exc.path,
+                "detail": str(exc),
+            },
+        )
+
+    vectors = await batcher.submit(model_id, model, device, inputs, len(body.paths))
 
+    if is_binary_encoding(body.encoding):
+        return Response(
+            content=encode_vectors(vectors, model_id=model_id, encoding=body.encoding),
+            media_type=VECTORS_MEDIA_TYPE,
+        )
+    if hasattr(vectors, "tolist"):
+        vectors = vectors.tolist()
     dim = len(vectors[0]) if vectors else 0
     return {"embeddings": vectors, "dim": dim, "model_id": model_id}
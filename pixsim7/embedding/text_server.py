@@ -27,7 +27,7 @@ from __future__ import annotations
 import asyncio
 import os
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from pixsim7.embedding._daemon import (
@@ -42,6 +42,12 @@ from pixsim7.embedding.cli.text_local import (
     embed_texts as _embed_texts,
     load_model,
 )
+from pixsim7.embedding.wire import (
+    JSON_ENCODING,
+    VECTORS_MEDIA_TYPE,
+    encode_vectors,
+    is_binary_encoding,
+)
 
 _WEDGE_THRESHOLD_SEC = float(os.environ.get("PIXSIM_TEXT_EMBEDDING_WEDGE_SEC", "120"))
 
@@ -83,6 +89,9 @@ class EmbedTextsBody(BaseModel):
     # Accepted for request-shape parity with the provider contract; this daemon
     # serves exactly one model, so it's informational only.
     model: str | None = None
+    # Response encoding: "json" or a binary wire dtype ("f32" / "f16"), see
+    # pixsim7.embedding.wire.
+    encoding: str = JSON_ENCODING
 
 
 @app.post("/embed_texts")
@@ -109,5 +118,10 @@ async def embed_texts(body: EmbedTextsBody):
             _embed_texts, model, tokenizer, device, list(body.texts)
         )
 
+    if is_binary_encoding(body.encoding):
+        return Response(
+            content=encode_vectors(vectors, model_id=slot.key or MODEL_ID, encoding=body.encoding),
+            media_type=VECTORS_MEDIA_TYPE,
+        )
     dim = len(vectors[0]) if vectors else 0
     return {"embeddings": vectors, "dim": dim, "model_id": slot.key}
@@ -10,6 +10,7 @@ spaces.
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 
 
 class EmbeddingDimensionError(ValueError):
@@ -21,12 +22,16 @@ def validate_embeddings(
     expected_count: int,
     *,
     expected_dimensions: int,
-) -> list[list[float]]:
+) -> Sequence[Sequence[float]]:
     """Validate provider output: correct count, list[float]-compatible,
-    correct dims, all-finite. Returns the normalized list[list[float]].
+    correct dims, all-finite. Returns the normalized list[list[float]], or
+    the float32 array itself when given a numpy array (binary wire format),
+    checked without expanding it into Python floats.
 
     Raises EmbeddingDimensionError on any failure.
     """
+    if hasattr(embeddings, "ndim") and hasattr(embeddings, "dtype"):
+        return _validate_array(embeddings, expected_count, expected_dimensions)
     if not isinstance(embeddings, (list, tuple)):
         raise EmbeddingDimensionError(
             f"Embeddings payload is {type(embeddings).__name__}, expected list"
@@ -60,3 +65,32 @@ def validate_embeddings(
             normalized.append(as_float)
         normalized_embeddings.append(normalized)
     return normalized_embeddings
+
+
+def _validate_array(embeddings: object, expected_count: int, expected_dimensions: int):
+    import numpy as np
+
+    arr = np.asarray(embeddings)
+    if arr.ndim != 2:
+        raise EmbeddingDimensionError(
+            f"Embeddings array has shape {arr.shape}, expected (count, dims)"
+        )
+    if arr.shape[0] != expected_count:
+        raise EmbeddingDimensionError(
+            f"Expected {expected_count} embeddings, got {arr.shape[0]}"
+        )
+    if expected_count and arr.shape[1] != expected_dimensions:
+        raise EmbeddingDimensionError(
+            f"Embedding [0] has {arr.shape[1]} dimensions, expected {expected_dimensions}"
+        )
+    if arr.dtype.kind != "f":
+        raise EmbeddingDimensionError(
+            f"Embeddings array is {arr.dtype}, expected floats"
+        )
+    bad = np.argwhere(~np.isfinite(arr))
+    if bad.size:
+        i, j = (int(v) for v in bad[0])
+        raise EmbeddingDimensionError(
+            f"Embedding [{i}][{j}] is non-finite ({float(arr[i, j])})"
+        )
+    return arr
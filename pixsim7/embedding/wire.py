@@ -0,0 +1,76 @@
+"""Binary vector wire format shared by the embedding daemons and HTTP clients.
+
+JSON float lists are the default response shape, but formatting and parsing
+~1k floats per vector is a visible share of a large backfill's round-trip. A
+client can opt into this format per request (``"encoding": "f32" | "f16"`` in
+the body); a daemon that predates it just ignores the field and answers JSON,
+so clients must still accept JSON — the response ``Content-Type`` says which
+one came back.
+
+Layout (all little-endian)::
+
+    magic   4s   b"PXV1"
+    dtype   B    1 = float32, 2 = float16
+    _       B    reserved (0)
+    id_len  H    byte length of the UTF-8 model_id that follows the header
+    count   I    number of vectors
+    dim     I    components per vector
+    model_id     id_len bytes
+    payload      count * dim values, row-major
+"""
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+import numpy as np
+
+VECTORS_MEDIA_TYPE = "application/x-pixsim-vectors"
+JSON_ENCODING = "json"
+
+_MAGIC = b"PXV1"
+_HEADER = struct.Struct("<4sBBHII")
+_DTYPES = {"f32": (1, np.dtype("<f4")), "f16": (2, np.dtype("<f2"))}
+_DTYPE_BY_CODE = {code: dt for code, dt in _DTYPES.values()}
+
+
+def is_binary_encoding(encoding: str | None) -> bool:
+    return encoding in _DTYPES
+
+
+def encode_vectors(vectors: Any, *, model_id: str, encoding: str = "f32") -> bytes:
+    """Pack ``vectors`` (ndarray or list of lists, one row per input) as a
+    binary response body. ``encoding`` is ``"f32"`` (lossless for the models'
+    float32 output) or ``"f16"`` (half the bytes; ~3 significant digits)."""
+    code, dtype = _DTYPES[encoding]
+    arr = np.asarray(vectors, dtype=dtype)
+    if arr.ndim == 1 and arr.size == 0:
+        arr = arr.reshape(0, 0)
+    if arr.ndim != 2:
+        raise ValueError(f"expected a 2-D vector batch, got shape {arr.shape}")
+    mid = model_id.encode("utf-8")
+    header = _HEADER.pack(_MAGIC, code, 0, len(mid), arr.shape[0], arr.shape[1])
+    return header + mid + np.ascontiguousarray(arr).tobytes()
+
+
+def decode_vectors(body: bytes) -> tuple[Any, str]:
+    """``(float32 ndarray (count, dim), model_id)`` from :func:`encode_vectors`.
+
+    Raises ``ValueError`` on a truncated / foreign body so callers can map it
+    to their own error type.
+    """
+    if len(body) < _HEADER.size:
+        raise ValueError(f"vector body too short ({len(body)} bytes)")
+    magic, code, _reserved, id_len, count, dim = _HEADER.unpack_from(body)
+    if magic != _MAGIC:
+        raise ValueError(f"bad vector body magic {magic!r}")
+    dtype = _DTYPE_BY_CODE.get(code)
+    if dtype is None:
+        raise ValueError(f"unknown vector dtype code {code}")
+    offset = _HEADER.size + id_len
+    expected = offset + count * dim * dtype.itemsize
+    if len(body) != expected:
+        raise ValueError(f"vector body is {len(body)} bytes, header implies {expected}")
+    model_id = body[_HEADER.size:offset].decode("utf-8")
+    arr = np.frombuffer(body, dtype=dtype, count=count * dim, offset=offset)
+    return arr.reshape(count, dim).astype(np.float32, copy=False), model_id
@@ -56,11 +56,7 @@ def get_ingestion_stats() -> dict:
     """Return diagnostic stats from the active DB handler (if any)."""
     if _active_db_handler is None:
         return {"active": False}
-    return {
-        "active": True,
-        "dropped_logs": getattr(_active_db_handler, "_dropped_logs", 0),
-        "worker_errors": getattr(_active_db_handler, "_worker_errors", 0),
-    }
+    return {"active": True, **_active_db_handler.get_stats()}
 
 
 def set_db_min_level(level: str) -> None:
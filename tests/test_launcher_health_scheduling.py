@@ -0,0 +1,159 @@
+"""Launcher HealthManager: concurrent probes, per-service schedules, cycle metrics."""
+
+import threading
+import time
+from concurrent.futures import Future
+
+from launcher.core.health_manager import FLAP_TRANSITIONS, HealthManager
+from launcher.core.types import HealthStatus, ServiceDefinition, ServiceState, ServiceStatus
+
+
+def _http_state(key: str) -> ServiceState:
+    definition = ServiceDefinition(
+        key=key,
+        title=key,
+        program="python",
+        args=[],
+        cwd=".",
+        health_url=f"http://127.0.0.1:1/{key}/health",
+    )
+    return ServiceState(definition=definition)
+
+
+class _InlinePool:
+    """Runs submitted probes synchronously and records their keys."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, key, state, cycle):
+        self.submitted.append(key)
+        fn(key, state, cycle)
+        future = Future()
+        future.set_result(None)
+        return future
+
+
+class _ClosedPool:
+    def submit(self, *args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+
+def test_hung_probe_does_not_delay_other_services(monkeypatch):
+    states = {"slow": _http_state("slow"), "fast": _http_state("fast")}
+    mgr = HealthManager(states=states, adaptive_enabled=False, interval_sec=0.02)
+    release = threading.Event()
+    fast_probes = []
+    fast_seen = threading.Event()
+
+    def check(key, state):
+        if key == "slow":
+            release.wait(5)
+        else:
+            fast_probes.append(time.monotonic())
+            if len(fast_probes) >= 5:
+                fast_seen.set()
+
+    monkeypatch.setattr(mgr, "_check_service", check)
+    mgr.start()
+    try:
+        assert fast_seen.wait(2)
+        assert mgr.get_stats()["in_flight"] == ["slow"]
+    finally:
+        release.set()
+        mgr.stop()
+
+
+def test_service_interval_follows_its_own_history():
+    states = {"api": _http_state("api"), "worker": _http_state("worker")}
+    mgr = HealthManager(
+        states=states,
+        interval_sec=2.0,
+        startup_interval=0.5,
+        stable_interval=5.0,
+        stable_duration=300.0,
+    )
+    assert mgr._service_interval("api") == 2.0
+
+    mgr.service_healthy_since["api"] = time.time() - 600
+    assert mgr._service_interval("api") == 5.0
+
+    # Flapping between healthy and unhealthy: probe fast until it settles.
+    for status in [HealthStatus.HEALTHY, HealthStatus.UNHEALTHY] * FLAP_TRANSITIONS:
+        mgr._emit_health_update("worker", status)
+    assert mgr._service_interval("worker") == 0.5
+    assert mgr._service_interval("api") == 5.0
+
+    mgr.adaptive_enabled = False
+    assert mgr._service_interval("worker") == 2.0
+
+
+def test_schedule_probes_only_due_services_and_reacts_to_lifecycle_changes(monkeypatch):
+    states = {"api": _http_state("api"), "web": _http_state("web")}
+    mgr = HealthManager(states=states, adaptive_enabled=False, interval_sec=60.0)
+    checked = []
+    monkeypatch.setattr(mgr, "_check_service", lambda key, state: checked.append(key))
+    pool = _InlinePool()
+
+    mgr._dispatch_due(pool)
+    assert sorted(pool.submitted) == ["api", "web"]
+    assert mgr._dispatch_due(pool) <= mgr.startup_interval
+    assert len(pool.submitted) == 2
+
+    # A start from ProcessManager makes the service due right away.
+    states["web"].status = ServiceStatus.STARTING
+    mgr._dispatch_due(pool)
+    assert pool.submitted[2:] == ["web"]
+
+    stats = mgr.get_stats()
+    assert stats["cycle_count"] == 2
+    assert stats["in_flight"] == []
+    assert set(stats["probe_ms"]) == {"api", "web"}
+    assert stats["interval_sec"] == {"api": 60.0, "web": 60.0}
+
+
+def test_probes_cancelled_at_stop_are_rescheduled_after_restart(monkeypatch):
+    states = {"slow": _http_state("slow"), "fast": _http_state("fast")}
+    mgr = HealthManager(
+        states=states, adaptive_enabled=False, interval_sec=0.02, max_concurrent_probes=1
+    )
+    release = threading.Event()
+    slow_started = threading.Event()
+    fast_seen = threading.Event()
+
+    def check(key, state):
+        if key == "slow":
+            slow_started.set()
+            release.wait(5)
+        else:
+            fast_seen.set()
+
+    monkeypatch.setattr(mgr, "_check_service", check)
+    mgr.start()
+    try:
+        # "fast" is queued behind the hung probe when the monitor stops.
+        assert slow_started.wait(2)
+        mgr.stop()
+        assert mgr.get_stats()["in_flight"] == ["slow"]
+        assert not fast_seen.is_set()
+
+        release.set()
+        mgr.start()
+        assert fast_seen.wait(2)
+    finally:
+        release.set()
+        mgr.stop()
+
+
+def test_submit_after_pool_shutdown_releases_due_services(monkeypatch):
+    states = {"api": _http_state("api"), "web": _http_state("web")}
+    mgr = HealthManager(states=states, adaptive_enabled=False, interval_sec=60.0)
+    monkeypatch.setattr(mgr, "_check_service", lambda key, state: None)
+
+    mgr._dispatch_due(_ClosedPool())
+    assert mgr.get_stats()["in_flight"] == []
+
+    # Nothing is left marked in flight, so a working pool picks both up.
+    pool = _InlinePool()
+    mgr._dispatch_due(pool)
+    assert sorted(pool.submitted) == ["api", "web"]
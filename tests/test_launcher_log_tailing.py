@@ -0,0 +1,117 @@
+"""Launcher log tailing: open-handle tails, rotation, ring buffers, batched subscribers."""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from launcher.core.log_manager import LogManager
+from launcher.core.log_tailer import FileTail, PollingWatcher, create_watcher, read_last_lines
+
+
+def _state():
+    return SimpleNamespace(log_buffer=[], last_error="")
+
+
+def _write(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_file_tail_reads_only_new_complete_lines(tmp_path):
+    log = tmp_path / "svc.log"
+    _write(log, "old line\n")
+    tail = FileTail(log, position=log.stat().st_size)
+
+    assert tail.read_lines() == []
+    _write(log, "one\ntw")
+    assert tail.read_lines() == ["one"]
+    _write(log, "o\nthree\n")
+    assert tail.read_lines() == ["two", "three"]
+
+
+def test_file_tail_follows_rotation_and_truncation(tmp_path):
+    log = tmp_path / "svc.log"
+    _write(log, "a\n")
+    tail = FileTail(log)
+    assert tail.read_lines() == ["a"]
+
+    _write(log, "b\n")  # written just before the rotation
+    os.replace(log, tmp_path / "svc.log.1")
+    _write(log, "c\n")
+    assert tail.read_lines() == ["b", "c"]
+
+    _write(log, "d\ne\n")
+    assert tail.read_lines() == ["d", "e"]
+    with open(log, "w"):
+        pass
+    _write(log, "f\n")
+    assert tail.read_lines() == ["f"]
+
+
+def test_read_last_lines_reads_from_the_end(tmp_path):
+    log = tmp_path / "svc.log"
+    _write(log, "".join(f"line {i}\n" for i in range(10_000)))
+    assert read_last_lines(log, 3, block_size=16) == ["line 9997", "line 9998", "line 9999"]
+    assert read_last_lines(log, 20_000)[0] == "line 0"
+
+
+def test_manager_ring_buffer_and_batched_subscribers(tmp_path):
+    _write(tmp_path / "api.log", "".join(f"boot {i}\n" for i in range(20)))
+    states = {"api": _state(), "worker": _state()}
+    mgr = LogManager(states, log_dir=tmp_path, max_log_lines=10)
+    assert mgr.get_logs("api") == [f"boot {i}" for i in range(10, 20)]
+
+    batches = []
+    unsubscribe = mgr.subscribe(lambda key, lines: batches.append((key, list(lines))))
+    _write(tmp_path / "api.log", "\x1b[32mready\x1b[0m\n[2mdim[22m\n[12:00:00] [ERR] boom\n")
+    mgr._read_new_log_lines("api")
+    mgr._read_new_log_lines("worker")
+
+    assert batches == [("api", ["ready", "dim", "[12:00:00] [ERR] boom"])]
+    assert states["api"].last_error == "boom"
+    assert len(states["api"].log_buffer) == 10
+    assert mgr.get_logs("api", max_lines=2) == ["dim", "[12:00:00] [ERR] boom"]
+    assert mgr.get_logs("api", filter_level="ERROR") == ["[12:00:00] [ERR] boom"]
+
+    unsubscribe()
+    mgr.clear_logs("api")
+    _write(tmp_path / "api.log", "after clear\n")
+    mgr._read_new_log_lines("api")
+    assert mgr.get_logs("api") == ["after clear"]
+    assert len(batches) == 1
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_monitor_pushes_lines_from_changed_files(tmp_path, use_inotify):
+    if use_inotify and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    states = {f"svc{i}": _state() for i in range(12)}
+    mgr = LogManager(states, log_dir=tmp_path, monitor_interval=0.05, use_inotify=use_inotify)
+    received = []
+    done = threading.Event()
+
+    def on_lines(key, lines):
+        received.append((key, lines))
+        if sum(len(batch) for _, batch in received) >= 3:
+            done.set()
+
+    mgr.subscribe(on_lines)
+    mgr.start_monitoring()
+    try:
+        time.sleep(0.1)
+        _write(tmp_path / "svc3.log", "hello\nworld\n")
+        _write(tmp_path / "svc7.log", "other\n")
+        assert done.wait(5)
+    finally:
+        mgr.stop_monitoring()
+
+    lines = {(key, line) for key, batch in received for line in batch}
+    assert lines == {("svc3", "hello"), ("svc3", "world"), ("svc7", "other")}
+
+
+def test_create_watcher_fallback(tmp_path):
+    assert isinstance(create_watcher(tmp_path, prefer_inotify=False), PollingWatcher)
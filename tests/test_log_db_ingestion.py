@@ -0,0 +1,176 @@
+"""DBLogHandler ingestion: adaptive batches, COPY encoding, spill file and replay."""
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import func, select
+
+from pixsim_logging.db_handler import DBLogHandler
+
+
+def _event(i, **extra):
+    return {"event": f"poll {i}", "level": "info", "service": "worker", "timestamp": "2026-01-02T03:04:05Z", **extra}
+
+
+@pytest.fixture
+def handler(tmp_path):
+    h = DBLogHandler(
+        f"sqlite:///{tmp_path / 'logs.db'}",
+        batch_size=10,
+        max_batch_size=500,
+        flush_interval=60.0,
+        spill_path=str(tmp_path / "spill" / "log_entries.jsonl"),
+    )
+    # Stop the background worker; tests drive flushes directly.
+    h.shutdown()
+    yield h
+    h.engine.dispose()
+
+
+def _count(h):
+    with h.engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(h.table)).scalar()
+
+
+def test_batches_grow_with_queue_depth(handler):
+    for i in range(1200):
+        handler(None, "info", _event(i))
+
+    handler._worker()  # shutdown already requested: drains everything
+
+    assert _count(handler) == 1200
+    stats = handler.get_stats()
+    assert (stats["queued"], stats["flushed"], stats["insert_batches"]) == (1200, 1200, 3)
+    assert stats["mode"] == "insert"  # sqlite has no COPY
+
+
+def test_copy_payload_is_csv_with_real_nulls(handler, monkeypatch):
+    captured = {}
+
+    class _Cursor:
+        def copy_expert(self, sql, buf):
+            captured["sql"], captured["data"] = sql, buf.read()
+
+        def close(self):
+            pass
+
+    class _Raw:
+        def cursor(self):
+            return _Cursor()
+
+        def commit(self):
+            captured["committed"] = True
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(handler.engine, "raw_connection", lambda: _Raw())
+    handler.use_copy = True
+    rows = [handler._map_event(_event(i, error="", attempt=2, note='say "hi"\nbye')) for i in range(150)]
+    assert handler._write_rows(rows)
+
+    assert captured["sql"].startswith('COPY log_entries (timestamp, level, service')
+    assert "FROM STDIN WITH (FORMAT csv)" in captured["sql"]
+    parsed = list(csv.reader(io.StringIO(captured["data"])))
+    first = dict(zip(handler._copy_columns, parsed[0]))
+    assert len(parsed) == 150 and captured["committed"]
+    assert first["msg"] == "poll 0"
+    assert first["attempt"] == "2"
+    assert json.loads(first["extra"]) == {"note": 'say "hi"\nbye'}
+    assert first["timestamp"] == "2026-01-02T03:04:05"
+    # Empty string is quoted, NULL is the bare empty field.
+    line = captured["data"].splitlines()[0]
+    assert ',"",' in line and ",," in line
+    assert handler.get_stats()["copy_batches"] == 1
+
+
+def test_failed_copy_falls_back_to_insert(handler, monkeypatch):
+    handler.use_copy = True
+
+    def broken_copy(rows):
+        raise RuntimeError("copy rejected")
+
+    monkeypatch.setattr(handler, "_copy_rows", broken_copy)
+    handler._flush([_event(i) for i in range(200)])
+    assert _count(handler) == 200
+    assert handler.get_stats()["insert_batches"] == 1
+
+
+def test_outage_spills_and_replays_on_recovery(handler, monkeypatch):
+    real_insert = handler._insert_rows
+
+    def db_down(rows):
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(handler, "_insert_rows", db_down)
+    handler._flush([_event(i) for i in range(30)])
+    handler._flush([_event(i) for i in range(30, 40)])
+    assert _count(handler) == 0
+    stats = handler.get_stats()
+    assert stats["spilled"] == 40 and stats["spill_bytes"] > 0 and stats["dropped_logs"] == 0
+
+    monkeypatch.setattr(handler, "_insert_rows", real_insert)
+    handler._flush([_event(99)])
+    assert handler._next_replay == 0.0
+    handler._replay_spill()
+
+    assert _count(handler) == 41
+    stats = handler.get_stats()
+    assert stats["replayed"] == 40 and stats["spill_bytes"] == 0
+    assert not handler._spill_pending
+
+
+def test_spill_is_bounded(handler, monkeypatch):
+    monkeypatch.setattr(handler, "_insert_rows", lambda rows: (_ for _ in ()).throw(ConnectionError("down")))
+    handler.max_spill_bytes = 4096
+    for _ in range(20):
+        handler._flush([_event(i) for i in range(10)])
+
+    stats = handler.get_stats()
+    assert stats["spill_bytes"] <= 4096
+    assert stats["spilled"] + stats["dropped_logs"] == 200
+    assert stats["dropped_logs"] > 0
+
+
+def test_replay_drops_only_rows_the_db_rejects(handler, monkeypatch):
+    real_insert = handler._insert_rows
+    handler._spill([handler._map_event(_event(i)) for i in range(5)] + [handler._map_event(_event(5, msg="poison"))])
+
+    def picky_insert(rows):
+        if any(row["msg"] == "poison" for row in rows):
+            raise ValueError("invalid input syntax")
+        real_insert(rows)
+
+    monkeypatch.setattr(handler, "_insert_rows", picky_insert)
+    handler._replay_spill()
+
+    assert _count(handler) == 5
+    stats = handler.get_stats()
+    assert (stats["replayed"], stats["dropped_logs"], stats["spill_bytes"]) == (5, 1, 0)
+
+
+def test_replay_adopts_claims_left_by_dead_processes(handler):
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    orphan = f"{handler.spill_path}.{dead.pid}.replay"
+    live = f"{handler.spill_path}.{os.getppid()}.replay"
+    os.makedirs(os.path.dirname(orphan), exist_ok=True)
+    handler._rewrite_spill(orphan, [handler._map_event(_event(i)) for i in range(3)])
+    handler._rewrite_spill(live, [handler._map_event(_event(i)) for i in range(4)])
+    handler._spill([handler._map_event(_event(i)) for i in range(2)])
+
+    handler._replay_spill()
+    assert _count(handler) == 3 and not os.path.exists(orphan)
+    # The handler's own spill file is still pending and goes next.
+    assert handler._spill_pending
+    handler._replay_spill()
+
+    assert _count(handler) == 5
+    # A claim whose owner is still running is left to that process.
+    assert os.path.exists(live)
+    assert not handler._spill_pending